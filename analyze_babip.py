@@ -1,10 +1,47 @@
-"""Analyze BABIP by batted ball type from game logs."""
+"""Analyze BABIP by batted ball type from game logs or an event store.
+
+Usage:
+    python analyze_babip.py game_logs/game_log_X.txt   # parse a text log
+    python analyze_babip.py runs/season_2025           # EventStore directory
+"""
+import os
 import re
 import sys
 
+import numpy as np
+
+
+def batted_balls_from_event_store(store_dir):
+    """(batted ball type, OutcomeCodePA) pairs from a saved EventStore.
+
+    Loads plays.npy memory-mapped; no text parsing.
+    """
+    from batted_ball.event_store import EventStore
+
+    store = EventStore.load(store_dir)
+    plays = store.plays
+    plays = plays[~np.isnan(plays['launch_angle'])]
+
+    # Same launch angle buckets as BattedBallMetrics.hit_type
+    bb_types = np.select(
+        [plays['launch_angle'] < 10, plays['launch_angle'] < 25, plays['launch_angle'] < 50],
+        ['GROUND_BALL', 'LINE_DRIVE', 'FLY_BALL'],
+        default='POPUP',
+    )
+    outcomes = store.decode('pa_outcome', plays['outcome'])
+    return list(zip(bb_types, outcomes))
+
+
 def analyze_babip(log_file):
-    with open(log_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    if os.path.isdir(log_file):
+        matches = batted_balls_from_event_store(log_file)
+    else:
+        with open(log_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # Find batted ball sections with outcome
+        bb_pattern = r'BATTED BALL: (\w+).*?OutcomeCodePA: (\w+)'
+        matches = re.findall(bb_pattern, content, re.DOTALL)
 
     stats = {
         'LINE_DRIVE': {'hits': 0, 'outs': 0, 'hr': 0},
@@ -13,10 +50,6 @@ def analyze_babip(log_file):
         'POPUP': {'hits': 0, 'outs': 0, 'hr': 0},
     }
 
-    # Find batted ball sections with outcome
-    bb_pattern = r'BATTED BALL: (\w+).*?OutcomeCodePA: (\w+)'
-    matches = re.findall(bb_pattern, content, re.DOTALL)
-
     for bb_type, outcome in matches:
         bb_type = bb_type.upper()
         if bb_type not in stats:
@@ -1,11 +1,51 @@
 """
 Analyze why ground ball BABIP is too low (.056 vs target .200-.250).
+
+Usage:
+    python analyze_ground_balls.py                         # latest game log
+    python analyze_ground_balls.py game_logs/game_log_X.txt
+    python analyze_ground_balls.py runs/season_2025        # EventStore directory
 """
 
 import os
 import re
+import sys
 from collections import defaultdict
 
+import numpy as np
+
+
+def ground_balls_from_event_store(store_dir):
+    """Ground ball plays from a saved EventStore.
+
+    Loads plays.npy memory-mapped; no text parsing. Returns the same dicts as
+    analyze_game_log, with 'line' holding the play's row index.
+    """
+    from batted_ball.event_store import EventStore
+
+    store = EventStore.load(store_dir)
+    plays = store.plays
+    # Same launch angle bucket as BattedBallMetrics.hit_type
+    rows = np.flatnonzero(plays['launch_angle'] < 10)
+    plays = plays[rows]
+
+    outcomes = store.decode('pa_outcome', plays['outcome'])
+    is_out = np.char.startswith(outcomes.astype(str), 'OUT') | (outcomes == 'DOUBLE_PLAY')
+    outcomes = np.where(is_out, 'OUT', outcomes)
+
+    return [
+        {
+            'outcome': str(outcome),
+            'exit_velocity': float(ev),
+            'land_x': float(land_x),
+            'land_y': float(land_y),
+            'line': int(row),
+        }
+        for outcome, ev, land_x, land_y, row in zip(
+            outcomes, plays['exit_velocity'], plays['landing_x'], plays['landing_y'], rows)
+    ]
+
+
 def analyze_game_log(log_path):
     """Parse game log for ground ball and fielding data."""
     
@@ -66,19 +106,25 @@ def analyze_game_log(log_path):
 
 
 def main():
-    log_dir = "game_logs"
-    
-    logs = sorted([f for f in os.listdir(log_dir) if f.endswith('.txt')], reverse=True)
-    
-    if not logs:
-        print("No game logs found")
-        return
-    
-    log_path = os.path.join(log_dir, logs[0])
+    if len(sys.argv) > 1:
+        log_path = sys.argv[1]
+    else:
+        log_dir = "game_logs"
+
+        logs = sorted([f for f in os.listdir(log_dir) if f.endswith('.txt')], reverse=True)
+
+        if not logs:
+            print("No game logs found")
+            return
+
+        log_path = os.path.join(log_dir, logs[0])
     print(f"Analyzing: {log_path}")
     print()
-    
-    outcomes = analyze_game_log(log_path)
+
+    if os.path.isdir(log_path):
+        outcomes = ground_balls_from_event_store(log_path)
+    else:
+        outcomes = analyze_game_log(log_path)
     
     # Summarize
     outcome_counts = defaultdict(int)
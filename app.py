@@ -18,6 +18,7 @@ from batted_ball.database.team_loader import TeamLoader
 from batted_ball.sim_metrics import DebugLevel
 from batted_ball.series_metrics import SeriesMetrics
 from batted_ball.constants import SimulationMode
+from batted_ball.concurrency import ConcurrencyBudget
 from batted_ball.parallel_worker import (
     ParallelGameResult, 
     MockGameState, 
@@ -346,7 +347,8 @@ def main():
                 # Use spawn context explicitly for Windows compatibility
                 games_completed = 0
                 ctx = multiprocessing.get_context('spawn')
-                with ctx.Pool(processes=num_workers) as pool:
+                budget = ConcurrencyBudget.for_processes(num_workers)
+                with ctx.Pool(processes=num_workers, **budget.pool_kwargs(ctx)) as pool:
                     # imap_unordered returns results as they complete
                     for result in pool.imap_unordered(simulate_game_worker, game_args, chunksize=1):
                         games_completed += 1
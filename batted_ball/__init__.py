@@ -13,6 +13,7 @@ Includes:
 """
 
 from .trajectory import BattedBallSimulator, BattedBallResult
+from .trajectory_spline import TrajectorySpline
 from .environment import Environment, create_standard_environment, create_coors_field_environment
 from .contact import adjust_for_contact_point, ContactModel
 from .pitch import (
@@ -29,6 +30,7 @@ from .pitch import (
     create_knuckleball,
 )
 from .player import Pitcher, Hitter
+from .arsenal import PitcherArsenal
 from .at_bat import AtBatSimulator, AtBatResult
 
 # Fielding and baserunning modules
@@ -37,9 +39,12 @@ from .field_layout import (
     FieldPosition,
     BaseLocation,
     DefensivePosition,
+    AlignmentIndex,
     create_standard_field,
     distance_between_positions,
     position_from_coordinates,
+    positions_to_array,
+    positions_from_array,
     get_standard_defensive_alignment,
 )
 from .fielding import (
@@ -48,8 +53,11 @@ from .fielding import (
     ThrowResult,
     DetailedThrowResult,
     RelayThrowResult,
+    ThrowParameters,
+    ReachEnvelope,
     FieldingSimulator,
     simulate_fielder_throw,
+    throw_arrival_times,
     simulate_relay_throw,
     determine_cutoff_man,
     create_elite_fielder,
@@ -88,6 +96,16 @@ from .game_simulation import (
     PlayByPlayEvent,
     create_test_team,
 )
+from .log_writer import (
+    GameLogWriter,
+    LogLevel,
+)
+from .event_store import (
+    EventStore,
+    PITCH_EVENT_DTYPE,
+    PLAY_EVENT_DTYPE,
+)
+from .decision_surface import DecisionSurface
 from .series_metrics import (
     SeriesMetrics,
     AdvancedBattingMetrics,
@@ -129,6 +147,12 @@ from .ballpark import (
     list_available_parks,
     MLB_BALLPARKS,
 )
+from .park_factors import (
+    ParkFactorEngine,
+    ParkFactorResults,
+    ParkEnvironment,
+    BattedBallSample,
+)
 
 from .constants import *
 from .constants import SimulationMode, get_dt_for_mode
@@ -140,15 +164,18 @@ try:
         ResultObjectPool,
         OptimizedAerodynamicForces,
         UltraFastMode,
-        PerformanceTracker
+        PerformanceTracker,
+        PhaseProfiler,
     )
     from .bulk_simulation import BulkAtBatSimulator, BulkSimulationSettings, BulkSimulationResult
+    from .vectorized_at_bat import VectorizedAtBatEngine, VectorizedAtBatResults
     from .parallel_game_simulation import (
         ParallelGameSimulator,
         ParallelSimulationSettings,
         ParallelSimulationResult,
         GameResult
     )
+    from .concurrency import ConcurrencyBudget
     _PERFORMANCE_AVAILABLE = True
 except ImportError:
     _PERFORMANCE_AVAILABLE = False
@@ -180,6 +207,7 @@ __all__ = [
     # Core trajectory simulation
     'BattedBallSimulator',
     'BattedBallResult',
+    'TrajectorySpline',
     'Environment',
     'create_standard_environment',
     'create_coors_field_environment',
@@ -201,6 +229,7 @@ __all__ = [
     
     # Player attributes and at-bat
     'Pitcher',
+    'PitcherArsenal',
     'Hitter',
     'AtBatSimulator',
     'AtBatResult',
@@ -210,9 +239,12 @@ __all__ = [
     'FieldPosition',
     'BaseLocation',
     'DefensivePosition',
+    'AlignmentIndex',
     'create_standard_field',
     'distance_between_positions',
     'position_from_coordinates',
+    'positions_to_array',
+    'positions_from_array',
     'get_standard_defensive_alignment',
     
     # Fielding mechanics
@@ -221,8 +253,11 @@ __all__ = [
     'ThrowResult',
     'DetailedThrowResult',
     'RelayThrowResult',
+    'ThrowParameters',
+    'ReachEnvelope',
     'FieldingSimulator',
     'simulate_fielder_throw',
+    'throw_arrival_times',
     'simulate_relay_throw',
     'determine_cutoff_man',
     'create_elite_fielder',
@@ -256,6 +291,12 @@ __all__ = [
     'BaseState',
     'PlayByPlayEvent',
     'create_test_team',
+    'GameLogWriter',
+    'LogLevel',
+    'EventStore',
+    'PITCH_EVENT_DTYPE',
+    'PLAY_EVENT_DTYPE',
+    'DecisionSurface',
 
     # Statistics tracking
     'Scorekeeper',
@@ -278,6 +319,10 @@ __all__ = [
     'get_ballpark',
     'list_available_parks',
     'MLB_BALLPARKS',
+    'ParkFactorEngine',
+    'ParkFactorResults',
+    'ParkEnvironment',
+    'BattedBallSample',
 ]
 
 # Add performance modules if available
@@ -288,13 +333,17 @@ if _PERFORMANCE_AVAILABLE:
         'OptimizedAerodynamicForces',
         'UltraFastMode',
         'PerformanceTracker',
+        'PhaseProfiler',
         'BulkAtBatSimulator',
         'BulkSimulationSettings',
         'BulkSimulationResult',
+        'VectorizedAtBatEngine',
+        'VectorizedAtBatResults',
         'ParallelGameSimulator',
         'ParallelSimulationSettings',
         'ParallelSimulationResult',
-        'GameResult'
+        'GameResult',
+        'ConcurrencyBudget'
     ])
 
 # Add pybaseball integration if available
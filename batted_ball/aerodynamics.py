@@ -177,6 +177,43 @@ def _lookup_cd_cl(v_mag, spin_rpm, cd_table, cl_table):
     return cd, cl
 
 
+def lookup_cd_cl_batch(v_mag, spin_rpm, cd_table, cl_table):
+    """
+    Vectorized _lookup_cd_cl() for arrays of velocities and spin rates.
+
+    Parameters
+    ----------
+    v_mag, spin_rpm : np.ndarray
+        Velocity magnitudes (m/s) and spin rates (rpm), same shape
+    cd_table, cl_table : np.ndarray
+        Pre-computed coefficient tables
+
+    Returns
+    -------
+    tuple of (cd, cl) arrays
+    """
+    v_clamped = np.clip(v_mag, _LUT_V_MIN, _LUT_V_MAX - _LUT_V_STEP)
+    s_clamped = np.clip(spin_rpm, _LUT_S_MIN, _LUT_S_MAX - _LUT_S_STEP)
+
+    v_pos = (v_clamped - _LUT_V_MIN) / _LUT_V_STEP
+    s_pos = (s_clamped - _LUT_S_MIN) / _LUT_S_STEP
+    v_idx = np.minimum(v_pos.astype(np.intp), _LUT_V_COUNT - 2)
+    s_idx = np.minimum(s_pos.astype(np.intp), _LUT_S_COUNT - 2)
+    v_frac = np.clip(v_pos - v_idx, 0.0, 1.0)
+    s_frac = np.clip(s_pos - s_idx, 0.0, 1.0)
+
+    w00 = (1.0 - v_frac) * (1.0 - s_frac)
+    w01 = (1.0 - v_frac) * s_frac
+    w10 = v_frac * (1.0 - s_frac)
+    w11 = v_frac * s_frac
+
+    cd = (cd_table[v_idx, s_idx] * w00 + cd_table[v_idx, s_idx + 1] * w01 +
+          cd_table[v_idx + 1, s_idx] * w10 + cd_table[v_idx + 1, s_idx + 1] * w11)
+    cl = (cl_table[v_idx, s_idx] * w00 + cl_table[v_idx, s_idx + 1] * w01 +
+          cl_table[v_idx + 1, s_idx] * w10 + cl_table[v_idx + 1, s_idx + 1] * w11)
+    return cd, cl
+
+
 @njit(cache=True)
 def aerodynamic_force_tuple_lookup(position, velocity, spin_axis_x, spin_axis_y, spin_axis_z,
                                     spin_rate_rpm, cd_base, air_density, cross_area,
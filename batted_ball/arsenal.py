@@ -0,0 +1,257 @@
+"""
+Per-game pitcher arsenal cache.
+
+AtBatSimulator used to rebuild every pitch from scratch: an if/elif ladder
+picked a create_*() factory (new spin axis array, normalized), and the
+velocity and spin getters re-read the attributes and stamina on every call.
+Pitch selection rebuilt its weight dict and normalized it through
+np.random.choice.
+
+A PitcherArsenal is built once per game per pitcher (Pitcher.get_arsenal())
+and holds, for every pitch type the pitcher throws:
+- a template PitchType with the fresh velocity, spin, axis and efficiency
+- the Statcast whiff multiplier and usage weight
+- the count-based selection weights for all 12 counts
+
+Fatigue is applied per pitch as the same scalar velocity/spin deltas the
+Pitcher getters use, and selection is a cumulative-weight draw that consumes
+the same single uniform random number as np.random.choice did.
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .pitch import (
+    PitchType,
+    create_fastball_4seam,
+    create_fastball_2seam,
+    create_cutter,
+    create_curveball,
+    create_slider,
+    create_changeup,
+    create_splitter,
+)
+
+
+# Pitch name → (Pitcher getter key, factory); unknown names throw a fastball
+PITCH_FACTORIES = {
+    'fastball': ('fastball', create_fastball_4seam),
+    '4-seam': ('fastball', create_fastball_4seam),
+    '2-seam': ('2-seam', create_fastball_2seam),
+    'sinker': ('2-seam', create_fastball_2seam),
+    'cutter': ('cutter', create_cutter),
+    'curveball': ('curveball', create_curveball),
+    'curve': ('curveball', create_curveball),
+    'slider': ('slider', create_slider),
+    'changeup': ('changeup', create_changeup),
+    'change': ('changeup', create_changeup),
+    'splitter': ('splitter', create_splitter),
+}
+DEFAULT_PITCH_FACTORY = ('fastball', create_fastball_4seam)
+
+# Fatigue at full stamina depletion (see Pitcher.get_pitch_velocity_mph/_spin_rpm)
+FATIGUE_VELOCITY_LOSS_MPH = 4.0
+FATIGUE_SPIN_LOSS_FRACTION = 0.12
+MIN_PITCH_VELOCITY_MPH = 70.0
+
+BREAKING_OFFSPEED = ('slider', 'curveball', 'splitter', 'changeup')
+FASTBALLS = ('fastball', '4-seam', '2-seam', 'cutter')
+FOUR_SEAMS = ('fastball', '4-seam')
+PUT_AWAY_PITCHES = ('slider', 'changeup', 'splitter')
+
+
+def count_weight_multiplier(pitch_type: str, balls: int, strikes: int) -> float:
+    """Selection weight multiplier for a pitch type in a count."""
+    # Calculate count leverage
+    # Positive = pitcher ahead, negative = hitter ahead
+    leverage = strikes - balls
+
+    if leverage >= 2:
+        # Pitcher ahead (0-2, 1-2, 2-2) - can waste pitch
+        if pitch_type in BREAKING_OFFSPEED:
+            return 1.5  # Favor breaking/offspeed
+    elif leverage <= -2:
+        # Hitter ahead (3-0, 3-1) - need strike
+        if pitch_type in FASTBALLS:
+            return 2.0  # Strongly favor fastballs
+        return 0.3  # Reduce breaking balls
+    elif balls == 3 and strikes < 2:
+        # 3-ball count - must throw strike
+        if pitch_type in FOUR_SEAMS:
+            return 2.5
+        return 0.2
+    elif strikes == 2:
+        # Two-strike count - put-away pitch (Sprint 8 baseline)
+        if pitch_type in PUT_AWAY_PITCHES:
+            return 1.8  # Favor out pitches
+    return 1.0
+
+
+class ArsenalPitch(NamedTuple):
+    """Fresh (unfatigued) parameters for one pitch type."""
+    pitch_type: str
+    template: PitchType        # Fresh velocity/spin, normalized axis, efficiency
+    velocity_mph: float
+    spin_rpm: float
+    whiff_multiplier: float
+    usage_weight: float        # Base selection weight (usage / 100)
+
+
+class PitcherArsenal:
+    """
+    Precomputed pitch parameters and selection weights for one pitcher.
+
+    Parameters
+    ----------
+    pitcher : Pitcher
+        Pitcher whose attributes, pitch_arsenal and pitch_effectiveness
+        define the arsenal
+    """
+
+    def __init__(self, pitcher):
+        self.pitcher = pitcher
+        attributes = pitcher.attributes
+        self.source = (attributes.profile, pitcher.pitch_arsenal, pitcher.pitch_effectiveness)
+        self.stamina_pitches = attributes.get_stamina_pitches()
+
+        self.pitches: Dict[str, ArsenalPitch] = {}
+        self.pitch_types: Tuple[str, ...] = tuple(pitcher.pitch_arsenal)
+        for pitch_type in self.pitch_types:
+            self._add_pitch(pitch_type)
+
+        # Selection weights before sequencing, per count
+        self.count_weights: Dict[Tuple[int, int], List[float]] = {
+            (balls, strikes): [
+                self.pitches[pitch_type].usage_weight
+                * count_weight_multiplier(pitch_type, balls, strikes)
+                for pitch_type in self.pitch_types
+            ]
+            for balls in range(4)
+            for strikes in range(3)
+        }
+
+    def _add_pitch(self, pitch_type: str) -> ArsenalPitch:
+        pitcher = self.pitcher
+        key, factory = PITCH_FACTORIES.get(pitch_type, DEFAULT_PITCH_FACTORY)
+        velocity = max(pitcher.get_fresh_pitch_velocity_mph(key), MIN_PITCH_VELOCITY_MPH)
+        spin = pitcher.get_fresh_pitch_spin_rpm(key)
+
+        pitch_data = pitcher.pitch_arsenal.get(pitch_type, {})
+        entry = ArsenalPitch(
+            pitch_type=pitch_type,
+            template=factory(velocity, spin),
+            velocity_mph=velocity,
+            spin_rpm=spin,
+            whiff_multiplier=pitcher.get_pitch_whiff_multiplier(pitch_type),
+            usage_weight=pitch_data.get('usage', 50) / 100.0,  # Base weight from usage rating
+        )
+        self.pitches[pitch_type] = entry
+        return entry
+
+    def is_current(self) -> bool:
+        """True if the pitcher's attributes and arsenal dicts are unchanged."""
+        pitcher = self.pitcher
+        profile, pitch_arsenal, pitch_effectiveness = self.source
+        return (pitcher.attributes.profile is profile
+                and pitcher.pitch_arsenal is pitch_arsenal
+                and pitcher.pitch_effectiveness is pitch_effectiveness)
+
+    def get(self, pitch_type: str) -> ArsenalPitch:
+        """Arsenal entry for a pitch type (built on first use if not thrown)."""
+        entry = self.pitches.get(pitch_type)
+        if entry is None:
+            entry = self._add_pitch(pitch_type)
+        return entry
+
+    def stamina_factor(self, pitches_thrown: Optional[int] = None) -> float:
+        """Remaining stamina fraction (1.0 = fresh, 0.0 = exhausted)."""
+        if pitches_thrown is None:
+            pitches_thrown = self.pitcher.pitches_thrown
+        return max(0.0, 1.0 - (pitches_thrown / self.stamina_pitches))
+
+    def build_pitch(self, pitch_type: str, pitches_thrown: Optional[int] = None):
+        """
+        PitchType for the next pitch with fatigue applied.
+
+        Parameters
+        ----------
+        pitch_type : str
+            Pitch name (aliases and unknown names as in PITCH_FACTORIES)
+        pitches_thrown : int, optional
+            Pitch count for fatigue (default: the pitcher's current count)
+
+        Returns
+        -------
+        tuple
+            (PitchType, velocity_mph, spin_rpm)
+        """
+        entry = self.get(pitch_type)
+        fatigue = 1.0 - self.stamina_factor(pitches_thrown)
+        velocity = max(entry.velocity_mph - fatigue * FATIGUE_VELOCITY_LOSS_MPH,
+                       MIN_PITCH_VELOCITY_MPH)
+        spin = entry.spin_rpm * (1.0 - fatigue * FATIGUE_SPIN_LOSS_FRACTION)
+        return entry.template.adjusted(velocity, spin), velocity, spin
+
+    def select_pitch_type(self, count: Tuple[int, int], recent_pitches: List[str] = None) -> str:
+        """
+        Select pitch type based on count, arsenal, and pitch sequencing.
+
+        Parameters
+        ----------
+        count : tuple
+            (balls, strikes)
+        recent_pitches : list, optional
+            Last 1-2 pitch types thrown (for sequencing)
+
+        Returns
+        -------
+        str
+            Selected pitch type from pitcher's arsenal
+        """
+        pitch_types = self.pitch_types
+        if not pitch_types:
+            return 'fastball'
+
+        weights = self.count_weights.get(count)
+        if weights is None:
+            weights = [
+                self.pitches[pitch_type].usage_weight
+                * count_weight_multiplier(pitch_type, count[0], count[1])
+                for pitch_type in pitch_types
+            ]
+
+        if recent_pitches:
+            last_pitch = recent_pitches[-1]
+            before_last = recent_pitches[-2] if len(recent_pitches) >= 2 else None
+            sequenced = []
+            for pitch_type, weight in zip(pitch_types, weights):
+                # Pitch sequencing - avoid repeating same pitch
+                if pitch_type == last_pitch:
+                    weight *= 0.3  # Strongly discourage same pitch
+                if pitch_type == before_last:
+                    weight *= 0.5  # Discourage pitch from 2 ago
+
+                # Set-up sequences (fastball -> offspeed)
+                if last_pitch in FOUR_SEAMS and pitch_type in ('changeup', 'splitter'):
+                    weight *= 1.3  # Favor changeup/splitter after fastball
+                elif last_pitch in ('curveball', 'slider') and pitch_type in FOUR_SEAMS:
+                    weight *= 1.2  # Favor fastball after breaking ball
+                sequenced.append(weight)
+            weights = sequenced
+
+        # Weighted random selection: cumulative weights normalized the way
+        # np.random.choice does, searched with one uniform draw
+        weights = [max(weight, 0.01) for weight in weights]  # Ensure positive weight
+        total = 0.0
+        for weight in weights:
+            total += weight
+        cumulative = []
+        running = 0.0
+        for weight in weights:
+            running += weight / total
+            cumulative.append(running)
+        last = cumulative[-1]
+        cumulative = [value / last for value in cumulative]
+        return pitch_types[bisect_right(cumulative, np.random.random())]
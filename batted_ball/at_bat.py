@@ -8,18 +8,10 @@ Simulates realistic plate appearances using:
 """
 
 import numpy as np
+from time import perf_counter
 from typing import Dict, List, Optional, Tuple
 from .player import Pitcher, Hitter
-from .pitch import (
-    PitchSimulator,
-    create_fastball_4seam,
-    create_fastball_2seam,
-    create_cutter,
-    create_curveball,
-    create_slider,
-    create_changeup,
-    create_splitter,
-)
+from .pitch import PitchSimulator
 from .contact import ContactModel
 from .trajectory import BattedBallSimulator
 from .pitcher_control import PitcherControlModule
@@ -100,6 +92,7 @@ class AtBatSimulator:
         metrics_collector=None,
         debug_collector=None,
         catcher_framing_rating: float = 50000.0,
+        profiler=None,
     ):
         """
         Initialize at-bat simulator.
@@ -136,6 +129,8 @@ class AtBatSimulator:
         catcher_framing_rating : float, optional
             Catcher's framing ability (0-100k scale) for V2 umpire model
             Default: 50000 (average MLB catcher)
+        profiler : PhaseProfiler, optional
+            Phase timers/counters for hot-path profiling (default: None = off)
         """
         self.pitcher = pitcher
         self.hitter = hitter
@@ -145,8 +140,12 @@ class AtBatSimulator:
         self.wind_speed = wind_speed
         self.wind_direction = wind_direction
         self.metrics_collector = metrics_collector
+        # Resolved once so the per-pitch check is a single attribute read and
+        # no metric dataclasses are built when the collector is absent or OFF
+        self._record_metrics = metrics_collector is not None and metrics_collector.enabled
         self.debug_collector = debug_collector
         self.catcher_framing_rating = catcher_framing_rating
+        self.profiler = profiler
         
         # Determine simulation mode
         if simulation_mode is not None:
@@ -292,73 +291,9 @@ class AtBatSimulator:
         str
             Selected pitch type from pitcher's arsenal
         """
-        if recent_pitches is None:
-            recent_pitches = []
-
-        arsenal = list(self.pitcher.pitch_arsenal.keys())
-
-        if not arsenal:
-            return 'fastball'
-
-        balls, strikes = count
-
-        # Calculate count leverage
-        # Positive = pitcher ahead, negative = hitter ahead
-        leverage = strikes - balls
-
-        # Build weighted selection based on situation
-        pitch_weights = {}
-
-        for pitch_type in arsenal:
-            pitch_data = self.pitcher.pitch_arsenal[pitch_type]
-            weight = pitch_data.get('usage', 50) / 100.0  # Base weight from usage rating
-
-            # Adjust based on count leverage
-            if leverage >= 2:
-                # Pitcher ahead (0-2, 1-2, 2-2) - can waste pitch
-                if pitch_type in ['slider', 'curveball', 'splitter', 'changeup']:
-                    weight *= 1.5  # Favor breaking/offspeed
-            elif leverage <= -2:
-                # Hitter ahead (3-0, 3-1) - need strike
-                if pitch_type in ['fastball', '4-seam', '2-seam', 'cutter']:
-                    weight *= 2.0  # Strongly favor fastballs
-                else:
-                    weight *= 0.3  # Reduce breaking balls
-            elif balls == 3 and strikes < 2:
-                # 3-ball count - must throw strike
-                if pitch_type in ['fastball', '4-seam']:
-                    weight *= 2.5
-                else:
-                    weight *= 0.2
-            elif strikes == 2:
-                # Two-strike count - put-away pitch (Sprint 8 baseline)
-                if pitch_type in ['slider', 'changeup', 'splitter']:
-                    weight *= 1.8  # Favor out pitches
-
-            # Pitch sequencing - avoid repeating same pitch
-            if recent_pitches:
-                if pitch_type == recent_pitches[-1]:
-                    weight *= 0.3  # Strongly discourage same pitch
-                if len(recent_pitches) >= 2 and pitch_type == recent_pitches[-2]:
-                    weight *= 0.5  # Discourage pitch from 2 ago
-
-            # Set-up sequences (fastball -> offspeed)
-            if recent_pitches and len(recent_pitches) >= 1:
-                last_pitch = recent_pitches[-1]
-                if last_pitch in ['fastball', '4-seam'] and pitch_type in ['changeup', 'splitter']:
-                    weight *= 1.3  # Favor changeup/splitter after fastball
-                elif last_pitch in ['curveball', 'slider'] and pitch_type in ['fastball', '4-seam']:
-                    weight *= 1.2  # Favor fastball after breaking ball
-
-            pitch_weights[pitch_type] = max(weight, 0.01)  # Ensure positive weight
-
-        # Weighted random selection
-        pitch_types = list(pitch_weights.keys())
-        weights = list(pitch_weights.values())
-        weights_array = np.array(weights)
-        weights_array /= weights_array.sum()  # Normalize
-
-        return np.random.choice(pitch_types, p=weights_array)
+        # Count and sequencing weights over the pitcher's cached arsenal
+        # (see arsenal.PitcherArsenal.select_pitch_type)
+        return self.pitcher.get_arsenal().select_pitch_type(count, recent_pitches)
 
     def select_target_location(
         self,
@@ -600,40 +535,9 @@ class AtBatSimulator:
         actual_target_h = target_location[0] + h_error
         actual_target_v = target_location[1] + v_error
 
-        # Create pitch type with pitcher's attributes
-        if pitch_type == 'fastball' or pitch_type == '4-seam':
-            velocity = self.pitcher.get_pitch_velocity_mph('fastball')
-            spin = self.pitcher.get_pitch_spin_rpm('fastball', 2200)
-            pitch = create_fastball_4seam(velocity, spin)
-        elif pitch_type == '2-seam' or pitch_type == 'sinker':
-            velocity = self.pitcher.get_pitch_velocity_mph('2-seam')
-            spin = self.pitcher.get_pitch_spin_rpm('2-seam', 2100)
-            pitch = create_fastball_2seam(velocity, spin)
-        elif pitch_type == 'cutter':
-            velocity = self.pitcher.get_pitch_velocity_mph('cutter')
-            spin = self.pitcher.get_pitch_spin_rpm('cutter', 2200)
-            pitch = create_cutter(velocity, spin)
-        elif pitch_type == 'curveball' or pitch_type == 'curve':
-            velocity = self.pitcher.get_pitch_velocity_mph('curveball')
-            spin = self.pitcher.get_pitch_spin_rpm('curveball', 2500)
-            pitch = create_curveball(velocity, spin)
-        elif pitch_type == 'slider':
-            velocity = self.pitcher.get_pitch_velocity_mph('slider')
-            spin = self.pitcher.get_pitch_spin_rpm('slider', 2400)
-            pitch = create_slider(velocity, spin)
-        elif pitch_type == 'changeup' or pitch_type == 'change':
-            velocity = self.pitcher.get_pitch_velocity_mph('changeup')
-            spin = self.pitcher.get_pitch_spin_rpm('changeup', 1750)
-            pitch = create_changeup(velocity, spin)
-        elif pitch_type == 'splitter':
-            velocity = self.pitcher.get_pitch_velocity_mph('splitter')
-            spin = self.pitcher.get_pitch_spin_rpm('splitter', 1500)
-            pitch = create_splitter(velocity, spin)
-        else:
-            # Default to fastball
-            velocity = self.pitcher.get_pitch_velocity_mph('fastball')
-            spin = self.pitcher.get_pitch_spin_rpm('fastball', 2200)
-            pitch = create_fastball_4seam(velocity, spin)
+        # Pitch type from the pitcher's cached arsenal with fatigue applied
+        arsenal = self.pitcher.get_arsenal()
+        pitch, velocity, spin = arsenal.build_pitch(pitch_type)
 
         # Simulate pitch with physics
         extension = self.pitcher.get_release_extension_feet()
@@ -641,6 +545,10 @@ class AtBatSimulator:
         from .constants import MOUND_DISTANCE
         release_distance = MOUND_DISTANCE - extension
 
+        profiler = self.profiler
+        if profiler is not None:
+            t0 = perf_counter()
+
         result = self.pitch_sim.simulate(
             pitch,
             target_x=actual_target_h / 12.0,  # Convert inches to feet
@@ -652,9 +560,13 @@ class AtBatSimulator:
             fast_mode=self.fast_mode,
         )
 
+        if profiler is not None:
+            profiler.record('pitch_flight', perf_counter() - t0)
+            profiler.count('pitches')
+            profiler.count('pitch_steps', len(result.time))
+
         # Calculate fatigue metrics BEFORE updating pitcher state
-        stamina_cap = self.pitcher.attributes.get_stamina_pitches()
-        fatigue_level = min(1.0, self.pitcher.pitches_thrown / stamina_cap)
+        fatigue_level = min(1.0, self.pitcher.pitches_thrown / arsenal.stamina_pitches)
 
         # Estimate velocity penalty (from player.py logic)
         velocity_penalty = fatigue_level * 4.0  # Up to 4 mph loss when exhausted
@@ -734,7 +646,7 @@ class AtBatSimulator:
 
         # NEW: Apply pitcher's pitch-specific effectiveness (stuff rating)
         # Elite pitchers with great stuff on a specific pitch get more whiffs
-        pitcher_whiff_mult = self.pitcher.get_pitch_whiff_multiplier(pitch_type)
+        pitcher_whiff_mult = self.pitcher.get_arsenal().get(pitch_type).whiff_multiplier
         whiff_prob = base_whiff_prob * pitcher_whiff_mult
 
         # PHASE 2A SPRINT 3: Put-away mechanism for 2-strike counts
@@ -850,6 +762,10 @@ class AtBatSimulator:
             # Fallback to typical downward angle if not available
             pitch_trajectory_angle = 7.0
 
+        profiler = self.profiler
+        if profiler is not None:
+            t0 = perf_counter()
+
         # Contact made - simulate with physics
         collision_result = self.contact_model.full_collision(
             bat_speed_mph=bat_speed,
@@ -904,6 +820,10 @@ class AtBatSimulator:
             hitter_spray_tendency=base_spray
         )
 
+        if profiler is not None:
+            t1 = perf_counter()
+            profiler.record('contact', t1 - t0)
+
         # Simulate batted ball trajectory with environmental conditions including wind
         # Use adjusted EV and LA from Phase 3 EV-LA correlation
         batted_ball_result = self.batted_ball_sim.simulate(
@@ -918,6 +838,11 @@ class AtBatSimulator:
             fast_mode=self.fast_mode,
         )
 
+        if profiler is not None:
+            profiler.record('batted_ball_flight', perf_counter() - t1)
+            profiler.count('batted_balls')
+            profiler.count('batted_ball_steps', len(batted_ball_result.time))
+
         # Determine contact quality based on adjusted offset and location
         contact_quality = self._determine_contact_quality(adjusted_offset, pitch_location, pitch_data.get('is_strike', True))
         
@@ -1119,6 +1044,8 @@ class AtBatSimulator:
                       f"{pitch_data['velocity_plate']:.1f} mph")
 
             # Hitter decides whether to swing (with diagnostics)
+            if self.profiler is not None:
+                t0 = perf_counter()
             should_swing, swing_diagnostics = self.hitter.decide_to_swing(
                 pitch_data['final_location'],
                 pitch_data['is_strike'],
@@ -1128,6 +1055,8 @@ class AtBatSimulator:
                 return_diagnostics=True,
                 debug_collector=self.debug_collector,
             )
+            if self.profiler is not None:
+                self.profiler.record('swing_decision', perf_counter() - t0)
 
             # Store swing decision diagnostics in pitch data
             pitch_data['swing_decision'] = swing_diagnostics
@@ -1171,7 +1100,7 @@ class AtBatSimulator:
                     pitch_data['pitch_outcome'] = 'contact'
 
                     # Record batted ball metrics if collector is enabled
-                    if self.metrics_collector and self.metrics_collector.enabled:
+                    if self._record_metrics:
                         self._record_batted_ball_metrics(contact_result, pitch_data)
 
                     if verbose:
@@ -1272,7 +1201,7 @@ class AtBatSimulator:
             pitch_data['count_after'] = (balls, strikes)
 
             # Record pitch metrics if collector is enabled
-            if self.metrics_collector and self.metrics_collector.enabled:
+            if self._record_metrics:
                 self._record_pitch_metrics(pitch_data, len(pitches) + 1)
 
             pitches.append(pitch_data)
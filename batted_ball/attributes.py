@@ -10,6 +10,9 @@ Author: Claude Code
 """
 
 import numpy as np
+import inspect
+from functools import partial, wraps
+from operator import attrgetter
 from typing import Dict, Tuple
 
 
@@ -57,8 +60,11 @@ def piecewise_logistic_map(
     Returns
     -------
     float
-        Mapped physical value
+        Mapped physical value (array of values for ndarray ratings)
     """
+    if isinstance(rating, np.ndarray):
+        return piecewise_logistic_map_array(rating, human_min, human_cap, super_cap, H, k, k2)
+
     rating = np.clip(rating, 0, 100000)
 
     if rating <= H:
@@ -85,6 +91,9 @@ def piecewise_logistic_map_inverse(
 
     Maps 0 → human_cap (worst), H → human_min (best human), 100k → super_cap (best super)
     """
+    if isinstance(rating, np.ndarray):
+        return piecewise_logistic_map_inverse_array(rating, human_min, human_cap, super_cap, H, k, k2)
+
     rating = np.clip(rating, 0, 100000)
 
     if rating <= H:
@@ -95,11 +104,256 @@ def piecewise_logistic_map_inverse(
         return human_min - (human_min - super_cap) * sigmoid(x)
 
 
+def piecewise_logistic_map_array(
+    ratings,
+    human_min: float,
+    human_cap: float,
+    super_cap: float,
+    H: float = 85000.0,
+    k: float = 8.0,
+    k2: float = 5.0
+) -> np.ndarray:
+    """
+    Vectorized piecewise_logistic_map over an array of ratings.
+
+    Both branches are evaluated for every element and selected with np.where,
+    so a whole roster (or league) maps in one call. Element-wise results match
+    the scalar function.
+
+    Parameters
+    ----------
+    ratings : array_like
+        Attribute ratings (0-100,000)
+    human_min, human_cap, super_cap, H, k, k2
+        Same as piecewise_logistic_map
+
+    Returns
+    -------
+    np.ndarray
+        Mapped physical values (float64, same shape as ratings)
+    """
+    ratings = np.clip(np.asarray(ratings, dtype=np.float64), 0, 100000)
+    human = human_min + (human_cap - human_min) * sigmoid((ratings / H) * k - k/2)
+    superhuman = human_cap + (super_cap - human_cap) * sigmoid(
+        ((ratings - H) / (100000 - H)) * k2 - k2/2
+    )
+    return np.where(ratings <= H, human, superhuman)
+
+
+def piecewise_logistic_map_inverse_array(
+    ratings,
+    human_min: float,
+    human_cap: float,
+    super_cap: float,
+    H: float = 85000.0,
+    k: float = 8.0,
+    k2: float = 5.0
+) -> np.ndarray:
+    """
+    Vectorized piecewise_logistic_map_inverse over an array of ratings.
+
+    Returns
+    -------
+    np.ndarray
+        Mapped physical values (float64, same shape as ratings)
+    """
+    ratings = np.clip(np.asarray(ratings, dtype=np.float64), 0, 100000)
+    human = human_cap - (human_cap - human_min) * sigmoid((ratings / H) * k - k/2)
+    superhuman = human_min - (human_min - super_cap) * sigmoid(
+        ((ratings - H) / (100000 - H)) * k2 - k2/2
+    )
+    return np.where(ratings <= H, human, superhuman)
+
+
+# =============================================================================
+# PHYSICAL PROFILES (precomputed getter values)
+# =============================================================================
+
+class PhysicalProfile:
+    """
+    Immutable snapshot of every physical value derived from an attributes object.
+
+    Fields are named after the zero-argument getters without the ``get_``
+    prefix (``HitterProfile.bat_speed_mph`` == ``get_bat_speed_mph()``) and
+    hold plain Python floats, so hot paths read them without re-running
+    piecewise_logistic_map.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *values: float):
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), tuple(getattr(self, name) for name in self.__slots__))
+
+    def as_dict(self) -> Dict[str, float]:
+        """Profile values keyed by field name."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name):.4g}" for name in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+
+# Marks an attributes object whose profile is being compiled (getters compute
+# directly instead of recursing into compile_profile)
+_COMPILING = object()
+
+
+class _ProfiledAttributes:
+    """
+    Mixin that compiles an attributes object into a PhysicalProfile.
+
+    The profile is compiled lazily on the first getter call (or explicitly via
+    compile_profile()) and reused until any attribute is assigned, which
+    invalidates it. Ratings that change mid-game (e.g. an injury or a
+    calibration tweak) therefore only need a normal assignment, or an explicit
+    invalidate_profile() after in-place changes.
+    """
+
+    _PROFILE_CLASS = None    # Set by _install_profile()
+    _PROFILE_COMPUTES = ()   # Original (uncompiled) getter functions
+    _RATING_NAMES = ()       # 0-100k constructor ratings, set by _install_profile()
+    _MEASURED_NAMES = ()     # Other constructor arguments (measured values)
+    _CONSTRUCTOR_DEFAULTS = {}
+    # Profile fields a getter takes from an optional measured value instead of
+    # the rating mapping ({field: private attribute}); None = use the rating
+    _PROFILE_OVERRIDES = {}
+    _profile = None
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != '_profile':
+            object.__setattr__(self, '_profile', None)
+
+    @property
+    def profile(self) -> PhysicalProfile:
+        """Compiled physical profile (compiled on first access)."""
+        profile = self._profile
+        if profile is None or profile is _COMPILING:
+            profile = self.compile_profile()
+        return profile
+
+    def compile_profile(self) -> PhysicalProfile:
+        """Evaluate every getter once and freeze the results."""
+        object.__setattr__(self, '_profile', _COMPILING)
+        try:
+            values = [float(compute(self)) for compute in self._PROFILE_COMPUTES]
+        except BaseException:
+            object.__setattr__(self, '_profile', None)
+            raise
+        profile = self._PROFILE_CLASS(*values)
+        object.__setattr__(self, '_profile', profile)
+        return profile
+
+    def invalidate_profile(self):
+        """Discard the compiled profile (recompiled on next getter call)."""
+        object.__setattr__(self, '_profile', None)
+
+    @classmethod
+    def profile_columns(cls, ratings: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Evaluate every profile field for many players in one vectorized pass.
+
+        Runs the uncompiled getters once with rating arrays in place of
+        scalars, so the anchors stay defined in exactly one place.
+
+        Parameters
+        ----------
+        ratings : dict or structured array
+            Column per constructor rating name (e.g. 'BAT_SPEED'), all the same
+            length. Missing ratings default to 50,000. Override columns named
+            after _PROFILE_OVERRIDES attributes without the leading underscore
+            (e.g. 'actual_bat_speed_mph') replace the mapped value wherever
+            they are not NaN.
+
+        Returns
+        -------
+        dict
+            {profile field: float64 array}, same fields as cls._PROFILE_CLASS
+        """
+        names = ratings.dtype.names if isinstance(ratings, np.ndarray) else ratings
+        columns = {name: ratings[name] for name in names}
+        n = len(next(iter(columns.values()))) if columns else 0
+
+        view = _RatingColumns(cls)
+        for name in cls._RATING_NAMES:
+            values = columns.get(name, 50000)
+            view.__dict__[name] = np.clip(
+                np.broadcast_to(np.asarray(values, dtype=np.float64), (n,)), 0, 100000
+            )
+
+        fields = cls._PROFILE_CLASS.__slots__
+        result = {
+            field: np.broadcast_to(np.asarray(compute(view), dtype=np.float64), (n,)).copy()
+            for field, compute in zip(fields, cls._PROFILE_COMPUTES)
+        }
+        for field, attribute in cls._PROFILE_OVERRIDES.items():
+            measured = columns.get(attribute.lstrip('_'))
+            if measured is not None:
+                measured = np.asarray(measured, dtype=np.float64)
+                result[field] = np.where(np.isnan(measured), result[field], measured)
+        return result
+
+    @classmethod
+    def from_profile_row(cls, values: Dict[str, float], profile_values) -> '_ProfiledAttributes':
+        """
+        Build an attributes object with its profile already compiled.
+
+        Equivalent to ``cls(**values)`` followed by compile_profile(), but
+        skips __init__'s per-rating np.clip: ratings must already be clipped
+        to 0-100,000 (profile_columns() callers clip whole columns at once).
+        Missing constructor arguments take their defaults.
+
+        Parameters
+        ----------
+        values : dict
+            Constructor keyword arguments
+        profile_values : sequence of float
+            Profile field values in cls._PROFILE_CLASS.__slots__ order
+            (one row of profile_columns())
+        """
+        state = dict(cls._CONSTRUCTOR_DEFAULTS)
+        state.update(values)
+        attributes = cls.__new__(cls)
+        # Measured values are stored privately (e.g. _actual_bat_speed_mph)
+        attributes.__dict__.update(
+            (name if name.isupper() else f"_{name}", value) for name, value in state.items()
+        )
+        attributes.__dict__['_profile'] = cls._PROFILE_CLASS(*map(float, profile_values))
+        return attributes
+
+
+class _RatingColumns:
+    """
+    Stand-in ``self`` for the uncompiled getters in profile_columns().
+
+    Rating attributes are arrays, measured-value overrides are None (applied
+    afterwards), and ``get_*`` calls between getters resolve to the
+    uncompiled implementations.
+    """
+
+    def __init__(self, attributes_class):
+        self.__dict__['_class'] = attributes_class
+        for attribute in attributes_class._PROFILE_OVERRIDES.values():
+            self.__dict__[attribute] = None
+
+    def __getattr__(self, name):
+        if name.startswith('get_'):
+            return partial(getattr(self._class, f"_compute_{name[len('get_'):]}"), self)
+        raise AttributeError(name)
+
+
 # =============================================================================
 # HITTING ATTRIBUTES
 # =============================================================================
 
-class HitterAttributes:
+class HitterAttributes(_ProfiledAttributes):
     """
     Physics-based hitting attributes (0-100,000 scale).
 
@@ -107,6 +361,12 @@ class HitterAttributes:
     that deterministically produce EV/LA/spin via physics simulation.
     """
 
+    # PHASE 3: Direct Statcast measurements replace the rating mapping
+    _PROFILE_OVERRIDES = {
+        'bat_speed_mph': '_actual_bat_speed_mph',
+        'barrel_accuracy_mm': '_actual_barrel_accuracy_mm',
+    }
+
     def __init__(
         self,
         BAT_SPEED: float = 50000,
@@ -470,7 +730,7 @@ class HitterAttributes:
 # FIELDING ATTRIBUTES
 # =============================================================================
 
-class FielderAttributes:
+class FielderAttributes(_ProfiledAttributes):
     """Physics-based fielding attributes for kinematic races."""
 
     def __init__(
@@ -773,7 +1033,7 @@ class FielderAttributes:
         Sources: V2 Implementation Plan Phase 2B, MLB Statcast framing data
         Notes: Only applies to catchers; ignored for other fielding positions
         """
-        return float(self.FRAMING)
+        return np.float64(self.FRAMING)  # Array-safe for profile_columns()
 
     def get_jump_feet(self) -> float:
         """
@@ -1176,7 +1436,7 @@ def create_groundball_hitter(quality: str = "average") -> HitterAttributes:
 # PITCHING ATTRIBUTES
 # =============================================================================
 
-class PitcherAttributes:
+class PitcherAttributes(_ProfiledAttributes):
     """
     Physics-based pitching attributes (0-100,000 scale).
 
@@ -1642,3 +1902,62 @@ def create_reliever_pitcher(quality: str = "average") -> PitcherAttributes:
         COMMAND=np.random.randint(min_r, max_r),
         STAMINA=np.random.randint(20000, 45000),  # LOW stamina (short relief)
     )
+
+
+# =============================================================================
+# PROFILE INSTALLATION
+# =============================================================================
+
+def _profile_getter(compute, field: str):
+    """Getter that reads the compiled profile, compiling it if needed."""
+    read = attrgetter(field)
+
+    @wraps(compute)
+    def getter(self):
+        profile = self._profile
+        if profile is None:
+            return read(self.compile_profile())
+        if profile is _COMPILING:
+            return compute(self)
+        return read(profile)
+
+    return getter
+
+
+def _install_profile(attributes_class, profile_name: str):
+    """
+    Build the PhysicalProfile subclass for an attributes class and route its
+    zero-argument get_* methods through the compiled profile.
+
+    The original implementations remain available as ``_compute_<field>``.
+    """
+    getters = [
+        name for name, value in vars(attributes_class).items()
+        if name.startswith('get_') and callable(value)
+    ]
+    fields = tuple(name[len('get_'):] for name in getters)
+    profile_class = type(profile_name, (PhysicalProfile,), {
+        '__slots__': fields,
+        '__doc__': f"Compiled physical profile of {attributes_class.__name__}.",
+        '__module__': __name__,
+    })
+
+    computes = []
+    for getter_name, field in zip(getters, fields):
+        compute = vars(attributes_class)[getter_name]
+        computes.append(compute)
+        setattr(attributes_class, f"_compute_{field}", compute)
+        setattr(attributes_class, getter_name, _profile_getter(compute, field))
+
+    attributes_class._PROFILE_CLASS = profile_class
+    attributes_class._PROFILE_COMPUTES = tuple(computes)
+    parameters = list(inspect.signature(attributes_class.__init__).parameters.values())[1:]
+    attributes_class._CONSTRUCTOR_DEFAULTS = {p.name: p.default for p in parameters}
+    attributes_class._RATING_NAMES = tuple(p.name for p in parameters if p.name.isupper())
+    attributes_class._MEASURED_NAMES = tuple(p.name for p in parameters if not p.name.isupper())
+    return profile_class
+
+
+HitterProfile = _install_profile(HitterAttributes, 'HitterProfile')
+FielderProfile = _install_profile(FielderAttributes, 'FielderProfile')
+PitcherProfile = _install_profile(PitcherAttributes, 'PitcherProfile')
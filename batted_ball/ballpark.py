@@ -16,6 +16,17 @@ This module provides:
 import numpy as np
 from typing import Dict, Tuple, Optional
 
+from .constants import METERS_TO_FEET
+
+# Dense fence tables: one entry per FENCE_ANGLE_STEP degrees over the fair
+# territory. Every built-in profile has its knots on this grid, so table
+# interpolation reproduces the profile exactly.
+FENCE_ANGLE_MIN = -45.0
+FENCE_ANGLE_MAX = 45.0
+FENCE_ANGLE_STEP = 0.25
+# Regula falsi refinements of the trajectory/fence intersection per segment
+FENCE_CROSSING_ITERATIONS = 3
+
 
 class BallparkDimensions:
     """
@@ -60,6 +71,17 @@ class BallparkDimensions:
         # Sort angles for interpolation
         self.angles = sorted(fence_profile.keys())
 
+        # Dense fence distance/height tables (read-only)
+        self.table_angles = np.linspace(
+            FENCE_ANGLE_MIN, FENCE_ANGLE_MAX,
+            int(round((FENCE_ANGLE_MAX - FENCE_ANGLE_MIN) / FENCE_ANGLE_STEP)) + 1,
+        )
+        profile = np.array([fence_profile[angle] for angle in self.angles], dtype=float)
+        self.fence_distances = np.interp(self.table_angles, self.angles, profile[:, 0])
+        self.fence_heights = np.interp(self.table_angles, self.angles, profile[:, 1])
+        for table in (self.table_angles, self.fence_distances, self.fence_heights):
+            table.setflags(write=False)
+
     def get_fence_at_angle(self, spray_angle: float) -> Tuple[float, float]:
         """
         Get fence distance and height at a specific spray angle via interpolation.
@@ -76,35 +98,163 @@ class BallparkDimensions:
         height_ft : float
             Fence height at this angle
         """
-        # Clamp angle to field range (-45 to +45 degrees)
-        angle = np.clip(spray_angle, -45, 45)
+        # Clamp angle to field range (-45 to +45 degrees) and index the tables
+        angle = min(max(float(spray_angle), FENCE_ANGLE_MIN), FENCE_ANGLE_MAX)
+        position = (angle - FENCE_ANGLE_MIN) / FENCE_ANGLE_STEP
+        i = min(int(position), len(self.table_angles) - 2)
+        t = position - i
+
+        distances = self.fence_distances
+        heights = self.fence_heights
+        distance = distances[i] + t * (distances[i + 1] - distances[i])
+        height = heights[i] + t * (heights[i + 1] - heights[i])
+        return float(distance), float(height)
+
+    def fence_at_angles(self, spray_angles) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized get_fence_at_angle().
 
-        # Find bracketing angles
-        if angle <= self.angles[0]:
-            return self.fence_profile[self.angles[0]]
-        if angle >= self.angles[-1]:
-            return self.fence_profile[self.angles[-1]]
+        Parameters
+        ----------
+        spray_angles : array-like
+            Spray angles in degrees (field convention)
 
-        # Find the two angles that bracket our target
-        for i in range(len(self.angles) - 1):
-            if self.angles[i] <= angle <= self.angles[i + 1]:
-                angle_low = self.angles[i]
-                angle_high = self.angles[i + 1]
+        Returns
+        -------
+        distances_ft, heights_ft : ndarray
+            Fence distance and height at each angle
+        """
+        angles = np.clip(np.asarray(spray_angles, dtype=float), FENCE_ANGLE_MIN, FENCE_ANGLE_MAX)
+        position = (angles - FENCE_ANGLE_MIN) / FENCE_ANGLE_STEP
+        i = np.minimum(position.astype(np.intp), len(self.table_angles) - 2)
+        t = position - i
+
+        distances = self.fence_distances
+        heights = self.fence_heights
+        return (
+            distances[i] + t * (distances[i + 1] - distances[i]),
+            heights[i] + t * (heights[i + 1] - heights[i]),
+        )
+
+    def _fence_gap(self, positions):
+        """Horizontal distance past the fence (ft) and fence height for trajectory points."""
+        x = positions[..., 0]
+        y = positions[..., 1]
+        # Trajectory coordinates: x toward center field, y toward left field
+        spray_angles = np.degrees(np.arctan2(-y, x))
+        fence_distance, fence_height = self.fence_at_angles(spray_angles)
+        return np.hypot(x, y) * METERS_TO_FEET - fence_distance, fence_height
+
+    def fence_crossings_batch(self, positions, n_samples=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Intersect trajectory polylines with the fence surface.
 
-                dist_low, height_low = self.fence_profile[angle_low]
-                dist_high, height_high = self.fence_profile[angle_high]
+        The fence is a vertical wall at the (interpolated) fence distance for
+        every spray angle. For each trajectory the first segment that ends at
+        or past the wall is located and the crossing point on that segment is
+        solved by regula falsi, so spray-angle drift during flight is followed
+        exactly instead of using the landing angle.
 
-                # Linear interpolation
-                t = (angle - angle_low) / (angle_high - angle_low)
-                distance = dist_low + t * (dist_high - dist_low)
-                height = height_low + t * (height_high - height_low)
+        Parameters
+        ----------
+        positions : ndarray
+            (n_trajectories, n_samples, 3) trajectory points in meters, in
+            trajectory coordinates (x toward center field, y toward left
+            field, z up), e.g. BattedBallResult.position or the batch
+            integrator output
+        n_samples : array-like, optional
+            Valid samples per trajectory (padded batches); default: all
 
-                return distance, height
+        Returns
+        -------
+        reached : ndarray of bool
+            Trajectory reached the fence before its last sample
+        height_margin_ft : ndarray
+            Ball height minus fence height at the crossing (NaN if not reached)
+        """
+        positions = np.asarray(positions, dtype=float)
+        n_trajectories, n_points = positions.shape[:2]
+
+        # Only samples between the nearest and farthest fence distance need
+        # the fence lookup; everything past the farthest point is beyond it
+        x = positions[..., 0]
+        y = positions[..., 1]
+        horizontal_sq = x * x
+        horizontal_sq += y * y
+        beyond = horizontal_sq >= (self.fence_distances.max() / METERS_TO_FEET) ** 2
+        band = np.nonzero(~beyond & (horizontal_sq >= (self.fence_distances.min() / METERS_TO_FEET) ** 2))
+        gap, _ = self._fence_gap(positions[band])
+        beyond[band] = gap >= 0.0
+        if n_samples is not None:
+            beyond &= np.arange(n_points) < np.asarray(n_samples)[:, np.newaxis]
+        reached = beyond.any(axis=1)
+        first = np.argmax(beyond, axis=1)
+
+        height_margin = np.full(n_trajectories, np.nan)
+        rows = np.flatnonzero(reached)
+        k = first[rows]
+        p1 = positions[rows, k]
+        p0 = positions[rows, np.maximum(k - 1, 0)]
+        g0, _ = self._fence_gap(p0)
+        g1, _ = self._fence_gap(p1)
+
+        # Bracket [lo, hi] on each segment with gap(lo) < 0 <= gap(hi)
+        lo = np.zeros(len(rows))
+        hi = np.ones(len(rows))
+        g_lo = np.where(k > 0, g0, -1.0)
+        g_hi = g1
+        for _ in range(FENCE_CROSSING_ITERATIONS):
+            t = lo + (hi - lo) * g_lo / (g_lo - g_hi)
+            g, _ = self._fence_gap(p0 + t[:, np.newaxis] * (p1 - p0))
+            below = g < 0.0
+            lo = np.where(below, t, lo)
+            g_lo = np.where(below, g, g_lo)
+            hi = np.where(below, hi, t)
+            g_hi = np.where(below, g_hi, g)
+        t = np.where(k > 0, lo + (hi - lo) * g_lo / (g_lo - g_hi), 0.0)
+
+        crossing = p0 + t[:, np.newaxis] * (p1 - p0)
+        _, fence_height = self._fence_gap(crossing)
+        height_margin[rows] = crossing[:, 2] * METERS_TO_FEET - fence_height
+        return reached, height_margin
+
+    def clears_fence_batch(self, positions, n_samples=None) -> np.ndarray:
+        """
+        Whether each trajectory is above the fence where it crosses it.
 
-        # Fallback (shouldn't happen)
-        return 400.0, 10.0
+        Parameters
+        ----------
+        positions, n_samples
+            As in fence_crossings_batch()
+
+        Returns
+        -------
+        ndarray of bool
+        """
+        reached, height_margin = self.fence_crossings_batch(positions, n_samples)
+        cleared = reached.copy()
+        cleared[reached] = height_margin[reached] >= 0.0
+        return cleared
+
+    def clears_fence(self, trajectory_samples) -> bool:
+        """
+        Whether one trajectory clears the fence.
+
+        Parameters
+        ----------
+        trajectory_samples : ndarray
+            (n_samples, 3) trajectory points in meters (trajectory
+            coordinates), e.g. BattedBallResult.position
+
+        Returns
+        -------
+        bool
+        """
+        positions = np.asarray(trajectory_samples, dtype=float)[np.newaxis]
+        return bool(self.clears_fence_batch(positions)[0])
 
-    def is_home_run(self, spray_angle: float, distance_ft: float, height_at_fence_ft: float) -> bool:
+    def is_home_run(self, spray_angle: float, distance_ft: float, height_at_fence_ft: float,
+                    trajectory_samples: Optional[np.ndarray] = None) -> bool:
         """
         Determine if a ball clears the fence for a home run.
 
@@ -116,12 +266,18 @@ class BallparkDimensions:
             Horizontal distance ball traveled
         height_at_fence_ft : float
             Ball's height when it reaches the fence distance
+        trajectory_samples : ndarray, optional
+            (n_samples, 3) trajectory in meters; when given, the exact
+            trajectory/fence intersection (clears_fence) decides
 
         Returns
         -------
         bool
             True if home run (clears fence), False otherwise
         """
+        if trajectory_samples is not None and len(trajectory_samples) > 1:
+            return self.clears_fence(trajectory_samples)
+
         fence_dist, fence_height = self.get_fence_at_angle(spray_angle)
 
         # Ball must reach fence distance
@@ -7,6 +7,7 @@ baserunning simulation.
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Union
 from enum import Enum
 from .attributes import piecewise_logistic_map, piecewise_logistic_map_inverse
@@ -44,7 +45,166 @@ from .constants import (
     # Play timing
     CLOSE_PLAY_TOLERANCE, SAFE_RUNNER_BIAS,
 )
-from .field_layout import FieldPosition, FieldLayout
+from .field_layout import BASE_INDEX, BASES, FieldPosition, FieldLayout
+
+
+# Straight-line coordinates for moves that don't follow the base paths forward
+BASE_COORDINATES = {
+    "home": (0, 0),
+    "first": (63.64, 63.64),
+    "second": (0, 127.28),
+    "third": (-63.64, 63.64)
+}
+
+
+def _sprint_speed_fps(sprint_speed: float) -> float:
+    """Sprint speed rating to ft/s (see BaseRunner.get_sprint_speed_fps)."""
+    return piecewise_logistic_map(
+        sprint_speed,
+        human_min=RUNNER_SPRINT_SPEED_MIN,
+        human_cap=RUNNER_SPRINT_SPEED_ELITE,
+        super_cap=RUNNER_SPRINT_SPEED_MAX
+    )
+
+
+def _acceleration_fps2(acceleration: float) -> float:
+    """Acceleration rating to ft/s² (see BaseRunner.get_acceleration_fps2)."""
+    return piecewise_logistic_map(
+        acceleration,
+        human_min=RUNNER_ACCELERATION_MIN,
+        human_cap=RUNNER_ACCELERATION_ELITE,
+        super_cap=RUNNER_ACCELERATION_MAX
+    )
+
+
+def _reaction_time_seconds(base_running_iq: float) -> float:
+    """Baserunning IQ rating to reaction time (see BaseRunner.get_reaction_time_seconds)."""
+    return piecewise_logistic_map_inverse(
+        base_running_iq,
+        human_min=RUNNER_REACTION_TIME_MIN,
+        human_cap=RUNNER_REACTION_TIME_MAX,
+        super_cap=0.02
+    )
+
+
+def _turn_speed_retention(turn_efficiency: float) -> float:
+    """Turn efficiency rating to speed retention (see BaseRunner.get_turn_speed_retention)."""
+    return piecewise_logistic_map(
+        turn_efficiency,
+        human_min=TURN_SPEED_RETENTION_POOR,
+        human_cap=TURN_SPEED_RETENTION_ELITE,
+        super_cap=0.97
+    )
+
+
+def _optimal_leadoff(base: str, base_running_iq: float) -> float:
+    """Leadoff distance from a base (see BaseRunner.get_optimal_leadoff)."""
+    # Base leadoff distances on IQ rating
+    if base == "first":
+        min_lead = LEADOFF_FIRST_BASE_MIN
+        max_lead = LEADOFF_FIRST_BASE_MAX
+        avg_lead = LEADOFF_FIRST_BASE_AVG
+    elif base == "second":
+        min_lead = LEADOFF_SECOND_BASE_MIN
+        max_lead = LEADOFF_SECOND_BASE_MAX
+        avg_lead = LEADOFF_SECOND_BASE_AVG
+    elif base == "third":
+        min_lead = LEADOFF_THIRD_BASE_MIN
+        max_lead = LEADOFF_THIRD_BASE_MAX
+        avg_lead = LEADOFF_THIRD_BASE_AVG
+    else:
+        return 0.0  # No leadoff from home
+
+    # Map IQ to leadoff distance
+    return piecewise_logistic_map(
+        base_running_iq,
+        human_min=min_lead,
+        human_cap=max_lead,
+        super_cap=max_lead * 1.2  # Superhuman: 20% more aggressive
+    )
+
+
+def _base_distance(from_base: str, to_base: str) -> float:
+    """Running distance between two bases in feet."""
+    from_index = BASE_INDEX[from_base]
+    to_index = BASE_INDEX[to_base]
+    if from_base == "home" and to_base == "home":  # Complete circuit
+        return 4 * BASE_PATH_LENGTH
+    if to_index > from_index or to_base == "home":
+        # Forward along the base paths
+        return ((to_index - from_index) % 4) * BASE_PATH_LENGTH
+
+    # FIX FOR "12.01s TIME ARTIFACT" BUG:
+    # Instead of raising ValueError, provide physics-based fallback
+    # This prevents magic number fallbacks if runner.current_base is incorrect
+    # Estimate distance as straight-line between bases
+    from_pos = BASE_COORDINATES[from_base]
+    to_pos = BASE_COORDINATES[to_base]
+    return np.sqrt((to_pos[0] - from_pos[0])**2 + (to_pos[1] - from_pos[1])**2)
+
+
+def _running_time(total_distance: float, max_speed: float, acceleration: float,
+                  reaction_time: float, need_turn: bool, turn_retention: float) -> float:
+    """Reaction plus accelerate-then-cruise running time over a distance."""
+    # Account for turn efficiency if rounding bases
+    if need_turn:
+        effective_max_speed = max_speed * turn_retention
+    else:
+        effective_max_speed = max_speed
+
+    # Calculate running time using kinematics
+    time_to_max_speed = effective_max_speed / acceleration
+    distance_during_acceleration = 0.5 * acceleration * time_to_max_speed**2
+
+    if total_distance <= distance_during_acceleration:
+        # Never reach max speed
+        running_time = np.sqrt(2 * total_distance / acceleration)
+    else:
+        # Reach max speed, then constant velocity
+        remaining_distance = total_distance - distance_during_acceleration
+        time_at_max_speed = remaining_distance / effective_max_speed
+        running_time = time_to_max_speed + time_at_max_speed
+
+    total_time = reaction_time + running_time
+    return total_time
+
+
+@lru_cache(maxsize=4096)
+def _base_time_table(sprint_speed: float, acceleration: float,
+                     base_running_iq: float, turn_efficiency: float) -> np.ndarray:
+    """
+    Base-to-base running times for one set of runner ratings.
+
+    Shared by every runner with the same ratings, so a hitter's table is
+    built once however many times they reach base.
+
+    Returns
+    -------
+    np.ndarray
+        Read-only (2, 4, 4) times in seconds, indexed
+        [include_leadoff, BASE_INDEX[from_base], BASE_INDEX[to_base]]
+    """
+    max_speed = _sprint_speed_fps(sprint_speed)
+    acceleration_fps2 = _acceleration_fps2(acceleration)
+    reaction_time = _reaction_time_seconds(base_running_iq)
+    turn_retention = _turn_speed_retention(turn_efficiency)
+
+    times = np.empty((2, len(BASES), len(BASES)))
+    for from_base, from_index in BASE_INDEX.items():
+        leadoff = _optimal_leadoff(from_base, base_running_iq) if from_base != "home" else 0.0
+        for to_base, to_index in BASE_INDEX.items():
+            distance = _base_distance(from_base, to_base)
+            # Rounding a base unless running to the next one
+            need_turn = to_index != (from_index + 1) % len(BASES)
+            for include_leadoff in (0, 1):
+                total_distance = distance - leadoff if include_leadoff and from_base != "home" else distance
+                # Staying on a base with a lead is a negative distance (nan), as before
+                with np.errstate(invalid='ignore'):
+                    times[include_leadoff, from_index, to_index] = _running_time(
+                        total_distance, max_speed, acceleration_fps2, reaction_time, need_turn, turn_retention
+                    )
+    times.flags.writeable = False
+    return times
 
 
 class RunnerState(Enum):
@@ -152,6 +312,12 @@ class BaseRunner:
         self.base_running_iq = np.clip(base_running_iq, 0, 100000)
         self.sliding_ability = np.clip(sliding_ability, 0, 100000)
         self.turn_efficiency = np.clip(turn_efficiency, 0, 100000)
+
+        # Base-to-base times for these ratings, [include_leadoff, from, to]
+        # by BASE_INDEX; ratings are fixed once the runner is created
+        self.base_times = _base_time_table(
+            self.sprint_speed, self.acceleration, self.base_running_iq, self.turn_efficiency
+        )
         
         # Current state
         self.current_base = current_base
@@ -176,12 +342,7 @@ class BaseRunner:
         - 85k: 30 ft/s (elite ~20.5 mph)
         - 100k: 32 ft/s (superhuman ~21.8 mph)
         """
-        return piecewise_logistic_map(
-            self.sprint_speed,
-            human_min=RUNNER_SPRINT_SPEED_MIN,
-            human_cap=RUNNER_SPRINT_SPEED_ELITE,
-            super_cap=RUNNER_SPRINT_SPEED_MAX
-        )
+        return _sprint_speed_fps(self.sprint_speed)
     
     def get_acceleration_fps2(self) -> float:
         """
@@ -193,12 +354,7 @@ class BaseRunner:
         - 85k: 18 ft/s² (elite burst)
         - 100k: 22 ft/s² (superhuman)
         """
-        return piecewise_logistic_map(
-            self.acceleration,
-            human_min=RUNNER_ACCELERATION_MIN,
-            human_cap=RUNNER_ACCELERATION_ELITE,
-            super_cap=RUNNER_ACCELERATION_MAX
-        )
+        return _acceleration_fps2(self.acceleration)
     
     def get_reaction_time_seconds(self) -> float:
         """
@@ -211,12 +367,7 @@ class BaseRunner:
         - 85k: 0.08 s (elite anticipation)
         - 100k: 0.02 s (superhuman)
         """
-        return piecewise_logistic_map_inverse(
-            self.base_running_iq,
-            human_min=RUNNER_REACTION_TIME_MIN,
-            human_cap=RUNNER_REACTION_TIME_MAX,
-            super_cap=0.02
-        )
+        return _reaction_time_seconds(self.base_running_iq)
     
     def get_turn_speed_retention(self) -> float:
         """
@@ -228,12 +379,7 @@ class BaseRunner:
         - 85k: 0.92 (elite, 92% speed retention)
         - 100k: 0.97 (superhuman, 97% speed retention)
         """
-        return piecewise_logistic_map(
-            self.turn_efficiency,
-            human_min=TURN_SPEED_RETENTION_POOR,
-            human_cap=TURN_SPEED_RETENTION_ELITE,
-            super_cap=0.97
-        )
+        return _turn_speed_retention(self.turn_efficiency)
     
     def get_optimal_leadoff(self, base: str) -> float:
         """
@@ -242,29 +388,7 @@ class BaseRunner:
         Uses piecewise logistic mapping (0-100,000 scale):
         Higher IQ = more aggressive leads (but also smarter)
         """
-        # Base leadoff distances on IQ rating
-        if base == "first":
-            min_lead = LEADOFF_FIRST_BASE_MIN
-            max_lead = LEADOFF_FIRST_BASE_MAX
-            avg_lead = LEADOFF_FIRST_BASE_AVG
-        elif base == "second":
-            min_lead = LEADOFF_SECOND_BASE_MIN
-            max_lead = LEADOFF_SECOND_BASE_MAX
-            avg_lead = LEADOFF_SECOND_BASE_AVG
-        elif base == "third":
-            min_lead = LEADOFF_THIRD_BASE_MIN
-            max_lead = LEADOFF_THIRD_BASE_MAX
-            avg_lead = LEADOFF_THIRD_BASE_AVG
-        else:
-            return 0.0  # No leadoff from home
-
-        # Map IQ to leadoff distance
-        return piecewise_logistic_map(
-            self.base_running_iq,
-            human_min=min_lead,
-            human_cap=max_lead,
-            super_cap=max_lead * 1.2  # Superhuman: 20% more aggressive
-        )
+        return _optimal_leadoff(base, self.base_running_iq)
     
     def calculate_time_to_base(self, from_base: str, to_base: str, 
                               include_leadoff: bool = True) -> float:
@@ -284,92 +408,30 @@ class BaseRunner:
         -------
         float
             Time in seconds to reach target base
+
+        Notes
+        -----
+        Looked up in the runner's precomputed base_times table; only base
+        names outside BASES are computed on the fly.
         """
-        # Calculate total distance
-        if from_base == "home" and to_base == "first":
-            total_distance = BASE_PATH_LENGTH
-        elif from_base == "first" and to_base == "second":
-            total_distance = BASE_PATH_LENGTH
-        elif from_base == "second" and to_base == "third":
-            total_distance = BASE_PATH_LENGTH
-        elif from_base == "third" and to_base == "home":
-            total_distance = BASE_PATH_LENGTH
-        elif from_base == "first" and to_base == "third":
-            total_distance = 2 * BASE_PATH_LENGTH
-        elif from_base == "first" and to_base == "home":
-            total_distance = 3 * BASE_PATH_LENGTH
-        elif from_base == "second" and to_base == "home":
-            total_distance = 2 * BASE_PATH_LENGTH
-        elif from_base == "home" and to_base == "second":
-            total_distance = 2 * BASE_PATH_LENGTH
-        elif from_base == "home" and to_base == "third":
-            total_distance = 3 * BASE_PATH_LENGTH
-        elif from_base == "home" and to_base == "home":  # Complete circuit
-            total_distance = 4 * BASE_PATH_LENGTH
-        else:
-            # FIX FOR "12.01s TIME ARTIFACT" BUG:
-            # Instead of raising ValueError, provide physics-based fallback
-            # This prevents magic number fallbacks if runner.current_base is incorrect
-            # Estimate distance as straight-line between bases
-            base_positions = {
-                "home": (0, 0),
-                "first": (63.64, 63.64),
-                "second": (0, 127.28),
-                "third": (-63.64, 63.64)
-            }
+        from_index = BASE_INDEX.get(from_base)
+        to_index = BASE_INDEX.get(to_base)
+        if from_index is not None and to_index is not None:
+            return self.base_times[int(include_leadoff), from_index, to_index]
 
-            if from_base in base_positions and to_base in base_positions:
-                from_pos = base_positions[from_base]
-                to_pos = base_positions[to_base]
-                # Calculate Euclidean distance
-                total_distance = np.sqrt((to_pos[0] - from_pos[0])**2 + (to_pos[1] - from_pos[1])**2)
-            else:
-                # Ultimate fallback: assume 1 base = 90 feet
-                # This is better than returning a magic number like 12.01
-                total_distance = BASE_PATH_LENGTH
-                # Log warning for debugging
-                import warnings
-                warnings.warn(f"Invalid base combination: {from_base} to {to_base}, using fallback distance")
-        
-        # Subtract leadoff if applicable
+        # Ultimate fallback: assume 1 base = 90 feet
+        # This is better than returning a magic number like 12.01
+        # Log warning for debugging
+        import warnings
+        warnings.warn(f"Invalid base combination: {from_base} to {to_base}, using fallback distance")
+        total_distance = BASE_PATH_LENGTH
         if include_leadoff and from_base != "home":
-            leadoff = self.get_optimal_leadoff(from_base)
-            total_distance -= leadoff
-        
-        # Get physical attributes
-        max_speed = self.get_sprint_speed_fps()
-        acceleration = self.get_acceleration_fps2()
-        reaction_time = self.get_reaction_time_seconds()
-        
-        # Account for turn efficiency if rounding bases
-        need_turn = (
-            (from_base == "home" and to_base not in ["first"]) or
-            (from_base == "first" and to_base not in ["second"]) or
-            (from_base == "second" and to_base not in ["third"]) or
-            (from_base == "third" and to_base not in ["home"])
+            total_distance -= self.get_optimal_leadoff(from_base)
+        return _running_time(
+            total_distance, self.get_sprint_speed_fps(), self.get_acceleration_fps2(),
+            self.get_reaction_time_seconds(), need_turn=from_index is not None,
+            turn_retention=self.get_turn_speed_retention()
         )
-        
-        if need_turn:
-            turn_retention = self.get_turn_speed_retention()
-            effective_max_speed = max_speed * turn_retention
-        else:
-            effective_max_speed = max_speed
-        
-        # Calculate running time using kinematics
-        time_to_max_speed = effective_max_speed / acceleration
-        distance_during_acceleration = 0.5 * acceleration * time_to_max_speed**2
-        
-        if total_distance <= distance_during_acceleration:
-            # Never reach max speed
-            running_time = np.sqrt(2 * total_distance / acceleration)
-        else:
-            # Reach max speed, then constant velocity
-            remaining_distance = total_distance - distance_during_acceleration
-            time_at_max_speed = remaining_distance / effective_max_speed
-            running_time = time_to_max_speed + time_at_max_speed
-        
-        total_time = reaction_time + running_time
-        return total_time
     
     def should_slide(self, distance_to_base: float, current_speed: float) -> bool:
         """
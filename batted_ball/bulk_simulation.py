@@ -37,6 +37,10 @@ class BulkSimulationSettings:
     
     # Accuracy vs speed tradeoffs
     accuracy_level: str = 'high'  # 'high', 'medium', 'low'
+
+    # Lockstep struct-of-arrays engine (VectorizedAtBatEngine)
+    use_vectorized_engine: bool = False
+    vectorized_batch_size: int = 50000  # PAs advanced together per engine call
     
     @classmethod
     def for_simulation_count(cls, count: int) -> 'BulkSimulationSettings':
@@ -46,7 +50,8 @@ class BulkSimulationSettings:
                 use_ultra_fast_mode=True,
                 use_simplified_aerodynamics=True,
                 stream_results=True,
-                accuracy_level='medium'
+                accuracy_level='medium',
+                use_vectorized_engine=True
             )
         elif count >= 10000:
             return cls(
@@ -182,20 +187,31 @@ class BulkAtBatSimulator:
                 print(f"  Ultra-fast mode: {self.settings.use_ultra_fast_mode}")
                 print(f"  Simplified aerodynamics: {self.settings.use_simplified_aerodynamics}")
                 print(f"  Streaming results: {self.settings.stream_results}")
+                print(f"  Vectorized engine: {self.settings.use_vectorized_engine}")
         
         start_time = time.time()
         
+        # Determine optimal simulation mode
+        fast_mode = self.settings.use_ultra_fast_mode or n_at_bats >= 1000
+
+        if self.settings.use_vectorized_engine:
+            return self._simulate_matchup_vectorized(
+                pitcher, hitter, n_at_bats, fast_mode, start_time, verbose
+            )
+        
         # Initialize result tracking
         outcome_counts = {'strikeout': 0, 'walk': 0, 'in_play': 0, 'foul': 0}
-        contact_quality_counts = {'perfect': 0, 'good': 0, 'fair': 0, 'weak': 0, 'poor': 0}
+        contact_quality_counts = {
+            'solid': 0, 'perfect': 0, 'good': 0, 'fair': 0, 'weak': 0, 'poor': 0
+        }
         
         exit_velocities = []
         launch_angles = []
         distances = []
         individual_results = [] if not self.settings.stream_results else None
-        
-        # Determine optimal simulation mode
-        fast_mode = self.settings.use_ultra_fast_mode or n_at_bats >= 1000
+
+        # Every at-bat starts from the same pitch count (no fatigue carry-over)
+        start_pitches = pitcher.pitches_thrown
         
         # Process in batches if needed
         batch_size = self.settings.batch_size
@@ -213,7 +229,7 @@ class BulkAtBatSimulator:
             # Simulate batch
             for i in range(batch_size_actual):
                 # Reset pitcher state
-                pitcher.current_stamina = max(pitcher.current_stamina, 80)
+                pitcher.pitches_thrown = start_pitches
                 
                 # Create simulator with optimizations
                 sim = AtBatSimulator(
@@ -260,6 +276,84 @@ class BulkAtBatSimulator:
                           f"({completed/n_at_bats*100:.1f}%) - "
                           f"{rate:.1f} at-bats/sec - ETA: {eta:.1f}s")
         
+        pitcher.pitches_thrown = start_pitches
+
+        return self._finish_matchup(
+            n_at_bats, start_time, outcome_counts, contact_quality_counts,
+            exit_velocities, launch_angles, distances, individual_results, verbose
+        )
+
+    def _simulate_matchup_vectorized(
+        self,
+        pitcher: Pitcher,
+        hitter: Hitter,
+        n_at_bats: int,
+        fast_mode: bool,
+        start_time: float,
+        verbose: bool
+    ) -> BulkSimulationResult:
+        """
+        simulate_matchup() with the lockstep VectorizedAtBatEngine.
+
+        Same outcome and contact statistics as the per-at-bat loop (within
+        sampling error); no individual AtBatResult objects are built.
+        """
+        from .vectorized_at_bat import VectorizedAtBatEngine
+
+        # Seeded from the global stream so np.random.seed() still reproduces runs
+        engine = VectorizedAtBatEngine(
+            pitcher, hitter,
+            altitude=self.altitude,
+            temperature=self.temperature,
+            humidity=self.humidity,
+            fast_mode=fast_mode,
+            seed=np.random.randint(0, 2**31 - 1)
+        )
+
+        outcome_counts = {'strikeout': 0, 'walk': 0, 'in_play': 0, 'foul': 0}
+        contact_quality_counts = {
+            'solid': 0, 'perfect': 0, 'good': 0, 'fair': 0, 'weak': 0, 'poor': 0
+        }
+        exit_velocities = []
+        launch_angles = []
+        distances = []
+
+        batch_size = self.settings.vectorized_batch_size
+        for batch_start in range(0, n_at_bats, batch_size):
+            batch = engine.simulate(min(batch_size, n_at_bats - batch_start))
+            for outcome, count in batch.outcome_counts().items():
+                outcome_counts[outcome] += count
+            for quality, count in batch.contact_quality_counts().items():
+                contact_quality_counts[quality] += count
+            in_play = batch.in_play
+            exit_velocities.append(batch.exit_velocity[in_play])
+            launch_angles.append(batch.launch_angle[in_play])
+            distances.append(batch.distance[in_play])
+
+            if verbose:
+                completed = batch_start + len(batch)
+                print(f"  Progress: {completed:,}/{n_at_bats:,} "
+                      f"({completed/n_at_bats*100:.1f}%)")
+
+        return self._finish_matchup(
+            n_at_bats, start_time, outcome_counts, contact_quality_counts,
+            np.concatenate(exit_velocities), np.concatenate(launch_angles),
+            np.concatenate(distances), None, verbose
+        )
+
+    def _finish_matchup(
+        self,
+        n_at_bats: int,
+        start_time: float,
+        outcome_counts: Dict[str, int],
+        contact_quality_counts: Dict[str, int],
+        exit_velocities,
+        launch_angles,
+        distances,
+        individual_results: Optional[List[AtBatResult]],
+        verbose: bool
+    ) -> BulkSimulationResult:
+        """Summary statistics and result object for simulate_matchup()."""
         # Calculate final statistics
         end_time = time.time()
         simulation_time = end_time - start_time
@@ -272,9 +366,9 @@ class BulkAtBatSimulator:
         }
         
         # Contact metrics (only from balls in play)
-        avg_exit_velocity = np.mean(exit_velocities) if exit_velocities else 0.0
-        avg_launch_angle = np.mean(launch_angles) if launch_angles else 0.0
-        avg_distance = np.mean(distances) if distances else 0.0
+        avg_exit_velocity = np.mean(exit_velocities) if len(exit_velocities) else 0.0
+        avg_launch_angle = np.mean(launch_angles) if len(launch_angles) else 0.0
+        avg_distance = np.mean(distances) if len(distances) else 0.0
         
         # Track performance
         self.performance_tracker.track_simulation(simulation_time, n_at_bats)
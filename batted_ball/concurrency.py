@@ -0,0 +1,172 @@
+"""
+Concurrency budget for process pools and the native thread pools inside them.
+
+SeasonSimulator and ParallelGameSimulator run one worker process per core,
+and inside each worker three native thread pools size themselves to every
+core on first use: rayon (trajectory_rs), Numba's parallel=True kernels and
+the BLAS/OpenMP runtime behind NumPy. On a 64-core host that is 64 x 3 x 64
+threads competing for 64 cores.
+
+A ConcurrencyBudget splits the cores into processes x threads_per_process.
+Its pool_kwargs() plug an initializer into multiprocessing.Pool or
+ProcessPoolExecutor that caps all three thread pools in every worker and,
+on Linux, optionally pins each worker to its own block of CPUs.
+
+Example
+-------
+>>> budget = ConcurrencyBudget.for_processes(8)   # 64 cores -> 8 x 8
+>>> with Pool(processes=budget.processes, **budget.pool_kwargs()) as pool:
+...     pool.map(work, items)
+"""
+
+import os
+import multiprocessing as mp
+from dataclasses import dataclass
+from multiprocessing import cpu_count
+from typing import Any, Dict, List, Optional, Sequence
+
+# threadpoolctl caps BLAS/OpenMP pools that are already loaded (optional)
+try:
+    from threadpoolctl import threadpool_limits
+    THREADPOOLCTL_AVAILABLE = True
+except ImportError:
+    THREADPOOLCTL_AVAILABLE = False
+
+# Read by BLAS/OpenMP, Numba and rayon when their pools start
+THREAD_ENV_VARS = (
+    'OMP_NUM_THREADS',
+    'OPENBLAS_NUM_THREADS',
+    'MKL_NUM_THREADS',
+    'BLIS_NUM_THREADS',
+    'VECLIB_MAXIMUM_THREADS',
+    'NUMEXPR_NUM_THREADS',
+    'NUMBA_NUM_THREADS',
+    'RAYON_NUM_THREADS',
+)
+
+
+def available_cpus() -> List[int]:
+    """CPU ids this process may run on (affinity mask on Linux)."""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(cpu_count()))
+
+
+def limit_threads(threads: int, cpus: Optional[Sequence[int]] = None) -> Dict[str, Any]:
+    """
+    Cap the native thread pools of the current process.
+
+    Environment variables cover pools that have not started yet (and child
+    processes); pools that are already running are resized through
+    threadpoolctl (BLAS/OpenMP), numba.set_num_threads() and
+    trajectory_rs.set_num_threads(). Rayon's global pool can only be sized
+    once per process, so call this before the first Rust batch call.
+
+    Parameters
+    ----------
+    threads : int
+        Threads per pool
+    cpus : sequence of int, optional
+        CPU ids to pin the process to (Linux only; ignored elsewhere)
+
+    Returns
+    -------
+    dict
+        What was applied: 'blas', 'numba', 'rayon' thread counts and 'cpus'
+    """
+    threads = max(1, int(threads))
+    applied = {}
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(threads)
+
+    if THREADPOOLCTL_AVAILABLE:
+        threadpool_limits(limits=threads)
+        applied['blas'] = threads
+
+    try:
+        import numba
+        numba_threads = min(threads, numba.config.NUMBA_NUM_THREADS)
+        numba.set_num_threads(numba_threads)
+        applied['numba'] = numba_threads
+    except ImportError:
+        pass
+
+    from . import fast_trajectory
+    if fast_trajectory.RUST_AVAILABLE and hasattr(fast_trajectory.trajectory_rs, 'set_num_threads'):
+        fast_trajectory.trajectory_rs.set_num_threads(threads)
+        applied['rayon'] = fast_trajectory.trajectory_rs.get_num_threads()
+
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, cpus)
+        applied['cpus'] = sorted(cpus)
+    return applied
+
+
+def _init_worker(threads: int, cpu_sets: Optional[List[List[int]]], counter) -> None:
+    """Pool initializer: cap thread pools and take the next CPU block."""
+    cpus = None
+    if cpu_sets:
+        with counter.get_lock():
+            slot = counter.value
+            counter.value += 1
+        cpus = cpu_sets[slot % len(cpu_sets)]
+    limit_threads(threads, cpus)
+
+
+@dataclass(frozen=True)
+class ConcurrencyBudget:
+    """
+    Split of the available cores into worker processes and threads per worker.
+
+    Parameters
+    ----------
+    processes : int
+        Worker processes
+    threads_per_process : int
+        Rayon, Numba and BLAS threads inside each worker
+    pin_cpus : bool
+        Pin each worker to its own block of threads_per_process CPUs (Linux)
+    """
+
+    processes: int
+    threads_per_process: int = 1
+    pin_cpus: bool = False
+
+    @classmethod
+    def for_processes(cls, processes: Optional[int] = None, pin_cpus: bool = False) -> 'ConcurrencyBudget':
+        """Share the available cores evenly across processes (default: one per core)."""
+        n_cpus = len(available_cpus())
+        processes = max(1, processes or n_cpus)
+        return cls(processes, max(1, n_cpus // processes), pin_cpus)
+
+    @property
+    def total_threads(self) -> int:
+        """Native threads across all workers."""
+        return self.processes * self.threads_per_process
+
+    def cpu_sets(self) -> List[List[int]]:
+        """CPU block per worker slot (wraps around when oversubscribed)."""
+        cpus = available_cpus()
+        per = self.threads_per_process
+        return [
+            [cpus[(slot * per + k) % len(cpus)] for k in range(per)]
+            for slot in range(self.processes)
+        ]
+
+    def pool_kwargs(self, context=None) -> Dict[str, Any]:
+        """
+        initializer/initargs for multiprocessing.Pool or ProcessPoolExecutor.
+
+        Pass the pool's multiprocessing context (e.g. get_context('spawn'))
+        when it is not the default one.
+        """
+        cpu_sets = self.cpu_sets() if self.pin_cpus else None
+        counter = (context or mp).Value('i', 0)
+        return {
+            'initializer': _init_worker,
+            'initargs': (self.threads_per_process, cpu_sets, counter),
+        }
+
+    def apply(self) -> Dict[str, Any]:
+        """Cap the thread pools of the current process (serial or threaded runs)."""
+        return limit_threads(self.threads_per_process)
@@ -184,6 +184,9 @@ DT_FAST = 0.002     # 2 milliseconds (for bulk simulations - 2x faster, <1% accu
 DT_ULTRA_FAST = 0.005  # 5 milliseconds (for Monte Carlo - ~5x faster, <5% accuracy loss)
 DT_EXTREME = 0.010     # 10 milliseconds (for massive batches - ~10x faster, ~10% accuracy loss)
 
+# Knot spacing of the cubic Hermite trajectory spline (seconds)
+TRAJECTORY_SPLINE_DT = 0.02  # 20 ms (sub-micron error vs the 1 ms integrator samples)
+
 # Maximum simulation time (to prevent infinite loops)
 MAX_SIMULATION_TIME = 10.0  # seconds
 
@@ -234,6 +234,19 @@ def contact_point_from_swing(
     }
 
 
+def _float_power(values, exponent):
+    """
+    Elementwise values ** exponent through Python float pow (C library pow).
+
+    numpy's SIMD power differs from the C library in the last bit for some
+    inputs, which would break bit-compatibility with the scalar collision path.
+    """
+    return np.fromiter(
+        (value ** exponent for value in values.ravel().tolist()),
+        dtype=np.float64, count=values.size,
+    ).reshape(values.shape)
+
+
 class ContactModel:
     """
     Enhanced physics-based model for bat-ball contact.
@@ -616,3 +629,114 @@ class ContactModel:
             'contact_offset_total': contact_offset_total,
             'sweet_spot_distance': distance_from_sweet_spot_inches,
         }
+
+    def full_collision_batch(
+        self,
+        bat_speed_mph,
+        pitch_speed_mph,
+        bat_path_angle_deg,
+        pitch_trajectory_angle_deg=0.0,
+        vertical_contact_offset_inches=0.0,
+        horizontal_contact_offset_inches=0.0,
+        distance_from_sweet_spot_inches=0.0
+    ):
+        """
+        Perform full_collision() for many contacts at once.
+
+        Same formulas, evaluated elementwise in the same order, so every
+        element is bit-identical to the scalar path called with Python
+        floats. Inputs are broadcast
+        against each other (scalars apply to every contact), which makes
+        calibration sweeps over a contact parameter a single call.
+
+        Parameters
+        ----------
+        bat_speed_mph : float or array-like
+            Bat speed at contact (mph)
+        pitch_speed_mph : float or array-like
+            Pitch speed (mph)
+        bat_path_angle_deg : float or array-like
+            Bat path angle (degrees from horizontal)
+        pitch_trajectory_angle_deg : float or array-like
+            Pitch angle (degrees). Default 0.
+        vertical_contact_offset_inches : float or array-like
+            Vertical offset from bat center (inches). Default 0.
+        horizontal_contact_offset_inches : float or array-like
+            Horizontal offset (inches). Affects sidespin. Default 0.
+        distance_from_sweet_spot_inches : float or array-like
+            Distance from sweet spot along bat (inches). Default 0.
+
+        Returns
+        -------
+        dict
+            Same keys as full_collision(), each an ndarray of the broadcast
+            input shape
+        """
+        (bat_speed, pitch_speed, bat_path_angle, pitch_angle,
+         vertical_offset, horizontal_offset, sweet_spot_distance) = np.broadcast_arrays(*(
+            np.asarray(value, dtype=np.float64) for value in (
+                bat_speed_mph, pitch_speed_mph, bat_path_angle_deg,
+                pitch_trajectory_angle_deg, vertical_contact_offset_inches,
+                horizontal_contact_offset_inches, distance_from_sweet_spot_inches,
+            )
+        ))
+
+        contact_offset_total = np.sqrt(
+            _float_power(vertical_offset, 2) + _float_power(horizontal_offset, 2)
+        )
+
+        # Collision efficiency (calculate_collision_efficiency)
+        q = self.base_collision_efficiency - np.minimum(sweet_spot_distance * 0.006, 0.05)
+        q = q - contact_offset_total * OFFSET_EFFICIENCY_DEGRADATION
+        q = q - np.minimum(sweet_spot_distance * VIBRATION_ENERGY_LOSS_RATE,
+                           VIBRATION_ENERGY_LOSS_MAX)
+        if self.bat_type != 'wood':
+            q = q + self.energy_storage_ratio * TRAMPOLINE_ENERGY_RECOVERY * 0.1
+        collision_efficiency_q = np.maximum(q, 0.01)
+
+        # Master formula (calculate_exit_velocity_master_formula)
+        exit_velocity = np.maximum(
+            collision_efficiency_q * pitch_speed + (1.0 + collision_efficiency_q) * bat_speed,
+            10.0
+        )
+
+        # Off-center penalty beyond 1.1" (see full_collision)
+        off_center = contact_offset_total > 1.1
+        if np.any(off_center):
+            penalty = np.minimum(
+                _float_power(np.maximum(0, contact_offset_total[off_center] - 1.1), 1.1) * 0.025,
+                0.30
+            )
+            exit_velocity[off_center] *= (1.0 - penalty)
+        exit_velocity = np.maximum(exit_velocity, 15.0)
+
+        # Launch angle (calculate_launch_angle)
+        launch_angle = bat_path_angle * COLLISION_ANGLE_TO_LAUNCH_ANGLE_RATIO
+        launch_angle = launch_angle + pitch_angle * 0.15
+        launch_angle = np.where(
+            vertical_offset < 0,
+            launch_angle + np.abs(vertical_offset) * BELOW_CENTER_ANGLE_INCREASE,
+            np.where(vertical_offset > 0,
+                     launch_angle - vertical_offset * ABOVE_CENTER_ANGLE_DECREASE,
+                     launch_angle)
+        )
+        launch_angle = np.maximum(-20.0, np.minimum(launch_angle, 85.0))
+
+        # Spin from contact offsets, scaled by exit velocity
+        vertical_spin = np.where(
+            np.abs(vertical_offset) > 0.1,
+            -vertical_offset * VERTICAL_OFFSET_SPIN_FACTOR,
+            BASE_BACKSPIN_FROM_COMPRESSION
+        )
+        horizontal_spin = horizontal_offset * HORIZONTAL_OFFSET_SPIN_FACTOR
+        spin_velocity_factor = np.minimum(exit_velocity / 100.0, 1.2)
+
+        return {
+            'exit_velocity': exit_velocity,
+            'launch_angle': launch_angle,
+            'backspin_rpm': vertical_spin * spin_velocity_factor,
+            'sidespin_rpm': horizontal_spin * spin_velocity_factor,
+            'collision_efficiency_q': collision_efficiency_q,
+            'contact_offset_total': contact_offset_total,
+            'sweet_spot_distance': sweet_spot_distance.copy(),
+        }
@@ -6,6 +6,7 @@ This module provides functionality to:
 - Convert MLB stats to game attributes (0-100,000 scale)
 - Store teams and players in SQLite database
 - Load teams from database for game simulations
+- Convert stats and build attribute columns for whole rosters in one vectorized pass
 - Export database to CSV files for AI ingestion
 - Unified team abbreviation mappings
 """
@@ -15,6 +16,15 @@ from .stats_converter import StatsConverter
 from .pybaseball_fetcher import PybaseballFetcher
 from .team_loader import TeamLoader
 from .csv_exporter import CSVExporter
+from .roster_builder import (
+    pitcher_stat_ratings,
+    hitter_stat_ratings,
+    defensive_stat_ratings,
+    build_hitter_columns,
+    build_fielder_columns,
+    build_pitcher_columns,
+    attributes_from_columns,
+)
 from .team_mappings import (
     TEAM_ABBR_MAP,
     TEAM_FULL_NAMES,
@@ -32,6 +42,14 @@ __all__ = [
     'PybaseballFetcher',
     'TeamLoader',
     'CSVExporter',
+    # Batch roster building
+    'pitcher_stat_ratings',
+    'hitter_stat_ratings',
+    'defensive_stat_ratings',
+    'build_hitter_columns',
+    'build_fielder_columns',
+    'build_pitcher_columns',
+    'attributes_from_columns',
     # Team mappings
     'TEAM_ABBR_MAP',
     'TEAM_FULL_NAMES',
@@ -0,0 +1,349 @@
+"""
+Batch roster builder: season stats and database records to attribute columns.
+
+TeamLoader used to convert players one record at a time, running the rating
+adjustments and every piecewise_logistic_map call per player and per
+attribute. The functions here take all players at once (a pandas DataFrame,
+a numpy structured array, or a list of record dicts as returned by
+TeamDatabase.get_team_data) and produce every rating column plus every
+compiled physical profile column in one vectorized pass, so loading all 30
+teams or re-deriving attributes after a calibration change takes
+milliseconds.
+
+The *_stat_ratings() functions cover the step before that: a season stats
+DataFrame from PybaseballFetcher goes in, and the 0-100,000 rating columns
+stored by TeamDatabase come out. They read the columns and hand them to
+StatsConverter's *_attributes_array methods, which hold the conversion
+rules (the per-player mlb_stats_to_* methods run the same code on one row).
+
+The column names of the build_*_columns() results are:
+- Constructor ratings in upper case (e.g. 'BAT_SPEED', 'COMMAND')
+- Measured-value overrides ('actual_bat_speed_mph', NaN = not measured)
+- Profile fields named after the getters (e.g. 'bat_speed_mph')
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from batted_ball.attributes import HitterAttributes, FielderAttributes, PitcherAttributes
+from batted_ball.database.stats_converter import StatsConverter
+
+
+# Database column → FielderAttributes rating (missing = 50,000 average)
+# Note: 'jump_attr' etc. are the 0-100k converted attributes; 'jump' is raw Statcast data
+FIELDER_RATING_COLUMNS = {
+    'REACTION_TIME': 'reaction_time',
+    'TOP_SPRINT_SPEED': 'top_sprint_speed',
+    'ROUTE_EFFICIENCY': 'route_efficiency',
+    'ARM_STRENGTH': 'arm_strength',
+    'ARM_ACCURACY': 'arm_accuracy',
+    'FIELDING_SECURE': 'fielding_secure',
+    'JUMP': 'jump_attr',
+    'BURST': 'burst_attr',
+    'RANGE_BACK': 'range_back_attr',
+    'RANGE_IN': 'range_in_attr',
+    'CATCH_ELITE': 'catch_elite_attr',
+    'CATCH_DIFFICULT': 'catch_difficult_attr',
+}
+
+
+def _column(players, name: str, default: float = np.nan, required: bool = False) -> np.ndarray:
+    """
+    One numeric column as float64, with missing/None/NaN values set to default.
+
+    Raises KeyError for a required column that is absent.
+    """
+    if isinstance(players, np.ndarray):
+        present = name in (players.dtype.names or ())
+        values = players[name] if present else None
+    elif hasattr(players, 'columns'):
+        present = name in players.columns
+        values = players[name].to_numpy(dtype=np.float64, na_value=np.nan) if present else None
+    else:
+        present = any(name in record for record in players)
+        values = [record.get(name) for record in players] if present else None
+
+    if not present:
+        if required:
+            raise KeyError(name)
+        return np.full(len(players), default, dtype=np.float64)
+
+    column = np.asarray(values, dtype=np.float64)
+    if not np.isnan(default):
+        column = np.where(np.isnan(column), default, column)
+    return column
+
+
+def hitter_rating_columns(players) -> Dict[str, np.ndarray]:
+    """
+    HitterAttributes constructor columns from stored hitter records.
+
+    Applies the same adjustments TeamLoader has always made to the stored
+    ratings (see comments below).
+
+    Parameters
+    ----------
+    players : DataFrame, structured array or list of dict
+        Hitter records with at least 'power', 'contact' and 'discipline'
+
+    Returns
+    -------
+    dict
+        Rating columns plus 'actual_bat_speed_mph', 'actual_barrel_accuracy_mm'
+        and 'hard_swing_rate' (NaN where not measured)
+    """
+    raw_power = _column(players, 'power', required=True)
+
+    # BAT_SPEED: Use real bat tracking data (TRUE values, no scaling) when
+    # available; the 50k rating is then only a placeholder. Collision efficiency
+    # (q) was raised from 0.13 to 0.18 so true bat speeds keep realistic EV:
+    #   EV = q × pitch_speed + (1 + q) × bat_speed
+    # Fallback (FIX 2025-11-25): power-based estimate boosted to match generic teams
+    bat_speed = _column(players, 'bat_speed')
+    has_bat_speed = bat_speed > 0
+    bat_speed_boost = np.select(
+        [raw_power >= 70000, raw_power >= 50000],
+        [25000, 22000],   # Power hitters, balanced hitters
+        18000             # Contact hitters
+    )
+    boosted_bat_speed = np.where(
+        has_bat_speed, 50000, np.minimum(raw_power + bat_speed_boost, 100000)
+    )
+
+    # BARREL_ACCURACY: squared-up rate (~16%-43%, MLB 2024) converted to barrel
+    # error in mm: error = 40 - 90*rate, clamped to 5-30mm
+    #   rate=0.40 → 4mm (elite), 0.28 → 14.8mm (average), 0.18 → 23.8mm (poor)
+    squared_up_rate = _column(players, 'squared_up_rate')
+    squared_up_pct = np.where(squared_up_rate < 1, squared_up_rate, squared_up_rate / 100)
+    barrel_error_mm = np.clip(40.0 - 90.0 * squared_up_pct, 5.0, 30.0)
+
+    # ATTACK_ANGLE_CONTROL (FIX 2025-11-25 v3): stored values from stats_converter
+    # (50-70k) are too conservative compared to generic teams, so always apply a
+    # floor based on ACTUAL production (home runs, slugging), not power rating
+    hr_count = _column(players, 'home_runs', default=0.0)
+    slg = _column(players, 'slugging_pct', default=0.400)
+    slg = np.where(slg == 0, 0.400, slg)
+    min_aac = np.select(
+        [
+            (hr_count >= 35) | (slg >= 0.550),   # Elite power: ~15.8° mean LA
+            (hr_count >= 25) | (slg >= 0.480),   # Good power: ~13.8° mean LA
+            (hr_count >= 15) | (slg >= 0.420),   # Moderate power: ~10.4° mean LA
+            raw_power >= 40000,                  # Average hitter: ~7° (MLB average)
+        ],
+        [80000, 70000, 60000, 50000],
+        45000                                    # Contact/speed hitter: ~5° (more GBs)
+    )
+    stored_aac = _column(players, 'attack_angle_control', default=0.0)
+    attack_angle_control = np.where(stored_aac == 0, min_aac, np.maximum(stored_aac, min_aac))
+
+    # PHASE 3.1: Hard swing rate for EV variance (MLB range ~0.45 to ~0.97),
+    # stored as a decimal or a percentage
+    hard_swing_raw = _column(players, 'hard_swing_rate')
+    hard_swing_rate = np.where(hard_swing_raw <= 1.0, hard_swing_raw, hard_swing_raw / 100.0)
+
+    return {
+        'BAT_SPEED': boosted_bat_speed.astype(np.float64),
+        'BARREL_ACCURACY': _column(players, 'contact', required=True),
+        'ZONE_DISCERNMENT': _column(players, 'discipline', required=True),  # Pitch recognition
+        'VISION': _column(players, 'vision', default=50000),                # Contact frequency
+        'ATTACK_ANGLE_CONTROL': attack_angle_control.astype(np.float64),
+        'actual_bat_speed_mph': np.where(has_bat_speed, bat_speed, np.nan),
+        'actual_barrel_accuracy_mm': np.where(squared_up_rate > 0, barrel_error_mm, np.nan),
+        'hard_swing_rate': np.where(hard_swing_raw > 0, hard_swing_rate, np.nan),
+    }
+
+
+def fielder_rating_columns(players) -> Dict[str, np.ndarray]:
+    """
+    FielderAttributes constructor columns from stored hitter records.
+
+    Missing defensive columns default to 50,000 (average).
+    """
+    return {
+        rating: _column(players, column, default=50000)
+        for rating, column in FIELDER_RATING_COLUMNS.items()
+    }
+
+
+def pitcher_rating_columns(players) -> Dict[str, np.ndarray]:
+    """
+    PitcherAttributes constructor columns from stored pitcher records.
+
+    Parameters
+    ----------
+    players : DataFrame, structured array or list of dict
+        Pitcher records with at least 'velocity', 'command', 'stamina' and
+        'movement'
+    """
+    # NIBBLING_TENDENCY: Database stores as 0.0-1.0 REAL, PitcherAttributes needs 0-100k
+    nibbling = _column(players, 'nibbling_tendency', default=0.50)
+    return {
+        'RAW_VELOCITY_CAP': _column(players, 'velocity', required=True),
+        'COMMAND': _column(players, 'command', required=True),
+        'STAMINA': _column(players, 'stamina', required=True),
+        'SPIN_RATE_CAP': _column(players, 'movement', required=True),  # Use movement for spin
+        'NIBBLING_TENDENCY': np.trunc(nibbling * 100000),
+    }
+
+
+# ----------------------------------------------------------------------
+# Season stats → 0-100k ratings (column-wise StatsConverter)
+# ----------------------------------------------------------------------
+
+def _text_column(players, name: str, default: str) -> np.ndarray:
+    """One string column as an object array, with missing/None/NaN/'' set to default."""
+    if isinstance(players, np.ndarray):
+        values = players[name].tolist() if name in (players.dtype.names or ()) else None
+    elif hasattr(players, 'columns'):
+        values = players[name].tolist() if name in players.columns else None
+    else:
+        values = [record.get(name) for record in players]
+    if values is None:
+        return np.full(len(players), default, dtype=object)
+    return np.array(
+        [default if value is None or value != value or value == '' else value
+         for value in values],
+        dtype=object,
+    )
+
+
+# Season stat columns read by each conversion (see StatsConverter.*_attributes_array)
+PITCHER_STAT_COLUMNS = (
+    'era', 'whip', 'k_per_9', 'bb_per_9', 'avg_fastball_velo', 'innings_pitched', 'games_pitched',
+)
+HITTER_STAT_COLUMNS = (
+    'batting_avg', 'on_base_pct', 'slugging_pct', 'home_runs', 'strikeouts', 'walks',
+    'at_bats', 'avg_exit_velo', 'barrel_pct', 'sprint_speed', 'stolen_bases',
+)
+DEFENSIVE_STAT_COLUMNS = (
+    'oaa', 'sprint_speed', 'arm_strength_mph', 'drs', 'jump', 'jump_reaction', 'jump_burst',
+    'jump_route', 'fielding_pct', 'back_oaa', 'in_oaa', 'catch_5star_pct', 'catch_34star_pct',
+)
+
+
+def pitcher_stat_ratings(stats) -> Dict[str, np.ndarray]:
+    """
+    StatsConverter.mlb_stats_to_pitcher_attributes_v2 for a whole roster.
+
+    Parameters
+    ----------
+    stats : DataFrame, structured array or list of dict
+        Pitcher season stats (PITCHER_STAT_COLUMNS); missing columns or
+        values count as not available
+
+    Returns
+    -------
+    dict
+        int64 columns velocity, command, stamina, movement, repertoire and
+        putaway_skill, plus float nibbling_tendency (0.0-1.0)
+    """
+    return StatsConverter.pitcher_attributes_array(
+        **{name: _column(stats, name) for name in PITCHER_STAT_COLUMNS}
+    )
+
+
+def hitter_stat_ratings(stats) -> Dict[str, np.ndarray]:
+    """
+    StatsConverter.mlb_stats_to_hitter_attributes_v2 for a whole roster.
+
+    Parameters
+    ----------
+    stats : DataFrame, structured array or list of dict
+        Hitter season stats (HITTER_STAT_COLUMNS)
+
+    Returns
+    -------
+    dict
+        int64 columns contact, power, discipline, speed, vision and
+        attack_angle_control
+    """
+    return StatsConverter.hitter_attributes_array(
+        **{name: _column(stats, name) for name in HITTER_STAT_COLUMNS}
+    )
+
+
+def defensive_stat_ratings(stats) -> Dict[str, np.ndarray]:
+    """
+    StatsConverter.mlb_stats_to_defensive_attributes for a whole roster.
+
+    Parameters
+    ----------
+    stats : DataFrame, structured array or list of dict
+        Hitter season stats with 'primary_position' (missing = 'LF') and
+        DEFENSIVE_STAT_COLUMNS
+
+    Returns
+    -------
+    dict
+        int64 columns reaction_time, top_sprint_speed, route_efficiency,
+        arm_strength, fielding_secure, arm_accuracy, burst, jump, range_back,
+        range_in, catch_elite and catch_difficult
+    """
+    return StatsConverter.defensive_attributes_array(
+        _text_column(stats, 'primary_position', 'LF'),
+        **{name: _column(stats, name) for name in DEFENSIVE_STAT_COLUMNS}
+    )
+
+
+def rating_records(columns: Dict[str, np.ndarray]) -> List[Dict]:
+    """Per-player dicts of plain Python values from *_stat_ratings() output."""
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*(columns[name].tolist() for name in names))]
+
+
+def build_hitter_columns(players) -> Dict[str, np.ndarray]:
+    """Hitter rating columns plus every HitterProfile column."""
+    columns = hitter_rating_columns(players)
+    columns.update(HitterAttributes.profile_columns(columns))
+    return columns
+
+
+def build_fielder_columns(players) -> Dict[str, np.ndarray]:
+    """Fielder rating columns plus every FielderProfile column."""
+    columns = fielder_rating_columns(players)
+    columns.update(FielderAttributes.profile_columns(columns))
+    return columns
+
+
+def build_pitcher_columns(players) -> Dict[str, np.ndarray]:
+    """Pitcher rating columns plus every PitcherProfile column."""
+    columns = pitcher_rating_columns(players)
+    columns.update(PitcherAttributes.profile_columns(columns))
+    return columns
+
+
+def attributes_from_columns(attributes_class, columns: Dict[str, np.ndarray]) -> List:
+    """
+    Attribute objects with precompiled profiles from build_*_columns() output.
+
+    Parameters
+    ----------
+    attributes_class : type
+        HitterAttributes, FielderAttributes or PitcherAttributes
+    columns : dict
+        Output of the matching build_*_columns() function
+
+    Returns
+    -------
+    list
+        One attributes object per player, profile already compiled
+    """
+    ratings = {
+        name: np.clip(columns[name], 0, 100000)
+        for name in attributes_class._RATING_NAMES if name in columns
+    }
+    measured = {
+        name: columns[name] for name in attributes_class._MEASURED_NAMES if name in columns
+    }
+    fields = attributes_class._PROFILE_CLASS.__slots__
+    profile_rows = np.column_stack([columns[field] for field in fields]).tolist()
+
+    result = []
+    for i, profile_values in enumerate(profile_rows):
+        kwargs = {name: float(values[i]) for name, values in ratings.items()}
+        for name, values in measured.items():
+            value = float(values[i])
+            kwargs[name] = None if np.isnan(value) else value
+        result.append(attributes_class.from_profile_row(kwargs, profile_values))
+    return result
@@ -170,6 +170,421 @@ class StatsConverter:
         # CRITICAL: Clip to valid 0-100,000 range
         return int(np.clip(rating, 0, 100000))
 
+    @staticmethod
+    def percentile_to_rating_array(
+        values,
+        elite: float,
+        good: float,
+        avg: float,
+        poor: float,
+        inverse: bool = False
+    ) -> np.ndarray:
+        """
+        Vectorized percentile_to_rating for a whole column of players.
+
+        Parameters
+        ----------
+        values : array_like
+            Stat values to convert
+        elite, good, avg, poor, inverse
+            Same as percentile_to_rating
+
+        Returns
+        -------
+        np.ndarray
+            int64 ratings (0-100,000), element-wise equal to percentile_to_rating
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if inverse:
+            conditions = [values <= elite, values <= good, values <= avg, values <= poor]
+            ratings = [
+                90000 + 10000 * (elite - values) / max(elite * 0.2, 0.5),
+                90000 - 20000 * (values - elite) / (good - elite),
+                70000 - 20000 * (values - good) / (avg - good),
+                50000 - 20000 * (values - avg) / (poor - avg),
+            ]
+            default = 30000 - 30000 * np.minimum((values - poor) / (poor * 0.5), 1.0)
+        else:
+            conditions = [values >= elite, values >= good, values >= avg, values >= poor]
+            ratings = [
+                90000 + 10000 * (values - elite) / max(elite * 0.1, 0.05),
+                70000 + 20000 * (values - good) / (elite - good),
+                50000 + 20000 * (values - avg) / (good - avg),
+                30000 + 20000 * (values - poor) / (avg - poor),
+            ]
+            default = 30000 * np.maximum(values / poor, 0.0)
+
+        rating = np.select(conditions, ratings, default)
+        # int() truncates toward zero; after clipping to >= 0 that is floor
+        return np.floor(np.clip(rating, 0, 100000)).astype(np.int64)
+
+    # ------------------------------------------------------------------
+    # Stats → ratings
+    #
+    # The conversion rules are written once, column-wise, in the *_array
+    # methods below: every argument is a float array over players with NaN
+    # meaning "not available". The per-player mlb_stats_to_* methods run a
+    # one-row batch through them, so TeamDatabase (whole rosters through
+    # roster_builder) and single-player callers always agree.
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _rating_where(cls, values, present, elite, good, avg, poor, inverse=False, default=50000):
+        """percentile_to_rating_array where present, default elsewhere."""
+        ratings = cls.percentile_to_rating_array(
+            np.where(present, values, 0.0), elite, good, avg, poor, inverse=inverse
+        )
+        return np.where(present, ratings, default)
+
+    @staticmethod
+    def _mean_rating(ratings, present, default=50000) -> np.ndarray:
+        """int(np.mean()) over each row's present ratings, default if none."""
+        total = np.zeros(len(present[0]))
+        count = np.zeros(len(present[0]))
+        for rating, has in zip(ratings, present):
+            total += np.where(has, rating, 0)
+            count += has
+        mean = total / np.maximum(count, 1)
+        return np.where(count > 0, np.trunc(mean), default).astype(np.int64)
+
+    @staticmethod
+    def _scaled_from_average(values, scale, low, high) -> np.ndarray:
+        """np.clip(50000 + int(values * scale), low, high) element-wise."""
+        return np.clip(50000 + np.trunc(values * scale), low, high)
+
+    @staticmethod
+    def _one_row(**stats) -> Dict[str, np.ndarray]:
+        """Optional scalar stats as length-1 float arrays (None → NaN)."""
+        return {
+            name: np.array([np.nan if value is None else value], dtype=np.float64)
+            for name, value in stats.items()
+        }
+
+    @staticmethod
+    def _first_row(columns: Dict[str, np.ndarray]) -> Dict[str, any]:
+        """Plain Python values of the first row of *_array() output."""
+        return {name: values[0].item() for name, values in columns.items()}
+
+    @classmethod
+    def pitcher_attributes_array(
+        cls,
+        era: np.ndarray,
+        whip: np.ndarray,
+        k_per_9: np.ndarray,
+        bb_per_9: np.ndarray,
+        avg_fastball_velo: np.ndarray,
+        innings_pitched: np.ndarray,
+        games_pitched: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Convert pitcher statistics to v2 game attributes for many pitchers.
+
+        Parameters
+        ----------
+        era, whip, k_per_9, bb_per_9, avg_fastball_velo, innings_pitched, games_pitched : np.ndarray
+            One float per pitcher, NaN where the stat is not available
+            (see mlb_stats_to_pitcher_attributes)
+
+        Returns
+        -------
+        dict
+            int64 arrays velocity, command, stamina, movement, repertoire,
+            putaway_skill and float nibbling_tendency (0.0-1.0)
+        """
+        has_era, has_whip = ~np.isnan(era), ~np.isnan(whip)
+        has_k9, has_bb9 = ~np.isnan(k_per_9), ~np.isnan(bb_per_9)
+
+        # VELOCITY (from avg fastball velo)
+        velocity = cls._rating_where(
+            avg_fastball_velo, ~np.isnan(avg_fastball_velo),
+            cls.PITCHER_VELO_ELITE, cls.PITCHER_VELO_GOOD,
+            cls.PITCHER_VELO_AVG, cls.PITCHER_VELO_POOR,
+        )
+
+        # COMMAND (from BB/9, averaged with WHIP when available)
+        command = cls._rating_where(
+            bb_per_9, has_bb9,
+            cls.PITCHER_BB9_ELITE, cls.PITCHER_BB9_GOOD,
+            cls.PITCHER_BB9_AVG, cls.PITCHER_BB9_POOR,
+            inverse=True  # Lower BB/9 is better
+        )
+        whip_rating = cls._rating_where(
+            whip, has_whip,
+            0.95,   # Elite WHIP
+            1.10,   # Good WHIP
+            1.28,   # Average WHIP
+            1.45,   # Poor WHIP
+            inverse=True
+        )
+        command = np.where(has_whip, np.trunc((command + whip_rating) / 2), command)
+
+        # STAMINA (from innings pitched per game)
+        # Starters average 5-6 IP/game, relievers 1-2 IP/game
+        has_ip = ~np.isnan(innings_pitched) & (games_pitched > 0)
+        stamina = cls._rating_where(
+            innings_pitched / np.where(has_ip, games_pitched, 1.0), has_ip,
+            6.5,    # Elite (deep starter)
+            5.5,    # Good starter
+            3.0,    # Swing man
+            1.5,    # Reliever
+            default=60000  # Default to starter-ish
+        )
+
+        # MOVEMENT/REPERTOIRE (from K/9 and ERA)
+        # High K/9 suggests good stuff (movement + deception)
+        k9_rating = cls._rating_where(
+            k_per_9, has_k9,
+            cls.PITCHER_K9_ELITE, cls.PITCHER_K9_GOOD,
+            cls.PITCHER_K9_AVG, cls.PITCHER_K9_POOR,
+        )
+        # Good ERA suggests overall effectiveness; blend K/9 and ERA for movement
+        era_rating = cls._rating_where(
+            era, has_era,
+            cls.PITCHER_ERA_ELITE, cls.PITCHER_ERA_GOOD,
+            cls.PITCHER_ERA_AVG, cls.PITCHER_ERA_POOR,
+            inverse=True
+        )
+        movement = np.where(has_era, np.trunc((k9_rating + era_rating) / 2), k9_rating)
+        movement = movement.astype(np.int64)
+
+        # NIBBLING_TENDENCY (v2): control strategy (0.0-1.0, NOT 0-100k!)
+        # High BB/9 = high nibbling (pitches around zone)
+        # Low BB/9 = low nibbling (attacks zone)
+        nibbling_tendency = np.select(
+            [~has_bb9, bb_per_9 < 2.0, bb_per_9 < 2.5, bb_per_9 < 3.5, bb_per_9 < 4.5],
+            [
+                0.50,   # Default average
+                0.20,   # Aggressive (Gerrit Cole)
+                0.35,
+                0.50,   # Average
+                0.65,
+            ],
+            0.80        # Very careful
+        )
+
+        return {
+            'velocity': velocity.astype(np.int64),
+            'command': command.astype(np.int64),
+            'stamina': stamina.astype(np.int64),
+            'movement': movement,
+            'repertoire': movement.copy(),  # Use same for now
+            # PUTAWAY_SKILL (v2): finishing ability with 2 strikes - high K/9 = high finishing
+            'putaway_skill': k9_rating.astype(np.int64),
+            'nibbling_tendency': nibbling_tendency,
+        }
+
+    @classmethod
+    def hitter_attributes_array(
+        cls,
+        batting_avg: np.ndarray,
+        on_base_pct: np.ndarray,
+        slugging_pct: np.ndarray,
+        home_runs: np.ndarray,
+        strikeouts: np.ndarray,
+        walks: np.ndarray,
+        at_bats: np.ndarray,
+        avg_exit_velo: np.ndarray,
+        barrel_pct: np.ndarray,
+        sprint_speed: np.ndarray,
+        stolen_bases: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Convert hitter statistics to v2 game attributes for many hitters.
+
+        Parameters
+        ----------
+        batting_avg, on_base_pct, slugging_pct, home_runs, strikeouts, walks,
+        at_bats, avg_exit_velo, barrel_pct, sprint_speed, stolen_bases : np.ndarray
+            One float per hitter, NaN where the stat is not available
+            (see mlb_stats_to_hitter_attributes)
+
+        Returns
+        -------
+        dict
+            int64 arrays contact, power, discipline, speed, vision and
+            attack_angle_control
+        """
+        has_ab = at_bats > 0
+        safe_ab = np.where(has_ab, at_bats, 1.0)
+        has_k = ~np.isnan(strikeouts) & has_ab
+        has_hr = ~np.isnan(home_runs) & has_ab
+        has_bb = ~np.isnan(walks) & has_ab
+        has_obp, has_slg = ~np.isnan(on_base_pct), ~np.isnan(slugging_pct)
+        has_ev, has_barrel = ~np.isnan(avg_exit_velo), ~np.isnan(barrel_pct)
+        k_pct = (strikeouts / safe_ab) * 100
+        hr_per_ab = home_runs / safe_ab
+
+        # K% rating: part of CONTACT and DISCIPLINE, and VISION (v2) on its own.
+        # VISION controls whiff probability independently from contact quality:
+        # low K% = high VISION = fewer whiffs
+        k_rating = cls._rating_where(
+            k_pct, has_k,
+            cls.HITTER_K_PCT_ELITE, cls.HITTER_K_PCT_GOOD,
+            cls.HITTER_K_PCT_AVG, cls.HITTER_K_PCT_POOR,
+            inverse=True  # Lower K% is better
+        )
+
+        # CONTACT (from batting average, averaged with K% when available)
+        contact = cls._rating_where(
+            batting_avg, ~np.isnan(batting_avg),
+            cls.HITTER_AVG_ELITE, cls.HITTER_AVG_GOOD,
+            cls.HITTER_AVG_AVG, cls.HITTER_AVG_POOR,
+        )
+        contact = np.where(has_k, np.trunc((contact + k_rating) / 2), contact)
+
+        # POWER (mean of exit velocity, barrel %, slugging and HR rate ratings)
+        ev_rating = cls._rating_where(
+            avg_exit_velo, has_ev,
+            cls.HITTER_EV_ELITE, cls.HITTER_EV_GOOD, cls.HITTER_EV_AVG, cls.HITTER_EV_POOR,
+        )
+        barrel_rating = cls._rating_where(
+            barrel_pct, has_barrel,
+            cls.HITTER_BARREL_ELITE, cls.HITTER_BARREL_GOOD,
+            cls.HITTER_BARREL_AVG, cls.HITTER_BARREL_POOR,
+        )
+        slg_rating = cls._rating_where(
+            slugging_pct, has_slg,
+            0.550,  # Elite slugging
+            0.470,  # Good slugging
+            0.410,  # Average slugging
+            0.360,  # Poor slugging
+        )
+        hr_rating = cls._rating_where(
+            hr_per_ab, has_hr,
+            0.065,  # Elite (40+ HR in 600 AB)
+            0.050,  # Good (30 HR)
+            0.035,  # Average (20 HR)
+            0.020,  # Poor (12 HR)
+        )
+        power = cls._mean_rating(
+            [ev_rating, barrel_rating, slg_rating, hr_rating],
+            [has_ev, has_barrel, has_slg, has_hr],
+        )
+
+        # DISCIPLINE (mean of walk rate, OBP and K% ratings)
+        bb_rating = cls._rating_where(
+            (walks / safe_ab) * 100, has_bb,
+            15.0,   # Elite walk rate
+            11.0,   # Good
+            8.5,    # Average
+            6.0,    # Poor
+        )
+        obp_rating = cls._rating_where(
+            on_base_pct, has_obp,
+            0.380,  # Elite OBP
+            0.350,  # Good
+            0.320,  # Average
+            0.300,  # Poor
+        )
+        discipline = cls._mean_rating([bb_rating, obp_rating, k_rating], [has_bb, has_obp, has_k])
+
+        # SPEED (from sprint speed, with stolen bases fallback)
+        # Priority: sprint_speed (Statcast physical measurement) > stolen_bases estimation > default
+        has_sprint = ~np.isnan(sprint_speed)
+        sprint_rating = cls._rating_where(
+            sprint_speed, has_sprint,
+            cls.HITTER_SPEED_ELITE, cls.HITTER_SPEED_GOOD,
+            cls.HITTER_SPEED_AVG, cls.HITTER_SPEED_POOR,
+        )
+        # FALLBACK: Estimate from stolen bases when sprint speed not available
+        # Note: This is imperfect (strategy-dependent) but better than defaulting to average
+        # SB per 600 AB: Elite 30+, Good 15-25, Avg 5-15, Poor <5
+        steals_rating = cls._rating_where(
+            (stolen_bases / safe_ab) * 600, ~np.isnan(stolen_bases) & has_ab,
+            30.0,   # Elite (30+ SB per 600 AB)
+            20.0,   # Good (20 SB)
+            10.0,   # Average (10 SB)
+            5.0,    # Poor (5 SB)
+        )
+        speed = np.where(has_sprint, sprint_rating, steals_rating)
+
+        attack_angle_control = cls._attack_angle_control_array(
+            hr_per_ab, has_hr, slg_rating, has_slg, barrel_rating, has_barrel, ev_rating, has_ev
+        )
+
+        return {
+            'contact': contact.astype(np.int64),
+            'power': power,
+            'discipline': discipline,
+            'speed': speed.astype(np.int64),
+            'vision': k_rating.astype(np.int64),
+            'attack_angle_control': attack_angle_control,
+        }
+
+    @classmethod
+    def _attack_angle_control_array(
+        cls, hr_per_ab, has_hr, slg_rating, has_slg, barrel_rating, has_barrel, ev_rating, has_ev
+    ) -> np.ndarray:
+        """
+        ATTACK_ANGLE_CONTROL (v2 Phase 2C, CRITICAL for HR generation).
+
+        Controls launch angle tendency - higher = more fly balls = more HR
+        potential. Since launch angle data may not always be available, it is
+        inferred from:
+        - HR rate (most indicative of elevated launch tendency)
+        - Slugging percentage (correlates with extra base hits / fly ball success)
+        - Barrel % (optimal EV+LA combo frequency)
+        - Exit velocity (power indicator)
+
+        FIX 2025-11-25: Boosted output ranges to match generic team creation.
+        Previous scaling was too conservative, producing 50-68k instead of 58-88k.
+
+        Target ranges to match generic team creation:
+        - Power hitters: 75k-92k (HR rate > 5%, SLG > 0.500) - for ~18-24° mean LA
+        - Balanced hitters: 62k-78k (HR rate 2-5%, SLG 0.400-0.500) - for ~14-18° mean LA
+        - Contact/GB hitters: 50k-65k (HR rate < 2%, SLG < 0.400) - for ~10-14° mean LA
+
+        Returns
+        -------
+        np.ndarray
+            int64 ATTACK_ANGLE_CONTROL ratings (0-100k scale)
+        """
+        # 1. HR rate - most direct indicator of elevated launch tendency
+        # Thresholds based on MLB data:
+        # Elite power (40+ HR in 600 AB): >0.065 HR/AB
+        # Good power (30 HR): ~0.050
+        # Average power (18-20 HR): ~0.033
+        # Low power (<12 HR): <0.020
+        hr_score = cls._rating_where(hr_per_ab, has_hr, 0.065, 0.050, 0.033, 0.020)
+
+        # Scores in priority order, pre-weighted: HR most heavily, barrel highly,
+        # exit velocity as a lower-weight tie-breaker
+        scores = [
+            (hr_score * 1.5, has_hr),
+            (slg_rating, has_slg),
+            (barrel_rating * 1.2, has_barrel),
+            (ev_rating * 0.5, has_ev),
+        ]
+
+        # Weighted average; the k-th available score takes the k-th weight
+        weights = np.array([1.5, 1.0, 1.2, 0.5])  # HR, SLG, Barrel, EV
+        count = np.zeros(len(has_hr), dtype=np.int64)
+        weighted_sum = np.zeros(len(has_hr))
+        total_weight = np.zeros(len(has_hr))
+        for score, has in scores:
+            w = np.where(has, weights[np.minimum(count, len(weights) - 1)], 0.0)
+            weighted_sum += np.where(has, score * w, 0.0)
+            total_weight += w
+            count += has
+        raw_score = weighted_sum / np.where(count > 0, total_weight, 1.0)
+
+        # FIX 2025-11-25: BOOSTED scaling to match generic team creation
+        # Generic teams produce: power=72-88k, balanced=58-75k, GB=45-60k
+        # - Raw 85k+ → 80k-95k (elite power, fly ball hitters)
+        # - Raw 65k-85k → 68k-80k (good power, balanced hitters)
+        # - Raw 45k-65k → 58k-68k (average hitters)
+        # - Raw <45k → 50k-58k (groundball hitters)
+        attack_angle = np.select(
+            [raw_score >= 85000, raw_score >= 65000, raw_score >= 45000],
+            [80000 + np.trunc((raw_score - 85000) / 15000 * 15000),
+             68000 + np.trunc((raw_score - 65000) / 20000 * 12000),
+             58000 + np.trunc((raw_score - 45000) / 20000 * 10000)],
+            50000 + np.trunc(raw_score / 45000 * 8000)
+        )
+
+        # No data - use balanced default that matches generic teams (MLB average)
+        return np.where(count > 0, np.clip(attack_angle, 50000, 95000), 65000).astype(np.int64)
+
     @classmethod
     def mlb_stats_to_pitcher_attributes(
         cls,
@@ -206,94 +621,10 @@ class StatsConverter:
         dict
             Dictionary with keys: velocity, command, stamina, movement, repertoire
         """
-        attributes = {}
-
-        # VELOCITY (from avg fastball velo)
-        if avg_fastball_velo is not None:
-            attributes['velocity'] = cls.percentile_to_rating(
-                avg_fastball_velo,
-                cls.PITCHER_VELO_ELITE,
-                cls.PITCHER_VELO_GOOD,
-                cls.PITCHER_VELO_AVG,
-                cls.PITCHER_VELO_POOR,
-                inverse=False
-            )
-        else:
-            attributes['velocity'] = 50000  # Default average
-
-        # COMMAND (from BB/9 and WHIP)
-        command_rating = 50000
-        if bb_per_9 is not None:
-            bb_rating = cls.percentile_to_rating(
-                bb_per_9,
-                cls.PITCHER_BB9_ELITE,
-                cls.PITCHER_BB9_GOOD,
-                cls.PITCHER_BB9_AVG,
-                cls.PITCHER_BB9_POOR,
-                inverse=True  # Lower BB/9 is better
-            )
-            command_rating = bb_rating
-
-        if whip is not None:
-            whip_rating = cls.percentile_to_rating(
-                whip,
-                0.95,   # Elite WHIP
-                1.10,   # Good WHIP
-                1.28,   # Average WHIP
-                1.45,   # Poor WHIP
-                inverse=True
-            )
-            # Average BB/9 and WHIP ratings
-            command_rating = int((command_rating + whip_rating) / 2)
-
-        attributes['command'] = command_rating
-
-        # STAMINA (from innings pitched and games)
-        if innings_pitched is not None and games_pitched is not None and games_pitched > 0:
-            ip_per_game = innings_pitched / games_pitched
-            # Starters average 5-6 IP/game, relievers 1-2 IP/game
-            stamina_rating = cls.percentile_to_rating(
-                ip_per_game,
-                6.5,    # Elite (deep starter)
-                5.5,    # Good starter
-                3.0,    # Swing man
-                1.5,    # Reliever
-                inverse=False
-            )
-            attributes['stamina'] = stamina_rating
-        else:
-            attributes['stamina'] = 60000  # Default to starter-ish
-
-        # MOVEMENT/REPERTOIRE (from K/9 and ERA)
-        movement_rating = 50000
-        if k_per_9 is not None:
-            # High K/9 suggests good stuff (movement + deception)
-            movement_rating = cls.percentile_to_rating(
-                k_per_9,
-                cls.PITCHER_K9_ELITE,
-                cls.PITCHER_K9_GOOD,
-                cls.PITCHER_K9_AVG,
-                cls.PITCHER_K9_POOR,
-                inverse=False
-            )
-
-        if era is not None:
-            # Good ERA suggests overall effectiveness
-            era_rating = cls.percentile_to_rating(
-                era,
-                cls.PITCHER_ERA_ELITE,
-                cls.PITCHER_ERA_GOOD,
-                cls.PITCHER_ERA_AVG,
-                cls.PITCHER_ERA_POOR,
-                inverse=True
-            )
-            # Blend K/9 and ERA for movement
-            movement_rating = int((movement_rating + era_rating) / 2)
-
-        attributes['movement'] = movement_rating
-        attributes['repertoire'] = movement_rating  # Use same for now
-
-        return attributes
+        attrs = cls.mlb_stats_to_pitcher_attributes_v2(
+            era, whip, k_per_9, bb_per_9, avg_fastball_velo, innings_pitched, games_pitched
+        )
+        return {name: attrs[name] for name in ('velocity', 'command', 'stamina', 'movement', 'repertoire')}
 
     @classmethod
     def mlb_stats_to_hitter_attributes(
@@ -324,7 +655,7 @@ class StatsConverter:
         slugging_pct : float, optional
             Slugging percentage
         ops : float, optional
-            On-base plus slugging
+            On-base plus slugging (not used in the ratings)
         home_runs : int, optional
             Total home runs
         strikeouts : int, optional
@@ -336,7 +667,7 @@ class StatsConverter:
         avg_exit_velo : float, optional
             Average exit velocity (mph)
         max_exit_velo : float, optional
-            Maximum exit velocity (mph)
+            Maximum exit velocity (mph, not used in the ratings)
         barrel_pct : float, optional
             Barrel percentage
         sprint_speed : float, optional
@@ -349,168 +680,12 @@ class StatsConverter:
         dict
             Dictionary with keys: contact, power, discipline, speed
         """
-        attributes = {}
-
-        # Calculate OPS if not provided
-        if ops is None and on_base_pct is not None and slugging_pct is not None:
-            ops = on_base_pct + slugging_pct
-
-        # CONTACT (from batting average and K%)
-        contact_rating = 50000
-        if batting_avg is not None:
-            contact_rating = cls.percentile_to_rating(
-                batting_avg,
-                cls.HITTER_AVG_ELITE,
-                cls.HITTER_AVG_GOOD,
-                cls.HITTER_AVG_AVG,
-                cls.HITTER_AVG_POOR,
-                inverse=False
-            )
-
-        if strikeouts is not None and at_bats is not None and at_bats > 0:
-            k_pct = (strikeouts / at_bats) * 100
-            k_rating = cls.percentile_to_rating(
-                k_pct,
-                cls.HITTER_K_PCT_ELITE,
-                cls.HITTER_K_PCT_GOOD,
-                cls.HITTER_K_PCT_AVG,
-                cls.HITTER_K_PCT_POOR,
-                inverse=True  # Lower K% is better
-            )
-            # Average batting avg and K% ratings
-            contact_rating = int((contact_rating + k_rating) / 2)
-
-        attributes['contact'] = contact_rating
-
-        # POWER (from exit velocity, barrel %, slugging, HRs)
-        power_ratings = []
-
-        if avg_exit_velo is not None:
-            ev_rating = cls.percentile_to_rating(
-                avg_exit_velo,
-                cls.HITTER_EV_ELITE,
-                cls.HITTER_EV_GOOD,
-                cls.HITTER_EV_AVG,
-                cls.HITTER_EV_POOR,
-                inverse=False
-            )
-            power_ratings.append(ev_rating)
-
-        if barrel_pct is not None:
-            barrel_rating = cls.percentile_to_rating(
-                barrel_pct,
-                cls.HITTER_BARREL_ELITE,
-                cls.HITTER_BARREL_GOOD,
-                cls.HITTER_BARREL_AVG,
-                cls.HITTER_BARREL_POOR,
-                inverse=False
-            )
-            power_ratings.append(barrel_rating)
-
-        if slugging_pct is not None:
-            slg_rating = cls.percentile_to_rating(
-                slugging_pct,
-                0.550,  # Elite slugging
-                0.470,  # Good slugging
-                0.410,  # Average slugging
-                0.360,  # Poor slugging
-                inverse=False
-            )
-            power_ratings.append(slg_rating)
-
-        if home_runs is not None and at_bats is not None and at_bats > 0:
-            hr_per_ab = home_runs / at_bats
-            hr_rating = cls.percentile_to_rating(
-                hr_per_ab,
-                0.065,  # Elite (40+ HR in 600 AB)
-                0.050,  # Good (30 HR)
-                0.035,  # Average (20 HR)
-                0.020,  # Poor (12 HR)
-                inverse=False
-            )
-            power_ratings.append(hr_rating)
-
-        if power_ratings:
-            attributes['power'] = int(np.mean(power_ratings))
-        else:
-            attributes['power'] = 50000
-
-        # DISCIPLINE (from walk rate, OBP, K rate)
-        discipline_ratings = []
-
-        if walks is not None and at_bats is not None and at_bats > 0:
-            bb_pct = (walks / at_bats) * 100
-            bb_rating = cls.percentile_to_rating(
-                bb_pct,
-                15.0,   # Elite walk rate
-                11.0,   # Good
-                8.5,    # Average
-                6.0,    # Poor
-                inverse=False
-            )
-            discipline_ratings.append(bb_rating)
-
-        if on_base_pct is not None:
-            obp_rating = cls.percentile_to_rating(
-                on_base_pct,
-                0.380,  # Elite OBP
-                0.350,  # Good
-                0.320,  # Average
-                0.300,  # Poor
-                inverse=False
-            )
-            discipline_ratings.append(obp_rating)
-
-        # Also factor in K% (already calculated for contact)
-        if strikeouts is not None and at_bats is not None and at_bats > 0:
-            k_pct = (strikeouts / at_bats) * 100
-            k_disc_rating = cls.percentile_to_rating(
-                k_pct,
-                cls.HITTER_K_PCT_ELITE,
-                cls.HITTER_K_PCT_GOOD,
-                cls.HITTER_K_PCT_AVG,
-                cls.HITTER_K_PCT_POOR,
-                inverse=True
-            )
-            discipline_ratings.append(k_disc_rating)
-
-        if discipline_ratings:
-            attributes['discipline'] = int(np.mean(discipline_ratings))
-        else:
-            attributes['discipline'] = 50000
-
-        # SPEED (from sprint speed, with stolen bases fallback)
-        # Priority: sprint_speed (Statcast physical measurement) > stolen_bases estimation > default
-        if sprint_speed is not None:
-            # Use actual sprint speed from Statcast (ft/s)
-            speed_rating = cls.percentile_to_rating(
-                sprint_speed,
-                cls.HITTER_SPEED_ELITE,
-                cls.HITTER_SPEED_GOOD,
-                cls.HITTER_SPEED_AVG,
-                cls.HITTER_SPEED_POOR,
-                inverse=False
-            )
-            attributes['speed'] = speed_rating
-        elif stolen_bases is not None and at_bats is not None and at_bats > 0:
-            # FALLBACK: Estimate from stolen bases when sprint speed not available
-            # Note: This is imperfect (strategy-dependent) but better than defaulting to average
-            # SB per 600 AB: Elite 30+, Good 15-25, Avg 5-15, Poor <5
-            sb_per_600 = (stolen_bases / at_bats) * 600
-            speed_rating = cls.percentile_to_rating(
-                sb_per_600,
-                30.0,   # Elite (30+ SB per 600 AB)
-                20.0,   # Good (20 SB)
-                10.0,   # Average (10 SB)
-                5.0,    # Poor (5 SB)
-                inverse=False
-            )
-            attributes['speed'] = speed_rating
-        else:
-            # No speed data available - use league average
-            attributes['speed'] = 50000  # Default average
-
-        return attributes
+        attrs = cls.mlb_stats_to_hitter_attributes_v2(
+            batting_avg, on_base_pct, slugging_pct, ops, home_runs,
+            strikeouts, walks, at_bats, avg_exit_velo, max_exit_velo,
+            barrel_pct, sprint_speed, stolen_bases
+        )
+        return {name: attrs[name] for name in ('contact', 'power', 'discipline', 'speed')}
 
     @classmethod
     def mlb_stats_to_pitcher_attributes_v2(
@@ -540,45 +715,11 @@ class StatsConverter:
             Dictionary with v1 keys (velocity, command, stamina, movement, repertoire)
             PLUS v2 keys (putaway_skill, nibbling_tendency)
         """
-        # Get v1 attributes using existing method
-        attrs = cls.mlb_stats_to_pitcher_attributes(
-            era, whip, k_per_9, bb_per_9, avg_fastball_velo, innings_pitched, games_pitched
-        )
-
-        # Add v2 attributes
-
-        # PUTAWAY_SKILL: Finishing ability with 2 strikes (0-100k)
-        # High K/9 = high finishing ability
-        if k_per_9 is not None:
-            attrs['putaway_skill'] = cls.percentile_to_rating(
-                k_per_9,
-                cls.PITCHER_K9_ELITE,   # 11.0 K/9 = elite (95k-100k)
-                cls.PITCHER_K9_GOOD,    # 9.5 K/9 = good (70k-90k)
-                cls.PITCHER_K9_AVG,     # 8.5 K/9 = average (50k-70k)
-                cls.PITCHER_K9_POOR,    # 6.5 K/9 = poor (30k-50k)
-                inverse=False
-            )
-        else:
-            attrs['putaway_skill'] = 50000  # Default average
-
-        # NIBBLING_TENDENCY: Control strategy (0.0-1.0, NOT 0-100k!)
-        # High BB/9 = high nibbling (pitches around zone)
-        # Low BB/9 = low nibbling (attacks zone)
-        if bb_per_9 is not None:
-            if bb_per_9 < 2.0:
-                attrs['nibbling_tendency'] = 0.20  # Aggressive (Gerrit Cole)
-            elif bb_per_9 < 2.5:
-                attrs['nibbling_tendency'] = 0.35
-            elif bb_per_9 < 3.5:
-                attrs['nibbling_tendency'] = 0.50  # Average
-            elif bb_per_9 < 4.5:
-                attrs['nibbling_tendency'] = 0.65
-            else:
-                attrs['nibbling_tendency'] = 0.80  # Very careful
-        else:
-            attrs['nibbling_tendency'] = 0.50  # Default average
-
-        return attrs
+        return cls._first_row(cls.pitcher_attributes_array(**cls._one_row(
+            era=era, whip=whip, k_per_9=k_per_9, bb_per_9=bb_per_9,
+            avg_fastball_velo=avg_fastball_velo, innings_pitched=innings_pitched,
+            games_pitched=games_pitched,
+        )))
 
     @classmethod
     def mlb_stats_to_hitter_attributes_v2(
@@ -614,171 +755,12 @@ class StatsConverter:
             Dictionary with v1 keys (contact, power, discipline, speed)
             PLUS v2 keys (vision, attack_angle_control)
         """
-        # Get v1 attributes using existing method
-        attrs = cls.mlb_stats_to_hitter_attributes(
-            batting_avg, on_base_pct, slugging_pct, ops, home_runs,
-            strikeouts, walks, at_bats, avg_exit_velo, max_exit_velo,
-            barrel_pct, sprint_speed, stolen_bases
-        )
-
-        # Add v2 attribute: VISION
-        # Controls whiff probability independently from contact quality
-        # Low K% = high VISION = fewer whiffs
-        if strikeouts is not None and at_bats is not None and at_bats > 0:
-            k_pct = (strikeouts / at_bats) * 100
-            attrs['vision'] = cls.percentile_to_rating(
-                k_pct,
-                cls.HITTER_K_PCT_ELITE,    # 15% K = elite vision (95k-100k)
-                cls.HITTER_K_PCT_GOOD,     # 20% K = good vision (70k-90k)
-                cls.HITTER_K_PCT_AVG,      # 23% K = average vision (50k-70k)
-                cls.HITTER_K_PCT_POOR,     # 28% K = poor vision (30k-50k)
-                inverse=True  # Lower K% is better
-            )
-        else:
-            attrs['vision'] = 50000  # Default average
-
-        # Add v2 attribute: ATTACK_ANGLE_CONTROL (Phase 2C - CRITICAL for HR generation)
-        # Controls launch angle tendency - higher = more fly balls = more HR potential
-        # Inferred from HR rate, SLG, and barrel% since launch angle data not always available
-        #
-        # Target ranges (matching generic team creation in attributes.py):
-        # - Power hitters (high HR, high SLG): 72k-88k → mean launch angle 18-24°
-        # - Balanced hitters (moderate HR/SLG): 58k-75k → mean launch angle 13-19°
-        # - Contact/groundball hitters (low HR/SLG): 45k-60k → mean launch angle 9-15°
-        attrs['attack_angle_control'] = cls._calculate_attack_angle_control(
-            home_runs=home_runs,
-            at_bats=at_bats,
-            slugging_pct=slugging_pct,
-            barrel_pct=barrel_pct,
-            avg_exit_velo=avg_exit_velo
-        )
-
-        return attrs
-
-    @classmethod
-    def _calculate_attack_angle_control(
-        cls,
-        home_runs: Optional[int] = None,
-        at_bats: Optional[int] = None,
-        slugging_pct: Optional[float] = None,
-        barrel_pct: Optional[float] = None,
-        avg_exit_velo: Optional[float] = None
-    ) -> int:
-        """
-        Calculate ATTACK_ANGLE_CONTROL from available MLB stats.
-
-        Since launch angle data may not always be available, we infer it from:
-        - HR rate (most indicative of elevated launch tendency)
-        - Slugging percentage (correlates with extra base hits / fly ball success)
-        - Barrel % (optimal EV+LA combo frequency)
-        - Exit velocity (power indicator)
-
-        FIX 2025-11-25: Boosted output ranges to match generic team creation.
-        Previous scaling was too conservative, producing 50-68k instead of 58-88k.
-
-        Target ranges to match generic team creation:
-        - Power hitters: 75k-92k (HR rate > 5%, SLG > 0.500) - for ~18-24° mean LA
-        - Balanced hitters: 62k-78k (HR rate 2-5%, SLG 0.400-0.500) - for ~14-18° mean LA
-        - Contact/GB hitters: 50k-65k (HR rate < 2%, SLG < 0.400) - for ~10-14° mean LA
-
-        Returns
-        -------
-        int
-            ATTACK_ANGLE_CONTROL rating (0-100k scale)
-        """
-        attack_angle_scores = []
-
-        # 1. HR rate - most direct indicator of elevated launch tendency
-        if home_runs is not None and at_bats is not None and at_bats > 0:
-            hr_per_ab = home_runs / at_bats
-            # Thresholds based on MLB data:
-            # Elite power (40+ HR in 600 AB): >0.065 HR/AB
-            # Good power (30 HR): ~0.050
-            # Average power (18-20 HR): ~0.033
-            # Low power (<12 HR): <0.020
-            hr_score = cls.percentile_to_rating(
-                hr_per_ab,
-                0.065,  # Elite HR rate
-                0.050,  # Good
-                0.033,  # Average
-                0.020,  # Poor
-                inverse=False
-            )
-            attack_angle_scores.append(hr_score * 1.5)  # Weight HR most heavily
-
-        # 2. Slugging percentage - correlates with launch success
-        if slugging_pct is not None:
-            slg_score = cls.percentile_to_rating(
-                slugging_pct,
-                0.550,  # Elite SLG
-                0.470,  # Good
-                0.410,  # Average
-                0.360,  # Poor
-                inverse=False
-            )
-            attack_angle_scores.append(slg_score)
-
-        # 3. Barrel % - optimal EV+LA combo frequency (direct measure of good fly balls)
-        if barrel_pct is not None:
-            barrel_score = cls.percentile_to_rating(
-                barrel_pct,
-                cls.HITTER_BARREL_ELITE,   # 12% = elite
-                cls.HITTER_BARREL_GOOD,    # 8%
-                cls.HITTER_BARREL_AVG,     # 6%
-                cls.HITTER_BARREL_POOR,    # 4%
-                inverse=False
-            )
-            attack_angle_scores.append(barrel_score * 1.2)  # Weight barrel highly
-
-        # 4. Exit velocity as tie-breaker (power hitters tend to hit more fly balls)
-        if avg_exit_velo is not None:
-            ev_score = cls.percentile_to_rating(
-                avg_exit_velo,
-                cls.HITTER_EV_ELITE,   # 92 mph
-                cls.HITTER_EV_GOOD,    # 89.5
-                cls.HITTER_EV_AVG,     # 87.5
-                cls.HITTER_EV_POOR,    # 85
-                inverse=False
-            )
-            attack_angle_scores.append(ev_score * 0.5)  # Lower weight
-
-        if attack_angle_scores:
-            # Calculate weighted average
-            total_weight = 0
-            weighted_sum = 0
-            weights = [1.5, 1.0, 1.2, 0.5]  # HR, SLG, Barrel, EV
-            for i, score in enumerate(attack_angle_scores):
-                w = weights[i] if i < len(weights) else 1.0
-                weighted_sum += score * w
-                total_weight += w
-            raw_score = weighted_sum / total_weight
-
-            # FIX 2025-11-25: BOOSTED scaling to match generic team creation
-            # Generic teams produce: power=72-88k, balanced=58-75k, GB=45-60k
-            # Previous scaling was too conservative, clipping at 88k max
-            #
-            # New mapping: more aggressive boost to match generic teams
-            # - Raw 85k+ → 80k-95k (elite power, fly ball hitters)
-            # - Raw 65k-85k → 68k-80k (good power, balanced hitters)
-            # - Raw 45k-65k → 58k-68k (average hitters)
-            # - Raw <45k → 50k-58k (groundball hitters)
-            if raw_score >= 85000:
-                # Elite power hitter → high attack angle (80-95k)
-                attack_angle = 80000 + int((raw_score - 85000) / 15000 * 15000)
-            elif raw_score >= 65000:
-                # Good power/balanced hitter (68-80k)
-                attack_angle = 68000 + int((raw_score - 65000) / 20000 * 12000)
-            elif raw_score >= 45000:
-                # Average hitter (58-68k)
-                attack_angle = 58000 + int((raw_score - 45000) / 20000 * 10000)
-            else:
-                # Contact/groundball hitter (50-58k)
-                attack_angle = 50000 + int(raw_score / 45000 * 8000)
-
-            return int(np.clip(attack_angle, 50000, 95000))
-        else:
-            # No data - use balanced default that matches generic teams
-            return 65000  # Moderate-high attack angle for MLB average
+        return cls._first_row(cls.hitter_attributes_array(**cls._one_row(
+            batting_avg=batting_avg, on_base_pct=on_base_pct, slugging_pct=slugging_pct,
+            home_runs=home_runs, strikeouts=strikeouts, walks=walks, at_bats=at_bats,
+            avg_exit_velo=avg_exit_velo, barrel_pct=barrel_pct,
+            sprint_speed=sprint_speed, stolen_bases=stolen_bases,
+        )))
 
     # Jump metric ranges (Statcast "feet in right direction in first 3 seconds")
     # Positive = towards ball, negative = wrong direction
@@ -834,6 +816,305 @@ class StatsConverter:
     FIELDER_CATCH_34STAR_AVG = 65.0     # 65% = average
     FIELDER_CATCH_34STAR_POOR = 50.0    # 50% = poor
 
+    # Arm strength thresholds by position (throw velocity in mph)
+    ARM_STRENGTH_THRESHOLDS = {
+        'C': {'elite': 83, 'good': 80, 'avg': 77, 'poor': 74},  # Catcher
+        'SS': {'elite': 88, 'good': 85, 'avg': 82, 'poor': 79},  # Shortstop
+        '3B': {'elite': 88, 'good': 85, 'avg': 82, 'poor': 79},  # Third base
+        '2B': {'elite': 85, 'good': 82, 'avg': 79, 'poor': 76},  # Second base
+        '1B': {'elite': 85, 'good': 82, 'avg': 79, 'poor': 76},  # First base
+        'RF': {'elite': 92, 'good': 88, 'avg': 85, 'poor': 82},  # Right field (strongest)
+        'CF': {'elite': 90, 'good': 87, 'avg': 84, 'poor': 81},  # Center field
+        'LF': {'elite': 88, 'good': 85, 'avg': 82, 'poor': 79},  # Left field
+    }
+
+    @classmethod
+    def defensive_attributes_array(
+        cls,
+        position: np.ndarray,
+        oaa: np.ndarray,
+        sprint_speed: np.ndarray,
+        arm_strength_mph: np.ndarray,
+        drs: np.ndarray,
+        jump: np.ndarray,
+        jump_reaction: np.ndarray,
+        jump_burst: np.ndarray,
+        jump_route: np.ndarray,
+        fielding_pct: np.ndarray,
+        back_oaa: np.ndarray,
+        in_oaa: np.ndarray,
+        catch_5star_pct: np.ndarray,
+        catch_34star_pct: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Convert defensive metrics to v2 game attributes for many fielders.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            Primary position per fielder (object array of 'C', '1B', ..., 'RF')
+        oaa, sprint_speed, arm_strength_mph, drs, jump, jump_reaction, jump_burst,
+        jump_route, fielding_pct, back_oaa, in_oaa, catch_5star_pct, catch_34star_pct : np.ndarray
+            One float per fielder, NaN where the metric is not available
+            (see mlb_stats_to_defensive_attributes)
+
+        Returns
+        -------
+        dict
+            int64 arrays reaction_time, top_sprint_speed, route_efficiency,
+            arm_strength, arm_accuracy, fielding_secure, jump, burst,
+            range_back, range_in, catch_elite, catch_difficult
+        """
+        outfield = np.isin(position, ('LF', 'CF', 'RF'))
+        has_oaa, has_drs = ~np.isnan(oaa), ~np.isnan(drs)
+        has_sprint, has_jump = ~np.isnan(sprint_speed), ~np.isnan(jump)
+        scaled = cls._scaled_from_average
+        oaa_thresholds = (cls.FIELDER_OAA_ELITE, cls.FIELDER_OAA_GOOD,
+                          cls.FIELDER_OAA_AVG, cls.FIELDER_OAA_POOR)
+
+        # 1. TOP_SPRINT_SPEED - Direct from Statcast sprint speed
+        top_sprint_speed = cls._rating_where(
+            sprint_speed, has_sprint,
+            cls.HITTER_SPEED_ELITE,   # 29.5 ft/s = elite
+            cls.HITTER_SPEED_GOOD,    # 28.5 ft/s = good
+            cls.HITTER_SPEED_AVG,     # 27.5 ft/s = average
+            cls.HITTER_SPEED_POOR,    # 26.0 ft/s = poor
+        )
+
+        # 2. REACTION_TIME - From OAA (higher OAA = better fielder = faster reaction)
+        #
+        # FIX 2025-11-25: Was using inverse=True which caused ALL players to get 100k.
+        # The bug: inverse=True means "lower values are better" (like ERA), but for OAA
+        # higher values are better. Also was scaling OAA by 0.6 but comparing against
+        # unscaled thresholds.
+        #
+        # REACTION_TIME attribute: higher = faster reaction (100k = 0.00s, 0 = 0.30s)
+        # OAA metric: higher = better defender
+        # Therefore: inverse=False (higher OAA → higher attribute → faster reaction)
+        #
+        # 2025-11-26: Prefer Jump Reaction component when available (more direct measure)
+        # of an outfielder's first 1.5s; without OAA, outfielders fall back to the
+        # composite jump (4 ft jump ≈ +8 OAA equivalent)
+        has_reaction = ~np.isnan(jump_reaction)
+        reaction_time = np.select(
+            [has_reaction & outfield, has_oaa, has_jump & outfield],
+            [
+                cls._rating_where(
+                    jump_reaction, has_reaction,
+                    cls.FIELDER_REACTION_FT_ELITE,  # +2.5 ft = elite first step
+                    cls.FIELDER_REACTION_FT_GOOD,   # +1 ft = good
+                    cls.FIELDER_REACTION_FT_AVG,    # 0 ft = average
+                    cls.FIELDER_REACTION_FT_POOR,   # -2 ft = poor
+                ),
+                cls._rating_where(oaa, has_oaa, *oaa_thresholds),
+                cls._rating_where(jump * 2.0, has_jump, *oaa_thresholds),
+            ],
+            50000  # Default average
+        )
+
+        # 3. ROUTE_EFFICIENCY - From OAA + DRS composite, OR Jump Route component
+        # 2025-11-26: Prefer Jump Route component for outfielders (direct route measure)
+        has_route = ~np.isnan(jump_route)
+        route_score = np.where(has_oaa, oaa * 0.5, 0.0) + np.where(has_drs, drs * 0.5, 0.0)
+        route_efficiency = np.where(
+            has_route & outfield,
+            cls._rating_where(
+                jump_route, has_route,
+                cls.FIELDER_ROUTE_FT_ELITE,  # +1.5 ft = excellent routes
+                cls.FIELDER_ROUTE_FT_GOOD,   # +0.5 ft = good routes
+                cls.FIELDER_ROUTE_FT_AVG,    # 0 ft = average
+                cls.FIELDER_ROUTE_FT_POOR,   # -2 ft = poor routes
+            ),
+            # Fall back to OAA + DRS composite, on the average of their thresholds
+            cls._rating_where(
+                route_score, has_oaa | has_drs,
+                (cls.FIELDER_OAA_ELITE + cls.FIELDER_DRS_ELITE) / 2,  # ~9.0
+                (cls.FIELDER_OAA_GOOD + cls.FIELDER_DRS_GOOD) / 2,    # ~4.0
+                (cls.FIELDER_OAA_AVG + cls.FIELDER_DRS_AVG) / 2,      # 0.0
+                (cls.FIELDER_OAA_POOR + cls.FIELDER_DRS_POOR) / 2,    # ~-5.0
+            ),
+        )
+
+        # 4. ARM_STRENGTH - Position-specific from Statcast arm data
+        has_arm = ~np.isnan(arm_strength_mph)
+        arm_rating = np.full(len(position), 50000, dtype=np.int64)
+        for pos in set(position[has_arm].tolist()):
+            rows = has_arm & (position == pos)
+            thresh = cls.ARM_STRENGTH_THRESHOLDS.get(pos, cls.ARM_STRENGTH_THRESHOLDS['CF'])
+            arm_rating[rows] = cls.percentile_to_rating_array(
+                arm_strength_mph[rows], thresh['elite'], thresh['good'], thresh['avg'], thresh['poor']
+            )
+        # FIX 2025-11-25: When arm_strength_mph is not available, derive from OAA
+        # using a continuous scale instead of just 3 buckets (which gave everyone 50k or 70k).
+        # OAA correlates somewhat with arm (good fielders often have good arms), but arm
+        # and range are somewhat independent: 50k base + 3k per OAA point, capped at
+        # 20k-80k (leave room for actual arm data to exceed). DRS is the fallback.
+        arm_strength = np.select(
+            [has_arm, has_oaa, has_drs],
+            [arm_rating, scaled(oaa, 3000, 20000, 80000), scaled(drs, 2500, 20000, 80000)],
+            50000  # No defensive data - use average
+        )
+
+        # 5. FIELDING_SECURE - From fielding % (higher % = more secure)
+        fielding_secure = cls._rating_where(
+            fielding_pct, ~np.isnan(fielding_pct),
+            0.995,  # Elite fielding %
+            0.985,  # Good
+            0.975,  # Average
+            0.960,  # Poor
+        )
+
+        # 6. ARM_ACCURACY - Residual from defensive metrics
+        # Use DRS that isn't explained by range (proxy for throwing accuracy); without
+        # OAA, use DRS scaled down (less confident estimate)
+        accuracy_score = np.where(has_oaa, drs - (oaa * 0.5), drs * 0.3)
+        arm_accuracy = cls._rating_where(
+            accuracy_score, has_drs,
+            5.0,   # Elite accuracy
+            2.0,   # Good
+            0.0,   # Average
+            -3.0,  # Poor
+        )
+
+        # 7. BURST - Acceleration in second 1.5 seconds (from Jump Burst component)
+        # 2025-11-26: Outfielders without burst data derive it from sprint speed
+        # (29.5 ft/s → ~75k, 27.5 ft/s → ~50k, 26 ft/s → ~30k) or OAA.
+        # Infielders: burst less measured, default to average
+        has_burst = ~np.isnan(jump_burst)
+        burst = np.select(
+            [has_burst & outfield, outfield & has_sprint, outfield & has_oaa],
+            [
+                cls._rating_where(
+                    jump_burst, has_burst,
+                    cls.FIELDER_BURST_FT_ELITE,  # +2.5 ft = explosive acceleration
+                    cls.FIELDER_BURST_FT_GOOD,   # +1 ft = good
+                    cls.FIELDER_BURST_FT_AVG,    # 0 ft = average
+                    cls.FIELDER_BURST_FT_POOR,   # -2 ft = poor
+                ),
+                np.clip(np.trunc((sprint_speed - 27.5) * 12500 + 50000), 20000, 85000),
+                scaled(oaa, 2500, 20000, 85000),
+            ],
+            50000
+        )
+
+        # 8. JUMP - Direct mapping of Statcast jump metric (feet in right direction in 3s)
+        # This is a FIRST-CLASS attribute that models reaction + burst + route direction
+        # separately from pure reaction time or route efficiency. Typical range -4 to +6 ft.
+        # Without it, good outfielders typically have good jumps (+8 OAA → ~75k,
+        # -5 OAA → ~30k); for infielders jump is less critical, so OAA has less influence
+        jump_rating = np.select(
+            [has_jump, outfield & has_oaa, has_oaa],
+            [
+                cls._rating_where(
+                    jump, has_jump,
+                    cls.FIELDER_JUMP_ELITE,   # +4 ft = elite first step
+                    cls.FIELDER_JUMP_GOOD,    # +2 ft = good
+                    cls.FIELDER_JUMP_AVG,     # 0 ft = average
+                    cls.FIELDER_JUMP_POOR,    # -3 ft = poor
+                ),
+                scaled(oaa, 3125, 15000, 90000),  # ±25k swing over ±8 OAA range
+                scaled(oaa, 2000, 25000, 80000),
+            ],
+            50000
+        )
+
+        # 9. RANGE_BACK - Ability to go back on balls (from directional OAA)
+        # 2025-11-26: Without directional data, better overall fielders tend to be better
+        # going back; going back is less critical for infielders
+        has_back = ~np.isnan(back_oaa)
+        range_back = np.select(
+            [has_back, outfield & has_oaa, has_oaa],
+            [
+                cls._rating_where(
+                    back_oaa, has_back,
+                    cls.FIELDER_BACK_OAA_ELITE,  # +8 OAA back = elite
+                    cls.FIELDER_BACK_OAA_GOOD,   # +3 OAA = good
+                    cls.FIELDER_BACK_OAA_AVG,    # 0 = average
+                    cls.FIELDER_BACK_OAA_POOR,   # -5 OAA = poor
+                ),
+                scaled(oaa, 2500, 25000, 80000),
+                scaled(oaa, 1500, 30000, 75000),
+            ],
+            50000
+        )
+
+        # 10. RANGE_IN - Ability to come in on balls (from directional OAA)
+        # 2025-11-26: Outfielders fall back to OAA, then sprint speed (faster runners
+        # tend to charge better); charging ability is important for infielders
+        has_in = ~np.isnan(in_oaa)
+        range_in = np.select(
+            [has_in, outfield & has_oaa, outfield & has_sprint, ~outfield & has_oaa],
+            [
+                cls._rating_where(
+                    in_oaa, has_in,
+                    cls.FIELDER_IN_OAA_ELITE,  # +6 OAA in = elite
+                    cls.FIELDER_IN_OAA_GOOD,   # +2 OAA = good
+                    cls.FIELDER_IN_OAA_AVG,    # 0 = average
+                    cls.FIELDER_IN_OAA_POOR,   # -4 OAA = poor
+                ),
+                scaled(oaa, 2000, 25000, 80000),
+                np.clip(np.trunc((sprint_speed - 27.5) * 10000 + 50000), 30000, 75000),
+                scaled(oaa, 2500, 25000, 85000),
+            ],
+            50000
+        )
+
+        # 11. CATCH_ELITE - Ability to make 5-star catches (0-25% expected catch rate)
+        # 2025-11-26: Crow-Armstrong converts 59.4% of 5-star plays (elite is 50%+).
+        # Without catch probability data, elite fielders (high OAA) tend to make
+        # difficult catches (+8 OAA → ~75k, -5 OAA → ~30k); less so for infielders
+        has_catch_5 = ~np.isnan(catch_5star_pct)
+        catch_elite = np.select(
+            [has_catch_5 & outfield, outfield & has_oaa, has_oaa],
+            [
+                cls._rating_where(
+                    catch_5star_pct, has_catch_5,
+                    cls.FIELDER_CATCH_5STAR_ELITE,  # 50% = elite
+                    cls.FIELDER_CATCH_5STAR_GOOD,   # 35% = good
+                    cls.FIELDER_CATCH_5STAR_AVG,    # 20% = average
+                    cls.FIELDER_CATCH_5STAR_POOR,   # 10% = poor
+                ),
+                scaled(oaa, 3125, 20000, 85000),
+                scaled(oaa, 2000, 30000, 75000),
+            ],
+            50000
+        )
+
+        # 12. CATCH_DIFFICULT - Ability to make 3-4 star catches (25-75% expected)
+        # 2025-11-26: Same OAA fallback, tighter since 3-4 star has a higher baseline
+        has_catch_34 = ~np.isnan(catch_34star_pct)
+        catch_difficult = np.select(
+            [has_catch_34 & outfield, outfield & has_oaa, has_oaa],
+            [
+                cls._rating_where(
+                    catch_34star_pct, has_catch_34,
+                    cls.FIELDER_CATCH_34STAR_ELITE,  # 85% = elite
+                    cls.FIELDER_CATCH_34STAR_GOOD,   # 75% = good
+                    cls.FIELDER_CATCH_34STAR_AVG,    # 65% = average
+                    cls.FIELDER_CATCH_34STAR_POOR,   # 50% = poor
+                ),
+                scaled(oaa, 2500, 25000, 80000),
+                scaled(oaa, 2000, 30000, 75000),
+            ],
+            50000
+        )
+
+        columns = {
+            'top_sprint_speed': top_sprint_speed,
+            'reaction_time': reaction_time,
+            'route_efficiency': route_efficiency,
+            'arm_strength': arm_strength,
+            'fielding_secure': fielding_secure,
+            'arm_accuracy': arm_accuracy,
+            'burst': burst,
+            'jump': jump_rating,
+            'range_back': range_back,
+            'range_in': range_in,
+            'catch_elite': catch_elite,
+            'catch_difficult': catch_difficult,
+        }
+        return {name: values.astype(np.int64) for name, values in columns.items()}
+
     @classmethod
     def mlb_stats_to_defensive_attributes(
         cls,
@@ -908,367 +1189,16 @@ class StatsConverter:
               arm_strength, arm_accuracy, fielding_secure, jump,
               range_back, range_in, catch_elite, catch_difficult
         """
-        attrs = {}
-
-        # 1. TOP_SPRINT_SPEED - Direct from Statcast sprint speed
-        if sprint_speed is not None:
-            attrs['top_sprint_speed'] = cls.percentile_to_rating(
-                sprint_speed,
-                cls.HITTER_SPEED_ELITE,   # 29.5 ft/s = elite
-                cls.HITTER_SPEED_GOOD,    # 28.5 ft/s = good
-                cls.HITTER_SPEED_AVG,     # 27.5 ft/s = average
-                cls.HITTER_SPEED_POOR,    # 26.0 ft/s = poor
-                inverse=False
-            )
-        else:
-            attrs['top_sprint_speed'] = 50000  # Default average
-
-        # 2. REACTION_TIME - From OAA (higher OAA = better fielder = faster reaction)
-        # 
-        # FIX 2025-11-25: Was using inverse=True which caused ALL players to get 100k.
-        # The bug: inverse=True means "lower values are better" (like ERA), but for OAA
-        # higher values are better. Also was scaling OAA by 0.6 but comparing against
-        # unscaled thresholds.
-        #
-        # REACTION_TIME attribute: higher = faster reaction (100k = 0.00s, 0 = 0.30s)
-        # OAA metric: higher = better defender
-        # Therefore: inverse=False (higher OAA → higher attribute → faster reaction)
-        #
-        # 2025-11-26: Prefer Jump Reaction component when available (more direct measure)
-        if jump_reaction is not None and position in ['LF', 'CF', 'RF']:
-            # Outfielders with jump reaction data - direct measure of first 1.5s performance
-            attrs['reaction_time'] = cls.percentile_to_rating(
-                jump_reaction,
-                cls.FIELDER_REACTION_FT_ELITE,  # +2.5 ft = elite first step
-                cls.FIELDER_REACTION_FT_GOOD,   # +1 ft = good
-                cls.FIELDER_REACTION_FT_AVG,    # 0 ft = average
-                cls.FIELDER_REACTION_FT_POOR,   # -2 ft = poor
-                inverse=False
-            )
-        elif oaa is not None:
-            attrs['reaction_time'] = cls.percentile_to_rating(
-                oaa,  # Use OAA directly, not scaled
-                cls.FIELDER_OAA_ELITE,    # +8 OAA = elite reaction (90k-100k)
-                cls.FIELDER_OAA_GOOD,     # +3 OAA = good (70k-90k)
-                cls.FIELDER_OAA_AVG,      # 0 OAA = average (50k-70k)
-                cls.FIELDER_OAA_POOR,     # -5 OAA = poor (30k-50k)
-                inverse=False  # Higher OAA = higher rating = faster reaction
-            )
-        elif jump is not None and position in ['LF', 'CF', 'RF']:
-            # Outfielders: use composite jump metric if OAA not available
-            # Jump is typically 0-5 ft range, scale to match OAA thresholds
-            jump_as_oaa = jump * 2.0  # Rough conversion: 4 ft jump ≈ +8 OAA equivalent
-            attrs['reaction_time'] = cls.percentile_to_rating(
-                jump_as_oaa,
-                cls.FIELDER_OAA_ELITE,
-                cls.FIELDER_OAA_GOOD,
-                cls.FIELDER_OAA_AVG,
-                cls.FIELDER_OAA_POOR,
-                inverse=False
-            )
-        else:
-            attrs['reaction_time'] = 50000  # Default average
-
-        # 3. ROUTE_EFFICIENCY - From OAA + DRS composite, OR Jump Route component
-        # 2025-11-26: Prefer Jump Route component for outfielders (direct route measure)
-        if jump_route is not None and position in ['LF', 'CF', 'RF']:
-            # Outfielders with jump route data - direct measure of direction efficiency
-            attrs['route_efficiency'] = cls.percentile_to_rating(
-                jump_route,
-                cls.FIELDER_ROUTE_FT_ELITE,  # +1.5 ft = excellent routes
-                cls.FIELDER_ROUTE_FT_GOOD,   # +0.5 ft = good routes
-                cls.FIELDER_ROUTE_FT_AVG,    # 0 ft = average
-                cls.FIELDER_ROUTE_FT_POOR,   # -2 ft = poor routes
-                inverse=False
-            )
-        else:
-            # Fall back to OAA + DRS composite
-            route_score = 0.0
-            has_route_data = False
-
-            if oaa is not None:
-                route_score += oaa * 0.5
-                has_route_data = True
-
-            if drs is not None:
-                route_score += drs * 0.5
-                has_route_data = True
-
-            if has_route_data:
-                # Use average of OAA and DRS thresholds
-                attrs['route_efficiency'] = cls.percentile_to_rating(
-                    route_score,
-                    (cls.FIELDER_OAA_ELITE + cls.FIELDER_DRS_ELITE) / 2,  # ~9.0
-                    (cls.FIELDER_OAA_GOOD + cls.FIELDER_DRS_GOOD) / 2,    # ~4.0
-                    (cls.FIELDER_OAA_AVG + cls.FIELDER_DRS_AVG) / 2,      # 0.0
-                    (cls.FIELDER_OAA_POOR + cls.FIELDER_DRS_POOR) / 2,    # ~-5.0
-                    inverse=False
-                )
-            else:
-                attrs['route_efficiency'] = 50000
-
-        # 4. ARM_STRENGTH - Position-specific from Statcast arm data
-        # Position-specific thresholds (in mph)
-        position_thresholds = {
-            'C': {'elite': 83, 'good': 80, 'avg': 77, 'poor': 74},  # Catcher
-            'SS': {'elite': 88, 'good': 85, 'avg': 82, 'poor': 79},  # Shortstop
-            '3B': {'elite': 88, 'good': 85, 'avg': 82, 'poor': 79},  # Third base
-            '2B': {'elite': 85, 'good': 82, 'avg': 79, 'poor': 76},  # Second base
-            '1B': {'elite': 85, 'good': 82, 'avg': 79, 'poor': 76},  # First base
-            'RF': {'elite': 92, 'good': 88, 'avg': 85, 'poor': 82},  # Right field (strongest)
-            'CF': {'elite': 90, 'good': 87, 'avg': 84, 'poor': 81},  # Center field
-            'LF': {'elite': 88, 'good': 85, 'avg': 82, 'poor': 79},  # Left field
-        }
-
-        thresh = position_thresholds.get(position, position_thresholds.get('CF', position_thresholds['CF']))
-
-        if arm_strength_mph is not None:
-            attrs['arm_strength'] = cls.percentile_to_rating(
-                arm_strength_mph,
-                thresh['elite'],
-                thresh['good'],
-                thresh['avg'],
-                thresh['poor'],
-                inverse=False
-            )
-        else:
-            # FIX 2025-11-25: When arm_strength_mph is not available, derive from OAA
-            # using a continuous scale instead of just 3 buckets (which gave everyone 50k or 70k).
-            #
-            # Use OAA to estimate arm strength on the 0-100k scale directly.
-            # OAA correlates somewhat with arm (good fielders often have good arms),
-            # but add some variance since arm and range are somewhat independent.
-            #
-            # Mapping: OAA -> arm_strength attribute
-            # +10 OAA -> ~80k (very good arm)
-            # +5 OAA -> ~65k (above average)
-            # 0 OAA -> ~50k (average)
-            # -5 OAA -> ~35k (below average)
-            # -10 OAA -> ~20k (poor arm)
-            if oaa is not None:
-                # Scale OAA to arm strength: 50k base + 3k per OAA point
-                # Capped at 20k-80k range (leave room for actual arm data to exceed)
-                arm_from_oaa = 50000 + int(oaa * 3000)
-                attrs['arm_strength'] = int(np.clip(arm_from_oaa, 20000, 80000))
-            elif drs is not None:
-                # DRS as fallback (similar scale)
-                arm_from_drs = 50000 + int(drs * 2500)
-                attrs['arm_strength'] = int(np.clip(arm_from_drs, 20000, 80000))
-            else:
-                # No defensive data - use average
-                attrs['arm_strength'] = 50000
-
-        # 5. FIELDING_SECURE - From fielding % (higher % = more secure)
-        if fielding_pct is not None:
-            attrs['fielding_secure'] = cls.percentile_to_rating(
-                fielding_pct,
-                0.995,  # Elite fielding %
-                0.985,  # Good
-                0.975,  # Average
-                0.960,  # Poor
-                inverse=False
-            )
-        else:
-            attrs['fielding_secure'] = 50000
-
-        # 6. ARM_ACCURACY - Residual from defensive metrics
-        # Use DRS that isn't explained by range (proxy for throwing accuracy)
-        if drs is not None:
-            # If we have OAA, calculate residual
-            # If not, use DRS scaled down (less confident estimate)
-            if oaa is not None:
-                accuracy_score = drs - (oaa * 0.5)  # DRS beyond range
-            else:
-                accuracy_score = drs * 0.3  # Conservative estimate from DRS alone
-
-            attrs['arm_accuracy'] = cls.percentile_to_rating(
-                accuracy_score,
-                5.0,   # Elite accuracy
-                2.0,   # Good
-                0.0,   # Average
-                -3.0,  # Poor
-                inverse=False
-            )
-        else:
-            attrs['arm_accuracy'] = 50000
-
-        # 7. BURST - Acceleration in second 1.5 seconds (from Jump Burst component)
-        # 2025-11-26: New attribute mapping Statcast Burst component
-        if jump_burst is not None and position in ['LF', 'CF', 'RF']:
-            # Outfielders with burst data - direct measure of acceleration phase
-            attrs['burst'] = cls.percentile_to_rating(
-                jump_burst,
-                cls.FIELDER_BURST_FT_ELITE,  # +2.5 ft = explosive acceleration
-                cls.FIELDER_BURST_FT_GOOD,   # +1 ft = good
-                cls.FIELDER_BURST_FT_AVG,    # 0 ft = average
-                cls.FIELDER_BURST_FT_POOR,   # -2 ft = poor
-                inverse=False
-            )
-        elif position in ['LF', 'CF', 'RF']:
-            # Outfielders without burst data - derive from OAA or sprint speed
-            if sprint_speed is not None:
-                # Faster players tend to have better burst
-                # Estimate: 29.5 ft/s → ~75k, 27.5 ft/s → ~50k, 26 ft/s → ~30k
-                burst_from_speed = int((sprint_speed - 27.5) * 12500 + 50000)
-                attrs['burst'] = int(np.clip(burst_from_speed, 20000, 85000))
-            elif oaa is not None:
-                # Use OAA as proxy
-                burst_from_oaa = 50000 + int(oaa * 2500)
-                attrs['burst'] = int(np.clip(burst_from_oaa, 20000, 85000))
-            else:
-                attrs['burst'] = 50000
-        else:
-            # Infielders: burst less measured, default to average
-            attrs['burst'] = 50000
-
-        # 8. JUMP - Direct mapping of Statcast jump metric (feet in right direction in 3s)
-        # This is a FIRST-CLASS attribute that models reaction + burst + route direction
-        # separately from pure reaction time or route efficiency
-        if jump is not None:
-            # Jump metric: typical range -4 to +6 ft
-            # Positive = moved towards ball in first 3 seconds
-            # Negative = initially wrong direction
-            attrs['jump'] = cls.percentile_to_rating(
-                jump,
-                cls.FIELDER_JUMP_ELITE,   # +4 ft = elite first step
-                cls.FIELDER_JUMP_GOOD,    # +2 ft = good
-                cls.FIELDER_JUMP_AVG,     # 0 ft = average
-                cls.FIELDER_JUMP_POOR,    # -3 ft = poor
-                inverse=False  # Higher jump is better
-            )
-        elif position in ['LF', 'CF', 'RF']:
-            # Outfielders: derive from OAA if available
-            # Good outfielders typically have good jumps
-            if oaa is not None:
-                # Scale OAA to jump rating: higher OAA = better jump
-                # +8 OAA → ~75k, 0 OAA → ~50k, -5 OAA → ~30k
-                jump_from_oaa = 50000 + int(oaa * 3125)  # ±25k swing over ±8 OAA range
-                attrs['jump'] = int(np.clip(jump_from_oaa, 15000, 90000))
-            else:
-                attrs['jump'] = 50000  # Default average for outfielders
-        else:
-            # Infielders: jump is less critical, default to average
-            # But if we have OAA, use a smaller influence
-            if oaa is not None:
-                jump_from_oaa = 50000 + int(oaa * 2000)  # Smaller influence for infielders
-                attrs['jump'] = int(np.clip(jump_from_oaa, 25000, 80000))
-            else:
-                attrs['jump'] = 50000
-
-        # 9. RANGE_BACK - Ability to go back on balls (from directional OAA)
-        # 2025-11-26: New attribute for player-specific backward movement ability
-        if back_oaa is not None:
-            attrs['range_back'] = cls.percentile_to_rating(
-                back_oaa,
-                cls.FIELDER_BACK_OAA_ELITE,  # +8 OAA back = elite
-                cls.FIELDER_BACK_OAA_GOOD,   # +3 OAA = good
-                cls.FIELDER_BACK_OAA_AVG,    # 0 = average
-                cls.FIELDER_BACK_OAA_POOR,   # -5 OAA = poor
-                inverse=False  # Higher back_oaa is better
-            )
-        elif position in ['LF', 'CF', 'RF']:
-            # Outfielders: derive from OAA if available (back range is important)
-            if oaa is not None:
-                # Estimate: better overall fielders tend to be better going back
-                range_back_from_oaa = 50000 + int(oaa * 2500)
-                attrs['range_back'] = int(np.clip(range_back_from_oaa, 25000, 80000))
-            else:
-                attrs['range_back'] = 50000
-        else:
-            # Infielders: going back is less critical, default closer to average
-            if oaa is not None:
-                range_back_from_oaa = 50000 + int(oaa * 1500)
-                attrs['range_back'] = int(np.clip(range_back_from_oaa, 30000, 75000))
-            else:
-                attrs['range_back'] = 50000
-
-        # 10. RANGE_IN - Ability to come in on balls (from directional OAA)
-        # 2025-11-26: New attribute for player-specific forward/charging movement
-        if in_oaa is not None:
-            attrs['range_in'] = cls.percentile_to_rating(
-                in_oaa,
-                cls.FIELDER_IN_OAA_ELITE,  # +6 OAA in = elite
-                cls.FIELDER_IN_OAA_GOOD,   # +2 OAA = good
-                cls.FIELDER_IN_OAA_AVG,    # 0 = average
-                cls.FIELDER_IN_OAA_POOR,   # -4 OAA = poor
-                inverse=False  # Higher in_oaa is better
-            )
-        elif position in ['LF', 'CF', 'RF']:
-            # Outfielders: derive from OAA + sprint speed
-            if oaa is not None:
-                range_in_from_oaa = 50000 + int(oaa * 2000)
-                attrs['range_in'] = int(np.clip(range_in_from_oaa, 25000, 80000))
-            elif sprint_speed is not None:
-                # Faster runners tend to charge better
-                range_in_from_speed = int((sprint_speed - 27.5) * 10000 + 50000)
-                attrs['range_in'] = int(np.clip(range_in_from_speed, 30000, 75000))
-            else:
-                attrs['range_in'] = 50000
-        else:
-            # Infielders: charging ability is important
-            if oaa is not None:
-                range_in_from_oaa = 50000 + int(oaa * 2500)
-                attrs['range_in'] = int(np.clip(range_in_from_oaa, 25000, 85000))
-            else:
-                attrs['range_in'] = 50000
-
-        # 11. CATCH_ELITE - Ability to make 5-star catches (0-25% expected catch rate)
-        # 2025-11-26: New attribute for player-specific elite catch ability
-        # Crow-Armstrong converts 59.4% of 5-star plays (elite is 50%+)
-        if catch_5star_pct is not None and position in ['LF', 'CF', 'RF']:
-            attrs['catch_elite'] = cls.percentile_to_rating(
-                catch_5star_pct,
-                cls.FIELDER_CATCH_5STAR_ELITE,  # 50% = elite
-                cls.FIELDER_CATCH_5STAR_GOOD,   # 35% = good
-                cls.FIELDER_CATCH_5STAR_AVG,    # 20% = average
-                cls.FIELDER_CATCH_5STAR_POOR,   # 10% = poor
-                inverse=False  # Higher catch % is better
-            )
-        elif position in ['LF', 'CF', 'RF']:
-            # Outfielders without catch probability data - derive from OAA
-            # Elite fielders (high OAA) tend to make difficult catches
-            if oaa is not None:
-                # +8 OAA → ~75k, 0 OAA → ~50k, -5 OAA → ~30k
-                catch_elite_from_oaa = 50000 + int(oaa * 3125)
-                attrs['catch_elite'] = int(np.clip(catch_elite_from_oaa, 20000, 85000))
-            else:
-                attrs['catch_elite'] = 50000
-        else:
-            # Infielders: elite catches less common, use OAA influence
-            if oaa is not None:
-                catch_elite_from_oaa = 50000 + int(oaa * 2000)
-                attrs['catch_elite'] = int(np.clip(catch_elite_from_oaa, 30000, 75000))
-            else:
-                attrs['catch_elite'] = 50000
-
-        # 12. CATCH_DIFFICULT - Ability to make 3-4 star catches (25-75% expected)
-        # 2025-11-26: New attribute for player-specific difficult catch ability
-        if catch_34star_pct is not None and position in ['LF', 'CF', 'RF']:
-            attrs['catch_difficult'] = cls.percentile_to_rating(
-                catch_34star_pct,
-                cls.FIELDER_CATCH_34STAR_ELITE,  # 85% = elite
-                cls.FIELDER_CATCH_34STAR_GOOD,   # 75% = good
-                cls.FIELDER_CATCH_34STAR_AVG,    # 65% = average
-                cls.FIELDER_CATCH_34STAR_POOR,   # 50% = poor
-                inverse=False  # Higher catch % is better
-            )
-        elif position in ['LF', 'CF', 'RF']:
-            # Outfielders without catch probability data - derive from OAA
-            if oaa is not None:
-                # Similar scale but tighter since 3-4 star has higher baseline
-                catch_diff_from_oaa = 50000 + int(oaa * 2500)
-                attrs['catch_difficult'] = int(np.clip(catch_diff_from_oaa, 25000, 80000))
-            else:
-                attrs['catch_difficult'] = 50000
-        else:
-            # Infielders: derive from OAA
-            if oaa is not None:
-                catch_diff_from_oaa = 50000 + int(oaa * 2000)
-                attrs['catch_difficult'] = int(np.clip(catch_diff_from_oaa, 30000, 75000))
-            else:
-                attrs['catch_difficult'] = 50000
-
-        return attrs
+        return cls._first_row(cls.defensive_attributes_array(
+            np.array([position], dtype=object),
+            **cls._one_row(
+                oaa=oaa, sprint_speed=sprint_speed, arm_strength_mph=arm_strength_mph,
+                drs=drs, jump=jump, jump_reaction=jump_reaction, jump_burst=jump_burst,
+                jump_route=jump_route, fielding_pct=fielding_pct, back_oaa=back_oaa,
+                in_oaa=in_oaa, catch_5star_pct=catch_5star_pct,
+                catch_34star_pct=catch_34star_pct,
+            ),
+        ))
 
     @staticmethod
     def pitch_effectiveness_to_attributes(
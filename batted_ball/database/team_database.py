@@ -16,6 +16,12 @@ import numpy as np
 
 from .db_schema import DatabaseSchema
 from .stats_converter import StatsConverter
+from .roster_builder import (
+    pitcher_stat_ratings,
+    hitter_stat_ratings,
+    defensive_stat_ratings,
+    rating_records,
+)
 from .pybaseball_fetcher import PybaseballFetcher
 from .team_mappings import get_team_division, get_db_abbr, TEAM_DIVISIONS
 
@@ -157,11 +163,16 @@ class TeamDatabase:
             team_id = cursor.lastrowid
             print(f"  Created new team (ID: {team_id}) - {league} {division}")
 
+        # Convert stats to attributes for the whole roster at once
+        pitcher_attrs = rating_records(pitcher_stat_ratings(pitchers_df))
+        hitter_attrs = rating_records(hitter_stat_ratings(hitters_df))
+        defensive_attrs = rating_records(defensive_stat_ratings(hitters_df))
+
         # Store pitchers
         num_pitchers = 0
         print(f"\n  Storing {len(pitchers_df)} pitchers...")
-        for _, row in pitchers_df.iterrows():
-            pitcher_id = self._store_pitcher(row, season)
+        for (_, row), attrs in zip(pitchers_df.iterrows(), pitcher_attrs):
+            pitcher_id = self._store_pitcher(row, season, attrs)
             if pitcher_id:
                 # Link to team
                 cursor.execute("""
@@ -173,8 +184,8 @@ class TeamDatabase:
         # Store hitters
         num_hitters = 0
         print(f"  Storing {len(hitters_df)} hitters...")
-        for idx, row in hitters_df.iterrows():
-            hitter_id = self._store_hitter(row, season)
+        for (idx, row), attrs, defense in zip(hitters_df.iterrows(), hitter_attrs, defensive_attrs):
+            hitter_id = self._store_hitter(row, season, attrs, defense)
             if hitter_id:
                 # Link to team (batting order = order in dataframe)
                 cursor.execute("""
@@ -199,19 +210,12 @@ class TeamDatabase:
 
         return num_pitchers, num_hitters
 
-    def _store_pitcher(self, stats: pd.Series, season: int) -> Optional[int]:
-        """Store a pitcher in the database (v2: includes PUTAWAY_SKILL, NIBBLING_TENDENCY)."""
-        # Convert stats to attributes using v2 method
-        attrs = self.converter.mlb_stats_to_pitcher_attributes_v2(
-            era=clean_value(stats.get('era')),
-            whip=clean_value(stats.get('whip')),
-            k_per_9=clean_value(stats.get('k_per_9')),
-            bb_per_9=clean_value(stats.get('bb_per_9')),
-            avg_fastball_velo=clean_value(stats.get('avg_fastball_velo')),
-            innings_pitched=clean_value(stats.get('innings_pitched')),
-            games_pitched=clean_value(stats.get('games_pitched')),
-        )
+    def _store_pitcher(self, stats: pd.Series, season: int, attrs: Dict) -> Optional[int]:
+        """
+        Store a pitcher in the database (v2: includes PUTAWAY_SKILL, NIBBLING_TENDENCY).
 
+        attrs is the pitcher's row of roster_builder.pitcher_stat_ratings().
+        """
         cursor = self.conn.cursor()
 
         # Check if pitcher exists
@@ -266,47 +270,19 @@ class TeamDatabase:
 
         return pitcher_id
 
-    def _store_hitter(self, stats: pd.Series, season: int) -> Optional[int]:
-        """Store a hitter in the database (v2: includes VISION + defensive attributes)."""
-        # Convert offensive stats to attributes using v2 method (includes VISION)
-        attrs = self.converter.mlb_stats_to_hitter_attributes_v2(
-            batting_avg=clean_value(stats.get('batting_avg')),
-            on_base_pct=clean_value(stats.get('on_base_pct')),
-            slugging_pct=clean_value(stats.get('slugging_pct')),
-            ops=clean_value(stats.get('ops')),
-            home_runs=clean_value(stats.get('home_runs')),
-            strikeouts=clean_value(stats.get('strikeouts')),
-            walks=clean_value(stats.get('walks')),
-            at_bats=clean_value(stats.get('at_bats')),
-            avg_exit_velo=clean_value(stats.get('avg_exit_velo')),
-            max_exit_velo=clean_value(stats.get('max_exit_velo')),
-            barrel_pct=clean_value(stats.get('barrel_pct')),
-            sprint_speed=clean_value(stats.get('sprint_speed')),
-            stolen_bases=clean_value(stats.get('stolen_bases')),
-        )
+    def _store_hitter(
+        self, stats: pd.Series, season: int, attrs: Dict, defensive_attrs: Dict
+    ) -> Optional[int]:
+        """
+        Store a hitter in the database (v2: includes VISION + defensive attributes).
 
-        # Convert defensive metrics to attributes (v2: CRITICAL for BABIP tuning)
+        attrs and defensive_attrs are the hitter's rows of
+        roster_builder.hitter_stat_ratings() and defensive_stat_ratings().
+        """
         position = clean_value(stats.get('primary_position', 'LF'))  # Default to LF if missing
         if position is None or position == '':
             position = 'LF'  # Fallback default
 
-        defensive_attrs = self.converter.mlb_stats_to_defensive_attributes(
-            position=position,
-            oaa=clean_value(stats.get('oaa')),
-            sprint_speed=clean_value(stats.get('sprint_speed')),
-            arm_strength_mph=clean_value(stats.get('arm_strength_mph')),
-            drs=clean_value(stats.get('drs')),
-            jump=clean_value(stats.get('jump')),
-            jump_reaction=clean_value(stats.get('jump_reaction')),  # v3: Jump Reaction component
-            jump_burst=clean_value(stats.get('jump_burst')),        # v3: Jump Burst component
-            jump_route=clean_value(stats.get('jump_route')),        # v3: Jump Route component
-            fielding_pct=clean_value(stats.get('fielding_pct')),
-            back_oaa=clean_value(stats.get('back_oaa')),            # v3: Directional OAA going back
-            in_oaa=clean_value(stats.get('in_oaa')),                # v3: Directional OAA coming in
-            catch_5star_pct=clean_value(stats.get('catch_5star_pct')),    # v3: Catch probability 5-star
-            catch_34star_pct=clean_value(stats.get('catch_34star_pct')),  # v3: Catch probability 3-4 star
-        )
-
         cursor = self.conn.cursor()
 
         # Check if hitter exists
@@ -13,13 +13,19 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from batted_ball import Pitcher, Hitter
-from batted_ball.attributes import PitcherAttributes, HitterAttributes
+from batted_ball.attributes import PitcherAttributes, HitterAttributes, FielderAttributes
 from batted_ball.game_simulation import Team
 from batted_ball.player import generate_pitch_arsenal
 from batted_ball.defense_factory import create_standard_defense
 from batted_ball.ballpark_effects import get_ballpark_for_team
 
 from .team_database import TeamDatabase
+from .roster_builder import (
+    attributes_from_columns,
+    build_hitter_columns,
+    build_fielder_columns,
+    build_pitcher_columns,
+)
 
 
 class TeamLoader:
@@ -101,17 +107,26 @@ class TeamLoader:
         # Combine: starters first, then relievers
         pitcher_records = starter_records + reliever_records
 
-        # Convert pitchers
+        # Convert pitchers (attributes for the whole staff in one vectorized pass)
+        pitcher_attrs = attributes_from_columns(
+            PitcherAttributes, build_pitcher_columns(pitcher_records)
+        )
         pitchers = []
-        for record in pitcher_records:
-            pitcher = self._create_pitcher_from_record(record)
+        for record, attrs in zip(pitcher_records, pitcher_attrs):
+            pitcher = self._create_pitcher_from_record(record, attrs)
             if pitcher:
                 pitchers.append(pitcher)
 
-        # Convert hitters
+        # Convert hitters (batting and defensive attributes batched the same way)
+        hitter_attrs = attributes_from_columns(
+            HitterAttributes, build_hitter_columns(hitter_records)
+        )
+        defensive_attrs = attributes_from_columns(
+            FielderAttributes, build_fielder_columns(hitter_records)
+        )
         hitters = []
-        for record in hitter_records:
-            hitter = self._create_hitter_from_record(record)
+        for record, attrs, fielder_attrs in zip(hitter_records, hitter_attrs, defensive_attrs):
+            hitter = self._create_hitter_from_record(record, attrs, fielder_attrs)
             if hitter:
                 hitters.append(hitter)
 
@@ -177,7 +192,11 @@ class TeamLoader:
 
         return team
 
-    def _create_pitcher_from_record(self, record: Dict) -> Optional[Pitcher]:
+    def _create_pitcher_from_record(
+        self,
+        record: Dict,
+        attrs: Optional[PitcherAttributes] = None
+    ) -> Optional[Pitcher]:
         """
         Create a Pitcher object from database record (v2: includes NIBBLING_TENDENCY).
 
@@ -185,27 +204,19 @@ class TeamLoader:
         ----------
         record : dict
             Database record with pitcher stats and attributes
+        attrs : PitcherAttributes, optional
+            Attributes already built by roster_builder (built from the record
+            when omitted)
 
         Returns
         -------
         Pitcher or None
         """
-        # Create PitcherAttributes from stored ratings (v1 + v2)
+        # Stored ratings → PitcherAttributes (v1 + v2), see roster_builder.pitcher_rating_columns
         # Note: PUTAWAY_SKILL was removed - put-away mechanism uses get_stuff_rating()
         # which is calculated from RAW_VELOCITY_CAP, SPIN_RATE_CAP, and DECEPTION
-        
-        # NIBBLING_TENDENCY: Database stores as 0.0-1.0 REAL, but PitcherAttributes needs 0-100k
-        nibbling_db = record.get('nibbling_tendency', 0.50)  # Get 0.0-1.0 value
-        nibbling_attr = int(nibbling_db * 100000)  # Convert to 0-100k scale
-        
-        attrs = PitcherAttributes(
-            RAW_VELOCITY_CAP=record['velocity'],
-            COMMAND=record['command'],
-            STAMINA=record['stamina'],
-            SPIN_RATE_CAP=record['movement'],  # Use movement for spin
-            # v2 attribute (Phase 2B addition)
-            NIBBLING_TENDENCY=nibbling_attr,  # Converted from 0.0-1.0 to 0-100k
-        )
+        if attrs is None:
+            attrs = attributes_from_columns(PitcherAttributes, build_pitcher_columns([record]))[0]
 
         # Determine if starter based on is_starter flag from team_rosters
         # Fallback: use games_pitched heuristic if flag not available
@@ -229,156 +240,40 @@ class TeamLoader:
 
         return pitcher
 
-    def _create_hitter_from_record(self, record: Dict) -> Optional[Hitter]:
+    def _create_hitter_from_record(
+        self,
+        record: Dict,
+        hitter_attrs: Optional[HitterAttributes] = None,
+        defensive_attrs: Optional[FielderAttributes] = None
+    ) -> Optional[Hitter]:
         """
         Create a Hitter object from database record (v2: includes VISION + defensive attributes).
-        
+
         PHASE 3 UPDATE (2025-11-26): Uses real bat tracking data when available:
-        - bat_speed (mph) → actual_bat_speed_mph (direct, scaled to sim range)
+        - bat_speed (mph) → actual_bat_speed_mph (direct, TRUE values)
         - squared_up_rate → actual_barrel_accuracy_mm (converted via mapping)
-        
+
         When Statcast data is available, it's used directly. Otherwise, falls back
-        to attribute-based derivation.
+        to attribute-based derivation. The rating adjustments live in
+        roster_builder.hitter_rating_columns.
 
         Parameters
         ----------
         record : dict
             Database record with hitter stats and attributes
+        hitter_attrs : HitterAttributes, optional
+            Batting attributes already built by roster_builder
+        defensive_attrs : FielderAttributes, optional
+            Defensive attributes already built by roster_builder
 
         Returns
         -------
         Hitter or None
         """
-        # Get power rating (needed for AAC calculation regardless of bat tracking availability)
-        raw_power = record['power']
-        
-        # ============================================================
-        # BAT_SPEED: Use real bat tracking data if available (TRUE values)
-        # ============================================================
-        # Bat tracking data provides actual swing speed in mph from Baseball Savant
-        # 
-        # PHASE 3 UPDATE 2025-11-26: Using TRUE bat speeds (no scaling)
-        # Real MLB bat speeds: 63-79 mph
-        # 
-        # To compensate for lower bat speeds, collision efficiency (q) was increased
-        # from 0.13 to 0.18. This maintains the same exit velocities while using
-        # physically accurate bat speeds from Statcast data.
-        #
-        # Math: EV = q × pitch_speed + (1 + q) × bat_speed
-        # Old: q_eff=0.064, bat=83 mph → 89 mph EV
-        # New: q_eff=0.110, bat=71 mph → 89 mph EV (same result)
-        actual_bat_speed_mph = record.get('bat_speed')
-        true_bat_speed_mph = None  # Will be passed to HitterAttributes
-        
-        if actual_bat_speed_mph is not None and actual_bat_speed_mph > 0:
-            # Use TRUE bat speed directly (no scaling)
-            true_bat_speed_mph = float(actual_bat_speed_mph)
-            # Use 50k as placeholder BAT_SPEED rating (won't be used due to actual value)
-            boosted_bat_speed = 50000
-        else:
-            # Fallback: Use power-based estimation (legacy method)
-            # FIX 2025-11-25: Boosted BAT_SPEED to match generic teams
-            if raw_power >= 70000:
-                bat_speed_boost = 25000  # Power hitters
-            elif raw_power >= 50000:
-                bat_speed_boost = 22000  # Balanced hitters
-            else:
-                bat_speed_boost = 18000  # Contact hitters
-
-            boosted_bat_speed = min(raw_power + bat_speed_boost, 100000)
-
-        # ============================================================
-        # BARREL_ACCURACY: Convert squared-up rate to barrel error in mm
-        # ============================================================
-        # squared_up_rate from bat tracking tells us how often hitter squares up the ball
-        # Range: ~16% to ~43% (MLB 2024 data)
-        # 
-        # PHASE 3: Direct conversion to physical barrel accuracy
-        # Higher squared_up_rate → smaller error → more solid contact
-        base_barrel_accuracy = record['contact']  # For fallback rating
-        actual_barrel_accuracy_mm = None  # Will be passed to HitterAttributes
-        
-        squared_up_rate = record.get('squared_up_rate')
-        if squared_up_rate is not None and squared_up_rate > 0:
-            # Convert squared-up rate to barrel error in mm using research mapping:
-            # - 0.36 (elite, ~36%) → 7.5mm (0.3")
-            # - 0.28 (average, ~28%) → 15mm (0.6")
-            # - 0.18 (poor, ~18%) → 25mm (1.0")
-            # 
-            # Linear interpolation: error = 40 - 90*rate (clamped to 5-30mm range)
-            # This formula gives:
-            #   rate=0.40 → 40-36=4mm (elite)
-            #   rate=0.28 → 40-25.2=14.8mm (average)  
-            #   rate=0.18 → 40-16.2=23.8mm (poor)
-            #   rate=0.10 → 40-9=31mm (very poor)
-            squared_up_pct = squared_up_rate if squared_up_rate < 1 else squared_up_rate / 100
-            barrel_error_mm = 40.0 - 90.0 * squared_up_pct
-            actual_barrel_accuracy_mm = max(5.0, min(30.0, barrel_error_mm))
-            # Keep base_barrel_accuracy as fallback rating (won't be used due to actual value)
-            adjusted_barrel_accuracy = base_barrel_accuracy
-        else:
-            # No squared-up data - use contact attribute only
-            adjusted_barrel_accuracy = base_barrel_accuracy
-
-        # ATTACK_ANGLE_CONTROL: Use stored value if available, otherwise boost based on power
-        # FIX 2025-11-25 v3: ALWAYS apply boost to match generic team creation
-        # Generic teams use: power=72-88k (18-24° LA), balanced=58-75k (13-18° LA)
-        # 
-        # The problem is that stored AAC values from stats_converter (50-70k) are too 
-        # conservative compared to generic teams. Even elite power hitters like Michael Busch
-        # (34 HR, .523 SLG) only get ~68k AAC, but need 75-85k for realistic HR production.
-        #
-        # Solution: Apply aggressive boost based on power level + home run rate indicators
-        stored_aac = record.get('attack_angle_control')
-        
-        # Get HR rate indicators from the record
-        hr_count = record.get('home_runs', 0) or 0
-        ab_count = record.get('at_bats', 1) or 1  # Avoid division by zero
-        slg = record.get('slugging_pct', 0.400) or 0.400
-        
-        # Determine hitter archetype based on ACTUAL production, not power rating
-        is_elite_power = (hr_count >= 35) or (slg >= 0.550)  # Top ~10-15 hitters in MLB
-        is_good_power = (hr_count >= 25) or (slg >= 0.480)   # Top 30-40 power hitters
-        is_moderate_power = (hr_count >= 15) or (slg >= 0.420)
-        
-        # Calculate AAC based on actual production - conservative for realistic GB%
-        if is_elite_power:
-            min_aac = 80000  # Elite power: 80k for ~15.8° mean LA
-        elif is_good_power:
-            min_aac = 70000  # Good power: 70k for ~13.8° mean LA
-        elif is_moderate_power:
-            min_aac = 60000  # Moderate power: 60k for ~10.4° mean LA
-        elif raw_power >= 40000:
-            min_aac = 50000  # Average hitter: 50k for ~7° mean LA (MLB average)
-        else:
-            min_aac = 45000  # Contact/speed hitter: 45k for ~5° mean LA (more GBs)
-        
-        if stored_aac is None or stored_aac == 0:
-            attack_angle_control = min_aac
-        else:
-            attack_angle_control = max(stored_aac, min_aac)
-
-        # Get hard swing rate from bat tracking data (PHASE 3.1: EV variance)
-        # MLB range: ~0.45 to ~0.97. Higher = more max-effort swings = wider EV distribution
-        hard_swing_rate_raw = record.get('hard_swing_rate')
-        hard_swing_rate = None
-        if hard_swing_rate_raw is not None and hard_swing_rate_raw > 0:
-            # Normalize to 0-1 range (database stores as decimal like 0.72)
-            hard_swing_rate = float(hard_swing_rate_raw) if hard_swing_rate_raw <= 1.0 else hard_swing_rate_raw / 100.0
-        
-        # Create HitterAttributes with actual Statcast data if available
-        hitter_attrs = HitterAttributes(
-            BAT_SPEED=boosted_bat_speed,  # Rating (used if actual not available)
-            BARREL_ACCURACY=adjusted_barrel_accuracy,  # Rating (used if actual not available)
-            ZONE_DISCERNMENT=record['discipline'],  # Discipline maps to pitch recognition
-            VISION=record.get('vision', 50000),  # Contact frequency, default to average
-            ATTACK_ANGLE_CONTROL=attack_angle_control,  # Launch angle tendency
-            # PHASE 3: Direct Statcast measurements (override derived values)
-            actual_bat_speed_mph=true_bat_speed_mph,  # None if not available
-            actual_barrel_accuracy_mm=actual_barrel_accuracy_mm,  # None if not available
-            # PHASE 3.1: Hard swing rate for EV variance
-            hard_swing_rate=hard_swing_rate,  # None if not available
-        )
+        if hitter_attrs is None:
+            hitter_attrs = attributes_from_columns(HitterAttributes, build_hitter_columns([record]))[0]
+        if defensive_attrs is None:
+            defensive_attrs = attributes_from_columns(FielderAttributes, build_fielder_columns([record]))[0]
 
         # Create Hitter with speed for baserunning
         hitter = Hitter(
@@ -389,30 +284,8 @@ class TeamLoader:
 
         # Create player-specific Fielder with defensive attributes (v2: CRITICAL for BABIP tuning)
         # This replaces generic 50k fielders with realistic defensive variety
-        from batted_ball.attributes import FielderAttributes
         from batted_ball.fielding import Fielder
 
-        defensive_attrs = FielderAttributes(
-            REACTION_TIME=record.get('reaction_time', 50000),  # Default to average if missing
-            TOP_SPRINT_SPEED=record.get('top_sprint_speed', 50000),
-            ROUTE_EFFICIENCY=record.get('route_efficiency', 50000),
-            ARM_STRENGTH=record.get('arm_strength', 50000),
-            ARM_ACCURACY=record.get('arm_accuracy', 50000),
-            FIELDING_SECURE=record.get('fielding_secure', 50000),
-            # v3 addition: Jump metric for first-step/direction quality
-            # Note: 'jump_attr' is the 0-100k converted attribute, 'jump' is raw Statcast data
-            JUMP=record.get('jump_attr', 50000),
-            # v3 addition: Burst for acceleration phase (from Statcast Jump Burst component)
-            BURST=record.get('burst_attr', 50000),
-            # v3 addition: Directional ability from Statcast Directional OAA
-            RANGE_BACK=record.get('range_back_attr', 50000),  # Ability to go back on balls
-            RANGE_IN=record.get('range_in_attr', 50000),      # Ability to come in on balls
-            # v3 addition: Catch probability for difficult plays
-            CATCH_ELITE=record.get('catch_elite_attr', 50000),        # 5-star plays (0-25% expected)
-            CATCH_DIFFICULT=record.get('catch_difficult_attr', 50000), # 3-4 star plays (25-75% expected)
-            # Other attributes use defaults
-        )
-
         # Get position for fielder (default to LF if missing)
         position = record.get('primary_position', 'LF')
         if position is None or position == '':
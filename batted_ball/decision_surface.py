@@ -0,0 +1,421 @@
+"""
+Precomputed swing-decision and whiff probability surfaces per hitter.
+
+Hitter.decide_to_swing() and Hitter.calculate_whiff_probability() rebuild the
+same zone, count, velocity and pitch-type modifiers from attributes on every
+pitch. A DecisionSurface evaluates them once per hitter into small tables so
+each pitch costs one lookup:
+
+- Location: the base swing probability depends only on plate location (and
+  whether the pitch is a strike), not on the hitter. It is a closed form
+  that is cheaper to evaluate with the math module than to index at a useful
+  resolution, and a grid would blur the chase-rate step 3" from the zone.
+- Hitter modifiers: every later step (discipline, decision speed, velocity,
+  pitch type, count) is a multiply/add/cap on that base, so each
+  (pitch type, zone, count, velocity band) cell stores (scale, offset, cap)
+  and swing_prob = min(base * scale + offset, cap).
+- Whiff: per pitch type and velocity band, everything except the break
+  factor (applied per pitch, it needs the actual break).
+
+Validation mode evaluates the exact functions alongside every lookup and
+records the largest differences, so bulk runs can check the surface against
+the reference implementation.
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .player import (
+    COUNT_SWING_ADJUSTMENTS,
+    NO_COUNT_ADJUSTMENT,
+    base_whiff_rate,
+    swing_aggression_factor,
+    swing_chase_multiplier,
+    swing_velocity_multiplier,
+    whiff_velocity_multiplier,
+)
+
+
+# Velocity bands (mph)
+VELOCITY_STEP_MPH = 0.5
+VELOCITY_MIN_MPH = 60.0
+VELOCITY_MAX_MPH = 110.0
+
+# Pitch types built eagerly (others, and the hitter's pitch_recognition
+# keys, are added on first use)
+DEFAULT_PITCH_TYPES = (
+    'fastball', '2-seam', 'cutter', 'slider', 'curveball', 'changeup', 'splitter',
+)
+
+_INV_VELOCITY_STEP = 1.0 / VELOCITY_STEP_MPH
+_NV = int(round((VELOCITY_MAX_MPH - VELOCITY_MIN_MPH) / VELOCITY_STEP_MPH)) + 1
+_VELOCITY_NODES = VELOCITY_MIN_MPH + VELOCITY_STEP_MPH * np.arange(_NV)
+
+# Swing rows are laid out [zone (0 = strike, 1 = ball)][balls][strikes][velocity]
+_N_BALLS = 4
+_N_STRIKES = 3
+
+
+def location_base_probability(pitch_location: Tuple[float, float], is_strike: bool) -> float:
+    """
+    Base swing probability from plate location (first step of
+    Hitter.swing_probability_terms(), with math instead of numpy scalars).
+    """
+    if is_strike:
+        # Swing rate varies from 85% (center) to 65% (edges)
+        zone_difficulty = (abs(pitch_location[0]) / 8.5 + abs(pitch_location[1] - 30.0) / 12.0) / 2.0
+        return 0.85 - zone_difficulty * 0.20
+
+    # Chase rate falls off with distance from the zone (±8.5", 18"-42")
+    h_dist = abs(pitch_location[0]) - 8.5
+    if h_dist < 0.0:
+        h_dist = 0.0
+    z = pitch_location[1]
+    v_dist = z - 42.0 if z > 42.0 else (18.0 - z if z < 18.0 else 0.0)
+    distance_from_zone = math.sqrt(h_dist * h_dist + v_dist * v_dist)
+    if distance_from_zone < 3.0:
+        return 0.35 * math.exp(-distance_from_zone / 4.0)
+    return 0.10 * math.exp(-distance_from_zone / 8.0)
+
+
+def location_base_probabilities(horizontal, vertical, is_strike) -> np.ndarray:
+    """
+    Vectorized location_base_probability() over arrays of pitches.
+
+    Parameters
+    ----------
+    horizontal, vertical : array-like
+        Plate location (inches)
+    is_strike : array-like of bool
+        Whether each pitch is in the strike zone
+    """
+    horizontal = np.abs(np.asarray(horizontal, dtype=np.float64))
+    vertical = np.asarray(vertical, dtype=np.float64)
+
+    zone_difficulty = (horizontal / 8.5 + np.abs(vertical - 30.0) / 12.0) / 2.0
+    in_zone = 0.85 - zone_difficulty * 0.20
+
+    h_dist = np.maximum(horizontal - 8.5, 0.0)
+    v_dist = np.maximum(vertical - 42.0, 0.0) + np.maximum(18.0 - vertical, 0.0)
+    distance_from_zone = np.sqrt(h_dist * h_dist + v_dist * v_dist)
+    chase = np.where(
+        distance_from_zone < 3.0,
+        0.35 * np.exp(-distance_from_zone / 4.0),
+        0.10 * np.exp(-distance_from_zone / 8.0),
+    )
+    return np.where(is_strike, in_zone, chase)
+
+
+def _velocity_index(pitch_velocity):
+    """Velocity band per pitch (as in the scalar lookups, clamped to the table)."""
+    iv = ((np.asarray(pitch_velocity, dtype=np.float64) - VELOCITY_MIN_MPH)
+          * _INV_VELOCITY_STEP + 0.5).astype(np.intp)
+    return np.clip(iv, 0, _NV - 1)
+
+
+class DecisionSurface:
+    """
+    Precomputed swing and whiff probabilities for one hitter.
+
+    Built by Hitter.enable_decision_surface(); rebuilt automatically when the
+    hitter's attributes (compiled profile) change.
+
+    Parameters
+    ----------
+    hitter : Hitter
+        Hitter whose attributes and pitch_recognition define the surface
+    validate : bool
+        Evaluate the exact functions on every lookup and track the error
+    """
+
+    def __init__(self, hitter, validate: bool = False):
+        self.hitter = hitter
+        self.validate = validate
+        self.max_swing_error = 0.0
+        self.max_whiff_error = 0.0
+        self.validated_swings = 0
+        self.validated_whiffs = 0
+        self.build()
+
+    def build(self):
+        """(Re)compute the hitter modifiers for the default and known pitch types."""
+        attributes = self.hitter.attributes
+        self._profile = attributes.profile
+        self.discipline_factor = attributes.get_zone_discernment_factor()
+        self.aggression_factor = swing_aggression_factor(
+            attributes.get_swing_decision_latency_ms()
+        )
+        self.vision_factor = 2.0 - attributes.get_tracking_ability_factor()
+        self._swing_rows: Dict[str, List[Tuple[float, float, float]]] = {}
+        self._whiff_rows: Dict[str, List[float]] = {}
+        # Same cells as arrays for the batch lookups
+        self._swing_cells: Dict[str, np.ndarray] = {}
+        self._whiff_arrays: Dict[str, np.ndarray] = {}
+        for pitch_type in DEFAULT_PITCH_TYPES + tuple(self.hitter.pitch_recognition):
+            self._build_pitch_type(pitch_type)
+
+    def _build_pitch_type(self, pitch_type: str):
+        """Swing (scale, offset, cap) cells and whiff row for one pitch type."""
+        reaction = 0.8 + self.aggression_factor * 0.4
+        velocity = np.array([swing_velocity_multiplier(v) for v in _VELOCITY_NODES])
+
+        # Pre-count probability = base * scale + offset
+        # Strike: (base + (1 - discipline) * 0.15) * reaction * velocity
+        # Ball:   base * (1 - discipline * 0.12) * reaction * velocity * chase
+        pre_scale = np.stack([
+            reaction * velocity,
+            (1 - self.discipline_factor * 0.12) * reaction * velocity
+            * swing_chase_multiplier(pitch_type),
+        ])
+        pre_offset = np.stack([
+            (1 - self.discipline_factor) * 0.15 * reaction * velocity,
+            np.zeros(_NV),
+        ])
+
+        # Count: min(p * mult + add, cap), then the final clip to 0.98
+        cells = np.empty((2, _N_BALLS, _N_STRIKES, _NV, 3))
+        for balls in range(_N_BALLS):
+            for strikes in range(_N_STRIKES):
+                adjustments = COUNT_SWING_ADJUSTMENTS.get((balls, strikes), NO_COUNT_ADJUSTMENT)
+                for zone, (mult, add, cap) in enumerate(adjustments):
+                    cells[zone, balls, strikes, :, 0] = pre_scale[zone] * mult
+                    cells[zone, balls, strikes, :, 1] = pre_offset[zone] * mult + add
+                    cells[zone, balls, strikes, :, 2] = min(cap, 0.98)
+        self._swing_rows[pitch_type] = list(map(tuple, cells.reshape(-1, 3).tolist()))
+        self._swing_cells[pitch_type] = cells
+
+        # Whiff without the break factor
+        whiff = (
+            base_whiff_rate(pitch_type)
+            * np.array([whiff_velocity_multiplier(v) for v in _VELOCITY_NODES])
+            * self.vision_factor
+            * self.hitter.get_pitch_contact_multiplier(pitch_type)
+        )
+        self._whiff_rows[pitch_type] = whiff.tolist()
+        self._whiff_arrays[pitch_type] = whiff
+
+    def _rows_for(self, pitch_type: str):
+        if self.hitter.attributes.profile is not self._profile:
+            self.build()
+        if pitch_type not in self._swing_rows:
+            self._build_pitch_type(pitch_type)
+        return self._swing_rows[pitch_type], self._whiff_rows[pitch_type]
+
+    def swing_probability(
+        self,
+        pitch_location: Tuple[float, float],
+        is_strike: bool,
+        balls: int,
+        strikes: int,
+        pitch_velocity: float,
+        pitch_type: str,
+    ) -> float:
+        """
+        Swing probability from the surface (Hitter.swing_probability_terms().final).
+
+        Parameters
+        ----------
+        pitch_location : tuple
+            (horizontal_inches, vertical_inches) at plate
+        is_strike : bool
+            Whether pitch is in strike zone
+        balls, strikes : int
+            Count
+        pitch_velocity : float
+            Pitch speed in mph
+        pitch_type : str
+            Type of pitch
+        """
+        if not (0 <= balls < _N_BALLS and 0 <= strikes < _N_STRIKES):
+            return float(self.hitter.swing_probability_terms(
+                pitch_location, is_strike, (balls, strikes), pitch_velocity, pitch_type
+            ).final)
+
+        swing_rows, _ = self._rows_for(pitch_type)
+
+        iv = int((pitch_velocity - VELOCITY_MIN_MPH) * _INV_VELOCITY_STEP + 0.5)
+        if iv < 0:
+            iv = 0
+        elif iv >= _NV:
+            iv = _NV - 1
+
+        base = location_base_probability(pitch_location, is_strike)
+        zone = 0 if is_strike else _N_BALLS
+        cell = (((zone + balls) * _N_STRIKES + strikes) * _NV) + iv
+        scale, offset, cap = swing_rows[cell]
+        swing_prob = base * scale + offset
+        if swing_prob > cap:
+            swing_prob = cap
+
+        if self.validate:
+            exact = self.hitter.swing_probability_terms(
+                pitch_location, is_strike, (balls, strikes), pitch_velocity, pitch_type
+            ).final
+            self.max_swing_error = max(self.max_swing_error, abs(swing_prob - exact))
+            self.validated_swings += 1
+        return swing_prob
+
+    def whiff_probability(
+        self,
+        pitch_velocity: float,
+        pitch_type: str,
+        pitch_break: Tuple[float, float],
+    ) -> float:
+        """
+        Base whiff probability from the surface (Hitter.whiff_probability_exact()).
+
+        Parameters
+        ----------
+        pitch_velocity : float
+            Pitch speed in mph
+        pitch_type : str
+            Type of pitch
+        pitch_break : tuple
+            (vertical_break_inches, horizontal_break_inches)
+        """
+        _, whiff_row = self._rows_for(pitch_type)
+        iv = int((pitch_velocity - VELOCITY_MIN_MPH) * _INV_VELOCITY_STEP + 0.5)
+        if iv < 0:
+            iv = 0
+        elif iv >= _NV:
+            iv = _NV - 1
+
+        whiff_prob = whiff_row[iv] * (1.0 + math.hypot(pitch_break[0], pitch_break[1]) / 100.0)
+        if whiff_prob < 0.05:
+            whiff_prob = 0.05
+        elif whiff_prob > 0.70:
+            whiff_prob = 0.70
+
+        if self.validate:
+            exact = self.hitter.whiff_probability_exact(pitch_velocity, pitch_type, pitch_break)
+            self.max_whiff_error = max(self.max_whiff_error, abs(whiff_prob - exact))
+            self.validated_whiffs += 1
+        return whiff_prob
+
+    def swing_probabilities(
+        self,
+        horizontal,
+        vertical,
+        is_strike,
+        balls,
+        strikes,
+        pitch_velocity,
+        pitch_type: str,
+    ) -> np.ndarray:
+        """
+        Vectorized swing_probability() for many pitches of one pitch type.
+
+        Counts must be in the table range (0-3 balls, 0-2 strikes); there is
+        no validation mode for batch lookups.
+
+        Parameters
+        ----------
+        horizontal, vertical : array-like
+            Plate location (inches)
+        is_strike : array-like of bool
+            Whether each pitch is in the strike zone
+        balls, strikes : array-like of int
+            Count per pitch
+        pitch_velocity : array-like
+            Pitch speed in mph
+        pitch_type : str
+            Type of every pitch in the batch
+        """
+        if self.hitter.attributes.profile is not self._profile:
+            self.build()
+        if pitch_type not in self._swing_cells:
+            self._build_pitch_type(pitch_type)
+        cells = self._swing_cells[pitch_type]
+
+        zone = np.where(is_strike, 0, 1)
+        cell = cells[zone, balls, strikes, _velocity_index(pitch_velocity)]
+        base = location_base_probabilities(horizontal, vertical, is_strike)
+        return np.minimum(base * cell[:, 0] + cell[:, 1], cell[:, 2])
+
+    def whiff_probabilities(
+        self,
+        pitch_velocity,
+        pitch_type: str,
+        vertical_break,
+        horizontal_break,
+    ) -> np.ndarray:
+        """
+        Vectorized whiff_probability() for many pitches of one pitch type.
+
+        Parameters
+        ----------
+        pitch_velocity : array-like
+            Pitch speed in mph
+        pitch_type : str
+            Type of every pitch in the batch
+        vertical_break, horizontal_break : array-like
+            Pitch break (inches)
+        """
+        if self.hitter.attributes.profile is not self._profile:
+            self.build()
+        if pitch_type not in self._whiff_arrays:
+            self._build_pitch_type(pitch_type)
+        whiff = self._whiff_arrays[pitch_type][_velocity_index(pitch_velocity)]
+        whiff = whiff * (1.0 + np.hypot(vertical_break, horizontal_break) / 100.0)
+        return np.clip(whiff, 0.05, 0.70)
+
+    def validation_report(self) -> Dict[str, float]:
+        """Largest surface-vs-exact differences seen in validation mode."""
+        return {
+            'swings_checked': self.validated_swings,
+            'max_swing_error': self.max_swing_error,
+            'whiffs_checked': self.validated_whiffs,
+            'max_whiff_error': self.max_whiff_error,
+        }
+
+    def compare(self, n_samples: int = 10000, seed: int = 0) -> Dict[str, float]:
+        """
+        Compare the surface with the exact functions on random pitches.
+
+        Parameters
+        ----------
+        n_samples : int
+            Number of random pitches
+        seed : int
+            RNG seed (does not touch the global numpy RNG)
+
+        Returns
+        -------
+        dict
+            Max and mean absolute swing/whiff errors
+        """
+        rng = np.random.default_rng(seed)
+        pitch_types = list(self._swing_rows)
+        validate, self.validate = self.validate, False
+        swing_errors = np.empty(n_samples)
+        whiff_errors = np.empty(n_samples)
+        try:
+            for i in range(n_samples):
+                location = (float(rng.normal(0.0, 10.0)), float(rng.normal(30.0, 10.0)))
+                is_strike = abs(location[0]) <= 8.5 and 18.0 <= location[1] <= 42.0
+                count = (int(rng.integers(0, 4)), int(rng.integers(0, 3)))
+                velocity = float(rng.uniform(70.0, 102.0))
+                pitch_type = pitch_types[int(rng.integers(len(pitch_types)))]
+                pitch_break = (float(rng.normal(0.0, 10.0)), float(rng.normal(0.0, 10.0)))
+
+                swing_errors[i] = abs(
+                    self.swing_probability(location, is_strike, count[0], count[1],
+                                           velocity, pitch_type)
+                    - self.hitter.swing_probability_terms(location, is_strike, count,
+                                                          velocity, pitch_type).final
+                )
+                whiff_errors[i] = abs(
+                    self.whiff_probability(velocity, pitch_type, pitch_break)
+                    - self.hitter.whiff_probability_exact(velocity, pitch_type, pitch_break)
+                )
+        finally:
+            self.validate = validate
+        return {
+            'max_swing_error': float(swing_errors.max()),
+            'mean_swing_error': float(swing_errors.mean()),
+            'p99_swing_error': float(np.percentile(swing_errors, 99)),
+            'max_whiff_error': float(whiff_errors.max()),
+            'mean_whiff_error': float(whiff_errors.mean()),
+        }
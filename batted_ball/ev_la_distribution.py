@@ -13,6 +13,7 @@ Research Findings:
 This module provides:
 1. EVLADistribution class for correlated EV-LA sampling
 2. get_spray_angle_for_launch_angle() for LA-spray correlation
+3. Vectorized variants of the spray and EV-LA adjustments for batch engines
 """
 
 import numpy as np
@@ -206,7 +207,12 @@ class EVLADistribution:
         
         return la
     
-    def sample_batch(self, n: int, contact_qualities: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    def sample_batch(
+        self,
+        n: int,
+        contact_qualities: Optional[np.ndarray] = None,
+        rng: Optional[np.random.Generator] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Sample n (EV, LA) pairs efficiently using vectorized operations.
         
@@ -216,6 +222,8 @@ class EVLADistribution:
             Number of samples to generate
         contact_qualities : np.ndarray, optional
             Array of contact quality values. If None, uses 0.5 for all.
+        rng : np.random.Generator, optional
+            Random generator (default: the global NumPy random state)
             
         Returns
         -------
@@ -223,7 +231,8 @@ class EVLADistribution:
             Arrays of (exit_velocities, launch_angles)
         """
         # Generate base samples from bivariate normal
-        samples = np.random.multivariate_normal(self.means, self.covariance_matrix, size=n)
+        source = np.random if rng is None else rng
+        samples = source.multivariate_normal(self.means, self.covariance_matrix, size=n)
         evs = samples[:, 0]
         las = samples[:, 1]
         
@@ -314,6 +323,81 @@ def get_spray_angle_for_launch_angle(
     return float(spray)
 
 
+def get_spray_angles_for_launch_angles(
+    launch_angles: np.ndarray,
+    hitter_spray_tendency: float = 0.0,
+    rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    Vectorized get_spray_angle_for_launch_angle() for many batted balls.
+
+    Same pull probabilities per launch-angle band and the same 27° spread,
+    drawn from one generator for the whole batch.
+
+    Parameters
+    ----------
+    launch_angles : array-like
+        Launch angles in degrees
+    hitter_spray_tendency : float
+        Hitter's base spray tendency in degrees (physics convention)
+    rng : np.random.Generator, optional
+        Random generator (default: a fresh unseeded generator)
+
+    Returns
+    -------
+    np.ndarray
+        Spray angles in degrees (-45 to +45) using PHYSICS convention
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    launch_angles = np.asarray(launch_angles, dtype=np.float64)
+    n = launch_angles.shape[0]
+
+    SPRAY_STD_DEV = 27.0
+
+    # Pull probability: ground balls 65%, line drives 55%; fly balls are a
+    # plain normal around the tendency
+    pull_prob = np.where(launch_angles < 10, 0.65, 0.55)
+    pull_direction = np.where(rng.random(n) < pull_prob, 1.0, -1.0)
+    deviation = rng.normal(0.0, SPRAY_STD_DEV, n)
+    spray = hitter_spray_tendency + np.where(
+        launch_angles < 25, pull_direction * np.abs(deviation), deviation
+    )
+
+    # Clamp to foul line boundaries
+    return np.clip(spray, -45.0, 45.0)
+
+
+def apply_ev_la_correlation_adjustments(
+    exit_velocities: np.ndarray,
+    launch_angles: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized apply_ev_la_correlation_adjustment() for many batted balls.
+
+    Parameters
+    ----------
+    exit_velocities : array-like
+        Exit velocities in mph
+    launch_angles : array-like
+        Launch angles in degrees
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Adjusted (exit_velocities, launch_angles)
+    """
+    exit_velocities = np.asarray(exit_velocities, dtype=np.float64)
+    launch_angles = np.asarray(launch_angles, dtype=np.float64)
+
+    # Only very hard-hit extreme popups are pulled down
+    popup = (exit_velocities > 100) & (launch_angles > 45)
+    launch_angles = np.where(popup, launch_angles - (launch_angles - 45) * 0.15, launch_angles)
+
+    # Clamp to physical bounds
+    return exit_velocities, np.clip(launch_angles, -20.0, 85.0)
+
+
 def apply_ev_la_correlation_adjustment(
     exit_velocity: float,
     launch_angle: float,
@@ -0,0 +1,361 @@
+"""
+Structured play-by-play event store.
+
+Every pitch and every plate appearance is recorded as a fixed-schema row in a
+NumPy structured array instead of free text, so large runs can be analyzed
+without re-parsing game logs (see analyze_babip.py and
+analyze_ground_balls.py). Strings (player names, pitch types, outcome codes)
+are stored as small integer codes into per-store vocabularies; human-readable
+text is rendered only on demand.
+
+On disk a store is a directory holding ``pitches.npy``, ``plays.npy`` and a
+``vocab.json`` sidecar. EventStore.load() memory-maps the arrays so millions
+of events are available after a single read of the headers.
+
+Usage:
+    store = EventStore()
+    sim = GameSimulator(away, home, verbose=False, event_store=store)
+    sim.simulate_game()
+    store.save("runs/season_2025")
+
+    store = EventStore.load("runs/season_2025")
+    plays = store.plays
+    gb = plays[plays['launch_angle'] < 10]
+"""
+
+import json
+import os
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+
+# Pitch-level record (one row per pitch)
+PITCH_EVENT_DTYPE = np.dtype([
+    ('game_id', '<u4'),
+    ('pa_index', '<u2'),          # Plate appearance number within the game
+    ('pitch_index', 'u1'),        # 1-based pitch number within the PA
+    ('inning', 'u1'),
+    ('is_top', '?'),
+    ('outs', 'u1'),               # Outs before the PA
+    ('base_mask', 'u1'),          # Bases before the PA (first=1, second=2, third=4)
+    ('balls', 'u1'),              # Count before the pitch
+    ('strikes', 'u1'),
+    ('batter_id', '<u4'),         # 'player' vocabulary code
+    ('pitcher_id', '<u4'),
+    ('pitch_type', 'u1'),         # 'pitch_type' vocabulary code
+    ('velocity_release', '<f4'),  # mph
+    ('velocity_plate', '<f4'),    # mph
+    ('plate_x', '<f4'),           # Horizontal location at plate (inches)
+    ('plate_z', '<f4'),           # Vertical location at plate (inches)
+    ('swing', '?'),
+    ('outcome', 'u1'),            # 'pitch_outcome' vocabulary code
+])
+
+# Plate-appearance record (one row per PA)
+PLAY_EVENT_DTYPE = np.dtype([
+    ('game_id', '<u4'),
+    ('pa_index', '<u2'),
+    ('inning', 'u1'),
+    ('is_top', '?'),
+    ('outs', 'u1'),               # Outs before the PA
+    ('base_mask', 'u1'),          # Bases before the PA
+    ('batter_id', '<u4'),
+    ('pitcher_id', '<u4'),
+    ('num_pitches', 'u1'),
+    ('pitch_type', 'u1'),         # Last pitch of the PA
+    ('exit_velocity', '<f4'),     # mph (NaN if not put in play)
+    ('launch_angle', '<f4'),      # degrees (NaN if not put in play)
+    ('spray_angle', '<f4'),       # degrees (NaN if not put in play)
+    ('distance', '<f4'),          # feet (NaN if not put in play)
+    ('landing_x', '<f4'),         # Landing position, feet toward right field (NaN if not put in play)
+    ('landing_y', '<f4'),         # Landing position, feet toward center field (NaN if not put in play)
+    ('outcome', 'u1'),            # 'pa_outcome' vocabulary code (OutcomeCodePA)
+    ('fielder', 'u1'),            # Scoring position number of primary fielder, 0 = none
+    ('runs_scored', 'u1'),
+    ('outs_made', 'u1'),
+])
+
+# Vocabulary name -> columns that hold its codes
+_VOCAB_COLUMNS = {
+    'player': (('batter_id', 'pitcher_id'), ('batter_id', 'pitcher_id')),
+    'pitch_type': (('pitch_type',), ('pitch_type',)),
+    'pitch_outcome': (('outcome',), ()),
+    'pa_outcome': ((), ('outcome',)),
+}
+
+# Standard scoring numbers for primary fielder positions
+FIELDER_POSITION_NUMBERS = {
+    'pitcher': 1, 'catcher': 2, 'first_base': 3, 'second_base': 4,
+    'third_base': 5, 'shortstop': 6, 'left_field': 7, 'center_field': 8,
+    'right_field': 9,
+}
+_FIELDER_ABBREVIATIONS = ('', 'P', 'C', '1B', '2B', '3B', 'SS', 'LF', 'CF', 'RF')
+
+_NAN = float('nan')
+
+
+class EventStore:
+    """
+    Columnar store of pitch and plate-appearance events.
+
+    Rows are accumulated as tuples while a game is in progress and sealed
+    into one structured-array chunk per game by end_game(). The ``pitches``
+    and ``plays`` properties concatenate the chunks on first access.
+    """
+
+    def __init__(self):
+        self.vocab: Dict[str, List[str]] = {name: [] for name in _VOCAB_COLUMNS}
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in _VOCAB_COLUMNS}
+        self._pitch_chunks: List[np.ndarray] = []
+        self._play_chunks: List[np.ndarray] = []
+        self._pitch_rows: List[tuple] = []
+        self._play_rows: List[tuple] = []
+        self.num_games = 0
+        self._game_id = -1
+        self._pa_index = 0
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def code(self, vocab: str, value: str) -> int:
+        """Integer code for a string in the given vocabulary (added if new)."""
+        codes = self._codes[vocab]
+        code = codes.get(value)
+        if code is None:
+            code = len(codes)
+            codes[value] = code
+            self.vocab[vocab].append(value)
+        return code
+
+    def start_game(self) -> int:
+        """Begin recording a new game and return its game_id."""
+        self._game_id = self.num_games
+        self.num_games += 1
+        self._pa_index = 0
+        return self._game_id
+
+    def record_plate_appearance(
+        self,
+        inning: int,
+        is_top: bool,
+        outs: int,
+        base_mask: int,
+        batter_name: str,
+        pitcher_name: str,
+        pitches: Sequence[Dict],
+        outcome_code: str,
+        batted_ball: Optional[Dict] = None,
+        fielder_position: Optional[str] = None,
+        runs_scored: int = 0,
+        outs_made: int = 0,
+    ):
+        """
+        Record one plate appearance and its pitches.
+
+        Parameters
+        ----------
+        inning, is_top, outs, base_mask
+            Game situation before the plate appearance
+        batter_name, pitcher_name : str
+            Player names (stored as 'player' vocabulary codes)
+        pitches : sequence of dict
+            AtBatSimulator pitch dicts (pitch_type, velocity_release,
+            velocity_plate, final_location, count_before, swing, pitch_outcome)
+        outcome_code : str
+            PA outcome code (see get_pa_outcome_code)
+        batted_ball : dict, optional
+            AtBatSimulator batted ball dict (exit_velocity, launch_angle,
+            spray_angle, distance, trajectory) if the ball was put in play.
+            Landing coordinates come from landing_x/landing_y keys or, failing
+            that, the trajectory's BattedBallResult
+        fielder_position : str, optional
+            Primary fielder position name (e.g. 'shortstop')
+        runs_scored, outs_made : int
+            Result of the plate appearance
+        """
+        game_id = self._game_id
+        pa_index = self._pa_index
+        self._pa_index += 1
+        batter_id = self.code('player', batter_name)
+        pitcher_id = self.code('player', pitcher_name)
+        code = self.code
+
+        pitch_type = 0
+        for number, pitch in enumerate(pitches, 1):
+            pitch_type = code('pitch_type', pitch.get('pitch_type', 'unknown'))
+            location = pitch.get('final_location') or (_NAN, _NAN)
+            balls, strikes = pitch.get('count_before', (0, 0))
+            self._pitch_rows.append((
+                game_id, pa_index, number, inning, is_top, outs, base_mask,
+                balls, strikes, batter_id, pitcher_id, pitch_type,
+                pitch.get('velocity_release', _NAN), pitch.get('velocity_plate', _NAN),
+                location[0], location[1], bool(pitch.get('swing', False)),
+                code('pitch_outcome', pitch.get('pitch_outcome', 'unknown')),
+            ))
+
+        if batted_ball:
+            exit_velocity = batted_ball.get('exit_velocity', _NAN)
+            launch_angle = batted_ball.get('launch_angle', _NAN)
+            spray_angle = batted_ball.get('spray_angle', _NAN)
+            distance = batted_ball.get('distance', _NAN)
+            trajectory = batted_ball.get('trajectory')
+            if trajectory is not None:
+                landing_x = batted_ball.get('landing_x', trajectory.landing_x)
+                landing_y = batted_ball.get('landing_y', trajectory.landing_y)
+            else:
+                landing_x = batted_ball.get('landing_x', _NAN)
+                landing_y = batted_ball.get('landing_y', _NAN)
+        else:
+            exit_velocity = launch_angle = spray_angle = distance = _NAN
+            landing_x = landing_y = _NAN
+
+        self._play_rows.append((
+            game_id, pa_index, inning, is_top, outs, base_mask,
+            batter_id, pitcher_id, min(len(pitches), 255), pitch_type,
+            exit_velocity, launch_angle, spray_angle, distance,
+            landing_x, landing_y,
+            code('pa_outcome', outcome_code),
+            FIELDER_POSITION_NUMBERS.get(fielder_position, 0),
+            runs_scored, outs_made,
+        ))
+
+    def end_game(self):
+        """Seal the current game's rows into structured-array chunks."""
+        if self._pitch_rows:
+            self._pitch_chunks.append(np.array(self._pitch_rows, dtype=PITCH_EVENT_DTYPE))
+            self._pitch_rows = []
+        if self._play_rows:
+            self._play_chunks.append(np.array(self._play_rows, dtype=PLAY_EVENT_DTYPE))
+            self._play_rows = []
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    @property
+    def pitches(self) -> np.ndarray:
+        """All sealed pitch events (PITCH_EVENT_DTYPE)."""
+        return self._consolidate('_pitch_chunks', PITCH_EVENT_DTYPE)
+
+    @property
+    def plays(self) -> np.ndarray:
+        """All sealed plate-appearance events (PLAY_EVENT_DTYPE)."""
+        return self._consolidate('_play_chunks', PLAY_EVENT_DTYPE)
+
+    def _consolidate(self, attr: str, dtype: np.dtype) -> np.ndarray:
+        chunks = getattr(self, attr)
+        if not chunks:
+            return np.empty(0, dtype=dtype)
+        if len(chunks) > 1:
+            chunks[:] = [np.concatenate(chunks)]
+        return chunks[0]
+
+    def decode(self, vocab: str, codes) -> np.ndarray:
+        """Map an array of codes back to strings (object array)."""
+        return np.asarray(self.vocab[vocab], dtype=object)[np.asarray(codes)]
+
+    def merge(self, other: 'EventStore'):
+        """
+        Append another store's sealed events (e.g. from a worker process).
+
+        Vocabulary codes are remapped into this store and game ids offset so
+        they remain unique.
+        """
+        offset = self.num_games
+        remap = {}
+        for name, values in other.vocab.items():
+            remap[name] = np.array([self.code(name, value) for value in values],
+                                   dtype=np.uint32)
+
+        for attr, dtype, which in (('_pitch_chunks', PITCH_EVENT_DTYPE, 0),
+                                   ('_play_chunks', PLAY_EVENT_DTYPE, 1)):
+            events = other._consolidate(attr, dtype)
+            if len(events) == 0:
+                continue
+            events = events.copy()
+            events['game_id'] += offset
+            for name, columns in _VOCAB_COLUMNS.items():
+                for column in columns[which]:
+                    events[column] = remap[name][events[column]]
+            getattr(self, attr).append(events)
+
+        self.num_games += other.num_games
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, directory: str):
+        """Write pitches.npy, plays.npy and vocab.json to a directory."""
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, 'pitches.npy'), self.pitches)
+        np.save(os.path.join(directory, 'plays.npy'), self.plays)
+        with open(os.path.join(directory, 'vocab.json'), 'w', encoding='utf-8') as f:
+            json.dump({'num_games': self.num_games, 'vocab': self.vocab}, f)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> 'EventStore':
+        """
+        Load a saved store.
+
+        Parameters
+        ----------
+        directory : str
+            Directory written by save()
+        mmap : bool
+            Memory-map the event arrays read-only (default True)
+        """
+        store = cls()
+        with open(os.path.join(directory, 'vocab.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        for name, values in meta['vocab'].items():
+            for value in values:
+                store.code(name, value)
+        store.num_games = meta['num_games']
+
+        mmap_mode = 'r' if mmap else None
+        pitches = np.load(os.path.join(directory, 'pitches.npy'), mmap_mode=mmap_mode)
+        plays = np.load(os.path.join(directory, 'plays.npy'), mmap_mode=mmap_mode)
+        if len(pitches):
+            store._pitch_chunks.append(pitches)
+        if len(plays):
+            store._play_chunks.append(plays)
+        return store
+
+    # ------------------------------------------------------------------
+    # On-demand text rendering
+    # ------------------------------------------------------------------
+
+    def render_play(self, row) -> str:
+        """Human-readable one-line description of a play row."""
+        half = "Top" if row['is_top'] else "Bot"
+        batter = self.vocab['player'][row['batter_id']]
+        pitcher = self.vocab['player'][row['pitcher_id']]
+        text = (f"{half} {row['inning']}, {row['outs']} out: {batter} vs {pitcher} - "
+                f"{self.vocab['pa_outcome'][row['outcome']]} ({row['num_pitches']} pitches)")
+        if not np.isnan(row['exit_velocity']):
+            text += (f" EV={row['exit_velocity']:.1f} mph, LA={row['launch_angle']:.1f}°, "
+                     f"Spray={row['spray_angle']:.1f}°, Dist={row['distance']:.1f} ft")
+        if row['fielder']:
+            text += f" [{_FIELDER_ABBREVIATIONS[row['fielder']]}]"
+        if row['runs_scored']:
+            text += f", {row['runs_scored']} run(s) scored"
+        return text
+
+    def render_pitch(self, row) -> str:
+        """Human-readable one-line description of a pitch row."""
+        return (f"#{row['pitch_index']}: {self.vocab['pitch_type'][row['pitch_type']]} "
+                f"{row['velocity_release']:.1f}->{row['velocity_plate']:.1f} mph to "
+                f"({row['plate_x'] / 12.0:.2f}', {row['plate_z'] / 12.0:.2f}') "
+                f"[{row['balls']}-{row['strikes']}] "
+                f"{self.vocab['pitch_outcome'][row['outcome']]}")
+
+    def iter_play_text(self, game_id: Optional[int] = None) -> Iterator[str]:
+        """Render plays (optionally for one game) as text lines."""
+        plays = self.plays
+        if game_id is not None:
+            plays = plays[plays['game_id'] == game_id]
+        for row in plays:
+            yield self.render_play(row)
@@ -12,6 +12,7 @@ Coordinate System:
 - Units: Feet (converted to meters internally for physics calculations)
 """
 
+import math
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from .constants import (
@@ -45,8 +46,28 @@ from .constants import (
 )
 
 
+# Base order around the diamond; per-base arrays are indexed by BASE_INDEX
+BASES = ("home", "first", "second", "third")
+BASE_INDEX = {base: index for index, base in enumerate(BASES)}
+
+# Fielding zones used by get_nearest_fielder_position() and get_fielder_zones()
+CATCHER_ZONE_RADIUS = 30.0       # Feet from home plate
+PITCHER_ZONE_RADIUS = 25.0       # Feet from the mound
+PITCHER_ZONE_CENTER_Y = 60.5     # Mound distance from home plate (feet)
+OUTFIELD_ZONE_DISTANCE = 180.0   # Balls beyond this go to outfielders
+CENTER_FIELD_ZONE_ANGLE = 30.0   # Center fielder covers +/- this spray angle (degrees)
+CORNER_INFIELD_ZONE_X = 45.0     # Corner infielders cover |x| beyond this (feet)
+
+
 class FieldPosition:
-    """Represents a position on the baseball field."""
+    """
+    Represents a position on the baseball field.
+
+    Uses __slots__ for memory efficiency and faster attribute access; hot
+    fielding loops create these by the thousand. For bulk work keep
+    coordinates in arrays (positions_to_array / positions_from_array).
+    """
+    __slots__ = ('x', 'y', 'z')
     
     def __init__(self, x: float, y: float, z: float = 0.0):
         """
@@ -70,13 +91,13 @@ class FieldPosition:
         dx = self.x - other.x
         dy = self.y - other.y
         dz = self.z - other.z
-        return np.sqrt(dx**2 + dy**2 + dz**2)
+        return math.sqrt(dx**2 + dy**2 + dz**2)
 
     def horizontal_distance_to(self, other: 'FieldPosition') -> float:
         """Calculate horizontal (x,y) distance to another position, ignoring height."""
         dx = self.x - other.x
         dy = self.y - other.y
-        return np.sqrt(dx**2 + dy**2)
+        return math.sqrt(dx**2 + dy**2)
     
     def to_meters(self) -> Tuple[float, float, float]:
         """Convert position to meters for physics calculations."""
@@ -87,6 +108,11 @@ class FieldPosition:
     def to_array(self) -> np.ndarray:
         """Return position as numpy array in feet."""
         return np.array([self.x, self.y, self.z])
+
+    @classmethod
+    def from_array(cls, coordinates) -> 'FieldPosition':
+        """Create a position from an (x, y[, z]) array in feet."""
+        return cls(coordinates[0], coordinates[1], coordinates[2] if len(coordinates) > 2 else 0.0)
     
     def __repr__(self):
         return f"FieldPosition(x={self.x:.1f}, y={self.y:.1f}, z={self.z:.1f})"
@@ -182,6 +208,11 @@ class FieldLayout:
                 is_force_base=True
             )
         }
+        # (4, 2) x/y of each base in BASES order, for vectorized distances
+        self.base_coordinates = np.array(
+            [[self.bases[base].position.x, self.bases[base].position.y] for base in BASES]
+        )
+        self.base_coordinates.flags.writeable = False
     
     def _setup_defensive_positions(self):
         """Initialize standard defensive positions."""
@@ -312,17 +343,17 @@ class FieldLayout:
         distance_from_home = (ball_x**2 + ball_y**2)**0.5
         
         # Very close to home plate - catcher territory
-        if distance_from_home < 30.0:
+        if distance_from_home < CATCHER_ZONE_RADIUS:
             return 'catcher'
         
         # Close to pitcher's mound
-        pitcher_distance = ((ball_x - 0)**2 + (ball_y - 60.5)**2)**0.5
-        if pitcher_distance < 25.0:
+        pitcher_distance = ((ball_x - 0)**2 + (ball_y - PITCHER_ZONE_CENTER_Y)**2)**0.5
+        if pitcher_distance < PITCHER_ZONE_RADIUS:
             return 'pitcher'
         
         # Determine infield vs outfield based on distance
         # Balls beyond 180 feet go to outfielders
-        if distance_from_home > 180.0:
+        if distance_from_home > OUTFIELD_ZONE_DISTANCE:
             # Outfield responsibility based on spray angle from center field
             # Calculate angle: 0° = straight center, +angle = right, -angle = left
             import numpy as np
@@ -332,22 +363,62 @@ class FieldLayout:
             # Left field: -90° to -30°
             # Center field: -30° to +30°
             # Right field: +30° to +90°
-            if spray_angle < -30:  # Left field zone
+            if spray_angle < -CENTER_FIELD_ZONE_ANGLE:  # Left field zone
                 return 'left_field'
-            elif spray_angle > 30:  # Right field zone
+            elif spray_angle > CENTER_FIELD_ZONE_ANGLE:  # Right field zone
                 return 'right_field'
             else:  # Center field zone (-30° to +30°)
                 return 'center_field'
         else:
             # Infield responsibility
-            if ball_x > 45:  # Right side of infield
+            if ball_x > CORNER_INFIELD_ZONE_X:  # Right side of infield
                 return 'first_base'
-            elif ball_x < -45:  # Left side of infield
+            elif ball_x < -CORNER_INFIELD_ZONE_X:  # Left side of infield
                 return 'third_base'
             elif ball_x > 0:  # Right of center
                 return 'second_base'
             else:  # Left of center
                 return 'shortstop'
+
+    def get_fielder_zones(self, x, y) -> np.ndarray:
+        """
+        Vectorized get_nearest_fielder_position() for many landing points.
+
+        Parameters
+        ----------
+        x, y : array-like
+            Ball coordinates in feet
+
+        Returns
+        -------
+        np.ndarray
+            Responsible fielder position name for each point
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        distance_from_home = np.sqrt(x**2 + y**2)
+        pitcher_distance = np.sqrt(x**2 + (y - PITCHER_ZONE_CENTER_Y)**2)
+        spray_angle = np.arctan2(x, y) * 180.0 / np.pi
+        outfield = distance_from_home > OUTFIELD_ZONE_DISTANCE
+
+        # First matching condition wins, in the same order as the scalar rules
+        return np.select(
+            [
+                distance_from_home < CATCHER_ZONE_RADIUS,
+                pitcher_distance < PITCHER_ZONE_RADIUS,
+                outfield & (spray_angle < -CENTER_FIELD_ZONE_ANGLE),
+                outfield & (spray_angle > CENTER_FIELD_ZONE_ANGLE),
+                outfield,
+                x > CORNER_INFIELD_ZONE_X,
+                x < -CORNER_INFIELD_ZONE_X,
+                x > 0,
+            ],
+            [
+                'catcher', 'pitcher', 'left_field', 'right_field', 'center_field',
+                'first_base', 'third_base', 'second_base',
+            ],
+            default='shortstop',
+        )
     
     def calculate_base_path_distance(self, from_base: str, to_base: str) -> float:
         """
@@ -585,6 +656,121 @@ class FieldLayout:
         return "FieldLayout(MLB standard dimensions)"
 
 
+class AlignmentIndex:
+    """
+    Array-backed snapshot of a defensive alignment for nearest-fielder queries.
+
+    Keeps every fielder's coordinates in one (N, 3) array so distances from a
+    single ball or a batch of landing points to the whole defense are one
+    vectorized expression. With nine fielders a dense distance matrix beats a
+    k-d tree. The index is immutable: build a new one (or let
+    FieldingSimulator.alignment do it) when anyone is repositioned.
+    """
+
+    def __init__(self, positions: Dict[str, FieldPosition]):
+        """
+        Build the index.
+
+        Parameters
+        ----------
+        positions : dict
+            Position name -> FieldPosition for each positioned fielder
+        """
+        self.names = tuple(positions)
+        self.positions = tuple(positions.values())
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.coordinates = positions_to_array(self.positions)
+        self.coordinates.flags.writeable = False
+
+    def matches(self, positions: Dict[str, FieldPosition]) -> bool:
+        """Whether the index was built from exactly these position objects."""
+        return (len(positions) == len(self.positions)
+                and all(new is old for new, old in zip(positions.values(), self.positions))
+                and tuple(positions) == self.names)
+
+    def distances(self, points, horizontal: bool = False) -> np.ndarray:
+        """
+        Distance from each point to each fielder.
+
+        Parameters
+        ----------
+        points : FieldPosition or array-like
+            A single position, or (M, 2) / (M, 3) coordinates in feet
+            (z is 0 when omitted)
+        horizontal : bool
+            Ignore height, as FieldPosition.horizontal_distance_to() does
+
+        Returns
+        -------
+        np.ndarray
+            (M, N) distances in feet, columns in ``names`` order
+        """
+        if isinstance(points, FieldPosition):
+            points = [(points.x, points.y, points.z)]
+        points = np.asarray(points, dtype=float)
+        points = points.reshape(-1, points.shape[-1])
+        if points.shape[1] == 2:
+            points = np.column_stack([points, np.zeros(len(points))])
+
+        dx = self.coordinates[None, :, 0] - points[:, 0, None]
+        dy = self.coordinates[None, :, 1] - points[:, 1, None]
+        if horizontal:
+            return np.sqrt(dx**2 + dy**2)
+        dz = self.coordinates[None, :, 2] - points[:, 2, None]
+        return np.sqrt(dx**2 + dy**2 + dz**2)
+
+    def nearest(self, points, horizontal: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Closest fielder to each point.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            (index into ``names``, distance in feet) per point; index is -1
+            and distance inf when the index is empty
+        """
+        distances = self.distances(points, horizontal)
+        if not self.names:
+            return np.full(len(distances), -1), np.full(len(distances), np.inf)
+        closest = distances.argmin(axis=1)
+        return closest, distances[np.arange(len(distances)), closest]
+
+
+def positions_to_array(positions) -> np.ndarray:
+    """
+    Stack positions into one array for vectorized math.
+
+    Parameters
+    ----------
+    positions : iterable of FieldPosition
+
+    Returns
+    -------
+    np.ndarray
+        (N, 3) x/y/z coordinates in feet
+    """
+    return np.array([(p.x, p.y, p.z) for p in positions], dtype=float).reshape(-1, 3)
+
+
+def positions_from_array(coordinates) -> List[FieldPosition]:
+    """
+    Inverse of positions_to_array().
+
+    Parameters
+    ----------
+    coordinates : array-like
+        (N, 2) or (N, 3) coordinates in feet (z is 0 when omitted)
+
+    Returns
+    -------
+    list of FieldPosition
+    """
+    coordinates = np.asarray(coordinates, dtype=float)
+    if coordinates.shape[-1] == 2:
+        return [FieldPosition(x, y, 0.0) for x, y in coordinates.tolist()]
+    return [FieldPosition(x, y, z) for x, y, z in coordinates.tolist()]
+
+
 # Module-level convenience functions
 def create_standard_field() -> FieldLayout:
     """Create a standard MLB field layout."""
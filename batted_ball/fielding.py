@@ -5,6 +5,7 @@ Models individual fielder attributes, reaction times, movement physics,
 catching mechanics, and throwing physics for realistic defensive play simulation.
 """
 
+import math
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Union
 from .constants import (
@@ -42,8 +43,10 @@ from .constants import (
     # Play outcome tolerances
     CLOSE_PLAY_TOLERANCE, SAFE_RUNNER_BIAS,
     TAG_APPLICATION_TIME, TAG_AVOIDANCE_SUCCESS_RATE,
+    # Directional movement penalties
+    FORWARD_MOVEMENT_PENALTY, LATERAL_MOVEMENT_PENALTY, BACKWARD_MOVEMENT_PENALTY,
 )
-from .field_layout import FieldPosition, FieldLayout
+from .field_layout import AlignmentIndex, FieldPosition, FieldLayout
 from .attributes import FielderAttributes
 
 
@@ -150,6 +153,76 @@ class ThrowResult:
         self.arrival_time = release_time + flight_time
 
 
+# Slack (ft, s) that keeps reach-envelope pruning conservative under rounding
+REACH_ENVELOPE_TOLERANCE = 1e-6
+
+
+class ReachEnvelope:
+    """
+    Conservative bound on how far a fielder can get in a given time.
+
+    Uses __slots__ for memory efficiency and faster attribute access.
+    Holds the best case of every bounded term in calculate_time_to_position():
+    fastest direction, full sprint speed, perfect route and the whole Jump
+    credit. The unbounded reaction and Jump noise are passed in as the draws
+    actually made for the play, so the bound never excludes a reachable spot.
+    Fielder.reach_envelope keeps one instance per compiled profile.
+    """
+    __slots__ = ('profile', 'first_step_time', 'range_multiplier', 'jump_feet', 'best_speed_fps')
+
+    def __init__(self, fielder: 'Fielder'):
+        attributes = fielder.attributes
+        self.profile = attributes.profile
+        self.first_step_time = fielder.get_first_step_time()
+        self.range_multiplier = fielder.get_effective_range_multiplier()
+        self.jump_feet = attributes.get_jump_feet()
+
+        # Fastest of the directional penalties _directional_speed_penalty() can return
+        in_mod = attributes.get_range_in_modifier()
+        back_mod = attributes.get_range_back_modifier()
+        best_penalty = max(FORWARD_MOVEMENT_PENALTY,
+                           FORWARD_MOVEMENT_PENALTY * in_mod,
+                           LATERAL_MOVEMENT_PENALTY * (back_mod + in_mod) / 2.0,
+                           BACKWARD_MOVEMENT_PENALTY * back_mod)
+        self.best_speed_fps = fielder.get_sprint_speed_fps_statcast() * best_penalty
+
+    def effective_time(self, base_time: float) -> float:
+        """Apply the range multiplier to the movement part of a base time."""
+        movement_time = max(base_time - self.first_step_time, 0.0)
+        return self.first_step_time + movement_time / self.range_multiplier
+
+    def max_distance(self, time: float, reaction_noise: float = 0.0,
+                     jump_noise: float = 0.0) -> float:
+        """
+        Largest distance (ft) the fielder could cover within an effective time.
+
+        Parameters
+        ----------
+        time : float
+            Effective time budget in seconds
+        reaction_noise, jump_noise : float
+            Standard normal draws for reaction jitter and Jump variance
+
+        Returns
+        -------
+        float
+            Distance in feet, or -inf when nothing is reachable in time
+        """
+        # Effective time never drops below the first step
+        if time + REACH_ENVELOPE_TOLERANCE < self.first_step_time:
+            return -math.inf
+
+        # Undo the range multiplier, then spend what is left after the jittered first step
+        base_time = self.first_step_time + (time - self.first_step_time) * self.range_multiplier
+        first_step = max(0.0, self.first_step_time + 0.05 * reaction_noise)
+        run = (base_time - first_step) * self.best_speed_fps + REACH_ENVELOPE_TOLERANCE
+
+        # Every play covers at least 1 ft of effective distance
+        if run < 1.0:
+            return -math.inf
+        return run + max(0.0, self.jump_feet + jump_noise)
+
+
 class Fielder:
     """
     Represents a defensive player with physical attributes and fielding mechanics.
@@ -197,6 +270,28 @@ class Fielder:
         self.current_velocity = np.array([0.0, 0.0, 0.0])  # ft/s
         self.is_moving = False
         self.target_position = None
+
+        # Built from the compiled attribute profile by throw_parameters / reach_envelope
+        self._throw_parameters = None
+        self._reach_envelope = None
+
+    @property
+    def throw_parameters(self) -> 'ThrowParameters':
+        """Throwing constants, rebuilt whenever the attribute profile is recompiled."""
+        profile = self.attributes.profile
+        params = self._throw_parameters
+        if params is None or params.profile is not profile:
+            params = self._throw_parameters = ThrowParameters(self.attributes)
+        return params
+
+    @property
+    def reach_envelope(self) -> 'ReachEnvelope':
+        """Best-case movement constants, rebuilt whenever the attribute profile is recompiled."""
+        profile = self.attributes.profile
+        envelope = self._reach_envelope
+        if envelope is None or envelope.profile is not profile:
+            envelope = self._reach_envelope = ReachEnvelope(self)
+        return envelope
     
     def get_acceleration_fps2(self) -> float:
         """Get acceleration in feet per second squared."""
@@ -235,25 +330,20 @@ class Fielder:
         float
             Speed multiplier (0.85 to 1.15) based on direction and player ability
         """
-        from .constants import (
-            FORWARD_MOVEMENT_PENALTY,
-            LATERAL_MOVEMENT_PENALTY,
-            BACKWARD_MOVEMENT_PENALTY
-        )
-        
-        # Normalize direction vector
-        direction_mag = np.linalg.norm(movement_direction[:2])  # Only consider x,y
+        # Only consider x,y
+        return self._directional_speed_penalty(movement_direction[0], movement_direction[1])
+
+    def _directional_speed_penalty(self, dx: float, dy: float) -> float:
+        """calculate_directional_speed_penalty() for a movement of (dx, dy) feet."""
+        # Normalize direction vector (scalar math: no per-call arrays)
+        direction_mag = math.sqrt(dx * dx + dy * dy)
         if direction_mag < 1e-6:
             return FORWARD_MOVEMENT_PENALTY
         
-        direction_unit = movement_direction[:2] / direction_mag
-        
-        # Forward is positive y direction in our coordinate system
-        forward_component = direction_unit[1]
-        
         # Determine primary direction
-        angle = np.arctan2(direction_unit[0], direction_unit[1])  # angle from forward
-        angle_deg = np.abs(np.degrees(angle))
+        # Forward is positive y direction in our coordinate system
+        angle = math.atan2(dx / direction_mag, dy / direction_mag)  # angle from forward
+        angle_deg = abs(math.degrees(angle))
         
         if angle_deg <= 45:
             # Forward movement - use player's RANGE_IN modifier
@@ -647,18 +737,30 @@ class Fielder:
 
         # Calculate distance and direction to target
         distance = self.current_position.distance_to(target)
-        movement_vector = np.array([
-            target.x - self.current_position.x,
-            target.y - self.current_position.y,
-            0.0
-        ])
+        movement_dx = target.x - self.current_position.x
+        movement_dy = target.y - self.current_position.y
+        noise = self._draw_movement_noise(distance)
+        return self._time_to_position(distance, movement_dx, movement_dy, noise)
 
+    def _draw_movement_noise(self, distance: float) -> List[float]:
+        """
+        Standard normal draws for one calculate_time_to_position() call.
+
+        Reaction jitter, Jump variance and (from 30 ft out) route efficiency
+        variance come from a single call that advances the global RNG exactly
+        as the three separate np.random.normal() draws did.
+        """
+        return np.random.standard_normal(2 if distance < 30.0 else 3).tolist()
+
+    def _time_to_position(self, distance: float, movement_dx: float, movement_dy: float,
+                          noise: List[float]) -> float:
+        """calculate_time_to_position() given the distance, direction and noise draws."""
         # Get base physical attributes
         max_speed = self.get_sprint_speed_fps_statcast()
         first_step_time = self.get_first_step_time()
 
         # FIELDING REALISM: Add reaction time jitter (~±50ms)
-        reaction_jitter = np.random.normal(0, 0.05)  # ~±50ms std dev
+        reaction_jitter = 0.05 * noise[0]  # ~±50ms std dev
         first_step_time = max(0.0, first_step_time + reaction_jitter)
 
         # STATCAST JUMP: Get fielder's Jump metric (feet above/below average in first 3s)
@@ -667,11 +769,11 @@ class Fielder:
         jump_feet = self.attributes.get_jump_feet()
         
         # Add stochastic variance to Jump (~±1 ft per play for variability)
-        jump_variance = np.random.normal(0, 1.0)  # ±1 ft std dev
+        jump_variance = noise[1]  # ±1 ft std dev
         effective_jump_feet = jump_feet + jump_variance
 
         # Apply directional speed penalty
-        direction_penalty = self.calculate_directional_speed_penalty(movement_vector)
+        direction_penalty = self._directional_speed_penalty(movement_dx, movement_dy)
         directional_max_speed = max_speed * direction_penalty
 
         # Calculate effective speed based on distance
@@ -694,7 +796,7 @@ class Fielder:
             route_efficiency = route_efficiency_raw if route_efficiency_raw <= 1.0 else route_efficiency_raw / 100.0
 
             # FIELDING REALISM: Add stochastic variance (±2% noise)
-            route_eff_variance = np.random.normal(0, 0.02)  # ±2% noise
+            route_eff_variance = 0.02 * noise[2]  # ±2% noise
             route_efficiency = np.clip(route_efficiency + route_eff_variance, 0.85, 0.99)
 
             # REBALANCED 2025-01-XX: Route efficiency more impactful on medium-range plays
@@ -712,7 +814,7 @@ class Fielder:
             route_efficiency = route_efficiency_raw if route_efficiency_raw <= 1.0 else route_efficiency_raw / 100.0
 
             # FIELDING REALISM: Add stochastic variance (±2% noise)
-            route_eff_variance = np.random.normal(0, 0.02)  # ±2% noise
+            route_eff_variance = 0.02 * noise[2]  # ±2% noise
             route_efficiency = np.clip(route_efficiency + route_eff_variance, 0.85, 0.99)
 
             # REBALANCED 2025-01-XX: Route efficiency more impactful on long-range plays
@@ -741,18 +843,44 @@ class Fielder:
         # Get base time (already includes first-step/reaction time)
         base_time = self.calculate_time_to_position(target)
 
-        # Apply range multiplier to improve/reduce effective time
-        # Higher range = faster effective movement
-        range_multiplier = self.get_effective_range_multiplier()
+        # Range multiplier applies to movement only, not the first step
+        return self.reach_envelope.effective_time(base_time)
 
-        # Separate first-step from movement to apply range only to movement
-        first_step_time = self.get_first_step_time()
-        movement_time = max(base_time - first_step_time, 0.0)
+    def calculate_effective_time_within(self, target: FieldPosition, time_limit: float) -> float:
+        """
+        calculate_effective_time_to_position(), or inf if target is out of reach.
+
+        Draws the same random numbers as the exact calculation, then checks
+        the fielder's reach envelope with them. If even the best-case route
+        cannot get the fielder to ``target`` by ``time_limit``, the exact
+        timing is skipped and ``inf`` returned; otherwise the result equals
+        calculate_effective_time_to_position().
+
+        Parameters
+        ----------
+        target : FieldPosition
+            Target position to reach
+        time_limit : float
+            Latest effective time (seconds) the caller would accept
+
+        Returns
+        -------
+        float
+            Effective time in seconds, or inf when pruned
+        """
+        if self.current_position is None:
+            raise ValueError("Current position not set")
 
-        # Range affects movement efficiency
-        adjusted_movement = movement_time / range_multiplier
+        current = self.current_position
+        distance = current.distance_to(target)
+        noise = self._draw_movement_noise(distance)
 
-        return first_step_time + adjusted_movement
+        envelope = self.reach_envelope
+        if distance > envelope.max_distance(time_limit, noise[0], noise[1]):
+            return math.inf
+
+        base_time = self._time_to_position(distance, target.x - current.x, target.y - current.y, noise)
+        return envelope.effective_time(base_time)
     
     def can_reach_ball(self, ball_position: FieldPosition, ball_arrival_time: float) -> bool:
         """
@@ -812,11 +940,8 @@ class Fielder:
         # Create ground position under the ball for accurate fielder movement calculation
         ground_position = FieldPosition(ball_position.x, ball_position.y, 0.0)
         distance = self.current_position.horizontal_distance_to(ball_position)
-        movement_vector = np.array([
-            ball_position.x - self.current_position.x,
-            ball_position.y - self.current_position.y,
-            0.0
-        ])
+        movement_dx = ball_position.x - self.current_position.x
+        movement_dy = ball_position.y - self.current_position.y
 
         # Calculate fielder time to reach ground position under ball
         fielder_time = self.calculate_effective_time_to_position(ground_position)
@@ -920,8 +1045,7 @@ class Fielder:
             probability *= 0.96  # 4% penalty for 80-100 ft plays (reduced from 10%)
 
         # Backward movement penalty
-        from .constants import BACKWARD_MOVEMENT_PENALTY
-        direction_penalty = self.calculate_directional_speed_penalty(movement_vector)
+        direction_penalty = self._directional_speed_penalty(movement_dx, movement_dy)
         if direction_penalty == BACKWARD_MOVEMENT_PENALTY:
             probability *= 0.93  # 7% penalty
 
@@ -1192,6 +1316,94 @@ class Fielder:
 # THROW PHYSICS SIMULATION
 # =============================================================================
 
+# Throws arc slightly, adding ~7% to the straight-line flight time
+THROW_ARC_FACTOR = 1.07
+
+
+class ThrowParameters:
+    """
+    Per-fielder throwing constants derived from the attribute profile.
+
+    Uses __slots__ for memory efficiency and faster attribute access.
+    Fielder.throw_parameters keeps one instance per compiled profile, so
+    throws no longer re-read four attribute getters and redo the accuracy
+    clip every time.
+    """
+    __slots__ = ('profile', 'arm_strength_mph', 'transfer_time', 'accuracy_sigma_ft',
+                 'throw_velocity_fps', 'on_target_probability')
+
+    def __init__(self, attributes: FielderAttributes):
+        self.profile = attributes.profile
+        self.arm_strength_mph = attributes.get_arm_strength_mph()  # 60-105 mph
+        self.transfer_time = attributes.get_transfer_time_s()  # 0.4-0.8s
+        self.accuracy_sigma_ft = attributes.get_arm_accuracy_sigma_ft()  # 2-12 ft
+        self.throw_velocity_fps = self.arm_strength_mph * 1.467  # mph to ft/s
+        # Throws with sigma < 3 ft are very accurate (95% on-target)
+        # Throws with sigma > 8 ft are poor (70% on-target)
+        self.on_target_probability = np.clip(1.0 - (self.accuracy_sigma_ft - 2.0) / 15.0, 0.70, 0.98)
+
+    def flight_time(self, distance_ft):
+        """Flight time (seconds) for a throw of distance_ft (scalar or array)."""
+        return (distance_ft / self.throw_velocity_fps) * THROW_ARC_FACTOR
+
+    def draw_accuracy(self) -> Tuple[bool, float]:
+        """
+        Draw whether a throw is on target and its handling penalty.
+
+        Off-target throws cost the receiving fielder 0.5-1.0s. Consumes the
+        global RNG exactly as simulate_fielder_throw() always has.
+        """
+        on_target = np.random.random() < self.on_target_probability
+        handling_penalty = 0.0
+        if not on_target:
+            handling_penalty = np.random.uniform(0.5, 1.0)
+        return on_target, handling_penalty
+
+
+def throw_arrival_times(fielder: 'Fielder', from_positions,
+                        field_layout: FieldLayout) -> np.ndarray:
+    """
+    Transfer plus flight time from many throwing positions to every base.
+
+    The deterministic part of simulate_fielder_throw() for all four bases in
+    one vectorized call, so callers can compare throw options (force base,
+    relay pivot, first) without simulating each throw separately. Add a
+    handling penalty from ``fielder.throw_parameters.draw_accuracy()`` to get
+    the arrival time simulate_fielder_throw() would report.
+
+    Parameters
+    ----------
+    fielder : Fielder
+        Fielder making the throws
+    from_positions : array-like or FieldPosition
+        (N, 2) x/y throwing positions in feet, or a single FieldPosition
+    field_layout : FieldLayout
+        Field layout for base positions
+
+    Returns
+    -------
+    np.ndarray
+        (N, 4) seconds, columns in BASES order (home, first, second, third)
+
+    Examples
+    --------
+    >>> times = throw_arrival_times(shortstop, field_layout.base_coordinates, field_layout)
+    >>> times[BASE_INDEX['second'], BASE_INDEX['first']]  # Pivot from second to first
+    """
+    if isinstance(from_positions, FieldPosition):
+        from_positions = [(from_positions.x, from_positions.y)]
+    from_positions = np.asarray(from_positions, dtype=float).reshape(-1, 2)
+    bases = field_layout.base_coordinates
+
+    # Horizontal distances (throws are ground-level to ground-level)
+    dx = from_positions[:, 0, None] - bases[None, :, 0]
+    dy = from_positions[:, 1, None] - bases[None, :, 1]
+    distance_ft = np.sqrt(dx**2 + dy**2)
+
+    params = fielder.throw_parameters
+    return params.transfer_time + params.flight_time(distance_ft)
+
+
 class DetailedThrowResult:
     """
     Detailed result of a throw from fielder to base.
@@ -1282,48 +1494,31 @@ def simulate_fielder_throw(fielder: 'Fielder',
     - Inaccurate throws add 0.5-1.0s for receiving fielder to handle
     - Transfer time varies by position (infielders faster than outfielders)
     """
-    # Get fielder throwing attributes from physics-first system
-    arm_strength_mph = fielder.attributes.get_arm_strength_mph()  # 60-105 mph
-    transfer_time = fielder.attributes.get_transfer_time_s()  # 0.4-0.8s
-    accuracy_sigma_ft = fielder.attributes.get_arm_accuracy_sigma_ft()  # 2-12 ft
-    
+    params = fielder.throw_parameters
+
     # Get target base position
     base_position = field_layout.get_base_position(to_base)
-    
+
     # Calculate horizontal distance (throws are ground-level to ground-level)
     distance_ft = from_position.horizontal_distance_to(base_position)
-    
-    # Convert throw velocity to ft/s
-    throw_velocity_fps = arm_strength_mph * 1.467  # mph to ft/s
-    
-    # Calculate straight-line flight time
-    straight_flight_time = distance_ft / throw_velocity_fps
-    
-    # Add arc penalty (throws have upward arc, adding ~7% to travel time)
-    flight_time = straight_flight_time * 1.07
-    
-    # Determine if throw is on-target using accuracy
-    # Throws with sigma < 3 ft are very accurate (95% on-target)
-    # Throws with sigma > 8 ft are poor (70% on-target)
-    on_target_probability = np.clip(1.0 - (accuracy_sigma_ft - 2.0) / 15.0, 0.70, 0.98)
-    on_target = np.random.random() < on_target_probability
-    
-    # Off-target throws require extra handling time by receiving fielder
-    handling_penalty = 0.0
-    if not on_target:
-        handling_penalty = np.random.uniform(0.5, 1.0)
-    
+
+    # Straight-line flight time plus arc penalty
+    flight_time = params.flight_time(distance_ft)
+
+    # Determine if throw is on-target; misses need extra handling time
+    on_target, handling_penalty = params.draw_accuracy()
+
     # Total arrival time
-    total_time = transfer_time + flight_time + handling_penalty
-    
+    total_time = params.transfer_time + flight_time + handling_penalty
+
     return DetailedThrowResult(
         from_position=from_position,
         to_base=to_base,
-        throw_velocity_mph=arm_strength_mph,
-        transfer_time=transfer_time,
+        throw_velocity_mph=params.arm_strength_mph,
+        transfer_time=params.transfer_time,
         flight_time=flight_time,
         arrival_time=total_time,
-        accuracy_sigma_ft=accuracy_sigma_ft,
+        accuracy_sigma_ft=params.accuracy_sigma_ft,
         on_target=on_target
     )
 
@@ -1537,28 +1732,22 @@ def simulate_relay_throw(fielder: 'Fielder',
     # Calculate throw manually since we're throwing to a position, not a base
     first_throw_distance = from_position.horizontal_distance_to(cutoff_position)
 
-    # Get fielder's throwing attributes
-    fielder_arm_mph = fielder.attributes.get_arm_strength_mph()
-    fielder_transfer = fielder.attributes.get_transfer_time_s()
-    fielder_accuracy = fielder.attributes.get_arm_accuracy_sigma_ft()
-
-    # Calculate flight time
-    first_throw_velocity_fps = fielder_arm_mph * 1.467  # mph to ft/s
-    first_throw_flight_time = (first_throw_distance / first_throw_velocity_fps) * 1.07
+    # Fielder's throwing constants
+    params = fielder.throw_parameters
+    first_throw_flight_time = params.flight_time(first_throw_distance)
 
-    # Determine accuracy
-    on_target_prob_1 = np.clip(1.0 - (fielder_accuracy - 2.0) / 15.0, 0.70, 0.98)
-    first_on_target = np.random.random() < on_target_prob_1
+    # Determine accuracy (no handling penalty: the cut-off man absorbs it)
+    first_on_target = np.random.random() < params.on_target_probability
 
     # Create first throw result
     first_throw = DetailedThrowResult(
         from_position=from_position,
         to_base=f"{cutoff_man.position}_cutoff",
-        throw_velocity_mph=fielder_arm_mph,
-        transfer_time=fielder_transfer,
+        throw_velocity_mph=params.arm_strength_mph,
+        transfer_time=params.transfer_time,
         flight_time=first_throw_flight_time,
-        arrival_time=fielder_transfer + first_throw_flight_time,
-        accuracy_sigma_ft=fielder_accuracy,
+        arrival_time=params.transfer_time + first_throw_flight_time,
+        accuracy_sigma_ft=params.accuracy_sigma_ft,
         on_target=first_on_target
     )
 
@@ -1607,6 +1796,42 @@ class FieldingSimulator:
         self.field_layout = field_layout
         self.fielders = {}
         self.current_time = 0.0
+        self._alignment = None
+
+    @property
+    def alignment(self) -> AlignmentIndex:
+        """
+        Index of where the fielders currently stand.
+
+        Rebuilt only when a fielder is added or repositioned (any new
+        current_position object), so repeated queries during a play reuse it.
+        """
+        positions = {name: fielder.current_position for name, fielder in self.fielders.items()
+                     if fielder.current_position is not None}
+        index = self._alignment
+        if index is None or not index.matches(positions):
+            index = self._alignment = AlignmentIndex(positions)
+        return index
+
+    def apply_alignment(self, positions: Dict[str, FieldPosition]):
+        """
+        Move fielders to a new alignment.
+
+        Parameters
+        ----------
+        positions : dict
+            Position name -> FieldPosition, e.g. from
+            FieldLayout.apply_defensive_shift(); positions without a fielder
+            are ignored
+        """
+        for position_name, position in positions.items():
+            fielder = self.fielders.get(position_name)
+            if fielder is not None:
+                fielder.update_position(position)
+        self._alignment = AlignmentIndex(
+            {name: fielder.current_position for name, fielder in self.fielders.items()
+             if fielder.current_position is not None}
+        )
     
     def add_fielder(self, position_name: str, fielder: Fielder):
         """
@@ -1643,7 +1868,25 @@ class FieldingSimulator:
             fielder.update_position(adjusted_pos)
 
         self.fielders[position_name] = fielder
-    
+
+    def position_of(self, fielder: Fielder) -> Optional[str]:
+        """
+        Position name (alignment key) a fielder occupies.
+
+        Fielder.position is whatever the roster supplied, e.g. 'SS' or 'CF'
+        for database teams; the key passed to add_fielder() is always the
+        full name ('shortstop', 'center_field', ...).
+
+        Returns
+        -------
+        str or None
+            Position name, or None if the fielder is not in the alignment
+        """
+        for position_name, candidate in self.fielders.items():
+            if candidate is fielder:
+                return position_name
+        return None
+
     def determine_responsible_fielder(self, ball_position: FieldPosition,
                                      ball_arrival_time: Optional[float] = None) -> str:
         """
@@ -1685,11 +1928,14 @@ class FieldingSimulator:
         # PHYSICS-FIRST APPROACH: Check who can actually catch the ball
         # Calculate effective time for all fielders
         fielders_who_can_catch = []
+        alignment = self.alignment
+        distances = alignment.distances(ball_position, horizontal=True)[0]
 
         for pos_name, fielder in self.fielders.items():
             try:
                 # Calculate how long it takes this fielder to reach the ball
-                effective_time = fielder.calculate_effective_time_to_position(ball_position)
+                # (inf when the reach envelope rules out the diving-catch window)
+                effective_time = fielder.calculate_effective_time_within(ball_position, ball_arrival_time + 0.15)
 
                 # Time margin: positive = fielder arrives before ball (can catch)
                 time_margin = ball_arrival_time - effective_time
@@ -1697,7 +1943,7 @@ class FieldingSimulator:
                 # Only consider fielders who arrive before or very close to ball arrival
                 # Allow small negative margin for diving catches (up to -0.15s)
                 if time_margin >= -0.15:
-                    distance = fielder.current_position.horizontal_distance_to(ball_position)
+                    distance = distances[alignment.index[pos_name]]
                     hierarchy_priority = FIELDING_HIERARCHY.get(pos_name, 50)
 
                     fielders_who_can_catch.append({
@@ -1775,7 +2021,10 @@ class FieldingSimulator:
             raise ValueError(f"No fielder assigned to position {responsible_position}")
         
         fielder = self.fielders[responsible_position]
-        return fielder.attempt_fielding(ball_position, ball_arrival_time)
+        result = fielder.attempt_fielding(ball_position, ball_arrival_time)
+        # Report the alignment key; Fielder.position is 'CF', 'SS', ... for database rosters
+        result.fielder_position = responsible_position
+        return result
     
     def get_all_fielding_probabilities(self, ball_position: FieldPosition,
                                      ball_arrival_time: float) -> Dict[str, float]:
@@ -1798,7 +2047,8 @@ class FieldingSimulator:
         
         for pos_name, fielder in self.fielders.items():
             try:
-                effective_time = fielder.calculate_effective_time_to_position(ball_position)
+                # inf (probability 0) when out of reach even for a diving play
+                effective_time = fielder.calculate_effective_time_within(ball_position, ball_arrival_time + 0.3)
                 
                 if effective_time <= ball_arrival_time:
                     # Base probability if they can get there
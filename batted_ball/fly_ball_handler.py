@@ -7,6 +7,7 @@ and outfield ball fielding logic.
 
 import math
 import numpy as np
+from time import perf_counter
 from typing import Dict, List, Tuple, Optional
 
 from .constants import (
@@ -163,6 +164,7 @@ class FlyBallHandler:
         self.play_analyzer = None
         self.hit_handler = None
         self.throwing_logic = None
+        self.profiler = None  # Optional PhaseProfiler
 
     def simulate_catch_attempt(self, ball_position: FieldPosition,
                                hang_time: float, result: PlayResult) -> FieldingResult:
@@ -710,10 +712,15 @@ class FlyBallHandler:
         cutoff_first_fielder = self.fielding_simulator.fielders.get(cutoff_for_first, fielder)
 
         # Calculate throws using relay logic (automatically uses relay if distance > 200 ft)
+        profiler = self.profiler
+        if profiler is not None:
+            t0 = perf_counter()
         relay_to_first = simulate_relay_throw(fielder, cutoff_first_fielder, ball_position, 'first', self.field_layout)
         relay_to_second = simulate_relay_throw(fielder, cutoff_second_fielder, ball_position, 'second', self.field_layout)
         relay_to_third = simulate_relay_throw(fielder, cutoff_third_fielder, ball_position, 'third', self.field_layout)
         relay_to_home = simulate_relay_throw(fielder, cutoff_home_fielder, ball_position, 'home', self.field_layout)
+        if profiler is not None:
+            profiler.record('throwing', perf_counter() - t0)
 
         # Log throw analysis with relay information
         relay_info = ""
@@ -879,6 +886,11 @@ class FlyBallHandler:
         # Skip very early trajectory (first 0.15s or 10% of flight) - ball rising too fast near batter
         start_time_threshold = min(0.15, flight_time * 0.10)
 
+        # Ball positions at every sample time in one vectorized pass
+        sample_positions = self.calculate_ball_positions_at_times(
+            batted_ball_result, np.arange(1, time_steps) * dt
+        )
+
         for i in range(1, time_steps):  # Skip t=0 (still at bat)
             t = i * dt
 
@@ -887,7 +899,8 @@ class FlyBallHandler:
                 continue
 
             # Get ball position at time t
-            ball_pos_t = self.calculate_ball_position_at_time(batted_ball_result, t)
+            ball_xyz = sample_positions[i - 1]
+            ball_pos_t = FieldPosition(ball_xyz[0], ball_xyz[1], ball_xyz[2])
 
             if debug:
                 print(f"  t={t:.2f}s: ball at ({ball_pos_t.x:.0f}, {ball_pos_t.y:.0f}, {ball_pos_t.z:.1f}ft)")
@@ -905,10 +918,18 @@ class FlyBallHandler:
             candidates = []
             all_fielder_times = []  # Track all fielders for debug
 
+            # Calculate fielder movement time to the ground position under the ball
+            # Fielders run on the ground (z=0), not through the air!
+            ground_position = FieldPosition(ball_pos_t.x, ball_pos_t.y, 0.0)
+
             for position_name, fielder in self.fielding_simulator.fielders.items():
-                # Calculate fielder movement time to the ground position under the ball
-                # Fielders run on the ground (z=0), not through the air!
-                ground_position = FieldPosition(ball_pos_t.x, ball_pos_t.y, 0.0)
+                # Use horizontal distance for display (not 3D distance)
+                distance = fielder.current_position.horizontal_distance_to(ball_pos_t)
+
+                # Fielders need to arrive with time to spare to attempt catch
+                # Require at least some margin for realistic catches
+                # This prevents unrealistic diving catches where fielder barely gets there
+                min_margin = 0.05 if distance > 200 else 0.0
 
                 # Enable advanced AI pursuit for better fielding intelligence
                 USE_ADVANCED_AI = False  # Disable for now - use simpler calculation
@@ -938,16 +959,14 @@ class FlyBallHandler:
                         effective_time = fielder.calculate_effective_time_to_position(ground_position)
                 else:
                     # Use basic method - calculate time to reach ground position
-                    effective_time = fielder.calculate_effective_time_to_position(ground_position)
+                    # (inf when the reach envelope rules out arriving with min_margin to spare)
+                    effective_time = fielder.calculate_effective_time_within(ground_position, t - min_margin)
 
                 # Time margin = how much time fielder has to spare
                 # Fielder needs to arrive before ball at time t (when we're sampling the trajectory)
                 # If fielder can get there in less time than it takes ball to reach this point, they can catch it
                 time_margin = t - effective_time  # Positive = fielder arrives before ball at this point
 
-                # Use horizontal distance for display (not 3D distance)
-                distance = fielder.current_position.horizontal_distance_to(ball_pos_t)
-
                 # Track for debug
                 all_fielder_times.append({
                     'position': position_name,
@@ -956,10 +975,6 @@ class FlyBallHandler:
                     'effective_time': effective_time
                 })
 
-                # Fielders need to arrive with time to spare to attempt catch
-                # Require at least some margin for realistic catches
-                # This prevents unrealistic diving catches where fielder barely gets there
-                min_margin = 0.05 if distance > 200 else 0.0
                 if time_margin >= min_margin:
                     candidates.append({
                         'position': position_name,
@@ -1114,7 +1129,6 @@ class FlyBallHandler:
     def calculate_ball_position_at_time(self, batted_ball_result: BattedBallResult, t: float) -> FieldPosition:
         """Calculate ball position at time t during flight using actual physics trajectory."""
         # Use actual trajectory data from physics simulation
-        time_array = batted_ball_result.time
         position_array = batted_ball_result.position  # Nx3 array in meters
 
         # Handle edge cases
@@ -1136,25 +1150,8 @@ class FlyBallHandler:
                 max(0.0, pos[2] * METERS_TO_FEET)  # Don't go below ground
             )
 
-        # Find the two time points that bracket t
-        idx = np.searchsorted(time_array, t)
-
-        if idx == 0:
-            # At or before first point
-            pos = position_array[0]
-        elif idx >= len(time_array):
-            # At or after last point
-            pos = position_array[-1]
-        else:
-            # Interpolate between two points
-            t1 = time_array[idx - 1]
-            t2 = time_array[idx]
-            pos1 = position_array[idx - 1]
-            pos2 = position_array[idx]
-
-            # Linear interpolation factor
-            alpha = (t - t1) / (t2 - t1)
-            pos = pos1 + alpha * (pos2 - pos1)
+        # Evaluate the trajectory spline (direct segment lookup, no search)
+        pos = batted_ball_result.spline.position(t)
 
         # Convert to feet and return
         return FieldPosition(
@@ -1163,6 +1160,30 @@ class FlyBallHandler:
             max(0.0, pos[2] * METERS_TO_FEET)  # Don't go below ground
         )
 
+    def calculate_ball_positions_at_times(self, batted_ball_result: BattedBallResult,
+                                          times: np.ndarray) -> np.ndarray:
+        """
+        Vectorized calculate_ball_position_at_time() for many sample times.
+
+        Returns
+        -------
+        np.ndarray
+            (T, 3) ball positions in feet, same values as the scalar method
+        """
+        position_array = batted_ball_result.position  # Nx3 array in meters
+        times = np.asarray(times, dtype=float)
+        pos = batted_ball_result.spline.positions(times)
+
+        # Outside the flight
+        pos[times >= batted_ball_result.flight_time] = position_array[-1]
+        pos[times <= 0] = position_array[0]
+
+        positions = pos * METERS_TO_FEET
+        # Don't go below ground (the launch point is returned as-is)
+        airborne = times > 0
+        positions[airborne, 2] = np.maximum(positions[airborne, 2], 0.0)
+        return positions
+
     def create_trajectory_data_for_pursuit(self, batted_ball_result: BattedBallResult, current_time: float) -> dict:
         """
         Create trajectory data format expected by advanced AI pursuit methods.
@@ -6,11 +6,15 @@ all the physics-based mechanics (pitching, hitting, fielding, baserunning) into
 a full 9-inning game with detailed tracking and output.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from array import array
+from operator import attrgetter
 from typing import List, Dict, Optional, Tuple, Union
 from enum import Enum
 import random
 import sys
+from time import perf_counter
+from functools import partial
 import numpy as np
 
 from .player import Pitcher, Hitter, generate_pitch_arsenal
@@ -22,6 +26,8 @@ from .defense_factory import create_standard_defense
 from .at_bat import AtBatSimulator
 from .constants import SimulationMode
 from .ballpark_effects import get_ballpark_effects, get_ballpark_for_team, MLB_BALLPARK_EFFECTS
+from .log_writer import GameLogWriter, LogLevel
+from .event_store import EventStore
 from .attributes import (
     create_power_hitter,
     create_balanced_hitter,
@@ -162,64 +168,117 @@ def get_pa_outcome_code(outcome: str, batted_ball_result: Optional[Dict] = None)
     return outcome_map.get(outcome, outcome.upper())
 
 
-@dataclass
-class GameState:
-    """Tracks the complete state of a baseball game"""
-    inning: int = 1
-    is_top: bool = True  # True = top of inning (away team batting)
-    outs: int = 0
-    away_score: int = 0
-    home_score: int = 0
-
-    # Runners on base (None if empty, Hitter object if occupied)
-    runner_on_first: Optional[Hitter] = None
-    runner_on_second: Optional[Hitter] = None
-    runner_on_third: Optional[Hitter] = None
-
-    # Game statistics - Total (both teams)
-    total_pitches: int = 0
-    total_hits: int = 0
-    total_home_runs: int = 0
-
-    # Per-team statistics - Away team
-    away_hits: int = 0
-    away_singles: int = 0
-    away_doubles: int = 0
-    away_triples: int = 0
-    away_home_runs: int = 0
-    away_strikeouts: int = 0
-    away_walks: int = 0
-    away_errors: int = 0
-    away_at_bats: int = 0
-    away_ground_balls: int = 0  # Launch angle < 10 degrees
-    away_fly_balls: int = 0     # Launch angle >= 25 degrees
-    away_line_drives: int = 0   # Launch angle 10-25 degrees
-    away_exit_velocities: List[float] = field(default_factory=list)
-    away_launch_angles: List[float] = field(default_factory=list)
+# Per-team counters tracked by GameState. The counter snapshot array lays out
+# the away team at indices [0, N) and the home team at [N, 2N).
+TEAM_COUNTER_NAMES = (
+    'score',
+    'hits',
+    'singles',
+    'doubles',
+    'triples',
+    'home_runs',
+    'strikeouts',
+    'walks',
+    'errors',
+    'at_bats',
+    'ground_balls',      # Launch angle < 10 degrees
+    'fly_balls',         # Launch angle >= 25 degrees
+    'line_drives',       # Launch angle 10-25 degrees
     # Out tracking by batted ball type (Phase 1.7 - for validating defense calibration)
-    away_ground_ball_outs: int = 0
-    away_fly_ball_outs: int = 0
-    away_line_drive_outs: int = 0
-
-    # Per-team statistics - Home team
-    home_hits: int = 0
-    home_singles: int = 0
-    home_doubles: int = 0
-    home_triples: int = 0
-    home_home_runs: int = 0
-    home_strikeouts: int = 0
-    home_walks: int = 0
-    home_errors: int = 0
-    home_at_bats: int = 0
-    home_ground_balls: int = 0
-    home_fly_balls: int = 0
-    home_line_drives: int = 0
-    home_exit_velocities: List[float] = field(default_factory=list)
-    home_launch_angles: List[float] = field(default_factory=list)
-    # Out tracking by batted ball type (Phase 1.7)
-    home_ground_ball_outs: int = 0
-    home_fly_ball_outs: int = 0
-    home_line_drive_outs: int = 0
+    'ground_ball_outs',
+    'fly_ball_outs',
+    'line_drive_outs',
+)
+N_TEAM_COUNTERS = len(TEAM_COUNTER_NAMES)
+
+# Fully-qualified counter names in array order (away_* block, then home_*)
+GAME_STATE_COUNTER_FIELDS = tuple(
+    f"{team}_{name}" for team in ("away", "home") for name in TEAM_COUNTER_NAMES
+)
+
+# Reads every counter in one C-level call (used for end-of-game extraction)
+_get_counters = attrgetter(*GAME_STATE_COUNTER_FIELDS)
+
+# Per-team batted ball lists (exit velocity mph, launch angle deg)
+_GAME_STATE_LIST_FIELDS = (
+    'away_exit_velocities', 'away_launch_angles',
+    'home_exit_velocities', 'home_launch_angles',
+)
+
+# Base occupancy bits: first = 1, second = 2, third = 4
+BASE_FIRST = 1
+BASE_SECOND = 2
+BASE_THIRD = 4
+
+_BASE_STATE_BY_MASK = (
+    BaseState.EMPTY,
+    BaseState.FIRST,
+    BaseState.SECOND,
+    BaseState.FIRST_SECOND,
+    BaseState.THIRD,
+    BaseState.FIRST_THIRD,
+    BaseState.SECOND_THIRD,
+    BaseState.LOADED,
+)
+
+
+class GameState:
+    """
+    Tracks the complete state of a baseball game.
+
+    Compact representation: all fields are ``__slots__`` (no per-instance
+    dict), base occupancy is exposed as a 3-bit mask over the runner
+    references, and the per-team counters are extracted at the end of a game
+    as one fixed ``array('q')`` (see counter_snapshot/export_counters). The
+    attribute API (``away_hits``, ``runner_on_first``, ...) is unchanged, so
+    handlers and SeriesMetrics read and write it exactly as before.
+    """
+
+    __slots__ = (
+        'inning', 'is_top', 'outs',
+        'total_pitches', 'total_hits', 'total_home_runs',
+        'runner_on_first', 'runner_on_second', 'runner_on_third',
+        'away_exit_velocities', 'away_launch_angles',
+        'home_exit_velocities', 'home_launch_angles',
+    ) + GAME_STATE_COUNTER_FIELDS
+
+    def __init__(self, inning: int = 1, is_top: bool = True, outs: int = 0,
+                 total_pitches: int = 0, total_hits: int = 0,
+                 total_home_runs: int = 0, **fields):
+        self.inning = inning
+        self.is_top = is_top  # True = top of inning (away team batting)
+        self.outs = outs
+
+        # Game statistics - Total (both teams)
+        self.total_pitches = total_pitches
+        self.total_hits = total_hits
+        self.total_home_runs = total_home_runs
+
+        # Per-team counters (see TEAM_COUNTER_NAMES)
+        for name in GAME_STATE_COUNTER_FIELDS:
+            setattr(self, name, 0)
+
+        # Runners on base (None if empty, Hitter object if occupied)
+        self.runner_on_first: Optional[Hitter] = None
+        self.runner_on_second: Optional[Hitter] = None
+        self.runner_on_third: Optional[Hitter] = None
+
+        self.away_exit_velocities: List[float] = []
+        self.away_launch_angles: List[float] = []
+        self.home_exit_velocities: List[float] = []
+        self.home_launch_angles: List[float] = []
+
+        for name, value in fields.items():
+            if name not in _GAME_STATE_INIT_FIELDS:
+                raise TypeError(f"GameState got an unexpected keyword argument '{name}'")
+            setattr(self, name, value)
+
+    @property
+    def base_mask(self) -> int:
+        """Base occupancy as a 3-bit mask (first = 1, second = 2, third = 4)"""
+        return ((self.runner_on_first is not None)
+                | (self.runner_on_second is not None) << 1
+                | (self.runner_on_third is not None) << 2)
 
     def get_batting_team(self) -> str:
         """Returns which team is currently batting"""
@@ -231,26 +290,7 @@ class GameState:
 
     def get_base_state(self) -> BaseState:
         """Returns the current base/runner situation"""
-        first = self.runner_on_first is not None
-        second = self.runner_on_second is not None
-        third = self.runner_on_third is not None
-
-        if not any([first, second, third]):
-            return BaseState.EMPTY
-        elif first and second and third:
-            return BaseState.LOADED
-        elif first and second:
-            return BaseState.FIRST_SECOND
-        elif first and third:
-            return BaseState.FIRST_THIRD
-        elif second and third:
-            return BaseState.SECOND_THIRD
-        elif first:
-            return BaseState.FIRST
-        elif second:
-            return BaseState.SECOND
-        elif third:
-            return BaseState.THIRD
+        return _BASE_STATE_BY_MASK[self.base_mask]
 
     def clear_bases(self):
         """Clear all runners from bases"""
@@ -282,6 +322,35 @@ class GameState:
         else:
             self.home_score += 1
 
+    def counter_snapshot(self) -> array:
+        """
+        Per-team counters as a fixed array, read in one C-level call.
+
+        Returns
+        -------
+        array
+            ``array('q')`` laid out as GAME_STATE_COUNTER_FIELDS
+        """
+        return array('q', _get_counters(self))
+
+    def export_counters(self) -> Dict[str, int]:
+        """
+        Per-team counters keyed by attribute name (``away_hits``, ...).
+
+        Suitable for ``GameResult(**state.export_counters(), ...)``.
+
+        Returns
+        -------
+        dict
+            Mapping of every name in GAME_STATE_COUNTER_FIELDS to its value
+        """
+        return dict(zip(GAME_STATE_COUNTER_FIELDS, _get_counters(self)))
+
+    def __repr__(self) -> str:
+        return (f"GameState(inning={self.inning}, is_top={self.is_top}, "
+                f"outs={self.outs}, away_score={self.away_score}, "
+                f"home_score={self.home_score}, base_mask={self.base_mask})")
+
     def __str__(self) -> str:
         """String representation of game state"""
         half = "Top" if self.is_top else "Bot"
@@ -290,6 +359,12 @@ class GameState:
                 f"{self.outs} out | Runners: {base_state}")
 
 
+_GAME_STATE_INIT_FIELDS = frozenset(
+    GAME_STATE_COUNTER_FIELDS + _GAME_STATE_LIST_FIELDS
+    + ('runner_on_first', 'runner_on_second', 'runner_on_third')
+)
+
+
 @dataclass
 class Team:
     """Represents a baseball team with players"""
@@ -360,6 +435,7 @@ class Team:
         """Reset all pitchers' state (pitch count, fatigue) for a new game"""
         for pitcher in self.pitchers:
             pitcher.pitches_thrown = 0
+            pitcher.prepare_arsenal()
 
 
 class PitcherRotation:
@@ -424,6 +500,7 @@ class PitcherRotation:
             team.switch_pitcher(idx)
             # Reset this pitcher's state for fresh start
             starter.pitches_thrown = 0
+            starter.prepare_arsenal()
         except ValueError:
             pass  # Pitcher not found, keep current
     
@@ -461,6 +538,11 @@ class GameSimulator:
         wind_enabled: bool = True,
         starter_innings: int = 0,
         simulation_mode: Union[SimulationMode, str] = None,
+        profiler=None,
+        log_level: int = LogLevel.DETAILED,
+        compress_log: bool = False,
+        event_store: Optional[EventStore] = None,
+        decision_surfaces: bool = False,
     ):
         """
         Initialize game simulator.
@@ -490,6 +572,22 @@ class GameSimulator:
             - SimulationMode enum value (ACCURATE, FAST, ULTRA_FAST, EXTREME)
             - String: "accurate", "fast", "ultra_fast", "extreme"
             Defaults to ACCURATE for single games, ULTRA_FAST recommended for bulk.
+        profiler : PhaseProfiler, optional
+            Per-phase timers and counters (pitch flight, swing decision, contact,
+            batted ball flight, interception, throwing, bookkeeping).
+            Default None = disabled with no timing overhead.
+        log_level : int
+            Game log verbosity for console and log file: 0=OFF, 1=SUMMARY,
+            2=PLAY_BY_PLAY, 3=DETAILED (default, pitch sequences and play
+            breakdowns). Messages above this level are never formatted.
+        compress_log : bool
+            Gzip the log file (appends '.gz' to log_file if missing)
+        event_store : EventStore, optional
+            Records every pitch and plate appearance as fixed-schema rows
+            (see event_store.py). Default None = not recorded.
+        decision_surfaces : bool
+            Precompute each hitter's swing/whiff probability surface
+            (see decision_surface.py) instead of re-deriving it every pitch
         """
         self.away_team = away_team
         self.home_team = home_team
@@ -567,39 +665,47 @@ class GameSimulator:
             self.wind_speed = 0.0
             self.wind_direction = 0.0
 
-        # Initialize metrics collector
-        from .sim_metrics import SimMetricsCollector, DebugLevel
+        # Initialize metrics collector (shared no-op collector when OFF, so
+        # bulk runs with debug_metrics=0 allocate nothing per game or pitch)
+        from .sim_metrics import create_metrics_collector, DebugLevel
         debug_level_map = {
             0: DebugLevel.OFF,
             1: DebugLevel.BASIC,
             2: DebugLevel.DETAILED,
             3: DebugLevel.EXHAUSTIVE
         }
-        self.metrics_collector = SimMetricsCollector(
-            debug_level=debug_level_map.get(debug_metrics, DebugLevel.OFF)
+        self.metrics_collector = create_metrics_collector(
+            debug_level_map.get(debug_metrics, DebugLevel.OFF)
         )
 
-        # Open log file if specified
-        self.log_handle = None
-        if self.log_file:
-            self.log_handle = open(self.log_file, 'w', encoding='utf-8')
+        # Buffered, leveled log (flushed at half-inning and game end)
+        self.logger = GameLogWriter(
+            self.log_file, level=log_level, echo=verbose, compress=compress_log
+        )
 
         # Simulator (we'll create at-bat simulators per at-bat)
         self.play_simulator = PlaySimulator(ballpark=ballpark)
 
-    def log(self, message: str):
-        """Log a message to console and/or file"""
-        if self.verbose:
-            print(message)
-        if self.log_handle:
-            self.log_handle.write(message + '\n')
-            self.log_handle.flush()  # Ensure immediate write
+        self.profiler = profiler
+        if profiler is not None:
+            self.play_simulator.set_profiler(profiler)
+
+        self.event_store = event_store
+
+        if decision_surfaces:
+            for hitter in away_team.hitters + home_team.hitters:
+                if hitter.decision_surface is None:
+                    hitter.enable_decision_surface()
+
+    def log(self, message: str, level: int = LogLevel.PLAY_BY_PLAY):
+        """Log a message to console and/or file (buffered, see GameLogWriter)"""
+        self.logger.write(level, message)
 
     def close_log(self):
-        """Close the log file if open"""
-        if self.log_handle:
-            self.log_handle.close()
-            self.log_handle = None
+        """Flush and close the log file if open"""
+        logger = getattr(self, 'logger', None)
+        if logger is not None:
+            logger.close()
 
     def __del__(self):
         """Destructor to ensure log file is closed"""
@@ -607,37 +713,38 @@ class GameSimulator:
 
     def print_sim_config(self, rng_seed: int = None):
         """Print simulation configuration block"""
-        self.log("SIM CONFIG:")
+        log = partial(self.log, level=LogLevel.SUMMARY)
+        log("SIM CONFIG:")
 
         # Engine version - try to get git hash if available
         try:
             import subprocess
             git_hash = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
                                              stderr=subprocess.DEVNULL).decode('ascii').strip()
-            self.log(f"  EngineVersion: git-{git_hash}")
+            log(f"  EngineVersion: git-{git_hash}")
         except:
-            self.log(f"  EngineVersion: v1.1.2")
+            log(f"  EngineVersion: v1.1.2")
 
         # RNG seed
         if rng_seed is not None:
-            self.log(f"  RNGSeed: {rng_seed}")
+            log(f"  RNGSeed: {rng_seed}")
         else:
-            self.log(f"  RNGSeed: random")
+            log(f"  RNGSeed: random")
 
         # Ballpark
-        self.log(f"  Ballpark: {self.ballpark}")
+        log(f"  Ballpark: {self.ballpark}")
         if self.ballpark_effects:
-            self.log(f"    Park: {self.ballpark_effects.venue_name}")
-            self.log(f"    DistanceEffect: {self.ballpark_effects.total_distance_added:+.1f}%")
+            log(f"    Park: {self.ballpark_effects.venue_name}")
+            log(f"    DistanceEffect: {self.ballpark_effects.total_distance_added:+.1f}%")
 
         # Weather/environment (using actual ballpark data)
-        self.log(f"  Weather:")
-        self.log(f"    TemperatureF: {self.temperature:.1f}")
-        self.log(f"    AltitudeFt: {self.altitude:.0f}")
-        self.log(f"    Humidity: {self.humidity:.2f}")
+        log(f"  Weather:")
+        log(f"    TemperatureF: {self.temperature:.1f}")
+        log(f"    AltitudeFt: {self.altitude:.0f}")
+        log(f"    Humidity: {self.humidity:.2f}")
         # Wind info from game conditions (Phase 2C - variable wind)
-        self.log(f"    WindSpeedMph: {self.wind_speed:.1f}")
-        self.log(f"    WindDirection: {self.wind_direction:.0f}°")
+        log(f"    WindSpeedMph: {self.wind_speed:.1f}")
+        log(f"    WindDirection: {self.wind_direction:.0f}°")
         # Wind description for clarity
         if abs(self.wind_speed) > 0.5:
             if self.wind_direction == 0:
@@ -650,20 +757,23 @@ class GameSimulator:
                 wind_desc = "toward LF (L crosswind, helps RHH!)"
             else:
                 wind_desc = f"{self.wind_direction}°"
-            self.log(f"    WindDesc: {wind_desc}")
+            log(f"    WindDesc: {wind_desc}")
 
-        self.log("")  # Blank line after config
+        log("")  # Blank line after config
 
     def simulate_game(self, num_innings: int = 9, rng_seed: int = None) -> GameState:
         """Simulate a complete baseball game"""
-        if self.verbose:
-            self.log(f"\n{'='*80}")
-            self.log(f"GAME START: {self.away_team.name} @ {self.home_team.name}")
-            self.log(f"{'='*80}\n")
+        if self.logger.enabled_for(LogLevel.SUMMARY):
+            self.log(f"\n{'='*80}", LogLevel.SUMMARY)
+            self.log(f"GAME START: {self.away_team.name} @ {self.home_team.name}", LogLevel.SUMMARY)
+            self.log(f"{'='*80}\n", LogLevel.SUMMARY)
 
             # Print SIM CONFIG block
             self.print_sim_config(rng_seed)
 
+        if self.event_store is not None:
+            self.event_store.start_game()
+
         # Maximum extra innings to prevent infinite games (MLB record is 26)
         max_innings = num_innings + 20  # Allow up to 20 extra innings
         
@@ -693,13 +803,20 @@ class GameSimulator:
                     print(f"EXTRA INNINGS - Game tied {self.game_state.away_score}-{self.game_state.home_score}")
                     print(f"{'='*60}")
         
-        if self.verbose:
+        if self.logger.enabled_for(LogLevel.SUMMARY):
             self.print_final_summary()
+        self.logger.flush()
 
         # Print metrics summary if enabled
         if self.metrics_collector.enabled:
             self.metrics_collector.print_summary()
 
+        if self.profiler is not None:
+            self.profiler.end_game()
+
+        if self.event_store is not None:
+            self.event_store.end_game()
+
         return self.game_state
 
     def simulate_half_inning(self):
@@ -739,12 +856,20 @@ class GameSimulator:
 
         # End of half inning
         self.game_state.end_half_inning()
+        self.logger.flush()
 
     def simulate_at_bat(self, batting_team: Team, pitching_team: Team):
         """Simulate a single at-bat"""
         batter = batting_team.get_next_batter()
         pitcher = pitching_team.get_current_pitcher()
 
+        # Situation before the PA (for the event store)
+        state = self.game_state
+        if self.event_store is not None:
+            situation = (state.inning, state.is_top, state.outs, state.base_mask)
+            score_before = state.away_score if state.is_top else state.home_score
+        play_result = None
+
         if self.verbose:
             print(f"\n{batter.name} batting against {pitcher.name}")
             print(f"  Situation: {self.game_state.get_base_state().value}, {self.game_state.outs} out(s)")
@@ -758,20 +883,29 @@ class GameSimulator:
             humidity=self.humidity,
             wind_speed=self.wind_speed,
             wind_direction=self.wind_direction,
-            metrics_collector=self.metrics_collector,
+            metrics_collector=self.metrics_collector if self.metrics_collector.enabled else None,
             simulation_mode=self.simulation_mode,
+            profiler=self.profiler,
         )
 
         # Simulate the at-bat to get batted ball
+        profiler = self.profiler
+        if profiler is not None:
+            t0 = perf_counter()
         at_bat_result = at_bat_sim.simulate_at_bat()
+        if profiler is not None:
+            t1 = perf_counter()
+            profiler.record('at_bat', t1 - t0)
         num_pitches = len(at_bat_result.pitches)
         self.game_state.total_pitches += num_pitches
 
-        if self.verbose and at_bat_result.pitches:
+        if at_bat_result.pitches and self.logger.enabled_for(LogLevel.DETAILED):
             self.print_pitch_sequence(at_bat_result.pitches)
 
         if at_bat_result.outcome in ["strikeout", "walk"]:
             # Handle strikeout or walk
+            if profiler is not None:
+                t1 = perf_counter()
             self.handle_strikeout_or_walk(at_bat_result.outcome, batter)
 
             # Log the event
@@ -786,6 +920,8 @@ class GameSimulator:
                     "final_count": f"{balls}-{strikes}"
                 }
             )
+            if profiler is not None:
+                profiler.record('bookkeeping', perf_counter() - t1)
         else:
             # Ball was put in play - simulate the complete play
 
@@ -816,18 +952,53 @@ class GameSimulator:
             trajectory = at_bat_result.batted_ball_result['trajectory']
 
             # Simulate the play with current outs for realistic baserunning decisions
+            if profiler is not None:
+                t1 = perf_counter()
             play_result = self.play_simulator.simulate_complete_play(
                 batted_ball_result=trajectory,
                 batter_runner=batter_runner,
                 current_outs=self.game_state.outs
             )
+            if profiler is not None:
+                t2 = perf_counter()
+                profiler.record('play', t2 - t1)
 
             # Process the play result with enhanced physics data
             self.process_play_result(play_result, batter, pitcher, at_bat_result)
+            if profiler is not None:
+                profiler.record('bookkeeping', perf_counter() - t2)
 
             # Reset play simulator for next play
             self.play_simulator.reset_simulation()
 
+        if self.event_store is not None:
+            if play_result is None:
+                outcome_code = get_pa_outcome_code(at_bat_result.outcome)
+                fielder_position = None
+            else:
+                outcome = play_result.outcome
+                outcome_str = outcome.value if hasattr(outcome, 'value') else str(outcome)
+                outcome_code = get_pa_outcome_code(outcome_str, at_bat_result.batted_ball_result)
+                # Alignment key, not Fielder.position: DB rosters use 'SS', 'CF', ...
+                # Catches leave primary_fielder unset; their fielding attempt has the key
+                fielder = play_result.primary_fielder
+                if fielder is not None:
+                    fielder_position = self.play_simulator.fielding_simulator.position_of(fielder)
+                elif play_result.fielding_results:
+                    fielder_position = play_result.fielding_results[0].fielder_position
+                else:
+                    fielder_position = None
+            inning, is_top, outs_before, bases_before = situation
+            runs_after = state.away_score if is_top else state.home_score
+            self.event_store.record_plate_appearance(
+                inning, is_top, outs_before, bases_before,
+                batter.name, pitcher.name, at_bat_result.pitches, outcome_code,
+                batted_ball=at_bat_result.batted_ball_result if play_result is not None else None,
+                fielder_position=fielder_position,
+                runs_scored=runs_after - score_before,
+                outs_made=state.outs - outs_before,
+            )
+
     def handle_strikeout_or_walk(self, outcome: str, batter: Hitter):
         """Handle a strikeout or walk"""
         is_away_batting = self.game_state.is_top
@@ -842,7 +1013,7 @@ class GameSimulator:
                 self.game_state.home_strikeouts += 1
                 self.game_state.home_at_bats += 1
 
-            if self.verbose:
+            if self.logger.enabled_for(LogLevel.PLAY_BY_PLAY):
                 self.log(f"  ⚾ STRIKEOUT! {self.game_state.outs} out(s)")
                 self.log(f"  OutcomeCodePA: {get_pa_outcome_code('strikeout')}")
 
@@ -854,7 +1025,7 @@ class GameSimulator:
                 self.game_state.home_walks += 1
 
             # Batter walks to first, runners advance if forced
-            if self.verbose:
+            if self.logger.enabled_for(LogLevel.PLAY_BY_PLAY):
                 self.log(f"  🚶 WALK!")
                 self.log(f"  OutcomeCodePA: {get_pa_outcome_code('walk')}")
 
@@ -1049,7 +1220,7 @@ class GameSimulator:
         # Build description
         description = self.build_play_description(play_result, physics_data)
 
-        if self.verbose:
+        if self.logger.enabled_for(LogLevel.PLAY_BY_PLAY):
             self.log(f"  {description}")
 
             # Enhanced physics display
@@ -1088,7 +1259,8 @@ class GameSimulator:
             outcome_str = outcome.value if hasattr(outcome, 'value') else str(outcome)
             self.log(f"  OutcomeCodePA: {get_pa_outcome_code(outcome_str, at_bat_result.batted_ball_result if at_bat_result else None)}")
 
-            self.print_play_breakdown(play_result)
+            if self.logger.enabled_for(LogLevel.DETAILED):
+                self.print_play_breakdown(play_result)
 
 
         # Update game state based on outcome
@@ -1223,10 +1395,11 @@ class GameSimulator:
 
     def print_pitch_sequence(self, pitches: List[Dict]):
         """Print detailed pitch-by-pitch information for an at-bat."""
+        log = partial(self.log, level=LogLevel.DETAILED)
         if not pitches:
             return
 
-        self.log("  Pitch sequence:")
+        log("  Pitch sequence:")
         for index, pitch in enumerate(pitches, 1):
             index = pitch.get('sequence_index', index)
             pitch_type = pitch.get('pitch_type', 'pitch')
@@ -1268,72 +1441,73 @@ class GameSimulator:
                     f"LA {contact_summary['launch_angle']:.1f}°)"
                 )
 
-            self.log(
+            log(
                 f"    #{index}: {pitch_type} {velocity_release:.1f}->{velocity_plate:.1f} mph to {location_str} "
                 f"[{count_before[0]}-{count_before[1]} -> {count_after[0]}-{count_after[1]}] "
                 f"{outcome_desc}{contact_details}"
             )
             # Add machine-readable codes
-            self.log(f"    ZoneBucket: {zone_bucket}")
-            self.log(f"    OutcomeCodePitch: {get_pitch_outcome_code(pitch)}")
+            log(f"    ZoneBucket: {zone_bucket}")
+            log(f"    OutcomeCodePitch: {get_pitch_outcome_code(pitch)}")
 
             # Add fatigue diagnostics if available
             if 'pitcher_pitches_thrown' in pitch:
                 fatigue_level = pitch.get('pitcher_fatigue_level', 0.0)
                 velo_penalty = pitch.get('velocity_penalty_mph', 0.0)
                 command_penalty = pitch.get('command_penalty_inches', 0.0)
-                self.log(f"    Fatigue:")
-                self.log(f"      PitchCount: {pitch['pitcher_pitches_thrown']}")
-                self.log(f"      FatigueLevel: {fatigue_level:.2f}")
-                self.log(f"      VelocityPenaltyMph: {velo_penalty:.1f}")
-                self.log(f"      CommandPenaltyInches: {command_penalty:.1f}")
+                log(f"    Fatigue:")
+                log(f"      PitchCount: {pitch['pitcher_pitches_thrown']}")
+                log(f"      FatigueLevel: {fatigue_level:.2f}")
+                log(f"      VelocityPenaltyMph: {velo_penalty:.1f}")
+                log(f"      CommandPenaltyInches: {command_penalty:.1f}")
 
             # Add swing decision diagnostics if available
             if 'swing_decision' in pitch:
                 sd = pitch['swing_decision']
-                self.log(f"    SwingDecisionModel:")
-                self.log(f"      EstimatedStrikeProb: {sd['estimated_strike_prob']:.2f}")
-                self.log(f"      EV_Swing: {sd['ev_swing']:+.3f}")
-                self.log(f"      EV_Take: {sd['ev_take']:+.3f}")
-                self.log(f"      AggressionModifier: {sd['aggression_modifier']:+.2f}")
-                self.log(f"      Decision: {sd['decision']}")
+                log(f"    SwingDecisionModel:")
+                log(f"      EstimatedStrikeProb: {sd['estimated_strike_prob']:.2f}")
+                log(f"      EV_Swing: {sd['ev_swing']:+.3f}")
+                log(f"      EV_Take: {sd['ev_take']:+.3f}")
+                log(f"      AggressionModifier: {sd['aggression_modifier']:+.2f}")
+                log(f"      Decision: {sd['decision']}")
 
             # Add pitch intent diagnostics if available
             if 'pitch_intent' in pitch:
                 pi = pitch['pitch_intent']
-                self.log(f"    PitchIntent:")
-                self.log(f"      IntentionCategory: {pi['intention_category']}")
-                self.log(f"      IntendedZone: {pi['intended_zone']}")
-                self.log(f"      IntendedPitchType: {pi['intended_pitch_type']}")
-                self.log(f"      CommandError:")
-                self.log(f"        XErrorInches: {pi['x_error_inches']:+.1f}")
-                self.log(f"        ZErrorInches: {pi['z_error_inches']:+.1f}")
+                log(f"    PitchIntent:")
+                log(f"      IntentionCategory: {pi['intention_category']}")
+                log(f"      IntendedZone: {pi['intended_zone']}")
+                log(f"      IntendedPitchType: {pi['intended_pitch_type']}")
+                log(f"      CommandError:")
+                log(f"        XErrorInches: {pi['x_error_inches']:+.1f}")
+                log(f"        ZErrorInches: {pi['z_error_inches']:+.1f}")
                 if pi['missed_into_zone'] != pi['intended_zone']:
-                    self.log(f"      MissedIntoZone: {pi['missed_into_zone']}")
+                    log(f"      MissedIntoZone: {pi['missed_into_zone']}")
 
     def print_play_breakdown(self, play_result: PlayResult):
         """Print detailed physics/fielding/baserunning breakdown for a play."""
+        log = partial(self.log, level=LogLevel.DETAILED)
         events = play_result.get_events_chronological()
         if events:
-            self.log("    Play timeline:")
+            log("    Play timeline:")
             for event in events:
-                self.log(f"      [{event.time:5.2f}s] {event.description} ({event.event_type})")
+                log(f"      [{event.time:5.2f}s] {event.description} ({event.event_type})")
 
         if play_result.fielding_results:
-            self.log("    Fielding breakdown:")
+            log("    Fielding breakdown:")
             for fielding in play_result.fielding_results:
                 margin = fielding.ball_arrival_time - fielding.fielder_arrival_time
                 status = "made play" if fielding.success else "missed"
                 fielder_name = getattr(fielding, 'fielder_name', 'Fielder')
-                self.log(
+                log(
                     f"      {fielder_name}: ball {fielding.ball_arrival_time:.2f}s, "
                     f"arrival {fielding.fielder_arrival_time:.2f}s (margin {margin:+.2f}s) -> {status}"
                 )
 
         if play_result.baserunning_results:
-            self.log("    Baserunning results:")
+            log("    Baserunning results:")
             for baserun in play_result.baserunning_results:
-                self.log(
+                log(
                     f"      {baserun.runner_name}: {baserun.from_base} -> {baserun.to_base} "
                     f"in {baserun.arrival_time:.2f}s ({baserun.outcome})"
                 )
@@ -1341,29 +1515,31 @@ class GameSimulator:
 
     def print_final_summary(self):
         """Print final game summary"""
-        self.log(f"\n{'='*80}")
-        self.log(f"FINAL SCORE")
-        self.log(f"{'='*80}")
-        self.log(f"{self.away_team.name}: {self.game_state.away_score}")
-        self.log(f"{self.home_team.name}: {self.game_state.home_score}")
-        self.log(f"\nGame Statistics:")
-        self.log(f"  Total Pitches: {self.game_state.total_pitches}")
-        self.log(f"  Total Hits: {self.game_state.total_hits}")
-        self.log(f"  Home Runs: {self.game_state.total_home_runs}")
+        log = partial(self.log, level=LogLevel.SUMMARY)
+        log(f"\n{'='*80}")
+        log(f"FINAL SCORE")
+        log(f"{'='*80}")
+        log(f"{self.away_team.name}: {self.game_state.away_score}")
+        log(f"{self.home_team.name}: {self.game_state.home_score}")
+        log(f"\nGame Statistics:")
+        log(f"  Total Pitches: {self.game_state.total_pitches}")
+        log(f"  Total Hits: {self.game_state.total_hits}")
+        log(f"  Home Runs: {self.game_state.total_home_runs}")
 
         # Print sabermetric summaries for each team
-        self.log(f"\n{'-'*80}")
+        log(f"\n{'-'*80}")
         self.print_sabermetric_summary(self.away_team.name, is_away=True)
-        self.log(f"{'-'*80}")
+        log(f"{'-'*80}")
         self.print_sabermetric_summary(self.home_team.name, is_away=False)
-        self.log(f"{'='*80}")
+        log(f"{'='*80}")
 
         # Print model drift indicators (combined for both teams)
         self.print_model_drift_indicators()
-        self.log(f"{'='*80}\n")
+        log(f"{'='*80}\n")
 
     def print_sabermetric_summary(self, team_name: str, is_away: bool):
         """Print sabermetric summary for a team"""
+        log = partial(self.log, level=LogLevel.SUMMARY)
         gs = self.game_state
 
         # Get team-specific stats
@@ -1412,15 +1588,15 @@ class GameSimulator:
         # ISO = SLG - AVG
         iso = slg - avg
 
-        self.log(f"SABERMETRIC SUMMARY – {team_name}")
-        self.log(f"  PA: {pa}")
-        self.log(f"  AVG: {avg:.3f}")
-        self.log(f"  OBP: {obp:.3f}")
-        self.log(f"  SLG: {slg:.3f}")
-        self.log(f"  BABIP: {babip:.3f}")
-        self.log(f"  K%: {k_pct:.1f}%")
-        self.log(f"  BB%: {bb_pct:.1f}%")
-        self.log(f"  ISO: {iso:.3f}")
+        log(f"SABERMETRIC SUMMARY – {team_name}")
+        log(f"  PA: {pa}")
+        log(f"  AVG: {avg:.3f}")
+        log(f"  OBP: {obp:.3f}")
+        log(f"  SLG: {slg:.3f}")
+        log(f"  BABIP: {babip:.3f}")
+        log(f"  K%: {k_pct:.1f}%")
+        log(f"  BB%: {bb_pct:.1f}%")
+        log(f"  ISO: {iso:.3f}")
 
         # Add compact sabermetric snapshot
         # Calculate contact type rates
@@ -1440,12 +1616,13 @@ class GameSimulator:
         fb_pct = (fb_count / total_contact * 100) if total_contact > 0 else 0.0
         hr_per_fb = (hr / fb_count * 100) if fb_count > 0 else 0.0
 
-        self.log(f"\n  SABERMETRIC SNAPSHOT:")
-        self.log(f"    BABIP: {babip:.3f} | K%: {k_pct:.1f}% | BB%: {bb_pct:.1f}% | ISO: {iso:.3f} | HR/FB: {hr_per_fb:.1f}%")
-        self.log(f"    GB%: {gb_pct:.1f}% | LD%: {ld_pct:.1f}% | FB%: {fb_pct:.1f}%")
+        log(f"\n  SABERMETRIC SNAPSHOT:")
+        log(f"    BABIP: {babip:.3f} | K%: {k_pct:.1f}% | BB%: {bb_pct:.1f}% | ISO: {iso:.3f} | HR/FB: {hr_per_fb:.1f}%")
+        log(f"    GB%: {gb_pct:.1f}% | LD%: {ld_pct:.1f}% | FB%: {fb_pct:.1f}%")
 
     def print_model_drift_indicators(self):
         """Print model drift indicators to flag unrealistic stat distributions"""
+        log = partial(self.log, level=LogLevel.SUMMARY)
         gs = self.game_state
 
         # Combine both teams for model drift analysis
@@ -1480,7 +1657,7 @@ class GameSimulator:
         ld_pct = (total_ld / total_contact * 100) if total_contact > 0 else 0.0
         fb_pct = (total_fb / total_contact * 100) if total_contact > 0 else 0.0
 
-        self.log(f"\nMODEL DRIFT INDICATORS:")
+        log(f"\nMODEL DRIFT INDICATORS:")
 
         # Always show all metrics (even if not enough data for flags)
         # HR/FB check (MLB typical: 12-14%)
@@ -1496,7 +1673,7 @@ class GameSimulator:
             hr_fb_flag = " (sample size too small)"
         else:
             hr_fb_flag = " (no fly balls)"
-        self.log(f"  HR/FB: {hr_per_fb:.1f}%{hr_fb_flag}")
+        log(f"  HR/FB: {hr_per_fb:.1f}%{hr_fb_flag}")
 
         # BABIP check (MLB typical: .290-.310)
         babip_flag = ""
@@ -1511,7 +1688,7 @@ class GameSimulator:
             babip_flag = " (sample size too small)"
         else:
             babip_flag = " (no balls in play)"
-        self.log(f"  BABIP: {babip:.3f}{babip_flag}")
+        log(f"  BABIP: {babip:.3f}{babip_flag}")
 
         # K% check (MLB typical: 22-24%)
         k_flag = ""
@@ -1526,7 +1703,7 @@ class GameSimulator:
             k_flag = " (sample size too small)"
         else:
             k_flag = " (no plate appearances)"
-        self.log(f"  K%: {k_pct:.1f}%{k_flag}")
+        log(f"  K%: {k_pct:.1f}%{k_flag}")
 
         # BB% check (MLB typical: 8-9%)
         bb_flag = ""
@@ -1541,7 +1718,7 @@ class GameSimulator:
             bb_flag = " (sample size too small)"
         else:
             bb_flag = " (no plate appearances)"
-        self.log(f"  BB%: {bb_pct:.1f}%{bb_flag}")
+        log(f"  BB%: {bb_pct:.1f}%{bb_flag}")
 
         # Avg EV check (MLB typical: 87-89 mph)
         ev_flag = ""
@@ -1556,19 +1733,19 @@ class GameSimulator:
             ev_flag = " (sample size too small)"
         else:
             ev_flag = " (no batted balls)"
-        self.log(f"  AvgExitVelo: {avg_ev:.1f} mph{ev_flag}")
+        log(f"  AvgExitVelo: {avg_ev:.1f} mph{ev_flag}")
 
         # Contact type distribution (MLB typical: ~43% GB, ~24% LD, ~33% FB)
-        self.log(f"  Contact Distribution:")
+        log(f"  Contact Distribution:")
         gb_flag = " ok" if 38 <= gb_pct <= 48 else (" ⚠ too low" if gb_pct < 38 else " ⚠ too high")
         ld_flag = " ok" if 19 <= ld_pct <= 29 else (" ⚠ too low" if ld_pct < 19 else " ⚠ too high")
         fb_flag = " ok" if 28 <= fb_pct <= 38 else (" ⚠ too low" if fb_pct < 28 else " ⚠ too high")
         if total_contact >= 5:
-            self.log(f"    GB%: {gb_pct:.1f}% (MLB ~43%){gb_flag}")
-            self.log(f"    LD%: {ld_pct:.1f}% (MLB ~24%){ld_flag}")
-            self.log(f"    FB%: {fb_pct:.1f}% (MLB ~33%){fb_flag}")
+            log(f"    GB%: {gb_pct:.1f}% (MLB ~43%){gb_flag}")
+            log(f"    LD%: {ld_pct:.1f}% (MLB ~24%){ld_flag}")
+            log(f"    FB%: {fb_pct:.1f}% (MLB ~33%){fb_flag}")
         else:
-            self.log(f"    GB%: {gb_pct:.1f}% | LD%: {ld_pct:.1f}% | FB%: {fb_pct:.1f}% (sample size too small)")
+            log(f"    GB%: {gb_pct:.1f}% | LD%: {ld_pct:.1f}% | FB%: {fb_pct:.1f}% (sample size too small)")
 
         # Phase 1.7: Out rates by batted ball type (MLB typical: GB ~72%, LD ~26%, FB ~79%)
         total_gb_outs = gs.away_ground_ball_outs + gs.home_ground_ball_outs
@@ -1579,16 +1756,16 @@ class GameSimulator:
         ld_out_rate = (total_ld_outs / total_ld * 100) if total_ld > 0 else 0.0
         fb_out_rate = (total_fb_outs / total_fb * 100) if total_fb > 0 else 0.0
         
-        self.log(f"  Out Rates by Type (MLB: GB ~72%, LD ~26%, FB ~79%):")
+        log(f"  Out Rates by Type (MLB: GB ~72%, LD ~26%, FB ~79%):")
         if total_contact >= 5:
             gb_out_flag = " ok" if 65 <= gb_out_rate <= 80 else (" ⚠ too low" if gb_out_rate < 65 else " ⚠ too high")
             ld_out_flag = " ok" if 20 <= ld_out_rate <= 35 else (" ⚠ too low" if ld_out_rate < 20 else " ⚠ too high")
             fb_out_flag = " ok" if 72 <= fb_out_rate <= 86 else (" ⚠ too low" if fb_out_rate < 72 else " ⚠ too high")
-            self.log(f"    GB Out%: {gb_out_rate:.1f}% ({total_gb_outs}/{total_gb}){gb_out_flag}")
-            self.log(f"    LD Out%: {ld_out_rate:.1f}% ({total_ld_outs}/{total_ld}){ld_out_flag}")
-            self.log(f"    FB Out%: {fb_out_rate:.1f}% ({total_fb_outs}/{total_fb}){fb_out_flag}")
+            log(f"    GB Out%: {gb_out_rate:.1f}% ({total_gb_outs}/{total_gb}){gb_out_flag}")
+            log(f"    LD Out%: {ld_out_rate:.1f}% ({total_ld_outs}/{total_ld}){ld_out_flag}")
+            log(f"    FB Out%: {fb_out_rate:.1f}% ({total_fb_outs}/{total_fb}){fb_out_flag}")
         else:
-            self.log(f"    GB Out%: {gb_out_rate:.1f}% | LD Out%: {ld_out_rate:.1f}% | FB Out%: {fb_out_rate:.1f}% (sample size too small)")
+            log(f"    GB Out%: {gb_out_rate:.1f}% | LD Out%: {ld_out_rate:.1f}% | FB Out%: {fb_out_rate:.1f}% (sample size too small)")
 
 
 def create_test_team(name: str, team_quality: str = "average") -> Team:
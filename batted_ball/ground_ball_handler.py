@@ -8,6 +8,7 @@ fielding timing, throwing sequences, and ground ball roll calculations.
 import math
 import random
 import numpy as np
+from time import perf_counter
 from typing import Dict, List, Tuple, Optional
 
 from .constants import (
@@ -64,6 +65,7 @@ class GroundBallHandler:
         self.current_outs = current_outs
         self.hit_handler = hit_handler
         self.throwing_logic = throwing_logic
+        self.profiler = None  # Optional PhaseProfiler, set by PlaySimulator
 
     def handle_ground_ball(self, ball_position: FieldPosition, result):
         """
@@ -112,14 +114,15 @@ class GroundBallHandler:
 
             # ENHANCED LOGGING: Show all fielder distances for weak hits
             fielder_distances = []
+            alignment = self.fielding_simulator.alignment
+            distances = alignment.distances(ball_position)[0]
             for pos_name in potential_fielders:
-                if pos_name in self.fielding_simulator.fielders:
-                    fielder = self.fielding_simulator.fielders[pos_name]
-                    dist = fielder.current_position.distance_to(ball_position)
+                if pos_name in alignment.index:
+                    dist = distances[alignment.index[pos_name]]
                     fielder_distances.append(f"{pos_name}: {dist:.1f} ft")
                     if dist < min_distance:
                         min_distance = dist
-                        closest_fielder = fielder
+                        closest_fielder = self.fielding_simulator.fielders[pos_name]
                         closest_position = pos_name
 
             result.add_event(PlayEvent(
@@ -169,9 +172,14 @@ class GroundBallHandler:
             return
 
         # Use new ground ball interception system for normal ground balls
+        profiler = self.profiler
+        if profiler is not None:
+            t0 = perf_counter()
         interception = self.ground_ball_interceptor.find_best_interception(
             batted_ball, self.fielding_simulator.fielders
         )
+        if profiler is not None:
+            profiler.record('ground_ball_interception', perf_counter() - t0)
 
         # ENHANCED LOGGING: Show detailed interception analysis
         self.log_ground_ball_interception_details(interception, ball_position, result)
@@ -215,7 +223,11 @@ class GroundBallHandler:
         original_runners = self.baserunning_simulator.runners.copy()
 
         if batter_runner and self.throwing_logic:
+            if profiler is not None:
+                t0 = perf_counter()
             self.throwing_logic.simulate_throw_to_first(fielder, fielding_time, batter_runner, result)
+            if profiler is not None:
+                profiler.record('throwing', perf_counter() - t0)
             
             # FIX: If ThrowingLogic determines it's a SINGLE (safe at first), 
             # we MUST call HitHandler to advance other runners!
@@ -250,6 +262,9 @@ class GroundBallHandler:
                                       ground_ball_result: Optional[GroundBallResult] = None):
         """Simulate ground ball fielding and throwing sequence with proper fielder movement physics."""
         # Calculate fielder movement time to ball position (fielder runs while ball rolls)
+        # Exact time, not calculate_effective_time_within(): the fielder is already
+        # chosen and the time feeds the play clock (candidates are scanned by
+        # ground_ball_interception's batched kernel)
         fielder_movement_time = fielder.calculate_effective_time_to_position(ball_position)
 
         # Calculate ball roll time to fielder's interception point
@@ -342,7 +357,7 @@ class GroundBallHandler:
         if position_name is None:
             position_name = fielder.position
 
-        # Calculate time for fielder to reach ball position
+        # Calculate time for fielder to reach ball position (exact: it sets the play clock)
         fielder_reach_time = fielder.calculate_effective_time_to_position(ball_position)
 
         # Fielding control time (getting ball under control) scales with skill
@@ -758,14 +773,8 @@ class GroundBallHandler:
 
     def get_closest_fielder_distance(self, ball_position: FieldPosition) -> float:
         """Get distance from ball to closest fielder for ground ball roll calculation."""
-        min_distance = float('inf')
-
-        for fielder in self.fielding_simulator.fielders.values():
-            if fielder.current_position:
-                distance = fielder.current_position.distance_to(ball_position)
-                min_distance = min(min_distance, distance)
-
-        return min_distance if min_distance != float('inf') else 100.0  # Default fallback
+        closest, distance = self.fielding_simulator.alignment.nearest(ball_position)
+        return distance[0] if closest[0] >= 0 else 100.0  # Default fallback
 
     def _get_error_number(self, position: str) -> int:
         """Get the error number (1-9) for a fielding position."""
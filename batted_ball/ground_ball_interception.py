@@ -18,6 +18,14 @@ RUST ACCELERATION:
 When the trajectory_rs Rust library is available, this module automatically
 uses the native Rust implementation for significant performance gains (~4x).
 The Python implementation is kept as a fallback.
+
+BATCHED FIELDERS:
+find_best_interception() packs every fielder into arrays and evaluates them
+in one call: trajectory_rs.find_ground_ball_interception when it is built,
+otherwise a NumPy kernel over all fielders and candidate points at once. Both
+follow the per-fielder reference (_calculate_fielder_interception and the
+infielder-priority selection) step for step; use_batch=False runs the
+reference loop.
 """
 
 import numpy as np
@@ -45,6 +53,183 @@ try:
 except ImportError:
     pass
 
+# Batched kernel (newer trajectory_rs builds only)
+_RUST_GROUND_BALL_BATCH_AVAILABLE = False
+try:
+    from trajectory_rs import find_ground_ball_interception as _rust_find_ground_ball_interception
+    _RUST_GROUND_BALL_BATCH_AVAILABLE = True
+except ImportError:
+    pass
+
+# Fielder roles for the batched kernel; roles up to ROLE_MIDDLE_INFIELD are
+# infielders and win ground balls over outfielders
+ROLE_PITCHER = 0
+ROLE_CATCHER = 1
+ROLE_CORNER_INFIELD = 2
+ROLE_MIDDLE_INFIELD = 3
+ROLE_OUTFIELD = 4
+FIELDER_ROLES = {
+    'pitcher': ROLE_PITCHER,
+    'catcher': ROLE_CATCHER,
+    'first_base': ROLE_CORNER_INFIELD,
+    'third_base': ROLE_CORNER_INFIELD,
+    'second_base': ROLE_MIDDLE_INFIELD,
+    'shortstop': ROLE_MIDDLE_INFIELD,
+}
+
+MOUND_POSITION = np.array([0.0, 60.5])
+INTERCEPTION_MARGIN_MIN = -0.05      # Fielder may be up to 50 ms late
+FIELDER_ACCELERATION_FPS2 = 28.0     # Python travel-time model
+RUST_FIELDER_MAX_SPEED_FPS = 30.0    # Speed cap in trajectory_rs travel times
+
+
+def _candidate_times() -> np.ndarray:
+    """Rolling times tested after landing, accumulated exactly as the reference loop does."""
+    times = []
+    test_time = 0.1
+    while test_time <= 2.5:
+        times.append(test_time)
+        test_time += 0.025
+    return np.array(times)
+
+
+INTERCEPTION_TEST_TIMES = _candidate_times()
+INTERCEPTION_TEST_TIMES.flags.writeable = False
+
+
+def _fielder_travel_times(distance: np.ndarray, max_speed_fps: np.ndarray) -> np.ndarray:
+    """Array form of GroundBallInterceptor._calculate_fielder_travel_time_python."""
+    acceleration = FIELDER_ACCELERATION_FPS2
+    distance_to_max_speed = (max_speed_fps ** 2) / (2.0 * acceleration)
+    accelerating = np.sqrt(2.0 * distance / acceleration)
+    cruising = max_speed_fps / acceleration + (distance - distance_to_max_speed) / max_speed_fps
+    return np.where(distance <= distance_to_max_speed, accelerating, cruising)
+
+
+def find_ground_ball_interception_numpy(landing_x: float, landing_y: float,
+                                        direction_x: float, direction_y: float,
+                                        ball_speed_fps: float, decel_fps2: float,
+                                        flight_time: float, exit_velocity_mph: float,
+                                        fielder_positions: np.ndarray, fielder_speeds: np.ndarray,
+                                        reaction_times: np.ndarray, charge_bonuses: np.ndarray,
+                                        fielder_roles: np.ndarray) -> Tuple[int, float, float, float, float]:
+    """
+    Best ground-ball interception over all fielders, vectorized.
+
+    NumPy counterpart of trajectory_rs.find_ground_ball_interception: the
+    per-fielder rules of GroundBallInterceptor._calculate_fielder_interception
+    evaluated for every fielder and candidate time at once, then the
+    infielder-priority selection.
+
+    Parameters
+    ----------
+    landing_x, landing_y : float
+        Landing position (ft, field coordinates)
+    direction_x, direction_y : float
+        Unit rolling direction
+    ball_speed_fps, decel_fps2 : float
+        Rolling speed at landing and deceleration
+    flight_time : float
+        Time from contact to landing (s)
+    exit_velocity_mph : float
+        Exit velocity, selects the fielding strategy
+    fielder_positions : np.ndarray
+        (N, 2) fielder positions (ft)
+    fielder_speeds, reaction_times, charge_bonuses : np.ndarray
+        (N,) sprint speeds (ft/s), reaction times (s) and charge distances (ft)
+    fielder_roles : np.ndarray
+        (N,) ROLE_* codes
+
+    Returns
+    -------
+    tuple
+        (fielder_index, ball_time, fielder_time, intercept_x, intercept_y);
+        fielder_index is -1 if the ball gets through
+    """
+    landing = np.array([landing_x, landing_y])
+    direction = np.array([direction_x, direction_y])
+    positions = np.asarray(fielder_positions, dtype=np.float64)
+    speeds = np.asarray(fielder_speeds, dtype=np.float64)
+    reactions = np.asarray(reaction_times, dtype=np.float64)
+    charges = np.asarray(charge_bonuses, dtype=np.float64)
+    roles = np.asarray(fielder_roles)
+    pitcher = roles == ROLE_PITCHER
+
+    # Catchers only field balls within 15 ft that are not rolling away from them
+    from_home = np.linalg.norm(landing)
+    catcher_out = from_home > 15.0 or (
+        direction[1] > 0 and np.dot(direction, landing) > 0 and (from_home > 10.0 or ball_speed_fps > 30.0)
+    )
+    able = ~((roles == ROLE_CATCHER) & catcher_out)
+
+    # Charging infielders (and outfielders) close in toward home
+    effective = positions.copy()
+    charging = (charges > 0) & (roles != ROLE_PITCHER) & (roles != ROLE_CATCHER)
+    effective[charging, 1] -= charges[charging]
+
+    # Direct path: run laterally to the closest point of the ball's line
+    to_fielder = effective - landing
+    projection = to_fielder[:, 0] * direction[0] + to_fielder[:, 1] * direction[1]
+    closest = landing + projection[:, np.newaxis] * direction
+    lateral = np.sqrt(((effective - closest) ** 2).sum(axis=1))
+    discriminant = ball_speed_fps ** 2 - 2.0 * decel_fps2 * projection
+    with np.errstate(invalid='ignore'):
+        direct_ball_time = flight_time + (ball_speed_fps - np.sqrt(discriminant)) / decel_fps2
+    lateral_time = np.where(lateral <= 3.0, lateral / 15.0,
+                            np.where(lateral <= 8.0, lateral / 22.0, _fielder_travel_times(lateral, speeds)))
+    direct_fielder_time = reactions + lateral_time
+    from_mound = np.sqrt(((closest - MOUND_POSITION) ** 2).sum(axis=1))
+    direct = (
+        able & (projection > 0) & (discriminant > 0) & (lateral <= 18.0)
+        & ~(pitcher & ((from_mound > 15.0) | (lateral > 12.0)))
+        & (direct_ball_time - direct_fielder_time >= INTERCEPTION_MARGIN_MIN)
+    )
+
+    # Candidate points along the rolling path, (T, 2)
+    times = INTERCEPTION_TEST_TIMES
+    rolled = np.maximum(ball_speed_fps * times - 0.5 * decel_fps2 * times ** 2, 0.0)
+    ball_points = landing + direction * rolled[:, np.newaxis]
+    near_mound = ((np.sqrt(((ball_points - MOUND_POSITION) ** 2).sum(axis=1)) <= 10.0)
+                  & (np.abs(ball_points[:, 0]) <= 8.0))
+
+    # (N, T) fielder-to-point distances and arrival times
+    dx = ball_points[:, 0] - effective[:, 0, np.newaxis]
+    dy = ball_points[:, 1] - effective[:, 1, np.newaxis]
+    distance = np.sqrt(dx * dx + dy * dy)
+    fielder_time = reactions[:, np.newaxis] + _fielder_travel_times(distance, speeds[:, np.newaxis])
+    ball_time = flight_time + times
+    viable = (able[:, np.newaxis] & (ball_time - fielder_time >= INTERCEPTION_MARGIN_MIN)
+              & ~(pitcher[:, np.newaxis] & ~near_mound))
+
+    if exit_velocity_mph > 85.0:
+        score = -distance
+    elif exit_velocity_mph < 70.0:
+        score = np.broadcast_to(-ball_time, distance.shape)
+    else:
+        score = -distance * 0.5 - ball_time * 0.5
+    score = np.where(viable, score, -np.inf)
+    best_point = np.argmax(score, axis=1)
+    rows = np.arange(len(roles))
+    best_score = score[rows, best_point]
+    # A candidate point replaces the direct path only with a strictly better score
+    use_point = viable.any(axis=1) & (~direct | (best_score > -lateral))
+    fieldable = direct | use_point
+
+    chosen_ball_time = np.where(use_point, ball_time[best_point], direct_ball_time)
+    chosen_fielder_time = np.where(use_point, fielder_time[rows, best_point], direct_fielder_time)
+    chosen_point = np.where(use_point[:, np.newaxis], ball_points[best_point], closest)
+    fieldable &= chosen_ball_time - chosen_fielder_time >= INTERCEPTION_MARGIN_MIN
+    if not fieldable.any():
+        return -1, 0.0, 0.0, 0.0, 0.0
+
+    # Infielders first, then the shortest distance from the fielder's position (first on ties)
+    infield = fieldable & (roles != ROLE_OUTFIELD)
+    pool = infield if infield.any() else fieldable
+    reach = np.where(pool, np.sqrt(((chosen_point - positions) ** 2).sum(axis=1)), np.inf)
+    index = int(np.argmin(reach))
+    return (index, float(chosen_ball_time[index]), float(chosen_fielder_time[index]),
+            float(chosen_point[index, 0]), float(chosen_point[index, 1]))
+
 
 def is_rust_ground_ball_interception_available() -> bool:
     """Check if Rust ground ball interception acceleration is available."""
@@ -73,9 +258,10 @@ class GroundBallInterceptor:
     a ground ball along its rolling trajectory.
     """
     
-    def __init__(self, surface_type='grass', use_rust=True):
+    def __init__(self, surface_type='grass', use_rust=True, use_batch=True):
         self.surface_type = surface_type
         self.use_rust = use_rust and _RUST_GROUND_BALL_AVAILABLE
+        self.use_batch = use_batch
         
         # Ground ball deceleration parameters
         # Friction coefficients calibrated against MLB ground ball play times
@@ -111,6 +297,35 @@ class GroundBallInterceptor:
         """
         result = GroundBallInterceptionResult()
 
+        landing_pos, ball_direction, ball_speed_fps, decel_fps2, exit_velocity_mph = \
+            self._ground_ball_conditions(batted_ball_result)
+
+        find = self._find_best_interception_batch if self.use_batch else self._find_best_interception_per_fielder
+        best = find(landing_pos, ball_direction, ball_speed_fps, decel_fps2,
+                    batted_ball_result.flight_time, exit_velocity_mph, fielders)
+
+        if best is not None:
+            position_name, ball_time, fielder_time, ball_pos = best
+            result.can_be_fielded = True
+            result.fielding_fielder = fielders[position_name]
+            result.fielding_position = position_name
+            result.interception_time = ball_time
+            result.ball_position_at_interception = FieldPosition(ball_pos[0], ball_pos[1], 0.0)
+            result.fielder_arrival_time = fielder_time
+            result.time_margin = ball_time - fielder_time
+            result.interception_distance = np.linalg.norm(ball_pos - landing_pos)
+        
+        return result
+
+    def _ground_ball_conditions(self, batted_ball_result) -> Tuple[np.ndarray, np.ndarray, float, float, float]:
+        """
+        Rolling start of the ground ball in field coordinates.
+
+        Returns
+        -------
+        tuple
+            (landing_pos, ball_direction, ball_speed_fps, decel_fps2, exit_velocity_mph)
+        """
         # Get ground ball initial conditions
         landing_pos = np.array([batted_ball_result.landing_x, batted_ball_result.landing_y])
 
@@ -137,6 +352,58 @@ class GroundBallInterceptor:
         ball_speed_fps = ball_speed_mph * MPH_TO_MS * METERS_TO_FEET
         decel_fps2 = GRAVITY * METERS_TO_FEET * self.rolling_friction + GROUND_BALL_AIR_RESISTANCE
 
+        return landing_pos, ball_direction, ball_speed_fps, decel_fps2, exit_velocity_mph
+
+    def _find_best_interception_batch(self, landing_pos: np.ndarray, ball_direction: np.ndarray,
+                                      ball_speed_fps: float, decel_fps2: float, flight_time: float,
+                                      exit_velocity_mph: float, fielders: Dict[str, Fielder]
+                                      ) -> Optional[Tuple[str, float, float, np.ndarray]]:
+        """
+        Evaluate all fielders in one kernel call.
+
+        Returns
+        -------
+        tuple or None
+            (position_name, ball_time, fielder_time, ball_position) or None if the ball gets through
+        """
+        names = [name for name, fielder in fielders.items() if fielder.current_position is not None]
+        if not names:
+            return None
+        positions = np.array([[fielders[name].current_position.x, fielders[name].current_position.y]
+                              for name in names])
+        speeds = np.array([self._get_fielder_speed_fps(fielders[name]) for name in names])
+        reaction_times = np.array([fielders[name].get_reaction_time_seconds() for name in names])
+        charge_bonuses = np.array([self._calculate_charge_bonus(exit_velocity_mph, name) for name in names])
+        roles = np.array([FIELDER_ROLES.get(name, ROLE_OUTFIELD) for name in names], dtype=np.int64)
+
+        args = (landing_pos[0], landing_pos[1], ball_direction[0], ball_direction[1],
+                ball_speed_fps, decel_fps2, flight_time, exit_velocity_mph,
+                positions, speeds, reaction_times, charge_bonuses, roles)
+        if self.use_rust and _RUST_GROUND_BALL_BATCH_AVAILABLE:
+            index, ball_time, fielder_time, ball_x, ball_y = _rust_find_ground_ball_interception(*args)
+        else:
+            if self.use_rust:
+                # Same travel times as the per-fielder Rust helper
+                speeds = np.minimum(speeds, RUST_FIELDER_MAX_SPEED_FPS)
+                args = args[:9] + (speeds,) + args[10:]
+            index, ball_time, fielder_time, ball_x, ball_y = find_ground_ball_interception_numpy(*args)
+
+        if index < 0:
+            return None
+        return names[index], ball_time, fielder_time, np.array([ball_x, ball_y])
+
+    def _find_best_interception_per_fielder(self, landing_pos: np.ndarray, ball_direction: np.ndarray,
+                                            ball_speed_fps: float, decel_fps2: float, flight_time: float,
+                                            exit_velocity_mph: float, fielders: Dict[str, Fielder]
+                                            ) -> Optional[Tuple[str, float, float, np.ndarray]]:
+        """
+        Reference implementation: one _calculate_fielder_interception call per fielder.
+
+        Returns
+        -------
+        tuple or None
+            (position_name, ball_time, fielder_time, ball_position) or None if the ball gets through
+        """
         best_margin = float('-inf')
         best_fielder = None
         best_position = None
@@ -152,7 +419,7 @@ class GroundBallInterceptor:
             # Calculate optimal interception for this fielder
             interception_data = self._calculate_fielder_interception(
                 landing_pos, ball_direction, ball_speed_fps, decel_fps2,
-                fielder, batted_ball_result.flight_time, position_name, exit_velocity_mph
+                fielder, flight_time, position_name, exit_velocity_mph
             )
 
             if interception_data is None:
@@ -196,18 +463,10 @@ class GroundBallInterceptor:
                     best_ball_position = ball_pos
                     best_fielder_time = fielder_time
         
-        # Set result - tightened margin check from -0.1 to -0.05
-        if best_fielder is not None and best_margin >= -0.05:
-            result.can_be_fielded = True
-            result.fielding_fielder = best_fielder
-            result.fielding_position = best_position
-            result.interception_time = best_interception_time
-            result.ball_position_at_interception = FieldPosition(best_ball_position[0], best_ball_position[1], 0.0)
-            result.fielder_arrival_time = best_fielder_time
-            result.time_margin = best_margin
-            result.interception_distance = np.linalg.norm(best_ball_position - landing_pos)
-        
-        return result
+        # Tightened margin check from -0.1 to -0.05
+        if best_fielder is None or best_margin < -0.05:
+            return None
+        return best_position, best_interception_time, best_fielder_time, best_ball_position
     
     def _calculate_fielder_interception(self, landing_pos: np.ndarray, ball_direction: np.ndarray,
                                       ball_speed_fps: float, decel_fps2: float,
@@ -69,6 +69,11 @@ class HitHandler:
             except:
                 height_at_fence = None
 
+        # Full trajectory for the exact fence intersection
+        trajectory_samples = getattr(batted_ball, 'position', None)
+        if not isinstance(trajectory_samples, np.ndarray) or trajectory_samples.ndim != 2:
+            trajectory_samples = None
+
         # CONTACT QUALITY GATES - Limit outcomes based on contact quality
         # Weak contact (< 80 mph EV) cannot produce extra-base hits beyond singles
         if contact_quality == 'weak' or exit_velocity < 80:
@@ -79,7 +84,7 @@ class HitHandler:
         # Home runs possible if ball clears fence (park-adjusted)
         elif contact_quality == 'fair' or exit_velocity < 88:
             # PARK-ADJUSTED HOME RUN DETERMINATION
-            if self.ballpark.is_home_run(spray_angle, distance_ft, height_at_fence):
+            if self.ballpark.is_home_run(spray_angle, distance_ft, height_at_fence, trajectory_samples):
                 result.outcome = PlayOutcome.HOME_RUN
                 result.runs_scored = 1
             # Dynamic double/triple classification
@@ -92,7 +97,7 @@ class HitHandler:
         # Solid contact (88+ mph EV) - full range of outcomes
         else:  # solid contact
             # PARK-ADJUSTED HOME RUN DETERMINATION
-            if self.ballpark.is_home_run(spray_angle, distance_ft, height_at_fence):
+            if self.ballpark.is_home_run(spray_angle, distance_ft, height_at_fence, trajectory_samples):
                 result.outcome = PlayOutcome.HOME_RUN
                 result.runs_scored = 1
             # Dynamic double/triple classification
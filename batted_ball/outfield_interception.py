@@ -7,7 +7,7 @@ intersections with the ball's flight/rolling path, rather than final resting pos
 
 import numpy as np
 import math
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Tuple, Optional
 from .field_layout import FieldPosition
 from .fielding import Fielder
 from .constants import (
@@ -16,6 +16,16 @@ from .constants import (
 )
 
 
+def _row_norms(vectors: np.ndarray) -> np.ndarray:
+    """
+    Euclidean norm of each row.
+
+    Stacked matmul reduces every row through the same BLAS dot as
+    np.linalg.norm() on a single vector, so the results match it bit for bit.
+    """
+    return np.sqrt((vectors[:, None, :] @ vectors[:, :, None]).ravel())
+
+
 class OutfieldInterceptionResult:
     """Result of outfield ball interception analysis."""
     
@@ -73,15 +83,9 @@ class OutfieldInterceptor:
         positions = trajectory_data['position']  # Nx3 array in meters, FIELD COORDS
         velocities = trajectory_data['velocity']  # Nx3 array in m/s, FIELD COORDS
 
-        trajectory = []
-        for i in range(len(times)):
-            point = type('Point', (), {
-                't': times[i],
-                'x': positions[i][0] * METERS_TO_FEET,  # Field X (lateral, right +)
-                'y': positions[i][1] * METERS_TO_FEET,  # Field Y (forward, CF +)
-                'z': positions[i][2] * METERS_TO_FEET   # Field Z (vertical, up +)
-            })()
-            trajectory.append(point)
+        # Field X (lateral, right +), Y (forward, CF +), Z (vertical, up +) in feet
+        times = np.asarray(times)
+        trajectory = np.asarray(positions) * METERS_TO_FEET
             
         # Get ball landing information
         landing_pos = np.array([batted_ball_result.landing_x, batted_ball_result.landing_y])
@@ -115,7 +119,7 @@ class OutfieldInterceptor:
             
             # Option 1: Air catch during flight (if ball is high enough)
             air_option = self._calculate_air_interception(
-                trajectory, fielder, position_name
+                times, trajectory, fielder, position_name
             )
             if air_option:
                 interception_options.append((*air_option, 'air_catch'))
@@ -186,10 +190,20 @@ class OutfieldInterceptor:
         
         return result
     
-    def _calculate_air_interception(self, trajectory: List, fielder: Fielder, 
+    def _calculate_air_interception(self, times: np.ndarray, trajectory: np.ndarray, fielder: Fielder,
                                   position_name: str) -> Optional[Tuple[float, float, np.ndarray, float]]:
         """
         Calculate if fielder can catch ball in the air during flight.
+
+        Every trajectory point is tested at once; the earliest point with the
+        best time margin wins.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            (N,) trajectory times in seconds
+        trajectory : np.ndarray
+            (N, 3) ball positions in feet, field coordinates
         
         Returns
         -------
@@ -199,62 +213,48 @@ class OutfieldInterceptor:
         fielder_pos = np.array([fielder.current_position.x, fielder.current_position.y])
         fielder_speed_fps = self._get_fielder_speed_fps(fielder)
         reaction_time = fielder.get_reaction_time_seconds() - self.air_reaction_bonus
-        
-        best_option = None
-        best_margin = float('-inf')
-        
-        # Test interception points during flight
-        for i, point in enumerate(trajectory):
-            if i == 0:
-                continue  # Skip contact point
-
-            ball_time = point.t
-
-            # Skip very early trajectory (ball still near batter, fielders can't react yet)
-            # Match the threshold used in trajectory_interception system
-            if ball_time < 0.15:
-                continue
-
-            ball_pos = np.array([point.x, point.y])
-
-            # ANTI-EXPLOIT: Prevent unrealistic early catches near home plate
-            # Calculate distance from home plate
-            distance_from_home = np.linalg.norm(ball_pos)
-
-            # Skip catches if ball is too close to home AND still early in flight
-            # This prevents fielders from "catching" balls at 0.15-0.5s that are still near the batter
-            # Only allow very close catches for extremely low line drives (z < 3ft) that infielders can grab
-            if distance_from_home < 100.0 and ball_time < 0.6 and point.z > 3.0:
-                continue
-
-            # INFIELDER DEEP BALL RESTRICTION: Prevent infielders from attempting catches on deep fly balls
-            # Infielders should not be considered for catches beyond 180 ft (outfielder territory)
-            is_infielder = position_name in ['first_base', 'second_base', 'third_base', 'shortstop']
-            if is_infielder and distance_from_home > 180.0:
-                continue
-
-            # Only consider points where ball is catchable height (z > 2 ft and z < 12 ft)
-            # Note: point.z is already in feet (converted at line 82)
-            if point.z < 2.0 or point.z > 12.0:
-                continue
-            
-            # Calculate distance fielder must travel
-            distance_to_ball = np.linalg.norm(ball_pos - fielder_pos)
-            
-            # Calculate fielder arrival time
-            fielder_time = reaction_time + distance_to_ball / fielder_speed_fps
 
-            # Time margin: positive = fielder arrives early, negative = fielder arrives late
-            # We want to maximize this (prefer fielders who arrive earliest/most on-time)
-            time_margin = ball_time - fielder_time
+        # Test interception points during flight (skip contact point)
+        ball_time = times[1:]
+        ball_pos = trajectory[1:, :2]
+        ball_z = trajectory[1:, 2]
 
-            # Track best option (fielder must not be impossibly late)
-            # Allow up to -0.2s late for diving/stretching catches
-            if time_margin > best_margin and time_margin >= -0.2:
-                best_margin = time_margin
-                best_option = (ball_time, fielder_time, ball_pos, distance_to_ball)
-        
-        return best_option
+        # Skip very early trajectory (ball still near batter, fielders can't react yet)
+        # Match the threshold used in trajectory_interception system
+        catchable = ball_time >= 0.15
+
+        # ANTI-EXPLOIT: Prevent unrealistic early catches near home plate
+        # Skip catches if ball is too close to home AND still early in flight
+        # This prevents fielders from "catching" balls at 0.15-0.5s that are still near the batter
+        # Only allow very close catches for extremely low line drives (z < 3ft) that infielders can grab
+        distance_from_home = _row_norms(ball_pos)
+        catchable &= ~((distance_from_home < 100.0) & (ball_time < 0.6) & (ball_z > 3.0))
+
+        # INFIELDER DEEP BALL RESTRICTION: Prevent infielders from attempting catches on deep fly balls
+        # Infielders should not be considered for catches beyond 180 ft (outfielder territory)
+        if position_name in ['first_base', 'second_base', 'third_base', 'shortstop']:
+            catchable &= ~(distance_from_home > 180.0)
+
+        # Only consider points where ball is catchable height (z > 2 ft and z < 12 ft)
+        catchable &= ~((ball_z < 2.0) | (ball_z > 12.0))
+
+        # Calculate distance fielder must travel and fielder arrival time
+        distance_to_ball = _row_norms(ball_pos - fielder_pos)
+        fielder_time = reaction_time + distance_to_ball / fielder_speed_fps
+
+        # Time margin: positive = fielder arrives early, negative = fielder arrives late
+        # We want to maximize this (prefer fielders who arrive earliest/most on-time)
+        time_margin = ball_time - fielder_time
+
+        # Fielder must not be impossibly late
+        # Allow up to -0.2s late for diving/stretching catches
+        candidates = np.flatnonzero(catchable & (time_margin >= -0.2))
+        if len(candidates) == 0:
+            return None
+
+        # Track best option (first point with the largest margin)
+        best = candidates[np.argmax(time_margin[candidates])]
+        return (ball_time[best], fielder_time[best], ball_pos[best].copy(), distance_to_ball[best])
     
     def _calculate_ground_interception(self, landing_pos: np.ndarray, ground_speed_fps: float,
                                      fielder: Fielder, ball_landing_time: float) -> Optional[Tuple[float, float, np.ndarray, float]]:
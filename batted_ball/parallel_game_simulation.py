@@ -8,7 +8,7 @@ Phase 4 adds ThreadedGameSimulator which uses threads instead of processes,
 providing better performance due to:
 1. No pickle/unpickle overhead
 2. Shared memory (no data copying)
-3. Numba JIT releases the GIL, enabling true parallelism
+3. trajectory_rs kernels release the GIL, enabling true parallelism
 """
 
 import time
@@ -20,6 +20,7 @@ from typing import List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass, field
 import numpy as np
 
+from .concurrency import ConcurrencyBudget
 from .game_simulation import GameSimulator, GameState, Team, create_test_team
 from .player import Pitcher, Hitter
 from .constants import SimulationMode
@@ -32,6 +33,8 @@ class ParallelSimulationSettings:
     # Parallelization settings
     num_workers: Optional[int] = None  # None = use all CPU cores
     chunk_size: int = 1  # Games per worker batch
+    # Native threads per worker; None = split the cores evenly across workers
+    concurrency: Optional[ConcurrencyBudget] = None
     
     # Output settings
     verbose: bool = False
@@ -93,6 +96,9 @@ class GameResult:
     away_ground_balls: int = 0
     away_fly_balls: int = 0
     away_line_drives: int = 0
+    away_ground_ball_outs: int = 0
+    away_fly_ball_outs: int = 0
+    away_line_drive_outs: int = 0
     away_exit_velocities: List[float] = field(default_factory=list)
     away_launch_angles: List[float] = field(default_factory=list)
     
@@ -108,6 +114,9 @@ class GameResult:
     home_ground_balls: int = 0
     home_fly_balls: int = 0
     home_line_drives: int = 0
+    home_ground_ball_outs: int = 0
+    home_fly_ball_outs: int = 0
+    home_line_drive_outs: int = 0
     home_exit_velocities: List[float] = field(default_factory=list)
     home_launch_angles: List[float] = field(default_factory=list)
     
@@ -235,39 +244,14 @@ def _simulate_single_game(args: Tuple) -> GameResult:
         game_number=game_number,
         away_team_name=away_team.name,
         home_team_name=home_team.name,
-        away_score=final_state.away_score,
-        home_score=final_state.home_score,
         total_innings=final_state.inning - (0 if final_state.is_top else 1),
         total_pitches=final_state.total_pitches,
         total_hits=final_state.total_hits,
         total_home_runs=final_state.total_home_runs,
-        # Per-team batting stats
-        away_hits=final_state.away_hits,
-        away_singles=final_state.away_singles,
-        away_doubles=final_state.away_doubles,
-        away_triples=final_state.away_triples,
-        away_home_runs=final_state.away_home_runs,
-        away_strikeouts=final_state.away_strikeouts,
-        away_walks=final_state.away_walks,
-        away_errors=final_state.away_errors,
-        away_at_bats=final_state.away_at_bats,
-        away_ground_balls=final_state.away_ground_balls,
-        away_fly_balls=final_state.away_fly_balls,
-        away_line_drives=final_state.away_line_drives,
+        # Per-team counters (score, hits, ..., batted ball outs) in one copy
+        **final_state.export_counters(),
         away_exit_velocities=list(final_state.away_exit_velocities),
         away_launch_angles=list(final_state.away_launch_angles),
-        home_hits=final_state.home_hits,
-        home_singles=final_state.home_singles,
-        home_doubles=final_state.home_doubles,
-        home_triples=final_state.home_triples,
-        home_home_runs=final_state.home_home_runs,
-        home_strikeouts=final_state.home_strikeouts,
-        home_walks=final_state.home_walks,
-        home_errors=final_state.home_errors,
-        home_at_bats=final_state.home_at_bats,
-        home_ground_balls=final_state.home_ground_balls,
-        home_fly_balls=final_state.home_fly_balls,
-        home_line_drives=final_state.home_line_drives,
         home_exit_velocities=list(final_state.home_exit_velocities),
         home_launch_angles=list(final_state.home_launch_angles),
     )
@@ -339,10 +323,17 @@ class ParallelGameSimulator:
         self.settings = settings or ParallelSimulationSettings()
         
         # Determine number of workers
-        if self.settings.num_workers is None:
+        if self.settings.concurrency is not None:
+            self.num_workers = self.settings.concurrency.processes
+        elif self.settings.num_workers is None:
             self.num_workers = cpu_count()
         else:
             self.num_workers = min(self.settings.num_workers, cpu_count())
+        
+        # Rayon/Numba/BLAS threads inside each worker
+        self.concurrency = (
+            self.settings.concurrency or ConcurrencyBudget.for_processes(self.num_workers)
+        )
     
     def simulate_games(
         self,
@@ -406,7 +397,7 @@ class ParallelGameSimulator:
             game_results = [_simulate_single_game(game_args[0])]
         else:
             # Multiple games - use multiprocessing pool
-            with Pool(processes=self.num_workers) as pool:
+            with Pool(processes=self.num_workers, **self.concurrency.pool_kwargs()) as pool:
                 if self.settings.show_progress:
                     # Use imap_unordered for progress updates
                     for i, result in enumerate(pool.imap_unordered(
@@ -817,7 +808,8 @@ class ThreadedGameSimulator:
     **Important Performance Note**: Thread-based parallelism is NOT faster than
     process-based for full game simulations. This is because:
     
-    1. The Python GIL is only released during Numba JIT-compiled code
+    1. The Python GIL is only released inside trajectory_rs kernels
+       (benchmarks/benchmark_thread_scaling.py measures 1..N threads)
     2. Game simulation has significant Python overhead (game state, at-bat logic)
     3. Multiprocessing avoids GIL contention by using separate processes
     
@@ -0,0 +1,637 @@
+"""
+Park-factor Monte Carlo with common random numbers.
+
+Park factors read off whole simulated seasons are slow and noisy: every park
+sees a different set of batted balls. ParkFactorEngine draws one batted-ball
+sample (EVLADistribution.sample_batch() plus spray and spin), flies the same
+sample through every park's environment (altitude, temperature, humidity and
+wind) and classifies each ball against that park's fence. Every park sees the
+same balls and the same uniform draws for the catch/hit decisions (common
+random numbers), so the park-to-park differences carry almost none of the
+sampling noise.
+
+Airborne balls (launch angle above 10°) are integrated with
+trajectory_rs.integrate_trajectories_sampled_batch() when the extension is
+built, otherwise with a lockstep NumPy RK4 that mirrors the Rust kernel
+(lookup-table aerodynamics, wind shear). Each flight is kept as a sampled
+polyline for BallparkDimensions.fence_crossings_batch().
+
+Outcome model (per batted ball):
+
+- Ground ball: not integrated; a hit with GROUND_BALL_HIT_PROBABILITY, never
+  for extra bases (identical in every park)
+- Foul: lands outside the foul lines (not a ball in play)
+- Home run: clears the fence
+- Off the wall: reaches the fence without clearing it -> double
+- In play: the nearest fielder (standard positions) is caught up to the
+  hang time; the time margin gives a catch probability (the bands of
+  RouteEfficiencyAnalyzer). Uncaught balls landing DOUBLE_DISTANCE_FT or
+  deeper are doubles. Triples are not modelled.
+
+Factors are a park's rate over the mean rate of the parks studied:
+HR and XBH (doubles) per fair ball, BABIP = (H - HR) / (BIP - HR).
+Confidence intervals are percentile bootstraps over the batted balls that
+resample the same balls for every park, so the pairing carries into the
+intervals.
+
+Example
+-------
+>>> engine = ParkFactorEngine()
+>>> results = engine.run(n_balls=20000, seed=1)
+>>> print(results.summary())
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .aerodynamics import get_lookup_tables, lookup_cd_cl_batch
+from .ballpark import get_ballpark, list_available_parks
+from .ballpark_effects import get_ballpark_effects
+from .constants import (
+    BALL_CROSS_SECTIONAL_AREA,
+    BALL_MASS,
+    DT_FAST,
+    FEET_TO_METERS,
+    FIELDER_ACCELERATION_AVG,
+    FIELDER_REACTION_TIME_AVG,
+    FIELDER_SPRINT_SPEED_STATCAST_AVG,
+    GRAVITY,
+    MAX_SIMULATION_TIME,
+    METERS_TO_FEET,
+    MPH_TO_MS,
+    CENTER_FIELDER_X, CENTER_FIELDER_Y,
+    FIRST_BASEMAN_X, FIRST_BASEMAN_Y,
+    LEFT_FIELDER_X, LEFT_FIELDER_Y,
+    PITCHER_X, PITCHER_Y,
+    RIGHT_FIELDER_X, RIGHT_FIELDER_Y,
+    SECOND_BASEMAN_X, SECOND_BASEMAN_Y,
+    SHORTSTOP_X, SHORTSTOP_Y,
+    THIRD_BASEMAN_X, THIRD_BASEMAN_Y,
+)
+from .contact import ContactModel
+from .environment import Environment
+from .ev_la_distribution import EVLADistribution, get_spray_angles_for_launch_angles
+from . import fast_trajectory
+
+STATS = ('hr', 'xbh', 'babip')
+
+CONTACT_HEIGHT_FT = 3.0
+GROUND_BALL_MAX_LAUNCH_ANGLE = 10.0
+# MLB BABIP on ground balls
+GROUND_BALL_HIT_PROBABILITY = 0.24
+# hit_handler's double_distance_min
+DOUBLE_DISTANCE_FT = 220.0
+FOUL_LINE_ANGLE = 45.0
+BAT_SPEED_MPH = 70.0
+
+# Standard positions in field coordinates (x toward right field, y toward CF)
+FIELDER_POSITIONS_FT = np.array([
+    (PITCHER_X, PITCHER_Y),
+    (FIRST_BASEMAN_X, FIRST_BASEMAN_Y),
+    (SECOND_BASEMAN_X, SECOND_BASEMAN_Y),
+    (THIRD_BASEMAN_X, THIRD_BASEMAN_Y),
+    (SHORTSTOP_X, SHORTSTOP_Y),
+    (LEFT_FIELDER_X, LEFT_FIELDER_Y),
+    (CENTER_FIELDER_X, CENTER_FIELDER_Y),
+    (RIGHT_FIELDER_X, RIGHT_FIELDER_Y),
+])
+
+# Time margin (ball hang time - fielder time, s) -> catch probability,
+# as in RouteEfficiencyAnalyzer._calculate_catch_probability()
+CATCH_MARGIN_EDGES = np.array([-0.60, -0.35, -0.15, 0.0, 0.2, 0.5, 1.0])
+CATCH_MARGIN_PROBABILITIES = np.array([0.01, 0.03, 0.10, 0.42, 0.78, 0.88, 0.92, 0.95])
+
+# Wind shear of the trajectory_rs kernel
+WIND_REF_HEIGHT_M = 10.0
+WIND_SHEAR_EXPONENT = 0.20
+WIND_MIN_HEIGHT_M = 1.0
+WIND_MAX_MULTIPLIER = 1.7
+
+
+@dataclass
+class ParkEnvironment:
+    """
+    Playing conditions of one park.
+
+    Attributes
+    ----------
+    park_id : str
+        Park identifier shared by ballpark.py and ballpark_effects.py
+    altitude : float
+        Elevation in feet
+    temperature : float
+        Temperature in Fahrenheit
+    humidity : float
+        Relative humidity 0-1
+    wind_speed : float
+        Wind speed in mph
+    wind_direction : float
+        Wind direction in degrees (0 = blowing out to center field)
+    """
+    park_id: str
+    altitude: float = 0.0
+    temperature: float = 70.0
+    humidity: float = 0.5
+    wind_speed: float = 0.0
+    wind_direction: float = 0.0
+
+    @classmethod
+    def for_park(cls, park_id: str, wind_speed: float = 0.0, wind_direction: float = 0.0) -> 'ParkEnvironment':
+        """Elevation and average game temperature from ballpark_effects (humidity as GameSimulator)."""
+        effects = get_ballpark_effects(park_id)
+        return cls(park_id, float(effects.elevation_ft), effects.avg_temperature_f, 0.5,
+                   wind_speed, wind_direction)
+
+    @property
+    def air_density(self) -> float:
+        """Air density in kg/m³."""
+        return Environment(self.altitude, self.temperature, self.humidity).air_density
+
+    def wind_velocity(self) -> np.ndarray:
+        """Wind vector in m/s (trajectory coordinates), as BattedBallSimulator."""
+        speed = self.wind_speed * MPH_TO_MS
+        angle = np.deg2rad(self.wind_direction)
+        return np.array([speed * np.cos(angle), speed * np.sin(angle), 0.0])
+
+
+@dataclass
+class BattedBallSample:
+    """
+    Batted balls and uniform draws shared by every park.
+
+    Attributes
+    ----------
+    exit_velocity, launch_angle, spray_angle, backspin_rpm : np.ndarray
+        Launch conditions (mph, degrees, degrees in physics convention, rpm)
+    uniforms : np.ndarray
+        One uniform draw per ball for the catch / ground-ball hit decision
+    """
+    exit_velocity: np.ndarray
+    launch_angle: np.ndarray
+    spray_angle: np.ndarray
+    backspin_rpm: np.ndarray
+    uniforms: np.ndarray
+
+    @classmethod
+    def draw(
+        cls,
+        n: int,
+        seed: Optional[int] = None,
+        distribution: Optional[EVLADistribution] = None,
+    ) -> 'BattedBallSample':
+        """
+        Draw n batted balls.
+
+        EV and LA from EVLADistribution.sample_batch(), spray from
+        get_spray_angles_for_launch_angles() and backspin from
+        ContactModel.calculate_backspin() at a typical bat speed.
+        """
+        rng = np.random.default_rng(seed)
+        distribution = distribution or EVLADistribution()
+        exit_velocity, launch_angle = distribution.sample_batch(n, rng=rng)
+        spray_angle = get_spray_angles_for_launch_angles(launch_angle, rng=rng)
+        contact = ContactModel()
+        backspin = np.array([
+            contact.calculate_backspin(ev, la, BAT_SPEED_MPH)
+            for ev, la in zip(exit_velocity, launch_angle)
+        ])
+        return cls(exit_velocity, launch_angle, spray_angle, backspin, rng.random(n))
+
+    def __len__(self) -> int:
+        return len(self.exit_velocity)
+
+    @property
+    def airborne(self) -> np.ndarray:
+        """Balls above the ground-ball launch angle (integrated per park)."""
+        return self.launch_angle > GROUND_BALL_MAX_LAUNCH_ANGLE
+
+    def initial_states(self, index=slice(None)) -> Tuple[np.ndarray, np.ndarray]:
+        """(N, 6) initial states in meters and (N, 4) spin parameters."""
+        speed = self.exit_velocity[index] * MPH_TO_MS
+        launch = np.deg2rad(self.launch_angle[index])
+        spray = np.deg2rad(self.spray_angle[index])
+        states = np.zeros((len(speed), 6))
+        states[:, 2] = CONTACT_HEIGHT_FT * FEET_TO_METERS
+        states[:, 3] = speed * np.cos(launch) * np.cos(spray)
+        states[:, 4] = speed * np.cos(launch) * np.sin(spray)
+        states[:, 5] = speed * np.sin(launch)
+
+        # Pure backspin about +y (topspin as a reversed axis)
+        backspin = self.backspin_rpm[index]
+        spin_params = np.zeros((len(speed), 4))
+        spin_params[:, 1] = np.where(backspin < 0.0, -1.0, 1.0)
+        spin_params[:, 3] = np.abs(backspin)
+        return states, spin_params
+
+
+def _integrate_sampled_numpy(states, spin_params, wind_velocity, air_density, dt, max_time,
+                             sample_every, cd_table, cl_table):
+    """
+    Lockstep NumPy version of trajectory_rs.integrate_trajectories_sampled_batch().
+
+    Same forces, wind shear, landing interpolation and sampling as the Rust
+    kernel; used when the extension is not built.
+    """
+    n = len(states)
+    k = 0.5 * air_density * BALL_CROSS_SECTIONAL_AREA
+    spin_axes = spin_params[:, :3] / np.maximum(np.linalg.norm(spin_params[:, :3], axis=1), 1e-12)[:, None]
+    spin_rpm = spin_params[:, 3]
+
+    def derivative(state, axis, rpm):
+        z = np.maximum(state[:, 2], WIND_MIN_HEIGHT_M)
+        shear = np.clip((z / WIND_REF_HEIGHT_M) ** WIND_SHEAR_EXPONENT, 1.0, WIND_MAX_MULTIPLIER)
+        relative = state[:, 3:] - shear[:, None] * wind_velocity
+        speed = np.sqrt(np.einsum('ij,ij->i', relative, relative))
+        unit = relative / np.maximum(speed, 1e-12)[:, None]
+        cd, cl = lookup_cd_cl_batch(speed, rpm, cd_table, cl_table)
+        force = -(k * cd * speed * speed)[:, None] * unit
+
+        direction = np.cross(unit, axis)
+        direction_norm = np.sqrt(np.einsum('ij,ij->i', direction, direction))
+        magnus = (rpm > 1.0) & (direction_norm > 1e-6)
+        scale = np.where(magnus, k * cl * speed * speed / np.where(magnus, direction_norm, 1.0), 0.0)
+        force += scale[:, None] * direction
+        force[speed < 1e-6] = 0.0
+
+        accel = force / BALL_MASS
+        accel[:, 2] -= GRAVITY
+        return np.concatenate([state[:, 3:], accel], axis=1)
+
+    max_steps = int(max_time / dt) + 10
+    capacity = (max_steps + 1) // sample_every + 2
+    samples = np.zeros((n, capacity, 3))
+    counts = np.ones(n, dtype=np.int64)
+    landing_times = np.zeros(n)
+    samples[:, 0] = states[:, :3]
+
+    state = states.astype(np.float64).copy()
+    active = np.arange(n)
+    step = 0
+    time = 0.0
+    while len(active) and time < max_time and step + 1 < max_steps - 1:
+        x = state[active]
+        axis = spin_axes[active]
+        rpm = spin_rpm[active]
+        k1 = derivative(x, axis, rpm)
+        k2 = derivative(x + 0.5 * dt * k1, axis, rpm)
+        k3 = derivative(x + 0.5 * dt * k2, axis, rpm)
+        k4 = derivative(x + dt * k3, axis, rpm)
+        new = x + dt / 6.0 * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+        state[active] = new
+        step += 1
+        time += dt
+
+        if step % sample_every == 0:
+            samples[active, counts[active]] = new[:, :3]
+            counts[active] += 1
+
+        landed = new[:, 2] <= 0.0
+        if landed.any():
+            rows = active[landed]
+            previous = x[landed, :3]
+            current = new[landed, :3]
+            dz = current[:, 2] - previous[:, 2]
+            interpolated = np.abs(dz) > 1e-10
+            fraction = np.where(interpolated, -previous[:, 2] / np.where(interpolated, dz, 1.0), 1.0)
+            landing = previous + fraction[:, None] * (current - previous)
+            landing[:, 2] = np.where(interpolated, 0.0, current[:, 2])
+            landing_times[rows] = np.where(interpolated, (step - 1) * dt + fraction * dt, time)
+
+            # The landing point always ends the polyline (once)
+            append = interpolated | (step % sample_every != 0)
+            rows = rows[append]
+            samples[rows, counts[rows]] = landing[append]
+            counts[rows] += 1
+            active = active[~landed]
+
+    # Flights that ran out of time end on their last state
+    if len(active):
+        landing_times[active] = time
+        if step % sample_every != 0:
+            samples[active, counts[active]] = state[active, :3]
+            counts[active] += 1
+
+    n_samples = int(counts.max())
+    samples = samples[:, :n_samples]
+    last = samples[np.arange(n), counts - 1]
+    pad = np.arange(n_samples)[None, :] >= counts[:, None]
+    samples[pad] = np.repeat(last, n_samples - counts, axis=0)
+    return samples, counts, landing_times
+
+
+def integrate_sample(
+    sample: BattedBallSample,
+    environment: ParkEnvironment,
+    index=slice(None),
+    dt: float = DT_FAST,
+    sample_every: int = 10,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sampled flight polylines of a subset of the batted balls in one park.
+
+    Parameters
+    ----------
+    sample : BattedBallSample
+        Batted balls
+    environment : ParkEnvironment
+        Air density and wind of the park
+    index : slice or array, optional
+        Balls to integrate (default: all)
+    dt : float
+        Integration time step in seconds
+    sample_every : int
+        Keep every n-th integration step (plus the landing point)
+
+    Returns
+    -------
+    positions : np.ndarray
+        (N, S, 3) positions in meters (trajectory coordinates), padded
+    sample_counts : np.ndarray
+        Valid samples per ball
+    hang_times : np.ndarray
+        Flight time to the landing point in seconds
+    """
+    states, spin_params = sample.initial_states(index)
+    cd_table, cl_table = get_lookup_tables()
+    wind = environment.wind_velocity()
+    if fast_trajectory.RUST_AVAILABLE and hasattr(fast_trajectory.trajectory_rs, 'integrate_trajectories_sampled_batch'):
+        return fast_trajectory.trajectory_rs.integrate_trajectories_sampled_batch(
+            states, dt, MAX_SIMULATION_TIME, 0.0, spin_params, wind,
+            environment.air_density, BALL_CROSS_SECTIONAL_AREA, cd_table, cl_table,
+            sample_every,
+        )
+    return _integrate_sampled_numpy(
+        states, spin_params, wind, environment.air_density, dt,
+        MAX_SIMULATION_TIME, sample_every, cd_table, cl_table,
+    )
+
+
+def catch_probabilities(landing_x_ft, landing_y_ft, hang_times) -> np.ndarray:
+    """
+    Catch probability of balls landing at field coordinates after hang_times.
+
+    The nearest standard fielder reacts, accelerates and runs at the
+    average MLB sprint speed; the time margin is mapped through the
+    RouteEfficiencyAnalyzer bands.
+    """
+    dx = landing_x_ft[:, None] - FIELDER_POSITIONS_FT[:, 0]
+    dy = landing_y_ft[:, None] - FIELDER_POSITIONS_FT[:, 1]
+    distance = np.sqrt(dx * dx + dy * dy).min(axis=1)
+
+    speed = FIELDER_SPRINT_SPEED_STATCAST_AVG
+    accel = FIELDER_ACCELERATION_AVG
+    accel_distance = speed * speed / (2.0 * accel)
+    run_time = np.where(
+        distance < accel_distance,
+        np.sqrt(2.0 * distance / accel),
+        speed / accel + (distance - accel_distance) / speed,
+    )
+    margin = hang_times - (FIELDER_REACTION_TIME_AVG + run_time)
+    return CATCH_MARGIN_PROBABILITIES[np.searchsorted(CATCH_MARGIN_EDGES, margin, side='right')]
+
+
+@dataclass
+class ParkOutcomes:
+    """
+    Per-ball outcomes of one sample in one park.
+
+    Boolean arrays over the batted balls: fair (ball in play or home run),
+    home_run, hit (non-home-run hits) and extra_base (doubles).
+    """
+    park_id: str
+    fair: np.ndarray
+    home_run: np.ndarray
+    hit: np.ndarray
+    extra_base: np.ndarray
+
+    def rates(self) -> Dict[str, float]:
+        """HR and XBH per fair ball and BABIP."""
+        return _rates(self.fair, self.home_run, self.hit, self.extra_base)
+
+
+def _rates(fair, home_run, hit, extra_base, weights=None) -> Dict[str, np.ndarray]:
+    """Rates from outcome indicators (ball axis last), optionally bootstrap-weighted."""
+    def total(indicator):
+        indicator = np.asarray(indicator, dtype=np.float64)
+        return indicator.sum(axis=-1) if weights is None else weights @ indicator.T
+
+    n_fair = total(fair)
+    n_hr = total(home_run)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return {
+            'hr': n_hr / n_fair,
+            'xbh': total(extra_base) / n_fair,
+            'babip': total(hit) / (n_fair - n_hr),
+        }
+
+
+@dataclass
+class ParkFactorResults:
+    """
+    Park factors with bootstrap confidence intervals.
+
+    Attributes
+    ----------
+    park_ids : list of str
+        Parks in the study
+    n_balls : int
+        Batted balls per park
+    rates : dict
+        Stat -> (P,) rates per park
+    factors : dict
+        Stat -> (P,) park rate / mean rate over the parks
+    intervals : dict
+        Stat -> (P, 2) lower and upper confidence bounds of the factors
+    confidence : float
+        Confidence level of the intervals
+    """
+    park_ids: List[str]
+    n_balls: int
+    rates: Dict[str, np.ndarray]
+    factors: Dict[str, np.ndarray]
+    intervals: Dict[str, np.ndarray]
+    confidence: float = 0.95
+    outcomes: List[ParkOutcomes] = field(default_factory=list, repr=False)
+
+    def factor(self, park_id: str, stat: str = 'hr') -> Tuple[float, float, float]:
+        """(factor, lower, upper) of one park and stat."""
+        i = self.park_ids.index(park_id)
+        low, high = self.intervals[stat][i]
+        return float(self.factors[stat][i]), float(low), float(high)
+
+    def summary(self) -> str:
+        """Table of factors (x100) and intervals, sorted by HR factor."""
+        pct = int(round(self.confidence * 100))
+        lines = [f"Park factors ({self.n_balls:,} batted balls per park, {pct}% CI)"]
+        lines.append(f"{'Park':<16s}" + "".join(f"{stat.upper():>20s}" for stat in STATS))
+        for i in np.argsort(-self.factors['hr']):
+            row = f"{self.park_ids[i]:<16s}"
+            for stat in STATS:
+                low, high = self.intervals[stat][i] * 100
+                row += f"{self.factors[stat][i] * 100:8.0f} [{low:4.0f},{high:4.0f}]"
+            lines.append(row)
+        return "\n".join(lines)
+
+
+class ParkFactorEngine:
+    """
+    Monte Carlo park factors from one batted-ball sample run through every park.
+
+    Parameters
+    ----------
+    parks : sequence of str, optional
+        Park ids (default: every park in ballpark.py except 'generic')
+    wind_speed : float
+        Wind speed in mph applied in every park (default: calm)
+    wind_direction : float
+        Wind direction in degrees (0 = blowing out to center field)
+    environments : dict, optional
+        park id -> ParkEnvironment overriding the ballpark_effects conditions
+    dt : float
+        Integration time step in seconds
+    sample_every : int
+        Integration steps between polyline samples for the fence test
+    chunk_size : int
+        Airborne balls integrated per call (bounds the polyline memory)
+    """
+
+    def __init__(
+        self,
+        parks: Optional[Sequence[str]] = None,
+        wind_speed: float = 0.0,
+        wind_direction: float = 0.0,
+        environments: Optional[Dict[str, ParkEnvironment]] = None,
+        dt: float = DT_FAST,
+        sample_every: int = 10,
+        chunk_size: int = 2000,
+    ):
+        if parks is None:
+            parks = [park for park in list_available_parks() if park != 'generic']
+        self.parks = list(parks)
+        self.environments = {
+            park: ParkEnvironment.for_park(park, wind_speed, wind_direction) for park in self.parks
+        }
+        self.environments.update(environments or {})
+        self.dt = dt
+        self.sample_every = sample_every
+        self.chunk_size = chunk_size
+
+    def classify(self, sample: BattedBallSample, park_id: str) -> ParkOutcomes:
+        """Outcome of every ball of the sample in one park."""
+        ballpark = get_ballpark(park_id)
+        environment = self.environments[park_id]
+        n = len(sample)
+
+        # Ground balls: the same outcome in every park
+        fair = np.ones(n, dtype=bool)
+        home_run = np.zeros(n, dtype=bool)
+        extra_base = np.zeros(n, dtype=bool)
+        hit = sample.uniforms < GROUND_BALL_HIT_PROBABILITY
+
+        airborne = np.flatnonzero(sample.airborne)
+        for start in range(0, len(airborne), self.chunk_size):
+            rows = airborne[start:start + self.chunk_size]
+            positions, counts, hang_times = integrate_sample(
+                sample, environment, rows, self.dt, self.sample_every
+            )
+            reached, height_margin = ballpark.fence_crossings_batch(positions, counts)
+            cleared = reached & (np.nan_to_num(height_margin, nan=-1.0) >= 0.0)
+
+            landing = positions[np.arange(len(rows)), counts - 1]
+            landing_x = -landing[:, 1] * METERS_TO_FEET
+            landing_y = landing[:, 0] * METERS_TO_FEET
+            spray = np.degrees(np.arctan2(landing_x, landing_y))
+            is_fair = (np.abs(spray) <= FOUL_LINE_ANGLE) & (landing_y > 0.0)
+
+            caught = sample.uniforms[rows] < catch_probabilities(landing_x, landing_y, hang_times)
+            off_wall = reached & ~cleared
+            in_park_hit = off_wall | ~reached & ~caught
+            deep = np.hypot(landing_x, landing_y) >= DOUBLE_DISTANCE_FT
+
+            fair[rows] = is_fair
+            home_run[rows] = is_fair & cleared
+            hit[rows] = is_fair & in_park_hit
+            extra_base[rows] = is_fair & (off_wall | (in_park_hit & deep))
+
+        return ParkOutcomes(park_id, fair, home_run, hit, extra_base)
+
+    def run(
+        self,
+        n_balls: int = 20000,
+        seed: Optional[int] = None,
+        n_bootstrap: int = 1000,
+        confidence: float = 0.95,
+        sample: Optional[BattedBallSample] = None,
+        common_random_numbers: bool = True,
+    ) -> ParkFactorResults:
+        """
+        Draw one sample, classify it in every park and compute the factors.
+
+        Parameters
+        ----------
+        n_balls : int
+            Batted balls in the sample
+        seed : int, optional
+            Seed for the sample and the bootstrap
+        n_bootstrap : int
+            Bootstrap replicates for the confidence intervals (0 = none)
+        confidence : float
+            Confidence level of the intervals
+        sample : BattedBallSample, optional
+            Use this sample instead of drawing one
+        common_random_numbers : bool
+            Run the same sample through every park (default). If False,
+            every park gets its own sample and bootstrap, as separate
+            simulations would; for comparing the variance.
+
+        Returns
+        -------
+        ParkFactorResults
+        """
+        rng = np.random.default_rng(seed)
+        if sample is None:
+            sample = BattedBallSample.draw(n_balls, seed=rng.integers(2 ** 32))
+        samples = [sample] * len(self.parks)
+        if not common_random_numbers:
+            samples[1:] = [BattedBallSample.draw(len(sample), seed=rng.integers(2 ** 32))
+                           for _ in self.parks[1:]]
+        outcomes = [self.classify(s, park) for s, park in zip(samples, self.parks)]
+
+        fair = np.array([o.fair for o in outcomes])
+        home_run = np.array([o.home_run for o in outcomes])
+        hit = np.array([o.hit for o in outcomes])
+        extra_base = np.array([o.extra_base for o in outcomes])
+
+        rates = _rates(fair, home_run, hit, extra_base)
+        factors = {stat: rates[stat] / np.nanmean(rates[stat]) for stat in STATS}
+
+        intervals = {stat: np.column_stack([factors[stat], factors[stat]]) for stat in STATS}
+        if n_bootstrap:
+            n = len(sample)
+            uniform = np.full(n, 1.0 / n)
+            replicates = {stat: [] for stat in STATS}
+            block = max(1, min(n_bootstrap, 2_000_000 // n))
+            for start in range(0, n_bootstrap, block):
+                size = min(block, n_bootstrap - start)
+                if common_random_numbers:
+                    # Resample the same balls in every park
+                    weights = rng.multinomial(n, uniform, size=size).astype(np.float64)
+                    boot = _rates(fair, home_run, hit, extra_base, weights)
+                else:
+                    park_boot = [
+                        _rates(fair[p], home_run[p], hit[p], extra_base[p],
+                               rng.multinomial(n, uniform, size=size).astype(np.float64))
+                        for p in range(len(self.parks))
+                    ]
+                    boot = {stat: np.column_stack([b[stat] for b in park_boot]) for stat in STATS}
+                for stat in STATS:
+                    replicates[stat].append(boot[stat] / np.nanmean(boot[stat], axis=1, keepdims=True))
+            tail = (1.0 - confidence) / 2.0 * 100.0
+            for stat in STATS:
+                intervals[stat] = np.nanpercentile(
+                    np.concatenate(replicates[stat]), [tail, 100.0 - tail], axis=0
+                ).T
+
+        return ParkFactorResults(self.parks, len(sample), rates, factors, intervals, confidence, outcomes)
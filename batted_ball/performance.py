@@ -6,7 +6,7 @@ to reduce allocation overhead and improve simulation speed.
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from functools import lru_cache
 from .constants import (
     MAX_SIMULATION_TIME,
@@ -624,6 +624,149 @@ class PerformanceTracker:
         }
 
 
+class PhaseProfiler:
+    """
+    Per-phase timers and counters for the game simulation hot path.
+
+    Simulators hold an optional ``profiler`` attribute that defaults to None;
+    every instrumented call site is guarded by ``if profiler is not None`` so a
+    disabled profiler costs a single attribute check and no timer calls.
+
+    Phases are nested: ``at_bat`` contains ``pitch_flight``, ``swing_decision``,
+    ``contact`` and ``batted_ball_flight``; ``play`` contains the interception
+    and ``throwing`` phases. ``bookkeeping`` is game-state updates and logging.
+
+    Profilers are mergeable: worker processes return ``snapshot()`` (a plain,
+    picklable dict) and the parent folds it in with ``merge()``.
+    """
+
+    __slots__ = ('phase_times', 'phase_calls', 'counters', 'games')
+
+    def __init__(self):
+        """Initialize an empty profiler."""
+        self.phase_times: Dict[str, float] = {}
+        self.phase_calls: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+        self.games = 0
+
+    def record(self, phase: str, elapsed: float):
+        """
+        Add elapsed time for one call of a phase.
+
+        Parameters
+        ----------
+        phase : str
+            Phase name (e.g. 'pitch_flight')
+        elapsed : float
+            Elapsed wall time in seconds
+        """
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + elapsed
+        self.phase_calls[phase] = self.phase_calls.get(phase, 0) + 1
+
+    def count(self, name: str, n: int = 1):
+        """Increment a named counter (e.g. 'pitch_steps') by n."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def end_game(self):
+        """Mark the end of one simulated game (used for per-game averages)."""
+        self.games += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a picklable copy of the profiler contents.
+
+        Returns
+        -------
+        dict
+            {'phase_times', 'phase_calls', 'counters', 'games'}
+        """
+        return {
+            'phase_times': dict(self.phase_times),
+            'phase_calls': dict(self.phase_calls),
+            'counters': dict(self.counters),
+            'games': self.games,
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> 'PhaseProfiler':
+        """Rebuild a profiler from a snapshot dict."""
+        profiler = cls()
+        profiler.merge(snapshot)
+        return profiler
+
+    def merge(self, other: Union['PhaseProfiler', Dict[str, Any]]):
+        """
+        Fold another profiler (or snapshot dict) into this one.
+
+        Parameters
+        ----------
+        other : PhaseProfiler or dict
+            Profiler or snapshot from another game or worker process
+        """
+        if isinstance(other, PhaseProfiler):
+            other = other.snapshot()
+        if not other:
+            return
+        for phase, elapsed in other.get('phase_times', {}).items():
+            self.phase_times[phase] = self.phase_times.get(phase, 0.0) + elapsed
+        for phase, calls in other.get('phase_calls', {}).items():
+            self.phase_calls[phase] = self.phase_calls.get(phase, 0) + calls
+        for name, n in other.get('counters', {}).items():
+            self.counters[name] = self.counters.get(name, 0) + n
+        self.games += other.get('games', 0)
+
+    def reset(self):
+        """Clear all timers and counters."""
+        self.phase_times.clear()
+        self.phase_calls.clear()
+        self.counters.clear()
+        self.games = 0
+
+    def get_breakdown(self) -> Dict[str, Any]:
+        """
+        Get per-phase totals and per-game averages.
+
+        Returns
+        -------
+        dict
+            'phases' maps phase name to total_s, calls, per_game_ms and
+            per_call_us; 'counters' maps counter name to total and per_game.
+        """
+        games = max(self.games, 1)
+        phases = {}
+        for phase, total in sorted(self.phase_times.items(), key=lambda kv: -kv[1]):
+            calls = self.phase_calls.get(phase, 0)
+            phases[phase] = {
+                'total_s': total,
+                'calls': calls,
+                'per_game_ms': total / games * 1000.0,
+                'per_call_us': total / calls * 1e6 if calls else 0.0,
+            }
+        counters = {
+            name: {'total': n, 'per_game': n / games}
+            for name, n in sorted(self.counters.items())
+        }
+        return {'games': self.games, 'phases': phases, 'counters': counters}
+
+    def print_breakdown(self):
+        """Print a formatted per-game phase breakdown."""
+        breakdown = self.get_breakdown()
+
+        print("\n" + "=" * 60)
+        print(f"PHASE BREAKDOWN ({breakdown['games']} games)")
+        print("=" * 60)
+        print(f"{'Phase':<26} {'ms/game':>10} {'calls':>10} {'us/call':>10}")
+        print("-" * 60)
+        for phase, p in breakdown['phases'].items():
+            print(f"{phase:<26} {p['per_game_ms']:>10.1f} {p['calls']:>10} {p['per_call_us']:>10.1f}")
+        if breakdown['counters']:
+            print("-" * 60)
+            print(f"{'Counter':<26} {'per game':>10} {'total':>10}")
+            for name, c in breakdown['counters'].items():
+                print(f"{name:<26} {c['per_game']:>10.1f} {c['total']:>10}")
+        print("=" * 60)
+
+
 # Global performance tracker
 _performance_tracker = None
 
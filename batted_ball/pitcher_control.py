@@ -318,3 +318,115 @@ class PitcherControlModule:
                 vertical = np.random.uniform(24.0, 36.0)
 
         return horizontal, vertical
+
+    def generate_pitch_locations(
+        self,
+        balls: np.ndarray,
+        strikes: np.ndarray,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized generate_pitch_location() for many counts at once.
+
+        Uses the same zone-target probabilities, targeting strategies and
+        location distributions as the per-pitch path, drawn from one
+        generator for the whole batch (different random stream, same
+        distribution).
+
+        Parameters
+        ----------
+        balls : array-like of int
+            Ball count per pitch (0-3)
+        strikes : array-like of int
+            Strike count per pitch (0-2)
+        rng : np.random.Generator, optional
+            Random generator (default: a fresh unseeded generator)
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Target locations (horizontal_inches, vertical_inches)
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        balls = np.asarray(balls, dtype=np.intp)
+        strikes = np.asarray(strikes, dtype=np.intp)
+        n = balls.shape[0]
+        horizontal = np.empty(n)
+        vertical = np.empty(n)
+
+        # Zone-target probability depends only on the count
+        zone_probs = np.array([
+            [self.determine_zone_target_probability(b, s) for s in range(3)]
+            for b in range(4)
+        ])
+        targets_zone = rng.random(n) < zone_probs[balls, strikes]
+
+        # Zone strategy (_generate_zone_target): center first pitch and when
+        # behind, otherwise ahead (edge/corner/center 40/35/25) or neutral
+        # (center/edge/corner 40/35/25)
+        u = rng.random(n)
+        strategy = np.where(
+            strikes >= 1,
+            np.where(u < 0.40, 'edge', np.where(u < 0.75, 'corner', 'center')),
+            np.where(u < 0.40, 'center', np.where(u < 0.75, 'edge', 'corner')),
+        )
+        strategy[((balls == 0) & (strikes == 0)) | (balls >= 2)] = 'center'
+
+        def sides(size):
+            return np.where(rng.random(size) < 0.5, -1.0, 1.0)
+
+        mask = targets_zone & (strategy == 'center')
+        k = np.count_nonzero(mask)
+        horizontal[mask] = rng.normal(0, 2.0, k)
+        vertical[mask] = rng.normal(30.0, 3.0, k)
+
+        edge = targets_zone & (strategy == 'edge')
+        vertical_edge = rng.random(n) < 0.5
+        mask = edge & vertical_edge
+        k = np.count_nonzero(mask)
+        horizontal[mask] = rng.normal(0, 3.0, k)
+        vertical[mask] = np.where(rng.random(k) < 0.5, 22.0, 38.0) + rng.normal(0, 2.0, k)
+        mask = edge & ~vertical_edge
+        k = np.count_nonzero(mask)
+        horizontal[mask] = sides(k) * 6.0 + rng.normal(0, 1.5, k)
+        vertical[mask] = rng.normal(30.0, 4.0, k)
+
+        mask = targets_zone & (strategy == 'corner')
+        k = np.count_nonzero(mask)
+        horizontal[mask] = sides(k) * 6.5 + rng.normal(0, 1.0, k)
+        vertical[mask] = np.where(rng.random(k) < 0.5, 22.0, 38.0) + rng.normal(0, 1.5, k)
+
+        # Out of zone (_generate_out_of_zone_target): chase with 2 strikes
+        # (low/away/high/in 45/30/15/10), otherwise waste (low/away 60/40)
+        u = rng.random(n)
+        chase = ~targets_zone & (strikes == 2)
+        waste = ~targets_zone & (strikes != 2)
+
+        mask = chase & (u < 0.45)
+        k = np.count_nonzero(mask)
+        horizontal[mask] = rng.normal(0, 4.0, k)
+        vertical[mask] = rng.uniform(11.0, 17.0, k)
+        mask = chase & (u >= 0.45) & (u < 0.75)
+        k = np.count_nonzero(mask)
+        horizontal[mask] = sides(k) * rng.uniform(9.5, 14.0, k)
+        vertical[mask] = rng.uniform(22.0, 38.0, k)
+        mask = chase & (u >= 0.75) & (u < 0.90)
+        k = np.count_nonzero(mask)
+        horizontal[mask] = rng.normal(0, 4.0, k)
+        vertical[mask] = rng.uniform(43.0, 48.0, k)
+        mask = chase & (u >= 0.90)
+        k = np.count_nonzero(mask)
+        horizontal[mask] = sides(k) * rng.uniform(9.5, 13.0, k)
+        vertical[mask] = rng.uniform(24.0, 36.0, k)
+
+        mask = waste & (u < 0.60)
+        k = np.count_nonzero(mask)
+        horizontal[mask] = rng.normal(0, 5.0, k)
+        vertical[mask] = rng.uniform(8.0, 15.0, k)
+        mask = waste & (u >= 0.60)
+        k = np.count_nonzero(mask)
+        horizontal[mask] = sides(k) * rng.uniform(13.0, 19.0, k)
+        vertical[mask] = rng.uniform(24.0, 36.0, k)
+
+        return horizontal, vertical
@@ -84,7 +84,6 @@ class PlayAnalyzer:
     def calculate_ball_position_at_time(batted_ball_result: BattedBallResult, t: float) -> FieldPosition:
         """Calculate ball position at time t during flight using actual physics trajectory."""
         # Use actual trajectory data from physics simulation
-        time_array = batted_ball_result.time
         position_array = batted_ball_result.position  # Nx3 array in meters
 
         # Handle edge cases
@@ -106,25 +105,8 @@ class PlayAnalyzer:
                 max(0.0, pos[2] * METERS_TO_FEET)  # Don't go below ground
             )
 
-        # Find the two time points that bracket t
-        idx = np.searchsorted(time_array, t)
-
-        if idx == 0:
-            # At or before first point
-            pos = position_array[0]
-        elif idx >= len(time_array):
-            # At or after last point
-            pos = position_array[-1]
-        else:
-            # Interpolate between two points
-            t1 = time_array[idx - 1]
-            t2 = time_array[idx]
-            pos1 = position_array[idx - 1]
-            pos2 = position_array[idx]
-
-            # Linear interpolation factor
-            alpha = (t - t1) / (t2 - t1)
-            pos = pos1 + alpha * (pos2 - pos1)
+        # Evaluate the trajectory spline (direct segment lookup, no search)
+        pos = batted_ball_result.spline.position(t)
 
         # Convert to feet and return
         return FieldPosition(
@@ -7,6 +7,7 @@ timing and decision-making.
 """
 
 import numpy as np
+from time import perf_counter
 from typing import Dict, Optional
 
 # Import data classes from play_outcome module
@@ -84,6 +85,22 @@ class PlaySimulator:
         self.fly_ball_handler.hit_handler = self.hit_handler
         self.fly_ball_handler.throwing_logic = self.throwing_logic
 
+        # Optional PhaseProfiler (None = disabled); see set_profiler()
+        self.profiler = None
+
+    def set_profiler(self, profiler):
+        """
+        Attach a PhaseProfiler to this simulator and its handlers.
+
+        Parameters
+        ----------
+        profiler : PhaseProfiler or None
+            Profiler to record play phases into (None disables profiling)
+        """
+        self.profiler = profiler
+        self.fly_ball_handler.profiler = profiler
+        self.ground_ball_handler.profiler = profiler
+
     def setup_defense(self, fielders: Dict[str, Fielder]):
         """
         Set up defensive alignment.
@@ -248,9 +265,14 @@ class PlaySimulator:
             # FIX FOR "SCHRÖDINGER'S CATCH" BUG: Check trajectory interception FIRST
             # before attempting landing position catch. This prevents logging "ball drops"
             # followed by "caught" for the same play.
+            profiler = self.profiler
+            if profiler is not None:
+                t0 = perf_counter()
             trajectory_caught = self.fly_ball_handler.attempt_trajectory_interception(
                 batted_ball_result, result
             )
+            if profiler is not None:
+                profiler.record('fly_ball_interception', perf_counter() - t0)
 
             if trajectory_caught:
                 # Ball was caught during flight - play is over
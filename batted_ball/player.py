@@ -6,7 +6,7 @@ realistic baseball gameplay with individual player characteristics.
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from .attributes import HitterAttributes, FielderAttributes, PitcherAttributes
 from .constants import (
     # Pitcher attribute scales
@@ -99,6 +99,33 @@ class Pitcher:
         # State variables
         self.pitches_thrown = 0
 
+        # Per-game arsenal cache (see get_arsenal)
+        self.arsenal = None
+
+    def get_arsenal(self):
+        """
+        Precomputed arsenal (pitch parameters and selection weights).
+
+        Built on first use and rebuilt by prepare_arsenal() at the start of
+        each game, or automatically when the attributes or the pitch_arsenal /
+        pitch_effectiveness dicts are replaced.
+
+        Returns
+        -------
+        PitcherArsenal
+        """
+        arsenal = self.arsenal
+        if arsenal is None or not arsenal.is_current():
+            arsenal = self.prepare_arsenal()
+        return arsenal
+
+    def prepare_arsenal(self):
+        """(Re)build the arsenal cache for a new game."""
+        from .arsenal import PitcherArsenal
+
+        self.arsenal = PitcherArsenal(self)
+        return self.arsenal
+
     def get_pitch_velocity_mph(self, pitch_type: str = 'fastball') -> float:
         """
         Get pitch velocity in MPH with stamina degradation.
@@ -113,16 +140,7 @@ class Pitcher:
         float
             Velocity in MPH
         """
-        # Get base velocity from physics-first attributes
-        velocity_mph = self.attributes.get_raw_velocity_mph()
-
-        # Apply pitch-type modifiers (fastball = 100%, changeup = ~85%, etc.)
-        if pitch_type == 'changeup':
-            velocity_mph *= 0.85
-        elif pitch_type == 'curveball':
-            velocity_mph *= 0.88
-        elif pitch_type == 'slider':
-            velocity_mph *= 0.92
+        velocity_mph = self.get_fresh_pitch_velocity_mph(pitch_type)
 
         # Apply stamina degradation based on pitches thrown
         stamina_cap = self.attributes.get_stamina_pitches()
@@ -147,18 +165,7 @@ class Pitcher:
         float
             Spin rate in RPM
         """
-        # Get base spin rate from physics-first attributes (for 4-seam fastball)
-        base_spin_rpm = self.attributes.get_spin_rate_rpm()
-
-        # Apply pitch-type modifiers
-        if pitch_type == 'changeup':
-            spin_rpm = base_spin_rpm * 0.70  # Lower spin
-        elif pitch_type == 'curveball':
-            spin_rpm = base_spin_rpm * 1.10  # Higher spin
-        elif pitch_type == 'slider':
-            spin_rpm = base_spin_rpm * 0.95  # Slightly lower
-        else:  # fastball
-            spin_rpm = base_spin_rpm
+        spin_rpm = self.get_fresh_pitch_spin_rpm(pitch_type)
 
         # Apply stamina degradation
         stamina_cap = self.attributes.get_stamina_pitches()
@@ -167,6 +174,34 @@ class Pitcher:
 
         return spin_rpm * (1.0 - stamina_loss)
 
+    def get_fresh_pitch_velocity_mph(self, pitch_type: str = 'fastball') -> float:
+        """Pitch velocity in MPH before stamina degradation."""
+        # Get base velocity from physics-first attributes
+        velocity_mph = self.attributes.get_raw_velocity_mph()
+
+        # Apply pitch-type modifiers (fastball = 100%, changeup = ~85%, etc.)
+        if pitch_type == 'changeup':
+            velocity_mph *= 0.85
+        elif pitch_type == 'curveball':
+            velocity_mph *= 0.88
+        elif pitch_type == 'slider':
+            velocity_mph *= 0.92
+        return velocity_mph
+
+    def get_fresh_pitch_spin_rpm(self, pitch_type: str = 'fastball') -> float:
+        """Spin rate in RPM before stamina degradation."""
+        # Get base spin rate from physics-first attributes (for 4-seam fastball)
+        base_spin_rpm = self.attributes.get_spin_rate_rpm()
+
+        # Apply pitch-type modifiers
+        if pitch_type == 'changeup':
+            return base_spin_rpm * 0.70  # Lower spin
+        elif pitch_type == 'curveball':
+            return base_spin_rpm * 1.10  # Higher spin
+        elif pitch_type == 'slider':
+            return base_spin_rpm * 0.95  # Slightly lower
+        return base_spin_rpm  # fastball
+
     def get_release_extension_feet(self) -> float:
         """
         Get release extension in feet.
@@ -207,12 +242,38 @@ class Pitcher:
         tuple
             (horizontal_error_inches, vertical_error_inches)
         """
+        effective_sigma = self.get_effective_command_sigma_inches()
+
+        # Random error with normal distribution (NO DIVISION - use sigma directly!)
+        # Previous bug: Divided by 2.0, making error 10× too small
+        horizontal_error = np.random.normal(0, effective_sigma)
+        vertical_error = np.random.normal(0, effective_sigma)
+
+        return horizontal_error, vertical_error
+
+    def get_effective_command_sigma_inches(self, pitches_thrown: Optional[int] = None) -> float:
+        """
+        Command error sigma (inches) with the nonlinear fatigue penalty applied.
+
+        Parameters
+        ----------
+        pitches_thrown : int, optional
+            Pitch count for fatigue (default: the pitcher's current count)
+
+        Returns
+        -------
+        float
+            Standard deviation of the horizontal and vertical command error
+        """
+        if pitches_thrown is None:
+            pitches_thrown = self.pitches_thrown
+
         # Get base command error from attributes (FIXED - now actually uses it!)
         command_sigma = self.attributes.get_command_sigma_inches()
 
         # Apply stamina degradation with NONLINEAR scaling
         stamina_cap = self.attributes.get_stamina_pitches()
-        stamina_remaining = max(0.0, 1.0 - (self.pitches_thrown / stamina_cap))
+        stamina_remaining = max(0.0, 1.0 - (pitches_thrown / stamina_cap))
 
         # Nonlinear fatigue curve: exponential increase after 75% stamina used
         # At 0% fatigue (fresh): multiplier = 1.0
@@ -236,12 +297,7 @@ class Pitcher:
         # This ensures even exhausted poor-command pitchers can throw ~40-50% strikes
         effective_sigma = min(effective_sigma, 18.0)
 
-        # Random error with normal distribution (NO DIVISION - use sigma directly!)
-        # Previous bug: Divided by 2.0, making error 10× too small
-        horizontal_error = np.random.normal(0, effective_sigma)
-        vertical_error = np.random.normal(0, effective_sigma)
-
-        return horizontal_error, vertical_error
+        return effective_sigma
 
     def get_pitch_whiff_multiplier(self, pitch_type: str = 'fastball') -> float:
         """
@@ -441,6 +497,161 @@ def generate_pitch_arsenal(
     return arsenal
 
 
+# =============================================================================
+# SWING DECISION / WHIFF MODIFIERS
+# (shared by Hitter's exact functions and decision_surface.DecisionSurface)
+# =============================================================================
+
+_NO_CAP = float('inf')
+
+# Count situation adjustments to swing probability, applied as
+# min(p * mult + add, cap) for (in-zone, out-of-zone) pitches.
+#
+# PHASE 2A SPRINT 8 2025-11-20: Further reduce early-count aggression
+# Sprint 7 results: K% stuck at 14% despite zone rate 61.7% and whiff 29.5%
+# Root cause: Batters putting balls in play too early, not reaching 2-strike counts
+# Solution: MORE aggressive early-count patience to force deeper counts
+COUNT_SWING_ADJUSTMENTS = {
+    # First pitch - EXTREME zone-dependent patience (Sprint 7: K% 14.0%, target 18-20%)
+    # In-zone: MUCH stronger reduction (0.55× from 0.70×), force hitters to work the count
+    # Out-of-zone: HIGHER chase boost to balance (2.5× from 2.0×), chase ~28-30%
+    (0, 0): ((0.55, 0.0, _NO_CAP), (2.5, 0.0, _NO_CAP)),
+    # 1-0 count - HITTER'S COUNT, be patient (Sprint 8: look for their pitch)
+    # In-zone: stronger reduction (0.65× from 0.75×); out-of-zone: INCREASE chase (2.0× from 1.5×)
+    (1, 0): ((0.65, 0.0, _NO_CAP), (2.0, 0.0, _NO_CAP)),
+    # 0-1 count - behind in count, more aggressive
+    # Sprint 6 v1: 60.3% overall (too high), 80.0% in-zone (too high), 30.3% chase (good!)
+    # In-zone: stronger reduction (0.85× from 0.95×); out-of-zone: 2.0× boost working well
+    (0, 1): ((0.85, 0.0, _NO_CAP), (2.0, 0.0, _NO_CAP)),
+    # 1-1 count - even count, be patient but not too much
+    # Sprint 6 v1: 49.5% overall (close!), 63.9% in-zone (target: 69%), 29.5% chase (perfect!)
+    # In-zone: stronger reduction (0.75× from 0.85×); out-of-zone: reduced boost (2.0× from 2.5×)
+    (1, 1): ((0.75, 0.0, _NO_CAP), (2.0, 0.0, _NO_CAP)),
+    # 2-0 DEEP hitter's count - EXTREMELY selective (Sprint 8: near-automatic take)
+    # In-zone: MUCH stronger reduction (0.50× from 0.70×)
+    # Out-of-zone: INCREASE chase slightly (1.0× from 0.5×), allow some chase mistakes
+    (2, 0): ((0.50, 0.0, _NO_CAP), (1.0, 0.0, _NO_CAP)),
+    # 2-1 count - hitter's count but not extreme (Sprint 5: 55.7% overall, target: 45%)
+    # In-zone: reduction to reach target (0.75×); out-of-zone: moderate chase allowed (1.2×)
+    (2, 1): ((0.75, 0.0, _NO_CAP), (1.2, 0.0, _NO_CAP)),
+    # 3-0 count - must take unless perfect pitch (Sprint 6 v1: 20.0%, target: 25%)
+    # In-zone: selective but not TOO selective (0.45× from 0.35×)
+    # Out-of-zone: never chase but was too strict (0.15× from 0.1×)
+    (3, 0): ((0.45, 0.0, _NO_CAP), (0.15, 0.0, _NO_CAP)),
+    # 3-1 count - still very selective (Sprint 6 v1: 7.1%, WAY too low, target: 35%)
+    # In-zone: much weaker selectivity (0.70× from 0.50×); out-of-zone: some chase (0.60× from 0.3×)
+    (3, 1): ((0.70, 0.0, _NO_CAP), (0.60, 0.0, _NO_CAP)),
+    # 3-2 count - full count, must protect but selective (Sprint 6 v1: 48.0%, target: 60%)
+    # In-zone: weaker reduction (0.85× from 0.70×); out-of-zone: more chase (0.80× from 0.60×)
+    (3, 2): ((0.85, 0.0, _NO_CAP), (0.80, 0.0, _NO_CAP)),
+}
+# Protect the plate with 2 strikes (but not 3-2, handled above)
+# In-zone: +15%, cap at 95%
+# Out-of-zone - PHASE 2A REFINEMENT: Increased 2-strike chase bonus for more strikeouts
+# Previous iterations: 0.15 (Sprint 1) → 0.25 (Refinement Sprint 2)
+# Multiplier (1.4×) + flat bonus (+25%) for 2-strike desperation, capped at 70%.
+# This ensures batters chase even with elite discipline (expected K% +2-3 pp)
+for _balls in range(3):
+    COUNT_SWING_ADJUSTMENTS[(_balls, 2)] = ((1.0, 0.15, 0.95), (1.4, 0.25, 0.70))
+del _balls
+
+# Counts outside the table (not reachable in a legal count) are unadjusted
+NO_COUNT_ADJUSTMENT = ((1.0, 0.0, _NO_CAP), (1.0, 0.0, _NO_CAP))
+
+
+def swing_chase_multiplier(pitch_type: str) -> float:
+    """
+    Pitch type effect on chase rate (out-of-zone pitches only).
+
+    Breaking balls fool hitters: +25% chase on sliders/curves, +15% on
+    changeups/splitters.
+    """
+    pitch_type_lower = pitch_type.lower()
+    if 'slider' in pitch_type_lower or 'curve' in pitch_type_lower:
+        return 1.25
+    elif 'change' in pitch_type_lower or 'splitter' in pitch_type_lower:
+        return 1.15
+    return 1.0
+
+
+def swing_velocity_multiplier(pitch_velocity: float) -> float:
+    """
+    Velocity effect on swing probability (faster pitches = less time to decide = more takes).
+
+    Up to -10% at 100 mph; no effect at or below 85 mph.
+    """
+    velocity_difficulty = (pitch_velocity - 85) / 15.0  # Normalized
+    if velocity_difficulty > 0:
+        return 1.0 - velocity_difficulty * 0.10
+    return 1.0
+
+
+def swing_aggression_factor(decision_latency_ms: float) -> float:
+    """
+    Map swing decision latency to aggression (faster decisions = more aggressive swings).
+
+    FIXED 2025-11-20: Corrected inverted formula
+    Previous: aggression_factor = 1.0 - (decision_latency_ms - 75) / 125
+      → 75ms gave 1.0, 200ms gave 0.0 (BACKWARDS!)
+    New: aggression_factor = (200 - decision_latency_ms) / 125
+      → 75ms gives (200-75)/125 = 1.0 (clipped to 0.9) ✓ aggressive
+      → 130ms gives (200-130)/125 = 0.56 ✓ average
+      → 200ms gives (200-200)/125 = 0.0 (clipped to 0.2) ✓ passive
+    """
+    return np.clip((200.0 - decision_latency_ms) / 125.0, 0.2, 0.9)
+
+
+def base_whiff_rate(pitch_type: str) -> float:
+    """
+    Base whiff rate per swing by pitch type (MLB Statcast).
+
+    PHASE 2A SPRINT 1 2025-11-20: Reduced breaking ball base rates based on 10-game diagnostic
+    PHASE 1.6 (2025-11-28): 33% reduction to fix K% from 31.5% to ~22%
+    162-game validation showed K/9 at 12.4 vs MLB 8.5 (46% too high)
+    This produces batting avg 0.193 vs 0.248 target and runs/game 3.62 vs 4.5
+    Root cause: Effective whiff per swing ~25-45%, need ~15-20%
+    Solution: Reduce all base whiff rates by ~33%
+    """
+    pitch_type_lower = pitch_type.lower()
+    if 'fastball' in pitch_type_lower or '4-seam' in pitch_type_lower:
+        return 0.10  # PHASE 1.6: Reduced from 0.15 (-33%)
+    elif '2-seam' in pitch_type_lower or 'sinker' in pitch_type_lower:
+        return 0.12  # PHASE 1.6: Reduced from 0.18 (-33%)
+    elif 'cutter' in pitch_type_lower:
+        return 0.12  # PHASE 1.6: Reduced from 0.18 (-33%)
+    elif 'slider' in pitch_type_lower:
+        return 0.16  # PHASE 1.6: Reduced from 0.24 (-33%)
+    elif 'curve' in pitch_type_lower:
+        return 0.14  # PHASE 1.6: Reduced from 0.21 (-33%)
+    elif 'change' in pitch_type_lower:
+        return 0.12  # PHASE 1.6: Reduced from 0.18 (-33%)
+    elif 'splitter' in pitch_type_lower:
+        return 0.18  # PHASE 1.6: Reduced from 0.27 (-33%)
+    elif 'knuckle' in pitch_type_lower:
+        return 0.28  # PHASE 1.6: Reduced from 0.40 (-30%)
+    return 0.17  # PHASE 1.6: Reduced from 0.25 (-32%)
+
+
+def whiff_velocity_multiplier(pitch_velocity: float) -> float:
+    """Velocity effect on whiffs (faster = harder to hit): up to +20% at 100 mph."""
+    velocity_difficulty = (pitch_velocity - 85) / 15.0  # Normalized
+    return 1.0 + velocity_difficulty * 0.20
+
+
+class SwingProbabilityTerms(NamedTuple):
+    """Intermediate swing probabilities from Hitter.swing_probability_terms()."""
+    base: float                  # From location (zone difficulty / distance from zone)
+    after_discipline: float
+    after_reaction: float
+    after_velocity: float
+    after_pitch_type: float
+    after_count: float
+    final: float                 # Clipped to [0, 0.98]
+    discipline_factor: float
+    decision_latency_ms: float
+    aggression_factor: float
+
+
 class Hitter:
     """
     Represents a hitter with physics-first attributes (0-100,000 scale).
@@ -487,6 +698,9 @@ class Hitter:
         # Maps pitch type to {'recognition': rating, 'contact_ability': rating, 'whiff_resistance': rating}
         self.pitch_recognition = pitch_recognition or {}
 
+        # Optional precomputed swing/whiff surface (enable_decision_surface)
+        self.decision_surface = None
+
     def get_bat_speed_mph(self) -> float:
         """
         Get bat speed in MPH.
@@ -601,18 +815,19 @@ class Hitter:
 
         return horizontal_offset, vertical_offset
 
-    def decide_to_swing(
+    def swing_probability_terms(
         self,
         pitch_location: Tuple[float, float],
         is_strike: bool,
         count: Tuple[int, int],
         pitch_velocity: float = 90.0,
         pitch_type: str = 'fastball',
-        return_diagnostics: bool = False,
-        debug_collector=None,
-    ):
+    ) -> SwingProbabilityTerms:
         """
-        Decide whether to swing at a pitch.
+        Exact swing probability for a pitch, with every intermediate step.
+
+        This is the reference implementation behind decide_to_swing(); the
+        optional DecisionSurface is validated against it.
 
         Parameters
         ----------
@@ -626,14 +841,10 @@ class Hitter:
             Pitch speed in mph (affects reaction time)
         pitch_type : str
             Type of pitch (affects chase rate)
-        return_diagnostics : bool
-            If True, return (decision, diagnostics_dict) tuple
 
         Returns
         -------
-        bool or tuple
-            If return_diagnostics=False: True if swinging, False if taking
-            If return_diagnostics=True: (decision, diagnostics) tuple
+        SwingProbabilityTerms
         """
         balls, strikes = count
 
@@ -689,153 +900,85 @@ class Hitter:
         # Swing decision latency: lower ms = faster = more aggressive
         # Map to aggression factor: 75ms (elite, fast) = 0.9, 130ms (avg) = 0.5, 200ms (slow) = 0.2
         decision_latency_ms = self.attributes.get_swing_decision_latency_ms()
-        # FIXED 2025-11-20: Corrected inverted formula
-        # Previous: aggression_factor = 1.0 - (decision_latency_ms - 75) / 125
-        #   → 75ms gave 1.0, 200ms gave 0.0 (BACKWARDS!)
-        # New: aggression_factor = (200 - decision_latency_ms) / 125
-        #   → 75ms gives (200-75)/125 = 1.0 (clipped to 0.9) ✓ aggressive
-        #   → 130ms gives (200-130)/125 = 0.56 ✓ average
-        #   → 200ms gives (200-200)/125 = 0.0 (clipped to 0.2) ✓ passive
-        aggression_factor = np.clip((200.0 - decision_latency_ms) / 125.0, 0.2, 0.9)
+        aggression_factor = swing_aggression_factor(decision_latency_ms)
         swing_prob_after_reaction = swing_prob * (0.8 + aggression_factor * 0.4)
-        swing_prob = swing_prob_after_reaction
 
         # Velocity effect (faster pitches = less time to decide = more takes)
-        velocity_difficulty = (pitch_velocity - 85) / 15.0  # Normalized
-        swing_prob_after_velocity = swing_prob
-        if velocity_difficulty > 0:
-            swing_prob_after_velocity = swing_prob * (1.0 - velocity_difficulty * 0.10)  # Up to -10% for 100 mph
-        swing_prob = swing_prob_after_velocity
+        swing_prob_after_velocity = swing_prob_after_reaction * swing_velocity_multiplier(pitch_velocity)
 
         # Pitch type affects chase rate (breaking balls fool hitters)
-        pitch_type_lower = pitch_type.lower()
-        swing_prob_after_pitch_type = swing_prob
+        swing_prob_after_pitch_type = swing_prob_after_velocity
         if not is_strike:  # Only affects out-of-zone pitches
-            if 'slider' in pitch_type_lower or 'curve' in pitch_type_lower:
-                swing_prob_after_pitch_type = swing_prob * 1.25  # +25% chase rate on breaking balls
-            elif 'change' in pitch_type_lower or 'splitter' in pitch_type_lower:
-                swing_prob_after_pitch_type = swing_prob * 1.15  # +15% chase rate on off-speed
-        swing_prob = swing_prob_after_pitch_type
-
-        # Count situation adjustments
-        swing_prob_after_count = swing_prob
-
-        # PHASE 2A SPRINT 8 2025-11-20: Further reduce early-count aggression
-        # Sprint 7 results: K% stuck at 14% despite zone rate 61.7% and whiff 29.5%
-        # Root cause: Batters putting balls in play too early, not reaching 2-strike counts
-        # Solution: MORE aggressive early-count patience to force deeper counts
-        if balls == 0 and strikes == 0:
-            # First pitch - EXTREME zone-dependent patience
-            # Sprint 7: K% 14.0%, need to push to 18-20%
-            # Target: Reduce overall 0-0 swing to ~35-40% (MLB ~47% but need deeper counts for K's)
-            if is_strike:
-                # In-zone: MUCH stronger reduction (0.55× from 0.70×)
-                # Force hitters to work count even on first-pitch strikes
-                swing_prob_after_count = swing_prob * 0.55
-            else:
-                # Out-of-zone: HIGHER chase boost to balance (2.5× from 2.0×)
-                # Maintain chase rate around 28-30%
-                swing_prob_after_count = swing_prob * 2.5
-        elif balls == 1 and strikes == 0:
-            # 1-0 count - HITTER'S COUNT, be patient
-            # Sprint 8: Force hitters to look for their pitch, not just any strike
-            if is_strike:
-                # In-zone: stronger reduction (0.65× from 0.75×)
-                # This is a hitter's count - should be very selective
-                swing_prob_after_count = swing_prob * 0.65
-            else:
-                # Out-of-zone: INCREASE chase (2.0× from 1.5×)
-                # Balance extreme in-zone patience with maintained chase
-                swing_prob_after_count = swing_prob * 2.0
-        elif balls == 0 and strikes == 1:
-            # 0-1 count - behind in count, more aggressive
-            # Sprint 6 v1: 60.3% overall (too high), 80.0% in-zone (too high), 30.3% chase (good!)
-            if is_strike:
-                # In-zone: stronger reduction (0.85× from 0.95×)
-                swing_prob_after_count = swing_prob * 0.85
-            else:
-                # Out-of-zone: 2.0× boost working well
-                swing_prob_after_count = swing_prob * 2.0
-        elif balls == 1 and strikes == 1:
-            # 1-1 count - even count, be patient but not too much
-            # Sprint 6 v1: 49.5% overall (close!), 63.9% in-zone (target: 69%), 29.5% chase (perfect!)
-            if is_strike:
-                # In-zone: stronger reduction (0.75× from 0.85×) to lower overall
-                swing_prob_after_count = swing_prob * 0.75
-            else:
-                # Out-of-zone: reduce boost (2.0× from 2.5×) - 29.5% is perfect
-                swing_prob_after_count = swing_prob * 2.0
-        elif balls == 2 and strikes == 0:
-            # 2-0 DEEP hitter's count - EXTREMELY selective
-            # Sprint 8: Near-automatic take unless perfect pitch
-            if is_strike:
-                # In-zone: MUCH stronger reduction (0.50× from 0.70×)
-                # This is a deep count - force hitters to be patient
-                swing_prob_after_count = swing_prob * 0.50
-            else:
-                # Out-of-zone: INCREASE chase slightly (1.0× from 0.5×)
-                # Balance extreme in-zone patience, allow some chase mistakes
-                swing_prob_after_count = swing_prob * 1.0
-        elif balls == 2 and strikes == 1:
-            # 2-1 count - hitter's count but not extreme
-            # Sprint 5: 55.7% overall (too high, target: 45%)
-            if is_strike:
-                # In-zone: reduction to reach target (0.75×)
-                swing_prob_after_count = swing_prob * 0.75
-            else:
-                # Out-of-zone: moderate chase allowed (1.2×)
-                swing_prob_after_count = swing_prob * 1.2
-        elif balls == 3 and strikes == 0:
-            # 3-0 count - must take unless perfect pitch
-            # Sprint 6 v1: 20.0% (too low!, target: 25%)
-            if is_strike:
-                # In-zone: be selective but not TOO selective (0.45× from 0.35×)
-                swing_prob_after_count = swing_prob * 0.45
-            else:
-                # Out-of-zone: never chase but was too strict (0.15× from 0.1×)
-                swing_prob_after_count = swing_prob * 0.15
-        elif balls == 3 and strikes == 1:
-            # 3-1 count - still very selective
-            # Sprint 6 v1: 7.1% (WAY too low!, target: 35%)
-            if is_strike:
-                # In-zone: much weaker selectivity (0.70× from 0.50×)
-                swing_prob_after_count = swing_prob * 0.70
-            else:
-                # Out-of-zone: allow some chase (0.60× from 0.3×)
-                swing_prob_after_count = swing_prob * 0.60
-        elif balls == 3 and strikes == 2:
-            # 3-2 count - full count, must protect but selective
-            # Sprint 6 v1: 48.0% (too low, target: 60%)
-            if is_strike:
-                # In-zone: weaker reduction (0.85× from 0.70×)
-                swing_prob_after_count = swing_prob * 0.85
-            else:
-                # Out-of-zone: allow more chase (0.80× from 0.60×)
-                swing_prob_after_count = swing_prob * 0.80
-        elif strikes == 2:
-            # Protect the plate with 2 strikes (but not 3-2, handled above)
-            if is_strike:
-                swing_prob_after_count = min(swing_prob + 0.15, 0.95)  # +15%, cap at 95%
-            else:
-                # PHASE 2A REFINEMENT: Increased 2-strike chase bonus for more strikeouts
-                # Previous iterations: 0.15 (Sprint 1) → 0.25 (Refinement Sprint 2)
-                # Multiplier (1.4×) + flat bonus (+25%) for 2-strike desperation
-                # This ensures batters chase even with elite discipline
-                # Expected K% increase: +2-3 percentage points
-                base_chase_after_discipline = swing_prob
-                two_strike_bonus = 0.25  # Flat +25 percentage points (was 0.15)
-                swing_prob_after_count = min(base_chase_after_discipline * 1.4 + two_strike_bonus, 0.70)
-        elif balls == 3:
-            # Other 3-ball counts (shouldn't reach here due to above logic, but safety net)
-            if not is_strike:
-                swing_prob_after_count = swing_prob * 0.5  # Much less likely to chase
-            else:
-                swing_prob_after_count = min(swing_prob, 0.85)  # Cap swing rate
+            swing_prob_after_pitch_type = swing_prob_after_velocity * swing_chase_multiplier(pitch_type)
+
+        # Count situation adjustments (see COUNT_SWING_ADJUSTMENTS)
+        in_zone, out_of_zone = COUNT_SWING_ADJUSTMENTS.get((balls, strikes), NO_COUNT_ADJUSTMENT)
+        mult, add, cap = in_zone if is_strike else out_of_zone
+        swing_prob_after_count = min(swing_prob_after_pitch_type * mult + add, cap)
+
+        return SwingProbabilityTerms(
+            base=base_swing_prob,
+            after_discipline=swing_prob_after_discipline,
+            after_reaction=swing_prob_after_reaction,
+            after_velocity=swing_prob_after_velocity,
+            after_pitch_type=swing_prob_after_pitch_type,
+            after_count=swing_prob_after_count,
+            # Clip to reasonable bounds
+            final=np.clip(swing_prob_after_count, 0.0, 0.98),
+            discipline_factor=discipline_factor,
+            decision_latency_ms=decision_latency_ms,
+            aggression_factor=aggression_factor,
+        )
+
+    def decide_to_swing(
+        self,
+        pitch_location: Tuple[float, float],
+        is_strike: bool,
+        count: Tuple[int, int],
+        pitch_velocity: float = 90.0,
+        pitch_type: str = 'fastball',
+        return_diagnostics: bool = False,
+        debug_collector=None,
+    ):
+        """
+        Decide whether to swing at a pitch.
+
+        Parameters
+        ----------
+        pitch_location : tuple
+            (horizontal_inches, vertical_inches) at plate
+        is_strike : bool
+            Whether pitch is in strike zone
+        count : tuple
+            (balls, strikes)
+        pitch_velocity : float
+            Pitch speed in mph (affects reaction time)
+        pitch_type : str
+            Type of pitch (affects chase rate)
+        return_diagnostics : bool
+            If True, return (decision, diagnostics_dict) tuple
 
-        swing_prob = swing_prob_after_count
+        Returns
+        -------
+        bool or tuple
+            If return_diagnostics=False: True if swinging, False if taking
+            If return_diagnostics=True: (decision, diagnostics) tuple
+        """
+        balls, strikes = count
 
-        # Clip to reasonable bounds
-        swing_prob = np.clip(swing_prob, 0.0, 0.98)
+        surface = self.decision_surface
+        if surface is not None and not debug_collector:
+            # Precomputed surface lookup (see enable_decision_surface)
+            swing_prob = surface.swing_probability(
+                pitch_location, is_strike, balls, strikes, pitch_velocity, pitch_type
+            )
+            aggression_factor = surface.aggression_factor
+        else:
+            terms = self.swing_probability_terms(
+                pitch_location, is_strike, count, pitch_velocity, pitch_type
+            )
+            swing_prob = terms.final
+            aggression_factor = terms.aggression_factor
 
         # Make decision
         decision = np.random.random() < swing_prob
@@ -861,16 +1004,16 @@ class Hitter:
                 pitch_z=pitch_location[1],
                 is_in_zone=is_strike,
                 distance_from_zone=distance_from_zone_inches,
-                base_swing_prob=base_swing_prob,
-                discipline_modifier=swing_prob_after_discipline - base_swing_prob,
-                reaction_modifier=swing_prob_after_reaction - swing_prob_after_discipline,
-                velocity_modifier=swing_prob_after_velocity - swing_prob_after_reaction,
-                pitch_type_modifier=swing_prob_after_pitch_type - swing_prob_after_velocity,
-                count_modifier=swing_prob_after_count - swing_prob_after_pitch_type,
+                base_swing_prob=terms.base,
+                discipline_modifier=terms.after_discipline - terms.base,
+                reaction_modifier=terms.after_reaction - terms.after_discipline,
+                velocity_modifier=terms.after_velocity - terms.after_reaction,
+                pitch_type_modifier=terms.after_pitch_type - terms.after_velocity,
+                count_modifier=terms.after_count - terms.after_pitch_type,
                 final_swing_prob=swing_prob,
                 did_swing=decision,
-                batter_discipline=discipline_factor,
-                batter_reaction_time_ms=decision_latency_ms
+                batter_discipline=terms.discipline_factor,
+                batter_reaction_time_ms=terms.decision_latency_ms
             )
 
         if return_diagnostics:
@@ -1004,6 +1147,8 @@ class Hitter:
         Calculate probability of whiffing (missing) on a swing.
 
         Based on MLB Statcast data for pitch-type specific whiff rates.
+        Uses the hitter's DecisionSurface when enabled, otherwise
+        whiff_probability_exact().
 
         Parameters
         ----------
@@ -1019,36 +1164,39 @@ class Hitter:
         float
             Probability of whiff (0.0 to 1.0)
         """
-        # Base whiff rates from MLB Statcast data
-        # PHASE 2A SPRINT 1 2025-11-20: Reduced breaking ball base rates based on 10-game diagnostic
-        # PHASE 1.6 (2025-11-28): 33% reduction to fix K% from 31.5% to ~22%
-        # 162-game validation showed K/9 at 12.4 vs MLB 8.5 (46% too high)
-        # This produces batting avg 0.193 vs 0.248 target and runs/game 3.62 vs 4.5
-        # Root cause: Effective whiff per swing ~25-45%, need ~15-20%
-        # Solution: Reduce all base whiff rates by ~33%
-        pitch_type_lower = pitch_type.lower()
-        if 'fastball' in pitch_type_lower or '4-seam' in pitch_type_lower:
-            base_whiff_rate = 0.10  # PHASE 1.6: Reduced from 0.15 (-33%)
-        elif '2-seam' in pitch_type_lower or 'sinker' in pitch_type_lower:
-            base_whiff_rate = 0.12  # PHASE 1.6: Reduced from 0.18 (-33%)
-        elif 'cutter' in pitch_type_lower:
-            base_whiff_rate = 0.12  # PHASE 1.6: Reduced from 0.18 (-33%)
-        elif 'slider' in pitch_type_lower:
-            base_whiff_rate = 0.16  # PHASE 1.6: Reduced from 0.24 (-33%)
-        elif 'curve' in pitch_type_lower:
-            base_whiff_rate = 0.14  # PHASE 1.6: Reduced from 0.21 (-33%)
-        elif 'change' in pitch_type_lower:
-            base_whiff_rate = 0.12  # PHASE 1.6: Reduced from 0.18 (-33%)
-        elif 'splitter' in pitch_type_lower:
-            base_whiff_rate = 0.18  # PHASE 1.6: Reduced from 0.27 (-33%)
-        elif 'knuckle' in pitch_type_lower:
-            base_whiff_rate = 0.28  # PHASE 1.6: Reduced from 0.40 (-30%)
-        else:
-            base_whiff_rate = 0.17  # PHASE 1.6: Reduced from 0.25 (-32%)
+        surface = self.decision_surface
+        if surface is not None:
+            return surface.whiff_probability(pitch_velocity, pitch_type, pitch_break)
+        return self.whiff_probability_exact(pitch_velocity, pitch_type, pitch_break)
+
+    def whiff_probability_exact(
+        self,
+        pitch_velocity: float,
+        pitch_type: str,
+        pitch_break: Tuple[float, float],
+    ) -> float:
+        """
+        Exact whiff probability (reference for calculate_whiff_probability).
+
+        Parameters
+        ----------
+        pitch_velocity : float
+            Pitch speed in mph
+        pitch_type : str
+            Type of pitch
+        pitch_break : tuple
+            (vertical_break_inches, horizontal_break_inches)
+
+        Returns
+        -------
+        float
+            Probability of whiff (0.0 to 1.0)
+        """
+        # Base whiff rates from MLB Statcast data (see base_whiff_rate)
+        base_rate = base_whiff_rate(pitch_type)
 
         # Velocity effect (faster = harder to hit)
-        velocity_difficulty = (pitch_velocity - 85) / 15.0  # Normalized
-        velocity_factor = 1.0 + velocity_difficulty * 0.20  # Up to +20% for 100 mph
+        velocity_factor = whiff_velocity_multiplier(pitch_velocity)
 
         # Break effect (more movement = more whiffs)
         v_break, h_break = pitch_break
@@ -1073,13 +1221,44 @@ class Hitter:
         pitch_contact_mult = self.get_pitch_contact_multiplier(pitch_type)
 
         # Combine factors (using VISION instead of barrel accuracy)
-        whiff_prob = base_whiff_rate * velocity_factor * break_factor * vision_factor * pitch_contact_mult
+        whiff_prob = base_rate * velocity_factor * break_factor * vision_factor * pitch_contact_mult
 
         # Clip to reasonable bounds (5% minimum, 70% maximum)
         whiff_prob = np.clip(whiff_prob, 0.05, 0.70)
 
         return whiff_prob
 
+    def enable_decision_surface(self, validate: bool = False):
+        """
+        Build (or reuse) this hitter's precomputed DecisionSurface.
+
+        Once enabled, decide_to_swing() and calculate_whiff_probability()
+        sample the surface instead of evaluating every modifier per pitch.
+        The surface is rebuilt automatically if the hitter's attributes change.
+
+        Parameters
+        ----------
+        validate : bool
+            Also evaluate the exact functions on every lookup and track the
+            largest difference (DecisionSurface.validation_report())
+
+        Returns
+        -------
+        DecisionSurface
+        """
+        from .decision_surface import DecisionSurface
+
+        surface = self.decision_surface
+        if surface is None:
+            surface = DecisionSurface(self)
+            self.decision_surface = surface
+        surface.validate = validate
+        return surface
+
+    def disable_decision_surface(self):
+        """Go back to the exact swing/whiff functions."""
+        self.decision_surface = None
+
     def __repr__(self):
         bat_speed = self.attributes.get_bat_speed_mph()
         attack_angle = self.attributes.get_attack_angle_mean_deg()
@@ -27,6 +27,7 @@ import json
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from batted_ball.concurrency import ConcurrencyBudget
 from batted_ball.schedule_loader import ScheduleLoader, ScheduledGame
 from batted_ball.database.team_loader import TeamLoader
 from batted_ball.database.team_mappings import TEAM_DIVISIONS, get_team_division
@@ -34,6 +35,7 @@ from batted_ball.game_simulation import GameSimulator
 from batted_ball.stats_integration import StatsEnabledGameSimulator, StatsTrackingMode
 from batted_ball.series_metrics import SeriesMetrics
 from batted_ball.constants import SimulationMode
+from batted_ball.performance import PhaseProfiler
 
 
 # Ballpark mapping for home teams
@@ -68,6 +70,9 @@ class GameResult:
     away_exit_velocities: List[float] = field(default_factory=list)
     away_launch_angles: List[float] = field(default_factory=list)
     away_errors: int = 0
+    away_ground_ball_outs: int = 0
+    away_fly_ball_outs: int = 0
+    away_line_drive_outs: int = 0
     
     # Batting stats - Home
     home_hits: int = 0
@@ -84,6 +89,9 @@ class GameResult:
     home_exit_velocities: List[float] = field(default_factory=list)
     home_launch_angles: List[float] = field(default_factory=list)
     home_errors: int = 0
+    home_ground_ball_outs: int = 0
+    home_fly_ball_outs: int = 0
+    home_line_drive_outs: int = 0
     
     # Game totals
     total_pitches: int = 0
@@ -95,6 +103,9 @@ class GameResult:
     away_player_pitching: List[Dict[str, Any]] = field(default_factory=list)
     home_player_pitching: List[Dict[str, Any]] = field(default_factory=list)
     
+    # Phase profiler snapshot (empty unless phase profiling is enabled)
+    phase_profile: Dict[str, Any] = field(default_factory=dict)
+    
     @property
     def winner(self) -> str:
         return self.away_team if self.away_score > self.home_score else self.home_team
@@ -292,14 +303,15 @@ def _simulate_game_worker(args: Tuple) -> Optional[GameResult]:
     Parameters
     ----------
     args : tuple
-        (game_date, away_abbr, home_abbr, season)
+        (game_date, away_abbr, home_abbr, season[, profile_phases])
     
     Returns
     -------
     GameResult or None
         Game result if successful
     """
-    game_date, away_abbr, home_abbr, season = args
+    game_date, away_abbr, home_abbr, season = args[:4]
+    profile_phases = args[4] if len(args) > 4 else False
     
     # Look up team names
     away_info = _get_team_name_from_db(away_abbr, season)
@@ -357,7 +369,8 @@ def _simulate_game_worker(args: Tuple) -> Optional[GameResult]:
         ballpark=ballpark,
         wind_enabled=True,
         starter_innings=5,
-        simulation_mode=SimulationMode.ULTRA_FAST
+        simulation_mode=SimulationMode.ULTRA_FAST,
+        profiler=PhaseProfiler() if profile_phases else None,
     )
     
     # Simulate game
@@ -388,38 +401,12 @@ def _simulate_game_worker(args: Tuple) -> Optional[GameResult]:
         date=game_date,
         away_team=away_abbr,
         home_team=home_abbr,
-        away_score=final_state.away_score,
-        home_score=final_state.home_score,
-        # Away batting stats
-        away_hits=final_state.away_hits,
-        away_singles=final_state.away_singles,
-        away_doubles=final_state.away_doubles,
-        away_triples=final_state.away_triples,
-        away_home_runs=final_state.away_home_runs,
-        away_strikeouts=final_state.away_strikeouts,
-        away_walks=final_state.away_walks,
-        away_at_bats=final_state.away_at_bats,
-        away_ground_balls=final_state.away_ground_balls,
-        away_line_drives=final_state.away_line_drives,
-        away_fly_balls=final_state.away_fly_balls,
+        # Per-team counters (score, hits, ..., batted ball outs) in one copy
+        **final_state.export_counters(),
         away_exit_velocities=list(final_state.away_exit_velocities),
         away_launch_angles=list(final_state.away_launch_angles),
-        away_errors=final_state.away_errors,
-        # Home batting stats
-        home_hits=final_state.home_hits,
-        home_singles=final_state.home_singles,
-        home_doubles=final_state.home_doubles,
-        home_triples=final_state.home_triples,
-        home_home_runs=final_state.home_home_runs,
-        home_strikeouts=final_state.home_strikeouts,
-        home_walks=final_state.home_walks,
-        home_at_bats=final_state.home_at_bats,
-        home_ground_balls=final_state.home_ground_balls,
-        home_line_drives=final_state.home_line_drives,
-        home_fly_balls=final_state.home_fly_balls,
         home_exit_velocities=list(final_state.home_exit_velocities),
         home_launch_angles=list(final_state.home_launch_angles),
-        home_errors=final_state.home_errors,
         # Game totals
         total_pitches=final_state.total_pitches,
         # Player-level stats
@@ -427,6 +414,7 @@ def _simulate_game_worker(args: Tuple) -> Optional[GameResult]:
         home_player_batting=home_batting,
         away_player_pitching=away_pitching,
         home_player_pitching=home_pitching,
+        phase_profile=sim.profiler.snapshot() if sim.profiler is not None else {},
     )
 
 
@@ -449,6 +437,8 @@ class SeasonSimulator:
         verbose: bool = True,
         stats_db: Optional['StatsDatabase'] = None,
         stats_season_id: Optional[int] = None,
+        profile_phases: bool = False,
+        concurrency: Optional[ConcurrencyBudget] = None,
     ):
         """
         Initialize the season simulator.
@@ -467,10 +457,20 @@ class SeasonSimulator:
             Statistics database for recording player stats
         stats_season_id : int, optional
             Season ID in stats database (required if stats_db provided)
+        profile_phases : bool
+            Record per-phase timers/counters in every game and report a
+            per-game breakdown at the end of simulate_range (default: False)
+        concurrency : ConcurrencyBudget, optional
+            Worker processes and native threads per worker; overrides
+            num_workers (default: num_workers processes sharing the cores)
         """
         self.schedule = ScheduleLoader(schedule_path)
         self.season = season
-        self.num_workers = num_workers or max(1, cpu_count() - 1)
+        if concurrency is not None:
+            self.num_workers = concurrency.processes
+        else:
+            self.num_workers = num_workers or max(1, cpu_count() - 1)
+        self.concurrency = concurrency or ConcurrencyBudget.for_processes(self.num_workers)
         self.verbose = verbose
         
         # Stats tracking
@@ -489,6 +489,10 @@ class SeasonSimulator:
         # Aggregate series metrics across all games
         self.series_metrics = SeriesMetrics()
         
+        # Phase profiling merged from worker processes
+        self.profile_phases = profile_phases
+        self.phase_profiler = PhaseProfiler() if profile_phases else None
+        
         # Track which teams are in database
         self._available_teams: Optional[set] = None
     
@@ -537,13 +541,16 @@ class SeasonSimulator:
         
         # Prepare arguments for parallel simulation
         game_args = [
-            (game_date, g.away_team, g.home_team, self.season)
+            (game_date, g.away_team, g.home_team, self.season, self.profile_phases)
             for g in playable
         ]
         
         # Run games in parallel
         results = []
-        with ProcessPoolExecutor(max_workers=min(self.num_workers, len(game_args))) as executor:
+        with ProcessPoolExecutor(
+            max_workers=min(self.num_workers, len(game_args)),
+            **self.concurrency.pool_kwargs(),
+        ) as executor:
             futures = [executor.submit(_simulate_game_worker, args) for args in game_args]
             
             for future in as_completed(futures):
@@ -558,6 +565,9 @@ class SeasonSimulator:
                     # Update series metrics (GameResult has same attributes as GameState)
                     self.series_metrics.update_from_game(result)
                     
+                    if self.phase_profiler is not None:
+                        self.phase_profiler.merge(result.phase_profile)
+                    
                     # Record to stats database if enabled
                     if self.stats_db and self.stats_season_id:
                         self._record_game_to_stats_db(result)
@@ -641,7 +651,7 @@ class SeasonSimulator:
         
         elapsed = time.time() - start_time
         
-        return {
+        summary = {
             'start_date': start_date,
             'end_date': end_date,
             'game_days': len(dates),
@@ -650,6 +660,13 @@ class SeasonSimulator:
             'elapsed_seconds': elapsed,
             'games_per_second': total_games / elapsed if elapsed > 0 else 0,
         }
+        
+        if self.phase_profiler is not None:
+            summary['phase_breakdown'] = self.phase_profiler.get_breakdown()
+            if self.verbose:
+                self.phase_profiler.print_breakdown()
+        
+        return summary
     
     def simulate_season(self, progress_callback: Optional[callable] = None) -> Dict[str, Any]:
         """
@@ -2342,6 +2342,75 @@ class SimMetricsCollector:
                     })
 
 
+class NullMetricsCollector:
+    """
+    No-op stand-in for SimMetricsCollector when debug_level is OFF.
+
+    Holds no storage and no per-team tables, and every record_* method is an
+    empty call. Simulators should still gate on ``enabled`` so that the
+    PitchMetrics/BattedBallMetrics dataclasses (and their __post_init__
+    zone and expected-stat calculations) are never constructed.
+
+    Use ``create_metrics_collector()`` rather than instantiating directly;
+    a single shared instance is returned for the OFF level.
+    """
+
+    __slots__ = ()
+
+    debug_level = DebugLevel.OFF
+    enabled = False
+
+    def record_pitch(self, metrics):
+        pass
+
+    def record_swing_decision(self, metrics):
+        pass
+
+    def record_batted_ball(self, metrics):
+        pass
+
+    def record_fielding(self, metrics):
+        pass
+
+    def record_baserunning(self, metrics):
+        pass
+
+    def record_fatigue(self, metrics):
+        pass
+
+    def record_expected_outcome(self, metrics):
+        pass
+
+    def print_summary(self):
+        pass
+
+    def export_csv(self, filename: str):
+        pass
+
+
+NULL_METRICS_COLLECTOR = NullMetricsCollector()
+
+
+def create_metrics_collector(debug_level: DebugLevel = DebugLevel.OFF):
+    """
+    Create a metrics collector for the given debug level.
+
+    Parameters
+    ----------
+    debug_level : DebugLevel
+        Verbosity level for output
+
+    Returns
+    -------
+    SimMetricsCollector or NullMetricsCollector
+        The shared NULL_METRICS_COLLECTOR when debug_level is OFF,
+        otherwise a new SimMetricsCollector
+    """
+    if debug_level == DebugLevel.OFF:
+        return NULL_METRICS_COLLECTOR
+    return SimMetricsCollector(debug_level=debug_level)
+
+
 # ============================================================================
 # H. CONVENIENCE FUNCTIONS
 # ============================================================================
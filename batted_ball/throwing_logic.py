@@ -9,8 +9,8 @@ import numpy as np
 from typing import Dict, Optional
 
 from .constants import CLOSE_PLAY_TOLERANCE, SAFE_RUNNER_BIAS
-from .field_layout import FieldLayout, FieldPosition
-from .fielding import Fielder, simulate_fielder_throw
+from .field_layout import BASE_INDEX, FieldLayout, FieldPosition
+from .fielding import Fielder, throw_arrival_times
 from .baserunning import BaseRunner, BaserunningSimulator, detect_force_situation, get_force_base
 
 
@@ -76,6 +76,17 @@ class ThrowingLogic:
         self.field_layout = field_layout
         self.baserunning_simulator = baserunning_simulator
 
+    @staticmethod
+    def _throw_arrival(fielder: Fielder, arrival_times: np.ndarray, to_base: str) -> float:
+        """
+        Arrival time of one throw, as simulate_fielder_throw() would report it.
+
+        Takes the precomputed transfer + flight time to to_base from a row of
+        throw_arrival_times() and adds a freshly drawn handling penalty.
+        """
+        _, handling_penalty = fielder.throw_parameters.draw_accuracy()
+        return arrival_times[BASE_INDEX[to_base]] + handling_penalty
+
     def should_throw_to_first(self, ball_time: float, batter_runner: BaseRunner) -> bool:
         """Determine if fielder should throw to first base."""
         if not batter_runner:
@@ -134,17 +145,20 @@ class ThrowingLogic:
 
                 from_base, to_base, runner = force_targets[0]
 
-                # Get fielder position
+                # Throw times from the fielder (row 0) and from each base
+                # (rows 1-4) cover the force throw and the relay in one call
                 fielder_pos = fielder.current_position
-                ball_position = FieldPosition(fielder_pos.x, fielder_pos.y, 0)
+                throw_positions = np.vstack([(fielder_pos.x, fielder_pos.y),
+                                             self.field_layout.base_coordinates])
+                throw_times = throw_arrival_times(fielder, throw_positions, self.field_layout)
 
                 # Simulate throw to force base
-                throw = simulate_fielder_throw(fielder, ball_position, to_base, self.field_layout)
+                force_throw_time = self._throw_arrival(fielder, throw_times[0], to_base)
 
                 # Calculate runner arrival time
                 runner_time = runner.calculate_time_to_base(from_base, to_base, include_leadoff=False)
                 runner_arrival = release_time + runner_time
-                throw_arrival = release_time + throw.arrival_time
+                throw_arrival = release_time + force_throw_time
 
                 # Check if we get the force out
                 time_diff = runner_arrival - throw_arrival
@@ -159,21 +173,17 @@ class ThrowingLogic:
                     if result.outs_made < 2:
                         # Try to turn double play
                         # Relay throw to first
-                        relay_position = self.field_layout.get_base_position(to_base)
-                        relay_ball_pos = FieldPosition(relay_position.x, relay_position.y, 0)
-                        relay_throw = simulate_fielder_throw(
-                            fielder,  # Use original fielder's arm (approximation)
-                            relay_ball_pos,
-                            "first",
-                            self.field_layout
+                        # Use original fielder's arm (approximation)
+                        relay_throw_time = self._throw_arrival(
+                            fielder, throw_times[1 + BASE_INDEX[to_base]], "first"
                         )
 
                         # Relay throw from force base to first
                         # Time breakdown:
                         # 1. throw_arrival = when ball arrives at force base
-                        # 2. relay_throw.arrival_time = transfer + flight for relay throw
+                        # 2. relay_throw_time = transfer + flight for relay throw
                         # 3. No additional receive time needed (already in transfer_time)
-                        relay_time = throw_arrival + relay_throw.arrival_time
+                        relay_time = throw_arrival + relay_throw_time
 
                         # Check if batter is out
                         batter_time_to_first = batter_runner.calculate_time_to_base("home", "first", include_leadoff=False)
@@ -200,6 +210,7 @@ class ThrowingLogic:
                             # Double play!
                             result.outcome = PlayOutcome.DOUBLE_PLAY
                             result.outs_made = 2
+                            result.primary_fielder = fielder
                             result.add_event(PlayEvent(
                                 relay_time, "double_play",
                                 f"Double play! {fielder.position} to {to_base} to first"
@@ -287,6 +298,7 @@ class ThrowingLogic:
             outcome = "out"
             result.outcome = PlayOutcome.GROUND_OUT
             result.outs_made = 1
+            result.primary_fielder = fielder
             self.baserunning_simulator.remove_runner("home")
 
         result.add_event(PlayEvent(
@@ -335,15 +347,18 @@ class ThrowingLogic:
         base_priority = {"third": 3, "second": 2, "first": 1}
         force_targets.sort(key=lambda x: base_priority.get(x[0], 0), reverse=True)
 
+        # Transfer + flight time to every base from where the ball was fielded
+        throw_times = throw_arrival_times(fielder, ball_position, self.field_layout)[0]
+
         force_result = None
         for from_base, to_base, runner in force_targets:
             # Simulate throw to force base
-            throw = simulate_fielder_throw(fielder, ball_position, to_base, self.field_layout)
+            throw_time = self._throw_arrival(fielder, throw_times, to_base)
 
             # Calculate runner arrival time
             runner_time = runner.calculate_time_to_base(from_base, to_base, include_leadoff=False)
             runner_arrival = fielding_time + runner_time
-            throw_arrival = fielding_time + throw.arrival_time
+            throw_arrival = fielding_time + throw_time
 
             # Check if we get the out
             time_diff = runner_arrival - throw_arrival
@@ -395,11 +410,12 @@ class ThrowingLogic:
         pivot_position = self.field_layout.get_base_position(force_base)
 
         # Simulate relay throw to first
-        relay_throw = simulate_fielder_throw(fielder, pivot_position, "first", self.field_layout)
+        pivot_times = throw_arrival_times(fielder, pivot_position, self.field_layout)[0]
+        relay_throw_time = self._throw_arrival(fielder, pivot_times, "first")
 
         # Add small relay time penalty (fielder needs to catch, turn, throw)
         relay_penalty = 0.3  # 0.3s to receive and relay
-        throw2_arrival = throw1_arrival + relay_penalty + relay_throw.arrival_time
+        throw2_arrival = throw1_arrival + relay_penalty + relay_throw_time
 
         # Get batter-runner timing to first
         batter_runner = self.baserunning_simulator.get_runner_at_base("home")
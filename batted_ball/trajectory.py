@@ -25,6 +25,7 @@ from .constants import (
 from .environment import Environment
 from .aerodynamics import AerodynamicForces, create_spin_axis
 from .integrator import integrate_trajectory, create_initial_state
+from .trajectory_spline import TrajectorySpline
 
 # Phase 7: Import FastTrajectorySimulator for Rust-accelerated path
 from .fast_trajectory import FastTrajectorySimulator, RUST_AVAILABLE
@@ -33,7 +34,15 @@ from .fast_trajectory import FastTrajectorySimulator, RUST_AVAILABLE
 class BattedBallResult:
     """
     Container for batted ball simulation results.
+
+    Uses __slots__ for memory efficiency and faster attribute access.
+    Landing point, peak and final velocity are derived from the
+    trajectory on first access and cached, so results whose summary
+    quantities are never read do not pay for them.
     """
+    __slots__ = ('trajectory_data', 'initial_conditions', 'environment',
+                 'time', 'position', 'velocity', '_spline',
+                 '_landing', '_peak', '_final_velocity')
 
     def __init__(self, trajectory_data, initial_conditions, environment):
         """
@@ -57,43 +66,127 @@ class BattedBallResult:
         self.position = trajectory_data['position']  # Nx3 array in meters
         self.velocity = trajectory_data['velocity']  # Nx3 array in m/s
 
-        # Calculate derived quantities
-        self._calculate_results()
+        # Cubic Hermite spline of the arrays, built on first use by spline
+        self._spline = None
+
+        # Derived quantities, calculated on first access
+        self._landing = None
+        self._peak = None
+        self._final_velocity = None
+
+    def _calculate_landing(self):
+        """
+        Landing point, distance and spray angle from the last trajectory point.
 
-    def _calculate_results(self):
-        """Calculate derived quantities from trajectory."""
-        # Landing point (last point in trajectory)
+        Returns
+        -------
+        tuple
+            (landing_x, landing_y, landing_z, distance, spray_angle_landing)
+            in feet and degrees
+        """
         landing_pos = self.position[-1]
-        
+
         # Coordinate system conversion:
         # Integrator uses: x=toward outfield, y=lateral (left field positive), z=up
         # Field layout uses: x=lateral (right field positive), y=toward center field, z=up
         # Therefore: field_x = -integrator_y, field_y = integrator_x
-        self.landing_x = -landing_pos[1] * METERS_TO_FEET  # Negate for right-handed coords
-        self.landing_y = landing_pos[0] * METERS_TO_FEET   # Toward center field
-        self.landing_z = landing_pos[2] * METERS_TO_FEET   # Up
+        landing_x = -landing_pos[1] * METERS_TO_FEET  # Negate for right-handed coords
+        landing_y = landing_pos[0] * METERS_TO_FEET   # Toward center field
+        landing_z = landing_pos[2] * METERS_TO_FEET   # Up
 
         # Distance from home plate (horizontal distance)
-        self.distance = np.sqrt(landing_pos[0]**2 + landing_pos[1]**2) * METERS_TO_FEET
-
-        # Flight time
-        self.flight_time = self.time[-1]
-
-        # Peak height
-        max_z_index = np.argmax(self.position[:, 2])
-        self.peak_height = self.position[max_z_index, 2] * METERS_TO_FEET
-        self.time_to_peak = self.time[max_z_index]
-
-        # Final velocity
-        final_vel = self.velocity[-1]
-        self.final_velocity = np.linalg.norm(final_vel) * MS_TO_MPH
+        distance = np.sqrt(landing_pos[0]**2 + landing_pos[1]**2) * METERS_TO_FEET
 
         # Spray angle at landing (using FIELD coordinates for consistency)
         # Convention: 0° = center field, positive = right field, negative = left field
         # This matches ballpark.py which has left field fences at negative angles
-        self.spray_angle_landing = np.rad2deg(
-            np.arctan2(self.landing_x, self.landing_y)
-        )
+        spray_angle_landing = np.rad2deg(np.arctan2(landing_x, landing_y))
+
+        return landing_x, landing_y, landing_z, distance, spray_angle_landing
+
+    @property
+    def _landing_values(self):
+        if self._landing is None:
+            self._landing = self._calculate_landing()
+        return self._landing
+
+    @property
+    def landing_x(self):
+        """Landing x in field coordinates in feet (right field positive)."""
+        return self._landing_values[0]
+
+    @property
+    def landing_y(self):
+        """Landing y in field coordinates in feet (toward center field)."""
+        return self._landing_values[1]
+
+    @property
+    def landing_z(self):
+        """Landing height in feet."""
+        return self._landing_values[2]
+
+    @property
+    def distance(self):
+        """Horizontal distance from home plate at landing in feet."""
+        return self._landing_values[3]
+
+    @property
+    def spray_angle_landing(self):
+        """Spray angle of the landing point in degrees (0 = center field, positive = right field)."""
+        return self._landing_values[4]
+
+    @property
+    def flight_time(self):
+        """Flight time in seconds."""
+        return self.time[-1]
+
+    @property
+    def _peak_values(self):
+        if self._peak is None:
+            max_z_index = np.argmax(self.position[:, 2])
+            self._peak = (self.position[max_z_index, 2] * METERS_TO_FEET, self.time[max_z_index])
+        return self._peak
+
+    @property
+    def peak_height(self):
+        """Peak height in feet."""
+        return self._peak_values[0]
+
+    @property
+    def time_to_peak(self):
+        """Time of the peak height in seconds."""
+        return self._peak_values[1]
+
+    @property
+    def final_velocity(self):
+        """Speed at landing in mph."""
+        if self._final_velocity is None:
+            self._final_velocity = np.linalg.norm(self.velocity[-1]) * MS_TO_MPH
+        return self._final_velocity
+
+    @property
+    def spline(self) -> TrajectorySpline:
+        """Compact cubic Hermite spline of the trajectory for position-at-time queries."""
+        if self._spline is None:
+            self._spline = TrajectorySpline(self.time, self.position, self.velocity)
+        return self._spline
+
+    def drop_raw_trajectory(self):
+        """
+        Release the integrator's per-step arrays, keeping only the spline.
+
+        For long runs that hold on to many results. Afterwards time,
+        position and velocity hold the spline knots (every 20 ms plus
+        launch and landing), so endpoints and spline queries are unchanged.
+        """
+        # The peak needs the raw samples, so cache it before they go
+        self._peak = self._peak_values
+        spline = self.spline
+        self.time = spline.knot_times
+        self.position = spline.knot_positions
+        self.velocity = spline.knot_velocities
+        self.trajectory_data = dict(self.trajectory_data, time=self.time,
+                                    position=self.position, velocity=self.velocity)
 
     @property
     def exit_velocity(self):
@@ -163,39 +256,12 @@ class BattedBallResult:
         float
             Height in feet at that distance, or None if ball never reached that distance
         """
-        # Calculate horizontal distance at each point in trajectory
-        horizontal_distances = np.sqrt(
-            self.position[:, 0]**2 + self.position[:, 1]**2
-        ) * METERS_TO_FEET
-
-        # Find if ball reached this distance
-        if horizontal_distances[-1] < distance_ft:
+        # Solved on the spline rather than interpolated between raw samples
+        crossing = self.spline.fence_crossing(distance_ft)
+        if crossing is None:
             # Ball landed before reaching this distance
             return None
-
-        # Find the point where ball crosses this distance
-        # Use interpolation for accuracy
-        idx = np.where(horizontal_distances >= distance_ft)[0]
-        if len(idx) == 0:
-            return None
-
-        first_idx = idx[0]
-
-        if first_idx == 0:
-            # Ball starts at or past this distance (shouldn't happen)
-            return self.position[0, 2] * METERS_TO_FEET
-
-        # Interpolate between the point before and after crossing
-        d1 = horizontal_distances[first_idx - 1]
-        d2 = horizontal_distances[first_idx]
-        h1 = self.position[first_idx - 1, 2] * METERS_TO_FEET
-        h2 = self.position[first_idx, 2] * METERS_TO_FEET
-
-        # Linear interpolation
-        fraction = (distance_ft - d1) / (d2 - d1)
-        height = h1 + fraction * (h2 - h1)
-
-        return height
+        return crossing[1]
 
 
 class BattedBallSimulator:
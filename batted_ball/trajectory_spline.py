@@ -0,0 +1,200 @@
+"""
+Piecewise cubic Hermite representation of batted ball trajectories.
+
+The integrator stores positions and velocities every 1 ms. Fielding code
+only ever needs the ball position at arbitrary times and the point where
+the ball crosses the fence, so a trajectory is resampled once onto a
+coarse uniform knot grid and stored as one cubic per segment:
+
+- Knots every TRAJECTORY_SPLINE_DT seconds (plus one at landing), with
+  values taken from the integrator's own positions and velocities
+- Position at time t is an index computation and a Horner evaluation,
+  no search over the raw samples
+- Hermite interpolation with the true velocities keeps the error well
+  below the linear interpolation on 1 ms samples it replaces
+
+All quantities are in the integrator's units and coordinates (meters,
+seconds, x toward the outfield, y lateral, z up).
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .constants import METERS_TO_FEET, TRAJECTORY_SPLINE_DT
+
+
+def _hermite_coefficients(p0, m0, p1, m1, durations):
+    """
+    Power-basis coefficients of the cubic Hermite segments.
+
+    Each segment is p(s) = a + s*(b + s*(c + s*d)) for s in [0, 1], where
+    p0/p1 are the end positions and m0/m1 the end velocities.
+
+    Returns
+    -------
+    np.ndarray
+        (4, K, 3) coefficients a, b, c, d of every segment
+    """
+    h = durations[:, None]
+    coefficients = np.empty((4, len(durations), 3))
+    a, b, c, d = coefficients
+    a[...] = p0
+    np.multiply(h, m0, out=b)
+    end_slope = h * m1
+    chord = p1 - p0
+    np.subtract(3.0 * chord - end_slope, 2.0 * b, out=c)
+    np.subtract(b + end_slope, 2.0 * chord, out=d)
+    return coefficients
+
+
+class TrajectorySpline:
+    """
+    Compact cubic Hermite spline of one batted ball trajectory.
+
+    Uses __slots__ for memory efficiency and faster attribute access.
+    Built from the integrator's samples by BattedBallResult.spline; with
+    one knot per 20 samples it takes about a seventh of the memory of the
+    raw 1 ms time/position/velocity arrays.
+
+    Parameters
+    ----------
+    time : np.ndarray
+        (N,) sample times in seconds, starting at 0
+    position : np.ndarray
+        (N, 3) positions in meters
+    velocity : np.ndarray
+        (N, 3) velocities in m/s
+    knot_dt : float
+        Knot spacing in seconds
+    """
+    __slots__ = ('knot_dt', 'knot_times', 'knot_positions', 'knot_velocities',
+                 'durations', 'coefficients')
+
+    def __init__(self, time, position, velocity, knot_dt: float = TRAJECTORY_SPLINE_DT):
+        time = np.asarray(time, dtype=float)
+        position = np.asarray(position, dtype=float)
+        velocity = np.asarray(velocity, dtype=float)
+        self.knot_dt = knot_dt
+
+        # The integrator keeps its below-ground overshoot step before the
+        # interpolated landing sample; interior knots are searched in the
+        # time-ordered samples before that landing sample
+        flight_time = time[-1]
+        n_ordered = len(time) - 1 if len(time) > 2 and time[-2] > flight_time else len(time)
+
+        # Uniform knots strictly before landing, then the landing sample itself
+        n_uniform = max(int(math.ceil(flight_time / knot_dt)), 1)
+        interior = np.arange(1, n_uniform) * knot_dt
+        interior = interior[interior < flight_time]
+
+        # Knot values from the raw samples bracketing each interior knot
+        upper = np.clip(np.searchsorted(time[:n_ordered], interior, side='right'), 1, max(n_ordered - 1, 1))
+        lower = upper - 1
+        raw_durations = time[upper] - time[lower]
+        a, b, c, d = _hermite_coefficients(position[lower], velocity[lower], position[upper],
+                                           velocity[upper], raw_durations)
+        s = ((interior - time[lower]) / raw_durations)[:, None]
+        interior_positions = a + s * (b + s * (c + s * d))
+        interior_velocities = (b + s * (2.0 * c + s * 3.0 * d)) / raw_durations[:, None]
+
+        self.knot_times = np.concatenate([[time[0]], interior, [flight_time]])
+        self.knot_positions = np.vstack([position[:1], interior_positions, position[-1:]])
+        self.knot_velocities = np.vstack([velocity[:1], interior_velocities, velocity[-1:]])
+
+        # A single-sample trajectory gives one zero-length segment that stays at its start
+        durations = np.diff(self.knot_times)
+        durations[durations <= 0.0] = 1.0
+        self.durations = durations
+        self.coefficients = _hermite_coefficients(
+            self.knot_positions[:-1], self.knot_velocities[:-1],
+            self.knot_positions[1:], self.knot_velocities[1:], durations
+        )
+
+    @property
+    def flight_time(self) -> float:
+        """Time of the last knot (landing) in seconds."""
+        return self.knot_times[-1]
+
+    def _segment(self, t: float) -> Tuple[int, float]:
+        """Segment index containing time t (clamped to the flight) and the local parameter s."""
+        k = int(t / self.knot_dt) if t > 0.0 else 0
+        k = min(k, len(self.durations) - 1)
+        return k, (t - self.knot_times[k]) / self.durations[k]
+
+    def position(self, t: float) -> Tuple[float, float, float]:
+        """
+        Position (x, y, z) at time t in meters.
+
+        Same values as positions([t])[0]; times outside the flight are
+        extrapolated from the first or last segment.
+        """
+        k, s = self._segment(t)
+        s = float(s)
+        a, b, c, d = self.coefficients[:, k].tolist()
+        return tuple(a[i] + s * (b[i] + s * (c[i] + s * d[i])) for i in range(3))
+
+    def positions(self, times) -> np.ndarray:
+        """
+        Positions at many times in meters.
+
+        Parameters
+        ----------
+        times : array-like
+            (T,) times in seconds
+
+        Returns
+        -------
+        np.ndarray
+            (T, 3) positions
+        """
+        times = np.asarray(times, dtype=float)
+        k = np.minimum((np.maximum(times, 0.0) / self.knot_dt).astype(int), len(self.durations) - 1)
+        a, b, c, d = self.coefficients[:, k]
+        s = ((times - self.knot_times[k]) / self.durations[k])[:, None]
+        return a + s * (b + s * (c + s * d))
+
+    def velocity(self, t: float) -> np.ndarray:
+        """Velocity at time t in m/s (derivative of the spline)."""
+        k, s = self._segment(t)
+        _, b, c, d = self.coefficients[:, k]
+        return (b + s * (2.0 * c + s * 3.0 * d)) / self.durations[k]
+
+    def fence_crossing(self, distance_ft: float) -> Optional[Tuple[float, float]]:
+        """
+        When and how high the ball first reaches a horizontal distance.
+
+        Parameters
+        ----------
+        distance_ft : float
+            Horizontal distance from home plate in feet (e.g. the fence)
+
+        Returns
+        -------
+        tuple or None
+            (time_s, height_ft) at the crossing, or None if the ball lands
+            short of distance_ft
+        """
+        distance_m = distance_ft / METERS_TO_FEET
+        knots = self.knot_positions
+        reach = np.hypot(knots[:, 0], knots[:, 1])
+        if reach[-1] < distance_m:
+            return None
+
+        k = int(np.argmax(reach >= distance_m))
+        if k == 0:
+            return self.knot_times[0], knots[0, 2] * METERS_TO_FEET
+
+        # Newton on the horizontal distance within segment k-1, from the chord estimate
+        k -= 1
+        _, b, c, d = self.coefficients[:, k]
+        s = (distance_m - reach[k]) / (reach[k + 1] - reach[k])
+        for _ in range(4):
+            x, y, _ = self.position(self.knot_times[k] + s * self.durations[k])
+            dx, dy, _ = b + s * (2.0 * c + s * 3.0 * d)
+            r = math.hypot(x, y)
+            s = min(max(s - (r - distance_m) * r / (x * dx + y * dy), 0.0), 1.0)
+
+        t = self.knot_times[k] + s * self.durations[k]
+        return t, self.position(t)[2] * METERS_TO_FEET
@@ -6,8 +6,17 @@ Simulates umpire inconsistency and catcher framing impact.
 
 Source: v2_Implementation_Plan.md - Phase 2B
 Goal: Add realistic variability to strike zone enforcement, affecting BB% independently of K%.
+
+Calls are answered from a precomputed base strike probability grid over plate
+location (shared by all umpires with the same zone and bias), so a call is a
+table lookup plus at most one uniform draw; call_pitches() does the same for
+arrays of pitches.
 """
 
+import math
+from array import array
+from functools import lru_cache
+
 import numpy as np
 from typing import Tuple, Optional
 
@@ -21,6 +30,64 @@ from .constants import (
 )
 
 
+# Call grid resolution (inches). The grid covers the borderline band around
+# the zone over |horizontal| (the zone is symmetric); cell edges fall on the
+# band edges, so every cell is either a definitive call or borderline.
+CALL_GRID_STEP_INCHES = 0.05
+
+# Grid values for definitive calls (borderline cells hold the base strike
+# probability, which the framing bonus is added to)
+CLEAR_STRIKE = math.inf
+CLEAR_BALL = -math.inf
+
+
+@lru_cache(maxsize=16)
+def _call_grid(
+    borderline_bias: float,
+    zone_right: float,
+    zone_bottom: float,
+    zone_top: float,
+) -> Tuple[array, np.ndarray, int, int]:
+    """
+    Base strike probability grid (shared by umpires with the same zone/bias).
+
+    Cells are indexed ix * nz + iz with ix over |horizontal| from 0 and iz
+    over vertical from zone_bottom - borderline distance. Values are
+    evaluated at cell centers with the same rules as the exact call path.
+
+    Returns
+    -------
+    tuple
+        (grid as array('d') for scalar lookups, the same grid as ndarray,
+        nx, nz)
+    """
+    borderline = BB_BORDERLINE_DISTANCE_INCHES
+    step = CALL_GRID_STEP_INCHES
+    nx = int(round((zone_right + borderline) / step))
+    nz = int(round((zone_top - zone_bottom + 2 * borderline) / step))
+
+    x = (np.arange(nx) + 0.5)[:, None] * step
+    z = zone_bottom - borderline + (np.arange(nz) + 0.5)[None, :] * step
+
+    # Signed distance from the zone edge (see _calculate_distance_from_zone)
+    distance = np.minimum(x - zone_right, np.maximum(zone_bottom - z, z - zone_top))
+    base = np.where(
+        distance <= 0,
+        borderline_bias + (1.0 - borderline_bias) * (-distance / borderline),
+        borderline_bias * (1.0 - distance / borderline),
+    )
+    clearly_in = (
+        (x < zone_right - borderline)
+        & (z > zone_bottom + borderline)
+        & (z < zone_top - borderline)
+    )
+    base = np.where(clearly_in, CLEAR_STRIKE, base).ravel()
+
+    grid = array('d')
+    grid.frombytes(base.tobytes())
+    return grid, np.frombuffer(grid, dtype=np.float64), nx, nz
+
+
 class UmpireModel:
     """
     Umpire model for probabilistic ball/strike calls.
@@ -39,6 +106,7 @@ class UmpireModel:
     2. Probabilistic calls on borderline pitches (within 2" of edge)
     3. Catcher framing influence on borderline pitches
     4. Count-based bias (optional, future enhancement)
+    5. Precomputed call grid (call_pitch_exact() evaluates the rules directly)
     """
 
     def __init__(
@@ -72,6 +140,15 @@ class UmpireModel:
         self.zone_bottom = STRIKE_ZONE_BOTTOM * 12.0  # 18"
         self.zone_top = STRIKE_ZONE_TOP * 12.0  # 42"
 
+        # Precomputed base strike probability over plate location
+        self._grid, self._grid_array, self._grid_nx, self._grid_nz = _call_grid(
+            self.borderline_bias, self.zone_right, self.zone_bottom, self.zone_top
+        )
+        self._grid_x_max = self.zone_right + BB_BORDERLINE_DISTANCE_INCHES
+        self._grid_z_min = self.zone_bottom - BB_BORDERLINE_DISTANCE_INCHES
+        self._grid_z_max = self.zone_top + BB_BORDERLINE_DISTANCE_INCHES
+        self._inv_grid_step = 1.0 / CALL_GRID_STEP_INCHES
+
     def call_pitch(
         self,
         horizontal_inches: float,
@@ -81,6 +158,172 @@ class UmpireModel:
         """
         Determine ball or strike call for a pitch.
 
+        Looks up the base strike probability in the precomputed call grid
+        (same three-zone rules as call_pitch_exact(), sampled at 0.05"
+        resolution), then makes at most one uniform draw.
+
+        Parameters
+        ----------
+        horizontal_inches : float
+            Horizontal pitch location in inches from center
+            Negative = inside, positive = outside
+        vertical_inches : float
+            Vertical pitch location in inches above ground
+        framing_bonus : float, optional
+            Catcher framing bonus (0.0 to BB_FRAMING_BONUS_MAX)
+            Adds to strike probability on borderline pitches
+            Default 0.0 (no framing bonus)
+
+        Returns
+        -------
+        str
+            Either 'strike' or 'ball'
+        """
+        base_prob = self.base_strike_probability(horizontal_inches, vertical_inches)
+
+        # Definitive calls
+        if base_prob == CLEAR_STRIKE:
+            return 'strike'
+        if base_prob == CLEAR_BALL:
+            return 'ball'
+
+        # Borderline pitch: Probabilistic call
+        strike_probability = base_prob + framing_bonus
+        if self.consistency < 1.0:
+            noise_magnitude = (1.0 - self.consistency) * 0.2
+            strike_probability += np.random.normal(0, noise_magnitude)
+        strike_probability = min(max(strike_probability, 0.0), 1.0)
+
+        return 'strike' if np.random.random() < strike_probability else 'ball'
+
+    def base_strike_probability(self, horizontal_inches: float, vertical_inches: float) -> float:
+        """
+        Call grid lookup for one plate location.
+
+        Returns
+        -------
+        float
+            CLEAR_STRIKE, CLEAR_BALL, or the borderline strike probability
+            before framing, consistency noise and clipping
+        """
+        horizontal = abs(horizontal_inches)
+        if (horizontal > self._grid_x_max
+                or vertical_inches < self._grid_z_min
+                or vertical_inches > self._grid_z_max):
+            return CLEAR_BALL
+
+        ix = int(horizontal * self._inv_grid_step)
+        if ix >= self._grid_nx:
+            ix = self._grid_nx - 1
+        iz = int((vertical_inches - self._grid_z_min) * self._inv_grid_step)
+        if iz >= self._grid_nz:
+            iz = self._grid_nz - 1
+        return self._grid[ix * self._grid_nz + iz]
+
+    def strike_probability(
+        self,
+        horizontal_inches: float,
+        vertical_inches: float,
+        framing_bonus: float = 0.0
+    ) -> float:
+        """
+        Probability of a strike call (without consistency noise).
+
+        Parameters
+        ----------
+        horizontal_inches : float
+            Horizontal pitch location in inches from center
+        vertical_inches : float
+            Vertical pitch location in inches above ground
+        framing_bonus : float, optional
+            Catcher framing bonus
+
+        Returns
+        -------
+        float
+            Strike probability (0.0 to 1.0)
+        """
+        base_prob = self.base_strike_probability(horizontal_inches, vertical_inches)
+        if base_prob == CLEAR_STRIKE:
+            return 1.0
+        if base_prob == CLEAR_BALL:
+            return 0.0
+        return min(max(base_prob + framing_bonus, 0.0), 1.0)
+
+    def call_pitches(
+        self,
+        horizontal_inches: np.ndarray,
+        vertical_inches: np.ndarray,
+        framing_bonus=0.0,
+        rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """
+        Ball/strike calls for many pitches at once (bulk simulators).
+
+        Same call grid and rules as call_pitch(); one uniform draw (and one
+        noise draw when consistency < 1) per borderline pitch.
+
+        Parameters
+        ----------
+        horizontal_inches : array-like
+            Horizontal pitch locations in inches from center
+        vertical_inches : array-like
+            Vertical pitch locations in inches above ground
+        framing_bonus : float or array-like, optional
+            Catcher framing bonus, per pitch or shared
+        rng : numpy.random.Generator, optional
+            Random source (default: the global numpy RNG)
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array, True where the call is a strike
+        """
+        horizontal = np.abs(np.asarray(horizontal_inches, dtype=np.float64))
+        vertical = np.asarray(vertical_inches, dtype=np.float64)
+        horizontal, vertical = np.broadcast_arrays(horizontal, vertical)
+
+        on_grid = (
+            (horizontal <= self._grid_x_max)
+            & (vertical >= self._grid_z_min)
+            & (vertical <= self._grid_z_max)
+        )
+        ix = np.minimum((horizontal[on_grid] * self._inv_grid_step).astype(np.intp),
+                        self._grid_nx - 1)
+        iz = np.minimum(((vertical[on_grid] - self._grid_z_min) * self._inv_grid_step)
+                        .astype(np.intp), self._grid_nz - 1)
+        base_prob = np.full(horizontal.shape, CLEAR_BALL)
+        base_prob[on_grid] = self._grid_array[ix * self._grid_nz + iz]
+
+        strikes = base_prob == CLEAR_STRIKE
+        borderline = np.isfinite(base_prob)
+        n_borderline = int(np.count_nonzero(borderline))
+        if n_borderline == 0:
+            return strikes
+
+        random = rng if rng is not None else np.random
+        strike_probability = (
+            base_prob[borderline]
+            + np.broadcast_to(np.asarray(framing_bonus, dtype=np.float64), base_prob.shape)[borderline]
+        )
+        if self.consistency < 1.0:
+            noise_magnitude = (1.0 - self.consistency) * 0.2
+            strike_probability += random.normal(0, noise_magnitude, n_borderline)
+        np.clip(strike_probability, 0.0, 1.0, out=strike_probability)
+
+        strikes[borderline] = random.random(n_borderline) < strike_probability
+        return strikes
+
+    def call_pitch_exact(
+        self,
+        horizontal_inches: float,
+        vertical_inches: float,
+        framing_bonus: float = 0.0
+    ) -> str:
+        """
+        Determine ball or strike call for a pitch, evaluating the zone rules
+        directly (reference for the call grid used by call_pitch()).
+
         Three-zone system:
         1. Clear strike (>2" inside zone): Always strike
         2. Borderline (within 2" of edge): Probabilistic
@@ -0,0 +1,717 @@
+"""
+Vectorized plate-appearance engine for bulk matchup simulation.
+
+AtBatSimulator plays one plate appearance at a time, one pitch at a time,
+with a full pitch flight and batted-ball flight per pitch (~130 ms per PA).
+VectorizedAtBatEngine keeps thousands of independent plate appearances as
+arrays (count, last two pitch types, outcome) and advances every live count
+by one pitch per step:
+
+- Pitch selection: the arsenal's count weights with the sequencing factors
+- Targets: PitcherControlModule.generate_pitch_locations()
+- Command error: the pitcher's fatigue-adjusted sigma for the step's pitch count
+- Pitch flight: a PitchFlightTable per pitch type (below)
+- Calls: UmpireModel.call_pitches()
+- Swing and whiff: the hitter's DecisionSurface batch lookups
+- Contact: bat speed, contact offsets and timing sampled per swing,
+  ContactModel.full_collision_batch(), then the EV-LA and spray adjustments
+- Fouls: the same launch-angle, weak-contact and two-strike protection rules
+
+Every PA throws its n-th pitch in the same step, so everything that depends
+on the pitch count (fatigue) is a scalar per step. As in BulkAtBatSimulator,
+every PA starts from the pitcher's current pitch count.
+
+Pitch flight: a PitchFlightTable runs PitchSimulator.simulate_batch() once per
+pitch type over a grid of aim points (cached per pitch and environment; one
+parallel trajectory_rs call per aim iteration when the extension is built) and
+interpolates plate location, speed, break and approach angle bilinearly.
+Fatigue scales the plate speed with the release velocity.
+
+Batted balls are integrated together once all PAs are over
+(integrate_batted_balls()).
+
+The engine reproduces the distribution of the scalar path, not its random
+stream. Wind is not modelled (BulkAtBatSimulator has no wind).
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional
+
+import numpy as np
+
+from .constants import (
+    BALL_CROSS_SECTIONAL_AREA,
+    BALL_MASS,
+    BALL_RADIUS,
+    DT_FAST,
+    FEET_TO_METERS,
+    GRAVITY,
+    MAX_SIMULATION_TIME,
+    METERS_TO_FEET,
+    MOUND_DISTANCE,
+    MPH_TO_MS,
+    SimulationMode,
+    get_dt_for_mode,
+)
+from .contact import ContactModel
+from .decision_surface import DecisionSurface
+from .environment import Environment
+from .ev_la_distribution import (
+    apply_ev_la_correlation_adjustments,
+    get_spray_angles_for_launch_angles,
+)
+from .pitch import PitchSimulator, PitchType
+from .pitcher_control import PitcherControlModule
+from .player import Hitter, Pitcher
+from .umpire import UmpireModel
+from . import fast_trajectory
+
+
+# Aim-point grid (inches) for pitch flight tables
+FLIGHT_GRID_HORIZONTAL = np.arange(-24.0, 24.1, 12.0)
+FLIGHT_GRID_VERTICAL = np.arange(0.0, 60.1, 6.0)
+# AtBatSimulator fallback when the pitch never reaches the plate
+DEFAULT_PLATE_ANGLE_DEG = 7.0
+
+# Flight table columns
+_PLATE_DH, _PLATE_DV, _SPEED_RATIO, _V_BREAK, _H_BREAK, _PLATE_ANGLE = range(6)
+
+# Ground balls (launch angle <= 10°) on the Python path, as in
+# BattedBallSimulator._apply_ground_ball_corrections()
+GROUND_BALL_MAX_LAUNCH_ANGLE = 10.0
+GROUND_BALL_MAX_TIME = 1.5
+GROUND_BALL_DRAG_COEFFICIENT = 0.08
+CONTACT_HEIGHT_FT = 3.0
+
+OUTCOMES = ('strikeout', 'walk', 'in_play')
+STRIKEOUT, WALK, IN_PLAY = range(3)
+CONTACT_QUALITIES = ('solid', 'fair', 'weak')
+SOLID, FAIR, WEAK = range(3)
+NO_CONTACT = -1
+
+
+@lru_cache(maxsize=64)
+def _pitch_flight_grid(
+    name, velocity, spin_rpm, spin_axis, spin_efficiency,
+    release_distance, altitude, temperature, humidity, fast_mode,
+):
+    """Plate crossing per aim point for one pitch (read-only array)."""
+    pitch = PitchType(name, velocity, spin_rpm, np.array(spin_axis), spin_efficiency)
+    aim_h, aim_v = np.meshgrid(FLIGHT_GRID_HORIZONTAL, FLIGHT_GRID_VERTICAL, indexing='ij')
+    crossings = PitchSimulator().simulate_batch(
+        pitch,
+        target_x=aim_h.ravel() / 12.0,
+        target_z=aim_v.ravel() / 12.0,
+        release_distance=release_distance,
+        altitude=altitude,
+        temperature=temperature,
+        humidity=humidity,
+        fast_mode=fast_mode,
+    )
+    plate_angle = crossings['plate_angle_vertical']
+    grid = np.stack([
+        crossings['plate_y'] * 12.0 - aim_h.ravel(),
+        crossings['plate_z'] * 12.0 - aim_v.ravel(),
+        crossings['plate_speed'] / velocity,
+        crossings['vertical_break'],
+        crossings['horizontal_break'],
+        np.where(np.isnan(plate_angle), DEFAULT_PLATE_ANGLE_DEG, plate_angle),
+    ], axis=-1).reshape(aim_h.shape + (6,))
+    grid.setflags(write=False)
+    return grid
+
+
+def _grid_weights(values, nodes):
+    """Lower node index and interpolation weight, clamped to the grid."""
+    step = nodes[1] - nodes[0]
+    position = np.clip((values - nodes[0]) / step, 0.0, len(nodes) - 1)
+    index = np.minimum(position.astype(np.intp), len(nodes) - 2)
+    return index, position - index
+
+
+class PitchFlightTable:
+    """
+    Plate crossings for a pitcher's arsenal, interpolated from aim points.
+
+    Parameters
+    ----------
+    pitcher : Pitcher
+        Pitcher whose arsenal and extension define the pitches
+    altitude : float
+        Altitude in feet
+    temperature : float
+        Temperature in Fahrenheit
+    humidity : float
+        Relative humidity (0-1)
+    fast_mode : bool
+        Use the fast pitch integration time step
+    pitches_thrown : int, optional
+        Pitch count the table velocities are taken at (default: current)
+    """
+
+    def __init__(
+        self,
+        pitcher: Pitcher,
+        altitude: float = 0.0,
+        temperature: float = 70.0,
+        humidity: float = 0.5,
+        fast_mode: bool = True,
+        pitches_thrown: Optional[int] = None,
+    ):
+        arsenal = pitcher.get_arsenal()
+        release_distance = MOUND_DISTANCE - pitcher.get_release_extension_feet()
+        self.pitch_types = arsenal.pitch_types or ('fastball',)
+        grids = []
+        for pitch_type in self.pitch_types:
+            pitch, _, _ = arsenal.build_pitch(pitch_type, pitches_thrown)
+            grids.append(_pitch_flight_grid(
+                pitch.name, pitch.velocity, pitch.spin_rpm,
+                tuple(pitch.spin_axis.tolist()), pitch.spin_efficiency,
+                release_distance, altitude, temperature, humidity, fast_mode,
+            ))
+        self.grids = np.stack(grids)
+
+    def plate_crossings(self, pitch_type_index, aim_h, aim_v, release_velocity) -> Dict[str, np.ndarray]:
+        """
+        Plate crossing for a batch of pitches.
+
+        Parameters
+        ----------
+        pitch_type_index : np.ndarray of int
+            Index into pitch_types per pitch
+        aim_h, aim_v : np.ndarray
+            Aim point including command error (inches)
+        release_velocity : np.ndarray
+            Release velocity per pitch (mph, fatigue applied)
+
+        Returns
+        -------
+        dict
+            Arrays 'plate_h', 'plate_v' (inches), 'plate_speed' (mph),
+            'vertical_break', 'horizontal_break' (inches) and
+            'plate_angle' (degrees, positive = downward)
+        """
+        i, wh = _grid_weights(aim_h, FLIGHT_GRID_HORIZONTAL)
+        j, wv = _grid_weights(aim_v, FLIGHT_GRID_VERTICAL)
+        grids = self.grids
+        k = pitch_type_index
+        wh = wh[:, None]
+        wv = wv[:, None]
+        values = (
+            grids[k, i, j] * (1.0 - wh) * (1.0 - wv)
+            + grids[k, i + 1, j] * wh * (1.0 - wv)
+            + grids[k, i, j + 1] * (1.0 - wh) * wv
+            + grids[k, i + 1, j + 1] * wh * wv
+        )
+        return {
+            'plate_h': aim_h + values[:, _PLATE_DH],
+            'plate_v': aim_v + values[:, _PLATE_DV],
+            'plate_speed': release_velocity * values[:, _SPEED_RATIO],
+            'vertical_break': values[:, _V_BREAK],
+            'horizontal_break': values[:, _H_BREAK],
+            'plate_angle': values[:, _PLATE_ANGLE],
+        }
+
+
+def _ground_ball_landings(states, dt, air_density):
+    """
+    Landing points (m) of ground balls with the simplified forces.
+
+    Lockstep RK4 over all balls with the reduced ground-ball drag, stopped
+    at the ground (linearly interpolated) or after GROUND_BALL_MAX_TIME, as
+    integrate_trajectory() does per ball. The simplified force includes
+    gravity and the integrator adds it again, so ground balls fall at 2 g
+    on the scalar path; kept here so both paths agree.
+    """
+    drag_k = 0.5 * air_density * GROUND_BALL_DRAG_COEFFICIENT * BALL_CROSS_SECTIONAL_AREA / BALL_MASS
+
+    def acceleration(velocity):
+        speed = np.sqrt(np.einsum('ij,ij->i', velocity, velocity))
+        accel = -np.where(speed > 0.1, drag_k * speed, 0.0)[:, None] * velocity
+        accel[:, 2] -= 2.0 * GRAVITY
+        return accel
+
+    position = states[:, :3].copy()
+    velocity = states[:, 3:].copy()
+    landing = position.copy()
+    active = np.arange(len(states))
+    n_steps = int(np.ceil(GROUND_BALL_MAX_TIME / dt - 1e-9))
+    for _ in range(n_steps):
+        x = position[active]
+        v1 = velocity[active]
+        a1 = acceleration(v1)
+        v2 = v1 + 0.5 * dt * a1
+        a2 = acceleration(v2)
+        v3 = v1 + 0.5 * dt * a2
+        a3 = acceleration(v3)
+        v4 = v1 + dt * a3
+        a4 = acceleration(v4)
+        new_x = x + dt / 6.0 * (v1 + 2.0 * v2 + 2.0 * v3 + v4)
+        position[active] = new_x
+        velocity[active] = v1 + dt / 6.0 * (a1 + 2.0 * a2 + 2.0 * a3 + a4)
+
+        landed = new_x[:, 2] <= 0.0
+        dz = new_x[:, 2] - x[:, 2]
+        fraction = np.where(landed & (np.abs(dz) > 1e-10), -x[:, 2] / np.where(dz == 0.0, 1.0, dz), 1.0)
+        landing[active] = x + fraction[:, None] * (new_x - x)
+        active = active[~landed]
+        if not len(active):
+            break
+    return landing
+
+
+def integrate_batted_balls(
+    exit_velocity,
+    launch_angle,
+    spray_angle,
+    backspin_rpm,
+    altitude: float = 0.0,
+    temperature: float = 70.0,
+    humidity: float = 0.5,
+    dt: float = DT_FAST,
+) -> np.ndarray:
+    """
+    Carry distances (ft) for a batch of batted balls.
+
+    Uses trajectory_rs.integrate_trajectories_batch when the Rust extension
+    is available (the scalar Rust path has no ground-ball correction).
+    Otherwise airborne balls go through the Numba
+    calculate_trajectory_endpoints_batch and balls at 10° or less through
+    the simplified ground-ball model, matching BattedBallSimulator's
+    Python path.
+
+    Parameters
+    ----------
+    exit_velocity, launch_angle, spray_angle, backspin_rpm : array-like
+        Batted-ball launch conditions (mph, degrees, degrees, rpm)
+    altitude, temperature, humidity : float
+        Environment
+    dt : float
+        Integration time step in seconds
+
+    Returns
+    -------
+    np.ndarray
+        Horizontal distance from home plate to the landing point in feet
+    """
+    exit_velocity = np.asarray(exit_velocity, dtype=np.float64)
+    launch_angle = np.asarray(launch_angle, dtype=np.float64)
+    spray_angle = np.asarray(spray_angle, dtype=np.float64)
+    backspin_rpm = np.asarray(backspin_rpm, dtype=np.float64)
+    n = exit_velocity.shape[0]
+    distances = np.zeros(n)
+    if n == 0:
+        return distances
+
+    env = Environment(altitude, temperature, humidity)
+    speed = exit_velocity * MPH_TO_MS
+    launch_rad = np.deg2rad(launch_angle)
+    spray_rad = np.deg2rad(spray_angle)
+    states = np.empty((n, 6))
+    states[:, 0] = 0.0
+    states[:, 1] = 0.0
+    states[:, 2] = CONTACT_HEIGHT_FT * FEET_TO_METERS
+    states[:, 3] = speed * np.cos(launch_rad) * np.cos(spray_rad)
+    states[:, 4] = speed * np.cos(launch_rad) * np.sin(spray_rad)
+    states[:, 5] = speed * np.sin(launch_rad)
+
+    # Pure backspin (AtBatSimulator passes no sidespin)
+    spin = np.abs(backspin_rpm)
+    spin_params = np.zeros((n, 4))
+    spin_params[:, 1] = np.where(spin > 0.1, np.sign(backspin_rpm), 0.0)
+    spin_params[:, 2] = np.where(spin > 0.1, 0.0, 1.0)
+    spin_params[:, 3] = spin
+
+    cross_area = np.pi * BALL_RADIUS ** 2
+    if fast_trajectory.RUST_AVAILABLE and hasattr(fast_trajectory.trajectory_rs, 'integrate_trajectories_batch'):
+        cd_table, cl_table = fast_trajectory.get_lookup_tables()
+        spin_params[:, 1] = np.where(spin > 0.1, spin_params[:, 1], 1.0)
+        spin_params[:, 2] = 0.0
+        landing, _, _, _ = fast_trajectory.trajectory_rs.integrate_trajectories_batch(
+            states, dt, MAX_SIMULATION_TIME, 0.0, spin_params,
+            env.air_density, cross_area, cd_table, cl_table,
+        )
+        return np.hypot(landing[:, 0], landing[:, 1]) * METERS_TO_FEET
+
+    ground = launch_angle <= GROUND_BALL_MAX_LAUNCH_ANGLE
+    if ground.any():
+        # Reduced launch speed at contact for low angles
+        la = launch_angle[ground]
+        velocity_factor = np.where(
+            la <= 0.0,
+            np.minimum(0.85 + np.abs(la) / 30.0 * 0.05, 0.90),
+            np.where(la <= 5.0, 0.90 + la / 5.0 * 0.05, 0.95 + (la - 5.0) / 5.0 * 0.03),
+        )
+        ground_states = states[ground]
+        ground_states[:, 3:] *= velocity_factor[:, None]
+        landing = _ground_ball_landings(ground_states, dt, env.air_density)
+        distances[ground] = np.hypot(landing[:, 0], landing[:, 1]) * METERS_TO_FEET
+
+    air = ~ground
+    if air.any():
+        from .aerodynamics import aerodynamic_force_tuple_lookup, get_lookup_tables
+        from .constants import CD_BASE
+        from .integrator import calculate_trajectory_endpoints_batch
+
+        cd_table, cl_table = get_lookup_tables()
+        landing, _, _, _ = calculate_trajectory_endpoints_batch(
+            np.ascontiguousarray(states[air]), dt, MAX_SIMULATION_TIME, 0.0,
+            np.ascontiguousarray(spin_params[air]), CD_BASE, env.air_density,
+            cross_area, cd_table, cl_table, aerodynamic_force_tuple_lookup,
+        )
+        distances[air] = np.hypot(landing[:, 0], landing[:, 1]) * METERS_TO_FEET
+    return distances
+
+
+@dataclass
+class VectorizedAtBatResults:
+    """
+    Plate-appearance outcomes as arrays (one entry per PA).
+
+    Outcome and contact-quality codes index OUTCOMES and CONTACT_QUALITIES;
+    batted-ball fields are NaN (contact_quality NO_CONTACT) unless the PA
+    ended with a ball in play.
+    """
+    outcome: np.ndarray
+    pitches: np.ndarray
+    balls: np.ndarray
+    strikes: np.ndarray
+    exit_velocity: np.ndarray
+    launch_angle: np.ndarray
+    spray_angle: np.ndarray
+    distance: np.ndarray
+    contact_quality: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.outcome)
+
+    @property
+    def in_play(self) -> np.ndarray:
+        """Mask of PAs that ended with a ball in play."""
+        return self.outcome == IN_PLAY
+
+    def outcome_counts(self) -> Dict[str, int]:
+        """Number of PAs per outcome."""
+        counts = np.bincount(self.outcome, minlength=len(OUTCOMES))
+        return {name: int(count) for name, count in zip(OUTCOMES, counts)}
+
+    def contact_quality_counts(self) -> Dict[str, int]:
+        """Number of balls in play per contact quality."""
+        counts = np.bincount(self.contact_quality[self.in_play], minlength=len(CONTACT_QUALITIES))
+        return {name: int(count) for name, count in zip(CONTACT_QUALITIES, counts)}
+
+
+class VectorizedAtBatEngine:
+    """
+    Simulates many independent plate appearances of one matchup at once.
+
+    Supports the V2 pitcher control and umpire models (the defaults).
+
+    Parameters
+    ----------
+    pitcher : Pitcher
+        Pitcher with attribute ratings (not modified)
+    hitter : Hitter
+        Hitter with attribute ratings (not modified)
+    altitude : float
+        Altitude in feet (default: 0 = sea level)
+    temperature : float
+        Temperature in Fahrenheit (default: 70)
+    humidity : float
+        Relative humidity 0-1 (default: 0.5)
+    fast_mode : bool
+        Use the fast time steps, as AtBatSimulator(fast_mode=True)
+    catcher_framing_rating : float
+        Catcher's framing ability (0-100k scale), default average
+    seed : int, optional
+        Seed for the engine's random generator
+    """
+
+    def __init__(
+        self,
+        pitcher: Pitcher,
+        hitter: Hitter,
+        altitude: float = 0.0,
+        temperature: float = 70.0,
+        humidity: float = 0.5,
+        fast_mode: bool = True,
+        catcher_framing_rating: float = 50000.0,
+        seed: Optional[int] = None,
+    ):
+        self.pitcher = pitcher
+        self.hitter = hitter
+        self.altitude = altitude
+        self.temperature = temperature
+        self.humidity = humidity
+        self.fast_mode = fast_mode
+        self.dt = DT_FAST if fast_mode else get_dt_for_mode(SimulationMode.ACCURATE)
+        self.rng = np.random.default_rng(seed)
+
+        self.contact_model = ContactModel()
+        self.pitcher_control = PitcherControlModule(pitcher)
+        self.umpire = UmpireModel()
+        self.framing_bonus = self.umpire.get_framing_bonus(catcher_framing_rating)
+        # Private surface: batch lookups don't change the hitter's own mode
+        surface = hitter.decision_surface
+        self.surface = surface if surface is not None else DecisionSurface(hitter)
+
+    def _sequencing_factors(self, pitch_types) -> np.ndarray:
+        """Sequencing multipliers indexed [last + 1, before_last + 1, pitch] (0 = none)."""
+        from .arsenal import FOUR_SEAMS
+
+        k = len(pitch_types)
+        factors = np.ones((k + 1, k + 1, k))
+        for last in range(k):
+            for before in range(-1, k):
+                for index, pitch_type in enumerate(pitch_types):
+                    factor = 1.0
+                    if index == last:
+                        factor *= 0.3  # Strongly discourage same pitch
+                    if index == before:
+                        factor *= 0.5  # Discourage pitch from 2 ago
+                    if pitch_types[last] in FOUR_SEAMS and pitch_type in ('changeup', 'splitter'):
+                        factor *= 1.3
+                    elif pitch_types[last] in ('curveball', 'slider') and pitch_type in FOUR_SEAMS:
+                        factor *= 1.2
+                    factors[last + 1, before + 1, index] = factor
+        return factors
+
+    def simulate(self, n_at_bats: int) -> VectorizedAtBatResults:
+        """
+        Simulate n independent plate appearances.
+
+        Parameters
+        ----------
+        n_at_bats : int
+            Number of plate appearances
+
+        Returns
+        -------
+        VectorizedAtBatResults
+        """
+        rng = self.rng
+        pitcher = self.pitcher
+        hitter = self.hitter
+        attributes = hitter.attributes
+        arsenal = pitcher.get_arsenal()
+        start_pitches = pitcher.pitches_thrown
+
+        table = PitchFlightTable(
+            pitcher, self.altitude, self.temperature, self.humidity,
+            self.fast_mode, start_pitches,
+        )
+        pitch_types = table.pitch_types
+        n_types = len(pitch_types)
+        count_weights = np.array([
+            [arsenal.count_weights[(balls, strikes)] if arsenal.pitch_types else [1.0]
+             for strikes in range(3)]
+            for balls in range(4)
+        ])
+        sequencing = self._sequencing_factors(pitch_types)
+        whiff_multipliers = np.array([arsenal.get(pt).whiff_multiplier for pt in pitch_types])
+        put_away = 1.0 + 0.15 * pitcher.attributes.get_stuff_rating()
+
+        # Hitter constants for contact
+        bat_speed_max = hitter.get_bat_speed_mph()
+        hard_swing_rate = attributes._hard_swing_rate
+        if hard_swing_rate is None:
+            hard_swing_rate = 0.50
+        barrel_error_mm = attributes.get_barrel_accuracy_mm()
+        barrel_error_in = barrel_error_mm / 25.4
+        timing_ms = attributes.get_timing_precision_ms()
+        attack_mean = attributes.get_attack_angle_mean_deg()
+        attack_sd = 26.0 * np.clip(attributes.get_attack_angle_variance_deg() / 3.0, 0.7, 1.3)
+        spray_tendency = attributes.get_spray_tendency_deg()
+        contact_ability = max(0.2, min(1.0, 1.0 - (barrel_error_mm - 5) / 25.0))
+        pitch_path_adjustment = np.array([
+            -2.0 if pt in ('curveball', 'slider', 'slurve')
+            else 1.0 if pt in ('four_seam', 'two_seam') else 0.0
+            for pt in pitch_types
+        ])
+
+        n = n_at_bats
+        balls = np.zeros(n, dtype=np.intp)
+        strikes = np.zeros(n, dtype=np.intp)
+        pitches = np.zeros(n, dtype=np.intp)
+        last = np.full(n, -1, dtype=np.intp)
+        before_last = np.full(n, -1, dtype=np.intp)
+        outcome = np.full(n, -1, dtype=np.intp)
+        exit_velocity = np.full(n, np.nan)
+        launch_angle = np.full(n, np.nan)
+        spray_angle = np.full(n, np.nan)
+        backspin = np.zeros(n)
+        quality = np.full(n, NO_CONTACT, dtype=np.intp)
+
+        live = np.arange(n)
+        step = 0
+        while len(live):
+            pitches_thrown = start_pitches + step
+            b = balls[live]
+            s = strikes[live]
+            m = len(live)
+
+            # Pitch type: count weights x sequencing, one cumulative draw each
+            weights = np.maximum(
+                count_weights[b, s] * sequencing[last[live] + 1, before_last[live] + 1], 0.01
+            )
+            cumulative = np.cumsum(weights, axis=1)
+            draws = rng.random(m) * cumulative[:, -1]
+            kind = np.minimum((cumulative <= draws[:, None]).sum(axis=1), n_types - 1)
+
+            # Target, command error and flight
+            target_h, target_v = self.pitcher_control.generate_pitch_locations(b, s, rng)
+            sigma = pitcher.get_effective_command_sigma_inches(pitches_thrown)
+            aim_h = target_h + rng.normal(0.0, sigma, m)
+            aim_v = target_v + rng.normal(0.0, sigma, m)
+            velocities = np.array([
+                arsenal.build_pitch(pt, pitches_thrown)[1] for pt in pitch_types
+            ])
+            flight = table.plate_crossings(kind, aim_h, aim_v, velocities[kind])
+            plate_h = flight['plate_h']
+            plate_v = flight['plate_v']
+            plate_speed = flight['plate_speed']
+            called_strike = self.umpire.call_pitches(plate_h, plate_v, self.framing_bonus, rng=rng)
+
+            # Swing and whiff, grouped by pitch type
+            swing_prob = np.empty(m)
+            whiff_prob = np.empty(m)
+            for index, pitch_type in enumerate(pitch_types):
+                group = kind == index
+                if not group.any():
+                    continue
+                swing_prob[group] = self.surface.swing_probabilities(
+                    plate_h[group], plate_v[group], called_strike[group],
+                    b[group], s[group], plate_speed[group], pitch_type,
+                )
+                whiff_prob[group] = self.surface.whiff_probabilities(
+                    plate_speed[group], pitch_type,
+                    flight['vertical_break'][group], flight['horizontal_break'][group],
+                ) * whiff_multipliers[index]
+            whiff_prob = np.clip(np.where(s == 2, whiff_prob * put_away, whiff_prob), 0.05, 0.75)
+            swing = rng.random(m) < swing_prob
+            whiff = swing & (rng.random(m) < whiff_prob)
+            contact = np.flatnonzero(swing & ~whiff)
+
+            foul = np.zeros(m, dtype=bool)
+            in_play = np.zeros(m, dtype=bool)
+            if len(contact):
+                c = len(contact)
+                ch = plate_h[contact]
+                cv = plate_v[contact]
+                speed_c = plate_speed[contact]
+
+                # Bat speed: hard swings above max, otherwise triangular effort
+                hard = rng.random(c) < hard_swing_rate
+                effort = np.where(
+                    hard,
+                    1.0 + rng.uniform(0.02, 0.16, c),
+                    rng.triangular(0.90, 0.99, 1.03, c),
+                )
+                bat_speed = rng.normal(bat_speed_max * effort, 0.02 * bat_speed_max)
+                bat_speed = np.where(
+                    hard,
+                    np.clip(bat_speed, bat_speed_max * 0.98, bat_speed_max * 1.18),
+                    np.clip(bat_speed, bat_speed_max * 0.85, bat_speed_max * 1.04),
+                )
+
+                # Contact offsets, timing and location difficulty
+                h_offset = rng.normal(0.0, barrel_error_in, c)
+                v_offset = rng.normal(0.0, barrel_error_in, c)
+                timing_error = rng.normal(0.0, timing_ms * (1.0 + (speed_c - 80.0) / 20.0 * 0.3))
+                h_offset = h_offset + timing_error * 0.1
+                total_offset = np.hypot(h_offset, v_offset)
+                h_difficulty = np.abs(ch) / 8.5
+                v_difficulty = np.abs(cv - 30.0) / 12.0
+                out_of_zone = (
+                    np.maximum(np.abs(ch) - 8.5, 0.0) / 8.5
+                    + np.maximum(18.0 - cv, 0.0) / 10.0
+                    + np.maximum(cv - 42.0, 0.0) / 10.0
+                )
+                difficulty = np.minimum(
+                    h_difficulty + v_difficulty
+                    + np.minimum(h_difficulty * v_difficulty, 0.5) + out_of_zone,
+                    2.0,
+                )
+                adjusted_offset = total_offset * (1.0 + difficulty)
+
+                path_angle = np.clip(
+                    rng.normal(attack_mean + (cv - 30.0) * 0.3
+                               + pitch_path_adjustment[kind[contact]], attack_sd),
+                    -25.0, 70.0,
+                )
+                collision = self.contact_model.full_collision_batch(
+                    bat_speed_mph=bat_speed,
+                    pitch_speed_mph=speed_c,
+                    bat_path_angle_deg=path_angle,
+                    pitch_trajectory_angle_deg=flight['plate_angle'][contact],
+                    vertical_contact_offset_inches=v_offset,
+                    horizontal_contact_offset_inches=h_offset,
+                    distance_from_sweet_spot_inches=adjusted_offset,
+                )
+                ev, la = apply_ev_la_correlation_adjustments(
+                    collision['exit_velocity'], collision['launch_angle']
+                )
+                # Fly-ball EV penalty (0.5% per degree above 25°, at most 15%)
+                ev = ev * np.where(la > 25.0, np.maximum(1.0 - 0.005 * (la - 25.0), 0.85), 1.0)
+                spray = get_spray_angles_for_launch_angles(la, spray_tendency, rng)
+
+                # Contact quality thresholds (AtBatSimulator._determine_contact_quality)
+                took_strike = called_strike[contact]
+                solid_threshold = np.where(took_strike, 0.35, 0.175) * (1.5 - contact_ability * 0.5)
+                weak_threshold = np.where(took_strike, 1.2, 0.84) * (1.3 - contact_ability * 0.3)
+                contact_quality = np.where(
+                    adjusted_offset < solid_threshold, SOLID,
+                    np.where(adjusted_offset > weak_threshold, WEAK, FAIR),
+                )
+
+                # Fouls: extreme angles, weak contact, two-strike protection
+                is_foul = (la < -10.0) | (la > 60.0) | (np.abs(spray) > 45.0)
+                is_foul |= (contact_quality == WEAK) & (rng.random(c) < 0.45)
+                protection = np.array([0.16, 0.23, 0.09])[contact_quality]
+                is_foul |= (s[contact] >= 2) & (rng.random(c) < protection)
+
+                foul[contact] = is_foul
+                in_play[contact] = ~is_foul
+                ended = live[contact[~is_foul]]
+                exit_velocity[ended] = ev[~is_foul]
+                launch_angle[ended] = la[~is_foul]
+                spray_angle[ended] = spray[~is_foul]
+                backspin[ended] = collision['backspin_rpm'][~is_foul]
+                quality[ended] = contact_quality[~is_foul]
+
+            # Count update
+            take = ~swing
+            b = b + (take & ~called_strike)
+            s = s + ((take & called_strike) | whiff | (foul & (s < 2)))
+            balls[live] = b
+            strikes[live] = s
+            pitches[live] += 1
+            before_last[live] = last[live]
+            last[live] = kind
+
+            outcome[live[in_play]] = IN_PLAY
+            outcome[live[s >= 3]] = STRIKEOUT
+            outcome[live[b >= 4]] = WALK
+            live = live[outcome[live] < 0]
+            step += 1
+
+        in_play_mask = outcome == IN_PLAY
+        distance = np.full(n, np.nan)
+        distance[in_play_mask] = integrate_batted_balls(
+            exit_velocity[in_play_mask], launch_angle[in_play_mask],
+            spray_angle[in_play_mask], backspin[in_play_mask],
+            self.altitude, self.temperature, self.humidity, self.dt,
+        )
+
+        return VectorizedAtBatResults(
+            outcome=outcome,
+            pitches=pitches,
+            balls=balls,
+            strikes=strikes,
+            exit_velocity=exit_velocity,
+            launch_angle=launch_angle,
+            spray_angle=spray_angle,
+            distance=distance,
+            contact_quality=quality,
+        )
@@ -0,0 +1,147 @@
+"""
+Before/after benchmark for compiled attribute profiles.
+
+"Before" temporarily routes every get_* method on HitterAttributes,
+PitcherAttributes and FielderAttributes back to its uncompiled
+implementation (piecewise_logistic_map on every call); "after" uses the
+compiled PhysicalProfile. Reports getter calls per game, per-call cost and
+per-game wall time for the same seeded games.
+
+Usage:
+    python benchmarks/benchmark_attribute_profiles.py
+"""
+
+import time
+import sys
+import os
+from contextlib import contextmanager
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import numpy as np
+
+from batted_ball.attributes import HitterAttributes, PitcherAttributes, FielderAttributes
+from batted_ball.game_simulation import GameSimulator, create_test_team
+from batted_ball.constants import SimulationMode
+
+ATTRIBUTE_CLASSES = (HitterAttributes, PitcherAttributes, FielderAttributes)
+
+
+def _profile_fields(cls):
+    return cls._PROFILE_CLASS.__slots__
+
+
+@contextmanager
+def uncompiled_getters():
+    """Route get_* back to the original per-call mapping."""
+    saved = []
+    for cls in ATTRIBUTE_CLASSES:
+        for field in _profile_fields(cls):
+            name = f"get_{field}"
+            saved.append((cls, name, getattr(cls, name)))
+            setattr(cls, name, getattr(cls, f"_compute_{field}"))
+    try:
+        yield
+    finally:
+        for cls, name, getter in saved:
+            setattr(cls, name, getter)
+
+
+@contextmanager
+def counted_getters(counts):
+    """Count get_* calls by wrapping the installed getters."""
+    saved = []
+    for cls in ATTRIBUTE_CLASSES:
+        for field in _profile_fields(cls):
+            name = f"get_{field}"
+            original = getattr(cls, name)
+            saved.append((cls, name, original))
+
+            def counted(self, _original=original, _key=f"{cls.__name__}.{name}"):
+                counts[_key] = counts.get(_key, 0) + 1
+                return _original(self)
+
+            setattr(cls, name, counted)
+    try:
+        yield
+    finally:
+        for cls, name, getter in saved:
+            setattr(cls, name, getter)
+
+
+def run_games(n_games: int, seed: int = 42):
+    """Simulate n seeded games, returning elapsed seconds."""
+    random.seed(seed)
+    np.random.seed(seed)
+    away = create_test_team("Away", "average")
+    home = create_test_team("Home", "average")
+
+    start = time.perf_counter()
+    for _ in range(n_games):
+        sim = GameSimulator(away, home, verbose=False,
+                            simulation_mode=SimulationMode.ULTRA_FAST)
+        sim.simulate_game()
+        away.current_batter_index = home.current_batter_index = 0
+    return time.perf_counter() - start
+
+
+def benchmark_getter_cost(n_calls: int = 100000):
+    """Per-call cost of a representative getter from each class."""
+    print("\nPer-call getter cost:")
+    samples = [
+        (HitterAttributes(), 'bat_speed_mph'),
+        (PitcherAttributes(), 'command_sigma_inches'),
+        (FielderAttributes(), 'acceleration_time_s'),
+    ]
+    for attrs, field in samples:
+        compute = getattr(type(attrs), f"_compute_{field}")
+        getter = getattr(attrs, f"get_{field}")
+        start = time.perf_counter()
+        for _ in range(n_calls):
+            compute(attrs)
+        before = (time.perf_counter() - start) / n_calls
+        start = time.perf_counter()
+        for _ in range(n_calls):
+            getter()
+        after = (time.perf_counter() - start) / n_calls
+        print(f"  {type(attrs).__name__}.get_{field}: "
+              f"{before * 1e6:.2f} us -> {after * 1e6:.3f} us ({before / after:.0f}x)")
+
+
+def benchmark_attribute_profiles(n_games: int = 3):
+    print("=" * 70)
+    print("ATTRIBUTE PROFILE BENCHMARK")
+    print(f"{n_games} alternating run(s) per mode, ULTRA_FAST mode")
+    print("=" * 70)
+
+    benchmark_getter_cost()
+
+    # Also serves as warm-up for the timed runs
+    counts = {}
+    with counted_getters(counts):
+        run_games(1)
+    total_calls = sum(counts.values())
+    print(f"\nGetter calls per game: {total_calls}")
+    for key, count in sorted(counts.items(), key=lambda item: -item[1])[:8]:
+        print(f"  {key}: {count}")
+
+    # Alternate modes on the same seeded game and keep the best time of each,
+    # so machine noise doesn't land on one side only
+    before_times, after_times = [], []
+    for _ in range(n_games):
+        with uncompiled_getters():
+            before_times.append(run_games(1))
+        after_times.append(run_games(1))
+    before, after = min(before_times), min(after_times)
+
+    print("\nPer-game wall time (best of alternating runs):")
+    print(f"  Before (uncompiled getters): {before:.2f} s")
+    print(f"  After (compiled profiles):   {after:.2f} s")
+    print(f"  Speedup: {before / after:.2f}x")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    benchmark_attribute_profiles()
@@ -0,0 +1,73 @@
+"""
+Benchmark batched bat-ball collisions against the scalar path.
+
+Computes exit velocity, launch angle and spin for the same random contacts:
+- Scalar: ContactModel.full_collision() in a loop
+- Batch: ContactModel.full_collision_batch() in one call
+
+Usage:
+    python benchmarks/benchmark_collision_batch.py
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.contact import ContactModel
+
+
+N_CONTACTS = 50000
+
+
+def make_contacts(n: int, seed: int = 42):
+    """Random contact parameters (inches, mph, degrees)."""
+    rng = np.random.default_rng(seed)
+    return {
+        'bat_speed_mph': rng.uniform(55.0, 82.0, n),
+        'pitch_speed_mph': rng.uniform(75.0, 100.0, n),
+        'bat_path_angle_deg': rng.normal(12.0, 18.0, n),
+        'pitch_trajectory_angle_deg': rng.uniform(-10.0, -4.0, n),
+        'vertical_contact_offset_inches': rng.normal(0.0, 1.0, n),
+        'horizontal_contact_offset_inches': rng.normal(0.0, 0.8, n),
+        'distance_from_sweet_spot_inches': np.abs(rng.normal(0.0, 1.5, n)),
+    }
+
+
+def run_scalar(model, contacts):
+    rows = [dict(zip(contacts, values))
+            for values in zip(*(column.tolist() for column in contacts.values()))]
+    return [model.full_collision(**row) for row in rows]
+
+
+def benchmark_collision_batch():
+    """Per-contact cost of scalar and batched collisions."""
+    model = ContactModel()
+    contacts = make_contacts(N_CONTACTS)
+
+    print("=" * 70)
+    print("BATCHED COLLISION BENCHMARK")
+    print(f"{N_CONTACTS:,} contacts")
+    print("=" * 70)
+
+    scalar = batch = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        run_scalar(model, contacts)
+        scalar = min(scalar, time.perf_counter() - start)
+        start = time.perf_counter()
+        model.full_collision_batch(**contacts)
+        batch = min(batch, time.perf_counter() - start)
+
+    print(f"\nScalar:  {scalar / N_CONTACTS * 1e6:8.3f} us/contact")
+    print(f"Batch:   {batch / N_CONTACTS * 1e6:8.3f} us/contact ({scalar / batch:.1f}x)")
+    print("=" * 70)
+    return {'scalar': scalar, 'batch': batch}
+
+
+if __name__ == "__main__":
+    benchmark_collision_batch()
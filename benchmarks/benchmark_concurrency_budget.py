@@ -0,0 +1,109 @@
+"""
+Benchmark matrix: worker processes x native threads per worker.
+
+Each task integrates a batch of airborne batted balls
+(integrate_batted_balls: trajectory_rs/rayon or the Numba parallel kernel)
+and runs a BLAS matrix product. The same tasks are run on a process pool for
+every combination of processes and threads_per_process, with the thread
+pools capped by ConcurrencyBudget.pool_kwargs(). The "uncapped" column is the
+previous behaviour: every worker's pools size themselves to all cores.
+
+Usage:
+    python benchmarks/benchmark_concurrency_budget.py [num_tasks] [balls_per_task] [--pin]
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from multiprocessing import Pool
+
+import numpy as np
+
+from batted_ball.concurrency import ConcurrencyBudget, available_cpus
+
+MATRIX_SIZE = 400
+
+
+def _powers_of_two(limit):
+    values = [1]
+    while values[-1] * 2 <= limit:
+        values.append(values[-1] * 2)
+    if values[-1] != limit:
+        values.append(limit)
+    return values
+
+
+def run_task(args):
+    """One unit of work: a batch of batted balls plus a BLAS product."""
+    seed, balls = args
+    from batted_ball.vectorized_at_bat import integrate_batted_balls
+
+    rng = np.random.default_rng(seed)
+    distances = integrate_batted_balls(
+        rng.uniform(85.0, 110.0, balls),
+        rng.uniform(15.0, 40.0, balls),
+        rng.uniform(-40.0, 40.0, balls),
+        rng.uniform(1000.0, 3000.0, balls),
+    )
+    a = rng.standard_normal((MATRIX_SIZE, MATRIX_SIZE))
+    return float(distances.mean() + np.trace(a @ a.T))
+
+
+def time_pool(processes, num_tasks, balls, budget=None):
+    """Tasks/s for one pool configuration (JIT/cache load excluded)."""
+    pool_kwargs = budget.pool_kwargs() if budget is not None else {}
+    tasks = [(seed, balls) for seed in range(num_tasks)]
+    with Pool(processes=processes, **pool_kwargs) as pool:
+        pool.map(run_task, [(seed, 50) for seed in range(processes)], chunksize=1)
+        start = time.perf_counter()
+        pool.map(run_task, tasks, chunksize=1)
+        elapsed = time.perf_counter() - start
+    return num_tasks / elapsed
+
+
+def benchmark_concurrency_budget(num_tasks=32, balls=2000, pin_cpus=False):
+    """Throughput matrix for processes x threads_per_process."""
+    n_cpus = len(available_cpus())
+    process_counts = _powers_of_two(n_cpus)
+    thread_counts = _powers_of_two(n_cpus)
+
+    print("=" * 70)
+    print("CONCURRENCY BUDGET MATRIX (tasks/s)")
+    print(f"CPUs: {n_cpus}, tasks: {num_tasks}, balls per task: {balls}, "
+          f"BLAS {MATRIX_SIZE}x{MATRIX_SIZE}, pinning: {'on' if pin_cpus else 'off'}")
+    print("=" * 70)
+
+    # Populate the Numba on-disk cache once before any timed pool
+    time_pool(1, 1, 50)
+
+    header = f"{'Procs':>6s}" + "".join(f"{f'{t} thr':>10s}" for t in thread_counts) + f"{'uncapped':>10s}"
+    print(header)
+    results = {}
+    for processes in process_counts:
+        row = f"{processes:6d}"
+        for threads in thread_counts:
+            budget = ConcurrencyBudget(processes, threads, pin_cpus)
+            rate = time_pool(processes, num_tasks, balls, budget)
+            results[(processes, threads)] = rate
+            marker = '*' if budget.total_threads == n_cpus else ' '
+            row += f"{rate:9.2f}{marker}"
+        rate = time_pool(processes, num_tasks, balls)
+        results[(processes, None)] = rate
+        row += f"{rate:10.2f}"
+        print(row)
+
+    best = max((key for key in results if key[1] is not None), key=results.get)
+    print("\n* processes x threads == CPUs")
+    print(f"Best: {best[0]} processes x {best[1]} threads ({results[best]:.2f} tasks/s); "
+          f"default budget: {ConcurrencyBudget.for_processes(n_cpus)}")
+    print("=" * 70)
+    return results
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3] if not arg.startswith('--')]
+    benchmark_concurrency_budget(*args, pin_cpus='--pin' in sys.argv)
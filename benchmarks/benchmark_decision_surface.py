@@ -0,0 +1,98 @@
+"""
+Benchmark per-pitch swing decisions with and without decision surfaces.
+
+Runs the same random pitches (location, count, velocity, pitch type) through
+Hitter.decide_to_swing() and Hitter.calculate_whiff_probability():
+- Exact: every modifier re-derived from attributes per pitch
+- Surface: one lookup in the hitter's precomputed DecisionSurface
+
+Also reports surface build time and the surface-vs-exact error.
+
+Usage:
+    python benchmarks/benchmark_decision_surface.py
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.game_simulation import create_test_team
+from batted_ball.decision_surface import DEFAULT_PITCH_TYPES
+
+
+N_PITCHES = 20000
+
+
+def make_pitches(n: int, seed: int = 42):
+    """Random pitches as (location, is_strike, count, velocity, pitch_type, break)."""
+    rng = np.random.default_rng(seed)
+    pitches = []
+    for _ in range(n):
+        location = (float(rng.normal(0.0, 10.0)), float(rng.normal(30.0, 10.0)))
+        is_strike = abs(location[0]) <= 8.5 and 18.0 <= location[1] <= 42.0
+        count = (int(rng.integers(0, 4)), int(rng.integers(0, 3)))
+        pitch_type = DEFAULT_PITCH_TYPES[int(rng.integers(len(DEFAULT_PITCH_TYPES)))]
+        pitch_break = (float(rng.normal(0.0, 10.0)), float(rng.normal(0.0, 10.0)))
+        pitches.append((location, is_strike, count, float(rng.uniform(75.0, 100.0)),
+                        pitch_type, pitch_break))
+    return pitches
+
+
+def run_pitches(hitter, pitches):
+    """Swing decision for every pitch, whiff probability for every swing."""
+    for location, is_strike, count, velocity, pitch_type, pitch_break in pitches:
+        if hitter.decide_to_swing(location, is_strike, count, velocity, pitch_type):
+            hitter.calculate_whiff_probability(velocity, pitch_type, pitch_break)
+
+
+def _best_time(func, *args, repeats: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_decision_surface():
+    """Compare exact and surface per-pitch cost for one hitter."""
+    hitter = create_test_team("Bench", "average").hitters[0]
+    pitches = make_pitches(N_PITCHES)
+
+    print("=" * 70)
+    print("DECISION SURFACE BENCHMARK")
+    print(f"{N_PITCHES:,} pitches, {len(DEFAULT_PITCH_TYPES)} pitch types")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    surface = hitter.enable_decision_surface()
+    build_ms = (time.perf_counter() - start) * 1000
+    errors = surface.compare(N_PITCHES // 4)
+
+    # Alternate exact/surface runs so both see the same machine state
+    exact_time = surface_time = float('inf')
+    for _ in range(3):
+        hitter.disable_decision_surface()
+        exact_time = min(exact_time, _best_time(run_pitches, hitter, pitches, repeats=1))
+        hitter.decision_surface = surface
+        surface_time = min(surface_time, _best_time(run_pitches, hitter, pitches, repeats=1))
+
+    per_exact = exact_time / N_PITCHES * 1e6
+    per_surface = surface_time / N_PITCHES * 1e6
+    print(f"\nSurface build:             {build_ms:8.1f} ms")
+    print(f"Exact per pitch:           {per_exact:8.2f} us")
+    print(f"Surface per pitch:         {per_surface:8.2f} us ({per_exact / per_surface:.1f}x)")
+    print(f"\nMax swing prob error:      {errors['max_swing_error']:.5f}")
+    print(f"Mean swing prob error:     {errors['mean_swing_error']:.5f}")
+    print(f"Max whiff prob error:      {errors['max_whiff_error']:.5f}")
+    print("=" * 70)
+    return {'build_ms': build_ms, 'exact_us': per_exact, 'surface_us': per_surface, **errors}
+
+
+if __name__ == "__main__":
+    benchmark_decision_surface()
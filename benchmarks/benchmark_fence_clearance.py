@@ -0,0 +1,90 @@
+"""
+Benchmark fence clearance for a batch of trajectories in one park.
+
+Integrates a batch of fly balls once, then classifies them against the fence:
+- Scalar: BallparkDimensions.clears_fence() on each trajectory
+- Batch: BallparkDimensions.clears_fence_batch() on the padded position array
+
+The landing-angle approximation (get_height_at_distance() at the fence
+distance for the landing spray angle) is reported for comparison.
+
+Usage:
+    python benchmarks/benchmark_fence_clearance.py [num_balls] [park]
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball import BattedBallSimulator
+from batted_ball.ballpark import get_ballpark
+
+
+def make_trajectories(num_balls, seed=42):
+    """Simulated fly balls and their padded (B, S, 3) position array."""
+    rng = np.random.default_rng(seed)
+    sim = BattedBallSimulator()
+    results = [
+        sim.simulate(exit_velocity=rng.uniform(90.0, 115.0), launch_angle=rng.uniform(18.0, 40.0),
+                     spray_angle=rng.uniform(-42.0, 42.0), backspin_rpm=rng.uniform(1500.0, 2800.0))
+        for _ in range(num_balls)
+    ]
+    n_samples = np.array([len(r.position) for r in results])
+    positions = np.zeros((num_balls, n_samples.max(), 3))
+    for i, r in enumerate(results):
+        positions[i, :n_samples[i]] = r.position
+    return results, positions, n_samples
+
+
+def landing_angle_home_runs(park, results):
+    """Fence test at the landing spray angle, one ball at a time."""
+    home_runs = []
+    for r in results:
+        x, y, _ = r.position[-1]
+        spray = np.degrees(np.arctan2(-y, x))
+        fence_distance, _ = park.get_fence_at_angle(spray)
+        height = r.get_height_at_distance(fence_distance) if r.distance >= fence_distance else None
+        home_runs.append(park.is_home_run(spray, r.distance, height))
+    return np.array(home_runs)
+
+
+def benchmark_fence_clearance(num_balls=5000, park_name='fenway'):
+    """Balls/s for the scalar and batch fence tests."""
+    park = get_ballpark(park_name)
+
+    print("=" * 70)
+    print("FENCE CLEARANCE BENCHMARK")
+    print(f"Park: {park.name}, balls: {num_balls}")
+    print("=" * 70)
+
+    results, positions, n_samples = make_trajectories(num_balls)
+
+    start = time.perf_counter()
+    scalar = np.array([park.clears_fence(r.position) for r in results])
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = park.clears_fence_batch(positions, n_samples)
+    batch_time = time.perf_counter() - start
+
+    approx = landing_angle_home_runs(park, results)
+
+    print(f"Samples per trajectory: {n_samples.mean():.0f} (padded to {positions.shape[1]})")
+    print(f"Scalar: {scalar_time * 1000:9.2f} ms  {num_balls / scalar_time:12,.0f} balls/s")
+    print(f"Batch:  {batch_time * 1000:9.2f} ms  {num_balls / batch_time:12,.0f} balls/s")
+    print(f"Speedup: {scalar_time / batch_time:.1f}x")
+    print(f"Home runs: {batch.sum()} (scalar agrees: {np.array_equal(scalar, batch)}), "
+          f"landing-angle approximation differs on {np.count_nonzero(approx != batch)}")
+    print("=" * 70)
+    return scalar_time, batch_time
+
+
+if __name__ == "__main__":
+    num_balls = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    park_name = sys.argv[2] if len(sys.argv) > 2 else 'fenway'
+    benchmark_fence_clearance(num_balls, park_name)
@@ -0,0 +1,110 @@
+"""
+Benchmark object allocations per fly ball in the fielding layer.
+
+Plays the same fly balls against the same defense and counts, per ball:
+- FieldPosition objects created
+- np.array() calls (small throwaway arrays)
+- Wall time of the play (measured separately, without the counting hook)
+
+Usage:
+    python benchmarks/benchmark_fly_ball_allocations.py [num_balls]
+"""
+
+import time
+import sys
+import os
+import io
+import contextlib
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.baserunning import create_average_runner
+from batted_ball.field_layout import FieldLayout, FieldPosition
+from batted_ball.fielding import create_average_fielder
+from batted_ball.play_simulation import PlaySimulator
+from batted_ball.trajectory import BattedBallSimulator
+
+
+def make_fly_balls(num_balls, seed=42):
+    """Airborne balls spread over the outfield."""
+    rng = np.random.default_rng(seed)
+    simulator = BattedBallSimulator()
+    return [
+        simulator.simulate(rng.uniform(80.0, 105.0), rng.uniform(22.0, 45.0), rng.uniform(-40.0, 40.0), 1800.0)
+        for _ in range(num_balls)
+    ]
+
+
+def make_defense(layout):
+    """Average fielders at their standard positions."""
+    return {
+        name: create_average_fielder(name, 'outfield' if name.endswith('_field') else 'infield')
+        for name in layout.defensive_positions
+    }
+
+
+def play_all(balls, layout, fielders):
+    """Run every ball through a fresh PlaySimulator with the same defense."""
+    for ball in balls:
+        simulator = PlaySimulator(layout)
+        simulator.setup_defense(fielders)
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulator.simulate_complete_play(ball, create_average_runner("Batter"))
+
+
+class AllocationCounter:
+    """Profiler hook counting FieldPosition constructions and np.array() calls."""
+
+    def __init__(self):
+        self.positions = 0
+        self.arrays = 0
+        self._init_code = FieldPosition.__init__.__code__
+
+    def __call__(self, frame, event, arg):
+        if event == 'call' and frame.f_code is self._init_code:
+            self.positions += 1
+        elif event == 'c_call' and arg is np.array:
+            self.arrays += 1
+
+    def __enter__(self):
+        sys.setprofile(self)
+        return self
+
+    def __exit__(self, *exc):
+        sys.setprofile(None)
+
+
+def benchmark_fly_ball_allocations(num_balls=100, seed=42):
+    """Count allocations and time per fly ball."""
+    layout = FieldLayout()
+    balls = make_fly_balls(num_balls, seed)
+
+    print("=" * 70)
+    print("FLY BALL ALLOCATION BENCHMARK")
+    print(f"Fly balls: {num_balls}")
+    print("=" * 70)
+
+    np.random.seed(seed)
+    fielders = make_defense(layout)
+    with AllocationCounter() as counter:
+        play_all(balls, layout, fielders)
+
+    np.random.seed(seed)
+    fielders = make_defense(layout)
+    start = time.perf_counter()
+    play_all(balls, layout, fielders)
+    elapsed = time.perf_counter() - start
+
+    print(f"FieldPosition objects per fly ball: {counter.positions / num_balls:10.1f}")
+    print(f"np.array() calls per fly ball:      {counter.arrays / num_balls:10.1f}")
+    print(f"Time per fly ball:                  {elapsed / num_balls * 1000:10.2f} ms")
+    print("=" * 70)
+    return counter, elapsed
+
+
+if __name__ == "__main__":
+    num_balls = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    benchmark_fly_ball_allocations(num_balls)
@@ -0,0 +1,119 @@
+"""
+Microbenchmark for GameState updates and end-of-game result extraction.
+
+Compares the compact GameState (__slots__, base mask, single-call counter
+extraction) against an equivalent plain dataclass with the same field layout
+as the original implementation.
+
+Usage:
+    python benchmarks/benchmark_game_state.py
+"""
+
+import time
+import sys
+import os
+from dataclasses import field, make_dataclass
+from typing import List
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batted_ball.game_simulation import GameState, GAME_STATE_COUNTER_FIELDS
+
+
+# Reference: the original dataclass layout (one attribute per field)
+LegacyGameState = make_dataclass(
+    'LegacyGameState',
+    [('inning', int, 1), ('is_top', bool, True), ('outs', int, 0),
+     ('runner_on_first', object, None), ('runner_on_second', object, None),
+     ('runner_on_third', object, None), ('total_pitches', int, 0)]
+    + [(name, int, 0) for name in GAME_STATE_COUNTER_FIELDS]
+    + [(name, List[float], field(default_factory=list)) for name in
+       ('away_exit_velocities', 'away_launch_angles',
+        'home_exit_velocities', 'home_launch_angles')],
+)
+
+
+def simulate_updates(state, n_pa: int):
+    """Apply a representative per-PA update pattern to a state object."""
+    runner = object()
+    for i in range(n_pa):
+        state.total_pitches += 4
+        if state.is_top:
+            state.away_at_bats += 1
+            if i % 4 == 0:
+                state.away_hits += 1
+                state.away_singles += 1
+                state.runner_on_first = runner
+            else:
+                state.away_ground_balls += 1
+                state.away_ground_ball_outs += 1
+                state.outs += 1
+        else:
+            state.home_at_bats += 1
+            if i % 4 == 0:
+                state.home_hits += 1
+                state.home_singles += 1
+                state.runner_on_first = runner
+            else:
+                state.home_fly_balls += 1
+                state.home_fly_ball_outs += 1
+                state.outs += 1
+        if state.outs >= 3:
+            state.outs = 0
+            state.runner_on_first = None
+            state.runner_on_second = None
+            state.runner_on_third = None
+            state.is_top = not state.is_top
+
+
+def extract_legacy(state):
+    """Field-by-field copy, as GameResult construction used to do."""
+    return {name: getattr(state, name) for name in GAME_STATE_COUNTER_FIELDS}
+
+
+def extract_compact(state):
+    """One C-level attrgetter read via export_counters()."""
+    return state.export_counters()
+
+
+def bench(label, factory, extract, n_games: int, pa_per_game: int = 76):
+    start = time.perf_counter()
+    for _ in range(n_games):
+        simulate_updates(factory(), pa_per_game)
+    update_time = time.perf_counter() - start
+
+    state = factory()
+    simulate_updates(state, pa_per_game)
+    start = time.perf_counter()
+    for _ in range(n_games):
+        extract(state)
+    extract_time = time.perf_counter() - start
+
+    print(f"\n{label}:")
+    print(f"  Updates:    {update_time / n_games * 1e6:8.1f} us/game")
+    print(f"  Extraction: {extract_time / n_games * 1e6:8.2f} us/game")
+    return update_time, extract_time
+
+
+def benchmark_game_state(n_games: int = 20000):
+    """Compare legacy dataclass vs compact GameState."""
+    print("=" * 70)
+    print("GAMESTATE MICROBENCHMARK")
+    print(f"{n_games} games x 76 plate appearances")
+    print("=" * 70)
+
+    legacy = bench("Legacy dataclass", LegacyGameState, extract_legacy, n_games)
+    compact = bench("Compact GameState", GameState, extract_compact, n_games)
+
+    print("\n" + "=" * 70)
+    print(f"Update speedup:     {legacy[0] / compact[0]:.2f}x")
+    print(f"Extraction speedup: {legacy[1] / compact[1]:.2f}x")
+    legacy_size = sys.getsizeof(LegacyGameState()) + sys.getsizeof(LegacyGameState().__dict__)
+    print(f"Instance size: legacy {legacy_size} B, compact {sys.getsizeof(GameState())} B "
+          f"(excluding lists)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    benchmark_game_state()
@@ -0,0 +1,107 @@
+"""
+Benchmark ground-ball interception per grounder.
+
+Compares the two GroundBallInterceptor paths on the same ground balls and
+defense:
+- Per-fielder: the reference loop, one _calculate_fielder_interception per fielder
+- Batch: all fielders packed into arrays, one kernel call
+  (trajectory_rs.find_ground_ball_interception, or the NumPy kernel)
+
+Usage:
+    python benchmarks/benchmark_ground_ball_interception.py [num_grounders]
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from batted_ball.attributes import FielderAttributes
+from batted_ball.constants import MPH_TO_MS
+from batted_ball.field_layout import FieldPosition
+from batted_ball.fielding import Fielder
+from batted_ball.ground_ball_interception import GroundBallInterceptor, _RUST_GROUND_BALL_BATCH_AVAILABLE
+
+DEFENSE = {
+    'pitcher': (0.0, 60.5), 'catcher': (0.0, -3.0),
+    'first_base': (64.0, 91.0), 'second_base': (31.0, 144.0),
+    'shortstop': (-31.0, 144.0), 'third_base': (-64.0, 102.0),
+    'left_field': (-110.0, 280.0), 'center_field': (0.0, 320.0), 'right_field': (110.0, 280.0),
+}
+
+
+def make_defense(seed=0):
+    """Nine fielders at standard depth with varied speed and reactions."""
+    rng = np.random.default_rng(seed)
+    return {
+        name: Fielder(
+            name=name, position='outfield' if name.endswith('field') else 'infield',
+            attributes=FielderAttributes(REACTION_TIME=int(rng.integers(20000, 90000)),
+                                         TOP_SPRINT_SPEED=int(rng.integers(20000, 99000))),
+            current_position=FieldPosition(x, y, 0.0),
+        )
+        for name, (x, y) in DEFENSE.items()
+    }
+
+
+def make_grounders(num_grounders, seed=42):
+    """Landed ground balls in the shape GroundBallInterceptor reads from BattedBallResult."""
+    rng = np.random.default_rng(seed)
+    balls = []
+    for _ in range(num_grounders):
+        exit_velocity = rng.uniform(40.0, 115.0) * MPH_TO_MS
+        spray = np.radians(rng.uniform(-45.0, 45.0))
+        launch = np.radians(rng.uniform(-15.0, 0.0))
+        landing_y = rng.uniform(2.0, 40.0)
+        balls.append(SimpleNamespace(
+            landing_x=-landing_y * np.tan(spray), landing_y=landing_y,
+            exit_velocity=exit_velocity, flight_time=rng.uniform(0.1, 0.5),
+            # Trajectory coordinates: x toward center field, y toward left field (field x = -y)
+            velocity=[exit_velocity * np.array([np.cos(spray), np.sin(spray), np.sin(launch)])],
+        ))
+    return balls
+
+
+def time_per_grounder(interceptor, balls, fielders):
+    """Results and mean seconds per find_best_interception() call."""
+    start = time.perf_counter()
+    results = [interceptor.find_best_interception(ball, fielders) for ball in balls]
+    return results, (time.perf_counter() - start) / len(balls)
+
+
+def benchmark_ground_ball_interception(num_grounders=2000):
+    """Per-grounder time of the per-fielder loop and the batched kernel."""
+    balls = make_grounders(num_grounders)
+    fielders = make_defense()
+
+    print("=" * 70)
+    print("GROUND BALL INTERCEPTION BENCHMARK")
+    print(f"Grounders: {num_grounders}, fielders: {len(fielders)}")
+    print(f"Batch kernel: {'trajectory_rs' if _RUST_GROUND_BALL_BATCH_AVAILABLE else 'NumPy'}")
+    print("=" * 70)
+
+    reference, reference_time = time_per_grounder(GroundBallInterceptor(use_batch=False), balls, fielders)
+    batch, batch_time = time_per_grounder(GroundBallInterceptor(), balls, fielders)
+
+    agree = sum(r.fielding_position == b.fielding_position
+                and abs(r.interception_time - b.interception_time) < 1e-9
+                for r, b in zip(reference, batch))
+    fielded = sum(b.can_be_fielded for b in batch)
+
+    print(f"Per-fielder: {reference_time * 1e6:9.1f} us/grounder")
+    print(f"Batch:       {batch_time * 1e6:9.1f} us/grounder")
+    print(f"Speedup: {reference_time / batch_time:.1f}x")
+    print(f"Same fielder and time: {agree}/{num_grounders}, fielded: {fielded}")
+    print("=" * 70)
+    return reference_time, batch_time
+
+
+if __name__ == "__main__":
+    num_grounders = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    benchmark_ground_ball_interception(num_grounders)
@@ -0,0 +1,110 @@
+"""
+Benchmark the cost of building PitchResult and BattedBallResult objects.
+
+Both results derive their summary quantities on first access. For a batch
+of simulated pitches and batted balls (trajectories simulated once, outside
+the timings), compares per result:
+- Construct: wrapping the integrator output, no derived quantity read
+- Typical: construct and read what an at-bat reads (location, strike, speed,
+  break / landing point, distance, flight time)
+- All: construct and read every derived quantity
+- Loop break: the former per-sample Python loop for the pitch break
+
+Usage:
+    python benchmarks/benchmark_lazy_results.py [num_pitches] [num_balls]
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball import BattedBallSimulator, PitchSimulator
+from batted_ball.pitch import PitchResult, create_changeup, create_curveball, create_fastball_4seam, create_slider
+from batted_ball.trajectory import BattedBallResult
+
+PITCH_TYPICAL = ('plate_y', 'plate_z', 'is_strike', 'plate_speed', 'vertical_break', 'horizontal_break')
+PITCH_ALL = PITCH_TYPICAL + ('crossed_plate', 'plate_x', 'flight_time', 'total_break')
+BALL_TYPICAL = ('landing_x', 'landing_y', 'distance', 'flight_time')
+BALL_ALL = BALL_TYPICAL + ('landing_z', 'peak_height', 'time_to_peak', 'final_velocity', 'spray_angle_landing')
+
+
+def loop_break(position, plate_pos):
+    """Maximum vertical/horizontal deviation from the release-to-plate line, one sample at a time."""
+    release_pos = position[0]
+    max_vertical_dev = 0.0
+    max_horizontal_dev = 0.0
+    for pos in position:
+        vec_to_plate = plate_pos - release_pos
+        t = np.clip(np.dot(pos - release_pos, vec_to_plate) / np.dot(vec_to_plate, vec_to_plate), 0, 1)
+        deviation = pos - (release_pos + t * vec_to_plate)
+        max_vertical_dev = max(abs(deviation[2]), max_vertical_dev)
+        max_horizontal_dev = max(abs(deviation[1]), max_horizontal_dev)
+    return max_vertical_dev, max_horizontal_dev
+
+
+def time_results(cls, args_list, attributes, repeats):
+    """Seconds per result to construct each result and read the given attributes."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for args in args_list:
+            result = cls(*args)
+            for name in attributes:
+                getattr(result, name)
+    return (time.perf_counter() - start) / (repeats * len(args_list))
+
+
+def benchmark_lazy_results(num_pitches=200, num_balls=200, repeats=5, seed=42):
+    """Construction and first-read cost of pitch and batted ball results."""
+    rng = np.random.default_rng(seed)
+    np.random.seed(seed)
+    makers = [create_fastball_4seam, create_slider, create_curveball, create_changeup]
+
+    pitch_simulator = PitchSimulator()
+    pitches = [
+        pitch_simulator.simulate(makers[i % len(makers)](), target_x=rng.uniform(-0.7, 0.7),
+                                 target_z=rng.uniform(1.5, 3.5))
+        for i in range(num_pitches)
+    ]
+    pitch_args = [(p.trajectory_data, p.pitch_type, p.release_params, p.environment) for p in pitches]
+
+    ball_simulator = BattedBallSimulator()
+    balls = [
+        ball_simulator.simulate(rng.uniform(70.0, 110.0), rng.uniform(-10.0, 50.0), rng.uniform(-40.0, 40.0), 1800.0)
+        for _ in range(num_balls)
+    ]
+    ball_args = [(b.trajectory_data, b.initial_conditions, b.environment) for b in balls]
+
+    print("=" * 70)
+    print("LAZY RESULT BENCHMARK")
+    print(f"Pitches: {num_pitches}, batted balls: {num_balls}, repeats: {repeats}")
+    print("=" * 70)
+
+    pitch_times = [time_results(PitchResult, pitch_args, attributes, repeats)
+                   for attributes in ((), PITCH_TYPICAL, PITCH_ALL)]
+
+    start = time.perf_counter()
+    for p in pitches:
+        crossing = np.where(p.position[:, 0] <= 0)[0]
+        loop_break(p.position, p.position[crossing[0]] if len(crossing) else p.position[-1])
+    loop_time = (time.perf_counter() - start) / num_pitches
+
+    ball_times = [time_results(BattedBallResult, ball_args, attributes, repeats)
+                  for attributes in ((), BALL_TYPICAL, BALL_ALL)]
+
+    print(f"{'':20s}{'Construct':>12s}{'Typical':>12s}{'All':>12s}")
+    print(f"{'Pitch (us)':20s}" + "".join(f"{t * 1e6:12.1f}" for t in pitch_times))
+    print(f"{'Batted ball (us)':20s}" + "".join(f"{t * 1e6:12.1f}" for t in ball_times))
+    print(f"Loop break:          {loop_time * 1e6:10.1f} us/pitch")
+    print("=" * 70)
+    return pitch_times, ball_times, loop_time
+
+
+if __name__ == "__main__":
+    num_pitches = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    num_balls = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    benchmark_lazy_results(num_pitches, num_balls)
@@ -0,0 +1,129 @@
+"""
+Benchmark the per-pitch cost of the metrics collector in bulk runs.
+
+Simulates the same seeded set of at-bats with metrics OFF (the shared
+NullMetricsCollector that GameSimulator uses for debug_metrics=0) and with
+metrics BASIC, counting how many PitchMetrics/BattedBallMetrics objects are
+constructed. With metrics OFF the count must be zero.
+
+Usage:
+    python benchmarks/benchmark_metrics_overhead.py
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import numpy as np
+
+from batted_ball import sim_metrics
+from batted_ball.sim_metrics import DebugLevel, create_metrics_collector, NULL_METRICS_COLLECTOR
+from batted_ball.at_bat import AtBatSimulator
+from batted_ball.constants import SimulationMode
+from batted_ball.game_simulation import create_test_team
+
+
+class _ConstructionCounter:
+    """Counts __post_init__ calls on the metric dataclasses while active."""
+
+    def __init__(self):
+        self.counts = {'PitchMetrics': 0, 'BattedBallMetrics': 0}
+        self._originals = {}
+
+    def __enter__(self):
+        for name in self.counts:
+            cls = getattr(sim_metrics, name)
+            original = cls.__post_init__
+            self._originals[name] = original
+
+            def counted(obj, _original=original, _name=name):
+                self.counts[_name] += 1
+                _original(obj)
+
+            cls.__post_init__ = counted
+        return self
+
+    def __exit__(self, *exc):
+        for name, original in self._originals.items():
+            getattr(sim_metrics, name).__post_init__ = original
+
+
+def run_at_bats(collector, n_at_bats: int, seed: int = 42):
+    """
+    Simulate n_at_bats with the given collector.
+
+    Returns
+    -------
+    tuple
+        (elapsed_seconds, total_pitches)
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    away = create_test_team("Away", "average")
+    home = create_test_team("Home", "average")
+    pitcher = home.pitchers[0]
+
+    # GameSimulator passes None to AtBatSimulator when the collector is OFF
+    at_bat_collector = collector if collector.enabled else None
+
+    total_pitches = 0
+    start = time.perf_counter()
+    for i in range(n_at_bats):
+        batter = away.hitters[i % len(away.hitters)]
+        pitcher.pitches_thrown = 0
+        sim = AtBatSimulator(
+            pitcher,
+            batter,
+            metrics_collector=at_bat_collector,
+            simulation_mode=SimulationMode.ULTRA_FAST,
+        )
+        total_pitches += len(sim.simulate_at_bat().pitches)
+    elapsed = time.perf_counter() - start
+    return elapsed, total_pitches
+
+
+def benchmark_metrics_overhead(n_at_bats: int = 200):
+    """Compare metrics OFF vs BASIC over the same seeded at-bats."""
+    print("=" * 70)
+    print("METRICS COLLECTOR OVERHEAD BENCHMARK")
+    print(f"Simulating {n_at_bats} at-bats per level")
+    print("=" * 70)
+
+    off_collector = create_metrics_collector(DebugLevel.OFF)
+    assert off_collector is NULL_METRICS_COLLECTOR
+
+    # Warm up trajectory caches/JIT so the first level isn't penalized
+    run_at_bats(off_collector, 5)
+
+    results = {}
+    for label, collector in [
+        ('OFF', off_collector),
+        ('BASIC', create_metrics_collector(DebugLevel.BASIC)),
+    ]:
+        with _ConstructionCounter() as counter:
+            elapsed, pitches = run_at_bats(collector, n_at_bats)
+        results[label] = (elapsed, pitches, dict(counter.counts))
+        print(f"\n{label}:")
+        print(f"  Time: {elapsed:.2f}s, {elapsed / pitches * 1e6:.0f} us/pitch ({pitches} pitches)")
+        print(f"  PitchMetrics built: {counter.counts['PitchMetrics']}")
+        print(f"  BattedBallMetrics built: {counter.counts['BattedBallMetrics']}")
+
+    off_counts = results['OFF'][2]
+    print("\n" + "=" * 70)
+    if off_counts['PitchMetrics'] == 0 and off_counts['BattedBallMetrics'] == 0:
+        print("PASS: no metric objects constructed with metrics OFF")
+    else:
+        print("FAIL: metric objects constructed with metrics OFF")
+    off_rate = results['OFF'][0] / results['OFF'][1]
+    basic_rate = results['BASIC'][0] / results['BASIC'][1]
+    print(f"Per-pitch cost of BASIC metrics: {(basic_rate - off_rate) * 1e6:+.0f} us")
+    print("=" * 70)
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_metrics_overhead()
@@ -0,0 +1,75 @@
+"""
+Benchmark the park-factor Monte Carlo engine.
+
+Draws one batted-ball sample and runs it through every park:
+- Paired: the same balls in every park (common random numbers)
+- Independent: a fresh sample and bootstrap per park, as separate runs would
+
+Reports the run time and the mean width of the HR/XBH/BABIP factor
+confidence intervals for both designs.
+
+Usage:
+    python benchmarks/benchmark_park_factors.py [num_balls] [num_bootstrap]
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball import fast_trajectory
+from batted_ball.park_factors import STATS, BattedBallSample, ParkFactorEngine
+
+
+def mean_widths(results):
+    """Mean confidence-interval width per stat."""
+    return {stat: np.diff(results.intervals[stat], axis=1).mean() for stat in STATS}
+
+
+def benchmark_park_factors(num_balls=1000, num_bootstrap=500, seed=42):
+    """Time both designs and compare their interval widths."""
+    engine = ParkFactorEngine()
+    sample = BattedBallSample.draw(num_balls, seed=seed)
+
+    print("=" * 70)
+    print("PARK FACTOR BENCHMARK")
+    print(f"Parks: {len(engine.parks)}, balls: {num_balls}, bootstrap: {num_bootstrap}, "
+          f"airborne: {sample.airborne.sum()}")
+    print(f"Integrator: {'trajectory_rs' if fast_trajectory.RUST_AVAILABLE else 'NumPy'}")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    paired = engine.run(sample=sample, seed=seed, n_bootstrap=num_bootstrap)
+    paired_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    independent = engine.run(sample=sample, seed=seed, n_bootstrap=num_bootstrap,
+                             common_random_numbers=False)
+    independent_time = time.perf_counter() - start
+
+    print(f"Paired:      {paired_time:8.2f} s  "
+          f"{num_balls * len(engine.parks) / paired_time:10,.0f} ball-parks/s")
+    print(f"Independent: {independent_time:8.2f} s  "
+          f"{num_balls * len(engine.parks) / independent_time:10,.0f} ball-parks/s")
+    print()
+
+    paired_widths = mean_widths(paired)
+    independent_widths = mean_widths(independent)
+    print(f"{'CI width':<10} {'paired':>10} {'independent':>12} {'ratio':>8}")
+    for stat in STATS:
+        print(f"{stat:<10} {paired_widths[stat]:10.3f} {independent_widths[stat]:12.3f} "
+              f"{independent_widths[stat] / paired_widths[stat]:7.1f}x")
+    print()
+    print(paired.summary())
+    print("=" * 70)
+    return paired, independent
+
+
+if __name__ == "__main__":
+    num_balls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    num_bootstrap = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    benchmark_park_factors(num_balls, num_bootstrap)
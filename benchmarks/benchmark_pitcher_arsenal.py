@@ -0,0 +1,92 @@
+"""
+Benchmark per-pitch setup with and without the pitcher arsenal cache.
+
+Per pitch, AtBatSimulator needs a pitch type and a PitchType with fatigued
+velocity and spin. Compares:
+- Per pitch: getters plus a create_*() factory, weights through np.random.choice
+- Cached: PitcherArsenal.build_pitch() and PitcherArsenal.select_pitch_type()
+
+Usage:
+    python benchmarks/benchmark_pitcher_arsenal.py
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.arsenal import PITCH_FACTORIES, count_weight_multiplier
+from batted_ball.game_simulation import create_test_team
+
+
+N_PITCHES = 20000
+
+
+def per_pitch_setup(pitcher, situations):
+    """Getters, factory and np.random.choice for every pitch."""
+    for pitches_thrown, count, recent in situations:
+        pitcher.pitches_thrown = pitches_thrown
+        pitch_types = list(pitcher.pitch_arsenal)
+        weights = np.array([
+            max(pitcher.pitch_arsenal[p].get('usage', 50) / 100.0
+                * count_weight_multiplier(p, *count) * (0.3 if p == recent else 1.0), 0.01)
+            for p in pitch_types
+        ])
+        weights /= weights.sum()
+        pitch_type = np.random.choice(pitch_types, p=weights)
+        key, factory = PITCH_FACTORIES.get(pitch_type, PITCH_FACTORIES['fastball'])
+        factory(pitcher.get_pitch_velocity_mph(key), pitcher.get_pitch_spin_rpm(key))
+
+
+def cached_setup(pitcher, situations):
+    """Arsenal selection and fatigue deltas for every pitch."""
+    arsenal = pitcher.get_arsenal()
+    for pitches_thrown, count, recent in situations:
+        pitcher.pitches_thrown = pitches_thrown
+        arsenal.build_pitch(arsenal.select_pitch_type(count, [recent]))
+
+
+def benchmark_pitcher_arsenal():
+    """Compare per-pitch and cached pitch setup."""
+    pitcher = create_test_team("Bench", "average").pitchers[0]
+    pitch_types = list(pitcher.pitch_arsenal)
+    rng = np.random.default_rng(42)
+    situations = [
+        (int(rng.integers(0, 110)), (int(rng.integers(0, 4)), int(rng.integers(0, 3))),
+         pitch_types[int(rng.integers(len(pitch_types)))])
+        for _ in range(N_PITCHES)
+    ]
+
+    print("=" * 70)
+    print("PITCHER ARSENAL CACHE BENCHMARK")
+    print(f"{N_PITCHES:,} pitches, arsenal: {', '.join(pitch_types)}")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    pitcher.prepare_arsenal()
+    build_us = (time.perf_counter() - start) * 1e6
+
+    # Alternate runs so both see the same machine state
+    per_pitch = cached = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        per_pitch_setup(pitcher, situations)
+        per_pitch = min(per_pitch, time.perf_counter() - start)
+        start = time.perf_counter()
+        cached_setup(pitcher, situations)
+        cached = min(cached, time.perf_counter() - start)
+
+    print(f"\nArsenal build (once per game): {build_us:8.1f} us")
+    print(f"Per-pitch setup:               {per_pitch / N_PITCHES * 1e6:8.2f} us/pitch")
+    print(f"Cached setup:                  {cached / N_PITCHES * 1e6:8.2f} us/pitch "
+          f"({per_pitch / cached:.1f}x)")
+    print("=" * 70)
+    return {'build_us': build_us, 'per_pitch': per_pitch, 'cached': cached}
+
+
+if __name__ == "__main__":
+    benchmark_pitcher_arsenal()
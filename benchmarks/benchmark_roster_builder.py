@@ -0,0 +1,147 @@
+"""
+Benchmark batch roster building against per-player attribute construction.
+
+Builds a synthetic league (30 teams of 26 hitters and 13 pitchers, the record
+layout TeamDatabase.get_team_data returns) two ways:
+- Per player: one attributes object per record, profile compiled by calling
+  every getter (what TeamLoader did before the roster builder)
+- Batch: build_*_columns() for the whole league, one vectorized pass
+
+Usage:
+    python benchmarks/benchmark_roster_builder.py
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.attributes import HitterAttributes, FielderAttributes, PitcherAttributes
+from batted_ball.database.roster_builder import (
+    attributes_from_columns,
+    build_hitter_columns,
+    build_fielder_columns,
+    build_pitcher_columns,
+    hitter_rating_columns,
+    fielder_rating_columns,
+    pitcher_rating_columns,
+)
+
+
+N_TEAMS = 30
+HITTERS_PER_TEAM = 26
+PITCHERS_PER_TEAM = 13
+
+
+def make_league(seed: int = 42):
+    """Synthetic hitter and pitcher records for a full league."""
+    rng = np.random.default_rng(seed)
+    n_hitters = N_TEAMS * HITTERS_PER_TEAM
+    n_pitchers = N_TEAMS * PITCHERS_PER_TEAM
+
+    def rating(n):
+        return rng.integers(20000, 95000, n).tolist()
+
+    hitters = [
+        {
+            'power': p, 'contact': c, 'discipline': d, 'vision': v,
+            'home_runs': int(hr), 'slugging_pct': float(slg),
+            'bat_speed': float(bs) if bs > 0 else None,
+            'squared_up_rate': float(sq),
+            'reaction_time': rt, 'top_sprint_speed': ss, 'arm_strength': arm,
+        }
+        for p, c, d, v, hr, slg, bs, sq, rt, ss, arm in zip(
+            rating(n_hitters), rating(n_hitters), rating(n_hitters), rating(n_hitters),
+            rng.integers(0, 45, n_hitters), rng.uniform(0.3, 0.6, n_hitters),
+            rng.uniform(-30, 78, n_hitters), rng.uniform(0.15, 0.40, n_hitters),
+            rating(n_hitters), rating(n_hitters), rating(n_hitters),
+        )
+    ]
+    pitchers = [
+        {'velocity': v, 'command': c, 'stamina': s, 'movement': m,
+         'nibbling_tendency': float(nb)}
+        for v, c, s, m, nb in zip(
+            rating(n_pitchers), rating(n_pitchers), rating(n_pitchers), rating(n_pitchers),
+            rng.uniform(0.2, 0.8, n_pitchers),
+        )
+    ]
+    return hitters, pitchers
+
+
+def _per_player(attributes_class, columns):
+    """Construct and compile one attributes object per player."""
+    names = [name for name in columns if name in attributes_class._RATING_NAMES
+             or name in attributes_class._MEASURED_NAMES]
+    result = []
+    for i in range(len(next(iter(columns.values())))):
+        kwargs = {}
+        for name in names:
+            value = float(columns[name][i])
+            kwargs[name] = None if np.isnan(value) else value
+        attributes = attributes_class(**kwargs)
+        attributes.compile_profile()
+        result.append(attributes)
+    return result
+
+
+def build_per_player(hitters, pitchers):
+    """Per-player construction (rating adjustments shared, mapping per getter)."""
+    _per_player(HitterAttributes, hitter_rating_columns(hitters))
+    _per_player(FielderAttributes, fielder_rating_columns(hitters))
+    _per_player(PitcherAttributes, pitcher_rating_columns(pitchers))
+
+
+def build_columns(hitters, pitchers):
+    """Every rating and profile column, vectorized."""
+    return (build_hitter_columns(hitters), build_fielder_columns(hitters),
+            build_pitcher_columns(pitchers))
+
+
+def build_objects(hitters, pitchers):
+    """Vectorized columns plus attribute objects with precompiled profiles."""
+    hitter_columns, fielder_columns, pitcher_columns = build_columns(hitters, pitchers)
+    attributes_from_columns(HitterAttributes, hitter_columns)
+    attributes_from_columns(FielderAttributes, fielder_columns)
+    attributes_from_columns(PitcherAttributes, pitcher_columns)
+
+
+def _best_time(func, *args, repeats: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_roster_builder():
+    """Compare per-player and batch construction for a full league."""
+    hitters, pitchers = make_league()
+    print("=" * 70)
+    print("BATCH ROSTER BUILDER BENCHMARK")
+    print(f"{N_TEAMS} teams: {len(hitters)} hitters (+ fielders), {len(pitchers)} pitchers")
+    print("=" * 70)
+
+    # Warm up
+    build_per_player(hitters[:10], pitchers[:10])
+    build_objects(hitters[:10], pitchers[:10])
+
+    per_player = _best_time(build_per_player, hitters, pitchers, repeats=3)
+    columns_only = _best_time(build_columns, hitters, pitchers)
+    objects = _best_time(build_objects, hitters, pitchers, repeats=3)
+
+    print(f"\nPer-player compile:          {per_player * 1000:8.1f} ms")
+    print(f"Batch columns only:          {columns_only * 1000:8.1f} ms "
+          f"({per_player / columns_only:.0f}x)")
+    print(f"Batch columns + objects:     {objects * 1000:8.1f} ms "
+          f"({per_player / objects:.1f}x)")
+    print("=" * 70)
+    return {'per_player': per_player, 'columns': columns_only, 'objects': objects}
+
+
+if __name__ == "__main__":
+    benchmark_roster_builder()
@@ -0,0 +1,112 @@
+"""
+Thread-scaling benchmark for ThreadedGameSimulator.
+
+Runs the same set of games with 1, 2, 4, ... N threads and reports games/s,
+speedup over one thread and parallel efficiency. Threads share the Team
+objects, so nothing is pickled; they only run in parallel while a
+trajectory_rs kernel (which releases the GIL) is executing. A process-pool
+run at N workers (ParallelGameSimulator, which serializes the teams for
+every game) is printed as the reference.
+
+Both paths use SimulationMode.ACCURATE, the mode the process pool runs.
+
+Usage:
+    python benchmarks/benchmark_thread_scaling.py [num_games] [max_threads] [--no-processes]
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from multiprocessing import cpu_count
+
+from batted_ball import fast_trajectory
+from batted_ball.constants import SimulationMode
+from batted_ball.game_simulation import create_test_team
+from batted_ball.parallel_game_simulation import (
+    ParallelGameSimulator,
+    ParallelSimulationSettings,
+    ThreadedGameSimulator,
+    ThreadedSimulationSettings,
+)
+
+
+def thread_counts(max_threads):
+    """1, 2, 4, ... up to and including max_threads."""
+    counts = []
+    n = 1
+    while n < max_threads:
+        counts.append(n)
+        n *= 2
+    counts.append(max_threads)
+    return counts
+
+
+def run_threaded(away, home, num_games, num_threads):
+    """Wall time for num_games on num_threads threads."""
+    simulator = ThreadedGameSimulator(ThreadedSimulationSettings(
+        num_workers=num_threads,
+        simulation_mode=SimulationMode.ACCURATE,
+        show_progress=False,
+        base_seed=42,
+    ))
+    start = time.perf_counter()
+    simulator.simulate_games(away, home, num_games)
+    return time.perf_counter() - start
+
+
+def run_processes(away, home, num_games, num_workers):
+    """Wall time for num_games on a process pool of num_workers."""
+    simulator = ParallelGameSimulator(ParallelSimulationSettings(
+        num_workers=num_workers,
+        show_progress=False,
+    ))
+    start = time.perf_counter()
+    simulator.simulate_games(away, home, num_games)
+    return time.perf_counter() - start
+
+
+def benchmark_thread_scaling(num_games=16, max_threads=None, include_processes=True):
+    """Games/s for 1..max_threads threads, plus a process-pool reference."""
+    max_threads = max_threads or cpu_count()
+    rust_kernels = fast_trajectory.RUST_AVAILABLE and hasattr(
+        fast_trajectory.trajectory_rs, 'integrate_trajectory'
+    )
+
+    away = create_test_team("Scaling Away", "average")
+    home = create_test_team("Scaling Home", "average")
+
+    print("=" * 70)
+    print("THREADED GAME SIMULATION SCALING")
+    print(f"Games per run: {num_games}, CPU cores: {cpu_count()}")
+    print(f"trajectory_rs kernels: {'yes (GIL released)' if rust_kernels else 'not built'}")
+    print("=" * 70)
+
+    # Warm up JIT compilation and lookup tables outside the timings
+    run_threaded(away, home, 1, 1)
+
+    results = {}
+    print(f"\n{'Threads':>8s}{'Time (s)':>11s}{'Games/s':>10s}{'Speedup':>10s}{'Efficiency':>12s}")
+    for n in thread_counts(max_threads):
+        elapsed = run_threaded(away, home, num_games, n)
+        results[n] = elapsed
+        speedup = results[1] / elapsed
+        print(f"{n:8d}{elapsed:11.2f}{num_games / elapsed:10.2f}"
+              f"{speedup:9.2f}x{speedup / n * 100:11.0f}%")
+
+    if include_processes:
+        elapsed = run_processes(away, home, num_games, max_threads)
+        results['processes'] = elapsed
+        print(f"\nProcess pool ({max_threads} workers): {elapsed:.2f} s, "
+              f"{num_games / elapsed:.2f} games/s, "
+              f"threads vs processes: {elapsed / results[max_threads]:.2f}x")
+    print("=" * 70)
+    return results
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3] if not arg.startswith('--')]
+    benchmark_thread_scaling(*args, include_processes='--no-processes' not in sys.argv)
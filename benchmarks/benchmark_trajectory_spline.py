@@ -0,0 +1,86 @@
+"""
+Benchmark position-at-time queries on raw trajectories vs the Hermite spline.
+
+For a batch of simulated batted balls, compares:
+- Raw: searchsorted + linear interpolation on the 1 ms integrator arrays
+- Spline: BattedBallResult.spline.position() / positions()
+- Memory held by the raw arrays vs the spline
+
+Usage:
+    python benchmarks/benchmark_trajectory_spline.py [num_balls] [queries_per_ball]
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball import BattedBallSimulator
+
+
+def raw_position(result, t):
+    """Linear interpolation between the integrator samples bracketing t."""
+    idx = np.searchsorted(result.time, t)
+    alpha = (t - result.time[idx - 1]) / (result.time[idx] - result.time[idx - 1])
+    return result.position[idx - 1] + alpha * (result.position[idx] - result.position[idx - 1])
+
+
+def benchmark_trajectory_spline(num_balls=200, queries_per_ball=200, seed=42):
+    """Query throughput and memory for raw arrays and splines."""
+    rng = np.random.default_rng(seed)
+    simulator = BattedBallSimulator()
+    results = [
+        simulator.simulate(rng.uniform(70.0, 110.0), rng.uniform(5.0, 50.0), rng.uniform(-40.0, 40.0), 1800.0)
+        for _ in range(num_balls)
+    ]
+    queries = [rng.uniform(0.01, r.flight_time - 0.01, queries_per_ball) for r in results]
+    total = num_balls * queries_per_ball
+
+    print("=" * 70)
+    print("TRAJECTORY SPLINE BENCHMARK")
+    print(f"Balls: {num_balls}, queries per ball: {queries_per_ball}")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    splines = [r.spline for r in results]
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for r, times in zip(results, queries):
+        for t in times:
+            raw_position(r, t)
+    raw_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for spline, times in zip(splines, queries):
+        for t in times:
+            spline.position(t)
+    spline_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for spline, times in zip(splines, queries):
+        spline.positions(times)
+    batch_time = time.perf_counter() - start
+
+    raw_bytes = sum(r.time.nbytes + r.position.nbytes + r.velocity.nbytes for r in results)
+    spline_bytes = sum(s.knot_times.nbytes + s.knot_positions.nbytes + s.knot_velocities.nbytes
+                       + s.durations.nbytes + s.coefficients.nbytes for s in splines)
+
+    print(f"Spline build:         {build_time / num_balls * 1e6:10.1f} us/ball")
+    print(f"Raw scalar query:     {raw_time / total * 1e6:10.2f} us")
+    print(f"Spline scalar query:  {spline_time / total * 1e6:10.2f} us")
+    print(f"Spline batch query:   {batch_time / total * 1e6:10.3f} us")
+    print(f"Raw arrays:           {raw_bytes / num_balls / 1024:10.1f} KiB/ball")
+    print(f"Spline:               {spline_bytes / num_balls / 1024:10.1f} KiB/ball")
+    print("=" * 70)
+    return raw_time, spline_time, batch_time
+
+
+if __name__ == "__main__":
+    num_balls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    queries_per_ball = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    benchmark_trajectory_spline(num_balls, queries_per_ball)
@@ -0,0 +1,71 @@
+"""
+Benchmark umpire ball/strike calls: exact rules vs the call grid.
+
+Calls the same random taken pitches three ways:
+- Exact: UmpireModel.call_pitch_exact() (zone distance and borderline rules)
+- Grid: UmpireModel.call_pitch() (table lookup plus one uniform draw)
+- Batch: UmpireModel.call_pitches() on the whole array
+
+Usage:
+    python benchmarks/benchmark_umpire_calls.py
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.umpire import UmpireModel
+
+
+N_PITCHES = 100000
+
+
+def _call_each(call, horizontal, vertical, framing_bonus):
+    for h, v in zip(horizontal, vertical):
+        call(h, v, framing_bonus)
+
+
+def _best_time(func, *args, repeats: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_umpire_calls():
+    """Per-call cost of exact, grid and batch umpire calls."""
+    rng = np.random.default_rng(42)
+    horizontal = rng.normal(0.0, 9.0, N_PITCHES)
+    vertical = rng.normal(30.0, 9.0, N_PITCHES)
+    umpire = UmpireModel()
+    framing_bonus = umpire.get_framing_bonus(70000)
+
+    print("=" * 70)
+    print("UMPIRE CALL GRID BENCHMARK")
+    print(f"{N_PITCHES:,} taken pitches")
+    print("=" * 70)
+
+    h_list, v_list = horizontal.tolist(), vertical.tolist()
+    exact = _best_time(_call_each, umpire.call_pitch_exact, h_list, v_list, framing_bonus)
+    grid = _best_time(_call_each, umpire.call_pitch, h_list, v_list, framing_bonus)
+    batch = _best_time(umpire.call_pitches, horizontal, vertical, framing_bonus)
+
+    for label, elapsed in (("Exact", exact), ("Grid", grid), ("Batch", batch)):
+        print(f"{label + ':':<12}{elapsed / N_PITCHES * 1e6:8.3f} us/call "
+              f"({exact / elapsed:6.1f}x)")
+
+    strike_rate = umpire.call_pitches(horizontal, vertical, framing_bonus).mean()
+    print(f"\nBatch strike rate: {strike_rate:.3f}")
+    print("=" * 70)
+    return {'exact': exact, 'grid': grid, 'batch': batch}
+
+
+if __name__ == "__main__":
+    benchmark_umpire_calls()
@@ -0,0 +1,92 @@
+"""
+Benchmark plate appearances: scalar AtBatSimulator vs VectorizedAtBatEngine.
+
+Runs one matchup through:
+- Scalar: AtBatSimulator(fast_mode=True).simulate_at_bat() per PA
+- Vectorized: VectorizedAtBatEngine.simulate() over all PAs at once
+  (first call builds the pitch flight tables, reported separately)
+
+and prints PA/s plus the outcome distributions of both paths.
+
+Usage:
+    python benchmarks/benchmark_vectorized_at_bat.py [n_scalar] [n_vectorized]
+"""
+
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.at_bat import AtBatSimulator
+from batted_ball.game_simulation import create_test_team
+from batted_ball.vectorized_at_bat import VectorizedAtBatEngine
+
+
+def scalar_at_bats(pitcher, hitter, n):
+    """Per-PA loop as BulkAtBatSimulator runs it."""
+    start_pitches = pitcher.pitches_thrown
+    outcomes = {'strikeout': 0, 'walk': 0, 'in_play': 0}
+    pitches = 0
+    distances = []
+    for _ in range(n):
+        pitcher.pitches_thrown = start_pitches
+        result = AtBatSimulator(pitcher, hitter, fast_mode=True).simulate_at_bat()
+        outcomes[result.outcome] += 1
+        pitches += len(result.pitches)
+        if result.batted_ball_result:
+            distances.append(result.batted_ball_result['distance'])
+    pitcher.pitches_thrown = start_pitches
+    return outcomes, pitches / n, float(np.median(distances)) if distances else 0.0
+
+
+def benchmark_vectorized_at_bat(n_scalar=200, n_vectorized=50000):
+    """Compare scalar and vectorized plate appearances for one matchup."""
+    np.random.seed(42)
+    team = create_test_team("Bench", "average")
+    pitcher, hitter = team.pitchers[0], team.hitters[3]
+
+    print("=" * 70)
+    print("VECTORIZED PLATE-APPEARANCE ENGINE BENCHMARK")
+    print(f"Scalar: {n_scalar:,} PAs, vectorized: {n_vectorized:,} PAs")
+    print(f"Arsenal: {', '.join(pitcher.pitch_arsenal)}")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    outcomes, pitches_per_pa, median_distance = scalar_at_bats(pitcher, hitter, n_scalar)
+    scalar = time.perf_counter() - start
+
+    engine = VectorizedAtBatEngine(pitcher, hitter, fast_mode=True, seed=42)
+    start = time.perf_counter()
+    engine.simulate(100)  # Flight tables and JIT compilation
+    warmup = time.perf_counter() - start
+    start = time.perf_counter()
+    results = engine.simulate(n_vectorized)
+    vectorized = time.perf_counter() - start
+
+    counts = results.outcome_counts()
+    print(f"\n{'':12s}{'K%':>8s}{'BB%':>8s}{'InPlay%':>9s}{'P/PA':>7s}{'Dist':>8s}{'PA/s':>11s}")
+    print(f"{'Scalar':12s}"
+          f"{outcomes['strikeout'] / n_scalar * 100:8.1f}"
+          f"{outcomes['walk'] / n_scalar * 100:8.1f}"
+          f"{outcomes['in_play'] / n_scalar * 100:9.1f}"
+          f"{pitches_per_pa:7.2f}{median_distance:8.1f}"
+          f"{n_scalar / scalar:11.1f}")
+    print(f"{'Vectorized':12s}"
+          f"{counts['strikeout'] / n_vectorized * 100:8.1f}"
+          f"{counts['walk'] / n_vectorized * 100:8.1f}"
+          f"{counts['in_play'] / n_vectorized * 100:9.1f}"
+          f"{results.pitches.mean():7.2f}{np.median(results.distance[results.in_play]):8.1f}"
+          f"{n_vectorized / vectorized:11.1f}")
+    print(f"\nVectorized warm-up (tables, JIT): {warmup:.1f} s")
+    print(f"Speedup: {scalar / n_scalar / (vectorized / n_vectorized):.0f}x per PA")
+    print("=" * 70)
+    return {'scalar': scalar / n_scalar, 'vectorized': vectorized / n_vectorized}
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    benchmark_vectorized_at_bat(*args)
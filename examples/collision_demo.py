@@ -12,6 +12,8 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import numpy as np
+
 from batted_ball.contact import ContactModel
 from batted_ball import BattedBallSimulator
 
@@ -202,15 +204,17 @@ def demo_bat_pitch_speed_matrix():
     print()
     print("-" * 52)
 
-    for bat_speed in bat_speeds:
+    # Whole matrix in one call (bat speeds down, pitch speeds across)
+    result = model.full_collision_batch(
+        bat_speed_mph=np.array(bat_speeds)[:, None],
+        pitch_speed_mph=np.array(pitch_speeds)[None, :],
+        bat_path_angle_deg=28.0
+    )
+
+    for bat_speed, exit_velocities in zip(bat_speeds, result['exit_velocity']):
         print(f"{bat_speed} mph    ", end='')
-        for pitch_speed in pitch_speeds:
-            result = model.full_collision(
-                bat_speed_mph=bat_speed,
-                pitch_speed_mph=pitch_speed,
-                bat_path_angle_deg=28.0
-            )
-            print(f"{result['exit_velocity']:>9.1f}", end='')
+        for exit_velocity in exit_velocities:
+            print(f"{exit_velocity:>9.1f}", end='')
         print()
 
     print("\n💡 Insight: Exit velocity ≈ 1.2×(bat speed) + 0.2×(pitch speed)")
@@ -14,6 +14,12 @@ import random
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from batted_ball.database import TeamDatabase
+from batted_ball.database.roster_builder import (
+    pitcher_stat_ratings,
+    hitter_stat_ratings,
+    defensive_stat_ratings,
+    rating_records,
+)
 
 
 def create_sample_pitchers(team_name: str, season: int, quality: str = "average") -> pd.DataFrame:
@@ -315,8 +321,9 @@ def populate_sample_teams(db_path: str = "baseball_teams.db"):
 
         # Store pitchers
         num_pitchers = 0
-        for _, row in pitchers_df.iterrows():
-            pitcher_id = db._store_pitcher(row, season)
+        pitcher_attrs = rating_records(pitcher_stat_ratings(pitchers_df))
+        for (_, row), attrs in zip(pitchers_df.iterrows(), pitcher_attrs):
+            pitcher_id = db._store_pitcher(row, season, attrs)
             if pitcher_id:
                 cursor.execute("""
                     INSERT INTO team_rosters (team_id, pitcher_id, is_starter)
@@ -326,8 +333,10 @@ def populate_sample_teams(db_path: str = "baseball_teams.db"):
 
         # Store hitters
         num_hitters = 0
-        for idx, row in hitters_df.iterrows():
-            hitter_id = db._store_hitter(row, season)
+        hitter_attrs = rating_records(hitter_stat_ratings(hitters_df))
+        defensive_attrs = rating_records(defensive_stat_ratings(hitters_df))
+        for (idx, row), attrs, defense in zip(hitters_df.iterrows(), hitter_attrs, defensive_attrs):
+            hitter_id = db._store_hitter(row, season, attrs, defense)
             if hitter_id:
                 cursor.execute("""
                     INSERT INTO team_rosters (team_id, hitter_id, batting_order)
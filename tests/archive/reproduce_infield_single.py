@@ -13,6 +13,7 @@ from batted_ball.play_outcome import PlayOutcome, PlayResult, PlayEvent
 from batted_ball.trajectory import BattedBallResult
 from batted_ball.baserunning import BaseRunner
 from batted_ball.field_layout import FieldPosition
+from batted_ball.constants import METERS_TO_FEET
 
 def reproduce_infield_single():
     print("Reproducing Infield Single Bug...")
@@ -35,14 +36,18 @@ def reproduce_infield_single():
 
     # Create a WEAK ground ball result (Infield Single)
     
-    # Mock trajectory
-    steps = 10
+    # Mock trajectory: 40 ft straight toward center, 2 ft peak, 0.5 s flight
+    # (integrator coordinates: x toward the outfield, y lateral, z up, meters)
+    steps = 11
     time = np.linspace(0, 0.5, steps)
     position = np.zeros((steps, 3))
-    position[:, 1] = np.linspace(0, 40.0, steps)
+    position[:, 0] = np.linspace(0, 40.0 / METERS_TO_FEET, steps)
+    position[:, 2] = (2.0 / METERS_TO_FEET) * np.sin(np.pi * time / 0.5)
     velocity = np.zeros((steps, 3))
-    
+    velocity[:, 0] = (40.0 / METERS_TO_FEET) / 0.5
 
+    # landing_x/landing_y, distance, peak_height and flight_time are derived
+    # from these arrays (0, 40, 40, 2, 0.5)
     batted_ball = BattedBallResult(
         {
             'time': time,
@@ -52,16 +57,6 @@ def reproduce_infield_single():
         {'contact_quality': 'weak', 'exit_velocity': 40.0, 'launch_angle': -10.0},
         None
     )
-    # Manually set derived properties
-    batted_ball.landing_x = 0.0
-    batted_ball.landing_y = 40.0
-    batted_ball.hang_time = 0.5
-    batted_ball.peak_height = 2.0
-    batted_ball.flight_time = 0.5
-    batted_ball.distance = 40.0
-
-
-
 
     # Create PlaySimulator
     play_sim = PlaySimulator()
@@ -109,14 +109,16 @@ def reproduce_phantom_run():
     # Use BattedBallResult directly to avoid attribute errors
     
     # Mock trajectory arrays (needed for interception logic)
-    steps = 100
+    # Integrator coordinates: x toward the outfield, y lateral (left field
+    # positive), z up, all in meters
+    steps = 101
     time = np.linspace(0, 3.0, steps)
     position = np.zeros((steps, 3))
     
-    # Populate trajectory (simple arc)
+    # Populate trajectory (simple arc) landing 350 ft out, 100 ft toward right field
     M_TO_FT = 3.28084
-    traj_x_end = 100.0 / M_TO_FT
-    traj_y_end = 350.0 / M_TO_FT
+    traj_x_end = 350.0 / M_TO_FT
+    traj_y_end = -100.0 / M_TO_FT
     
     # Linear x/y, parabolic z
     position[:, 0] = np.linspace(0, traj_x_end, steps)
@@ -129,6 +131,7 @@ def reproduce_phantom_run():
     velocity[:, 1] = traj_y_end / 3.0
     velocity[:, 2] = 0 # Simplified
     
+    # Derived: landing (100, 350), distance ~364 ft, peak 40 ft, flight 3.0 s
     batted_ball = BattedBallResult(
         {
             'time': time,
@@ -138,15 +141,6 @@ def reproduce_phantom_run():
         {'contact_quality': 'solid', 'exit_velocity': 105.0, 'launch_angle': 20.0},
         None
     )
-    # Manually set derived properties that might be calculated in __init__
-    batted_ball.landing_x = 100.0
-    batted_ball.landing_y = 350.0
-    batted_ball.hang_time = 3.0
-    batted_ball.peak_height = 40.0
-    batted_ball.flight_time = 3.0
-    batted_ball.distance = 364.0
-    
-
 
     # Monkeypatch FlyBallHandler to force a hit (prevent catch)
     original_interception = play_sim.fly_ball_handler.attempt_trajectory_interception
@@ -0,0 +1,88 @@
+"""
+Tests for the array-backed defensive alignment index.
+
+Validates:
+1. Batched zone lookup agrees with get_nearest_fielder_position()
+2. Nearest-fielder distances match per-fielder FieldPosition distances
+3. FieldingSimulator rebuilds the index only when fielders move
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.field_layout import AlignmentIndex, FieldLayout, FieldPosition
+from batted_ball.fielding import FieldingSimulator, create_average_fielder
+
+LAYOUT = FieldLayout()
+
+
+def create_simulator():
+    """Fielding simulator with all nine positions filled."""
+    simulator = FieldingSimulator(LAYOUT)
+    for name in LAYOUT.defensive_positions:
+        position = 'outfield' if name.endswith('_field') else 'infield'
+        simulator.add_fielder(name, create_average_fielder(name, position))
+    return simulator
+
+
+class TestFielderZones:
+    """Vectorized zone assignment."""
+
+    def test_matches_scalar_zones(self):
+        rng = np.random.default_rng(8)
+        x = rng.uniform(-300, 300, 2000)
+        y = rng.uniform(-20, 420, 2000)
+        zones = LAYOUT.get_fielder_zones(x, y)
+        expected = [LAYOUT.get_nearest_fielder_position(FieldPosition(bx, by, 0)) for bx, by in zip(x, y)]
+        assert list(zones) == expected
+        assert set(zones) == set(LAYOUT.defensive_positions)
+
+
+class TestAlignmentIndex:
+    """Distances from landing points to the defense."""
+
+    def test_distances_match_field_positions(self):
+        positions = {name: LAYOUT.get_defensive_position(name) for name in LAYOUT.defensive_positions}
+        index = AlignmentIndex(positions)
+        ball = FieldPosition(-35.0, 210.0, 4.0)
+
+        distances = index.distances(ball)[0]
+        horizontal = index.distances(ball, horizontal=True)[0]
+        for name, position in positions.items():
+            assert distances[index.index[name]] == position.distance_to(ball)
+            assert horizontal[index.index[name]] == position.horizontal_distance_to(ball)
+
+        closest, distance = index.nearest([[-35.0, 210.0], [0.0, 60.0]])
+        assert [index.names[i] for i in closest] == ['shortstop', 'pitcher']
+        assert distance[0] == min(p.distance_to(FieldPosition(-35.0, 210.0, 0)) for p in positions.values())
+
+    def test_empty_index(self):
+        closest, distance = AlignmentIndex({}).nearest(FieldPosition(0, 100, 0))
+        assert closest[0] == -1 and np.isinf(distance[0])
+
+
+class TestSimulatorAlignment:
+    """Index caching on FieldingSimulator."""
+
+    def test_rebuilt_when_fielders_move(self):
+        simulator = create_simulator()
+        index = simulator.alignment
+        assert simulator.alignment is index
+        assert len(index.names) == 9
+
+        simulator.fielders['center_field'].update_position(FieldPosition(0.0, 330.0, 0.0))
+        moved = simulator.alignment
+        assert moved is not index
+        assert tuple(moved.coordinates[moved.index['center_field']]) == (0.0, 330.0, 0.0)
+
+        shifted = LAYOUT.apply_defensive_shift(20.0, 'pull_shift')
+        simulator.apply_alignment(shifted)
+        index = simulator.alignment
+        for name, position in shifted.items():
+            assert index.coordinates[index.index[name], 0] == position.x
+        assert simulator.alignment is index
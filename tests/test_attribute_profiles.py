@@ -0,0 +1,64 @@
+"""
+Tests for compiled physical attribute profiles.
+
+Validates:
+1. Compiled getters return the same values as the original mappings
+2. Profiles are immutable plain-float snapshots
+3. Assigning a rating invalidates the profile
+"""
+
+import pickle
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from batted_ball.attributes import (
+    HitterAttributes,
+    PitcherAttributes,
+    FielderAttributes,
+    HitterProfile,
+)
+
+
+class TestAttributeProfiles:
+    """Tests for PhysicalProfile compilation and invalidation."""
+
+    @pytest.mark.parametrize("attrs", [
+        HitterAttributes(BAT_SPEED=72000, VISION=30000),
+        HitterAttributes(actual_bat_speed_mph=74.5),
+        PitcherAttributes(RAW_VELOCITY_CAP=90000, COMMAND=20000),
+        FielderAttributes(TOP_SPRINT_SPEED=95000, ACCELERATION=10000),
+    ])
+    def test_profile_matches_uncompiled_getters(self, attrs):
+        """Every compiled field equals its original getter."""
+        profile = attrs.profile
+        for field, value in profile.as_dict().items():
+            expected = getattr(type(attrs), f"_compute_{field}")(attrs)
+            assert value == pytest.approx(float(expected), rel=1e-12)
+            assert getattr(attrs, f"get_{field}")() == value
+            assert type(value) is float
+
+    def test_profile_is_immutable(self):
+        """Profiles reject assignment and survive pickling."""
+        profile = HitterAttributes().profile
+        assert isinstance(profile, HitterProfile)
+        with pytest.raises(AttributeError):
+            profile.bat_speed_mph = 100.0
+
+        restored = pickle.loads(pickle.dumps(profile))
+        assert restored.as_dict() == profile.as_dict()
+
+    def test_assignment_invalidates_profile(self):
+        """Changing a rating recompiles with the new value."""
+        attrs = FielderAttributes(TOP_SPRINT_SPEED=30000)
+        slow = attrs.get_top_sprint_speed_fps()
+
+        attrs.TOP_SPRINT_SPEED = 90000
+        assert attrs._profile is None
+        fast = attrs.get_top_sprint_speed_fps()
+        assert fast > slow
+        assert attrs.profile.top_sprint_speed_fps == fast
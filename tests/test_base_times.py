@@ -0,0 +1,77 @@
+"""
+Tests for the precomputed base-to-base time tables.
+
+Validates:
+1. Table entries follow the runner's kinematics, turns and leadoffs
+2. Runners with the same ratings share one read-only table
+3. calculate_time_to_base() is a lookup for valid bases and warns otherwise
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from batted_ball.baserunning import BASE_INDEX, BASES, BaseRunner, _running_time
+from batted_ball.constants import BASE_PATH_LENGTH
+
+
+def _kinematic_time(runner, distance, need_turn):
+    """Time from the runner's own getters, bypassing the table."""
+    return _running_time(
+        distance, runner.get_sprint_speed_fps(), runner.get_acceleration_fps2(),
+        runner.get_reaction_time_seconds(), need_turn, runner.get_turn_speed_retention()
+    )
+
+
+class TestTableEntries:
+    """Values in the (include_leadoff, from, to) table."""
+
+    def test_single_base_and_extra_bases(self):
+        runner = BaseRunner(sprint_speed=70000, acceleration=40000, base_running_iq=60000, turn_efficiency=30000)
+        assert runner.base_times.shape == (2, len(BASES), len(BASES))
+
+        home_to_first = runner.calculate_time_to_base("home", "first", include_leadoff=False)
+        assert home_to_first == _kinematic_time(runner, BASE_PATH_LENGTH, need_turn=False)
+        assert home_to_first == runner.get_home_to_first_time()
+
+        # Rounding second costs turn retention; scoring from first covers three paths
+        first_to_third = runner.calculate_time_to_base("first", "third", include_leadoff=False)
+        assert first_to_third == _kinematic_time(runner, 2 * BASE_PATH_LENGTH, need_turn=True)
+        first_to_home = runner.calculate_time_to_base("first", "home", include_leadoff=False)
+        assert first_to_home == _kinematic_time(runner, 3 * BASE_PATH_LENGTH, need_turn=True)
+
+    def test_leadoff_and_backward_moves(self):
+        runner = BaseRunner(base_running_iq=80000)
+        lead = runner.get_optimal_leadoff("second")
+        with_lead = runner.calculate_time_to_base("second", "home")
+        assert with_lead == _kinematic_time(runner, 2 * BASE_PATH_LENGTH - lead, need_turn=True)
+        assert with_lead < runner.calculate_time_to_base("second", "home", include_leadoff=False)
+        # No lead from home
+        assert (runner.base_times[0, BASE_INDEX["home"]] == runner.base_times[1, BASE_INDEX["home"]]).all()
+
+        # Retreating uses the straight line between bases
+        back = runner.calculate_time_to_base("second", "first", include_leadoff=False)
+        assert back == _kinematic_time(runner, np.hypot(63.64, 63.64), need_turn=True)
+
+
+class TestSharedTables:
+    """One table per set of ratings."""
+
+    def test_same_ratings_share_table(self):
+        first = BaseRunner(name="A", sprint_speed=65000, acceleration=65000, base_running_iq=75000)
+        second = BaseRunner(name="B", sprint_speed=65000, acceleration=65000, base_running_iq=75000)
+        slower = BaseRunner(name="C", sprint_speed=30000, acceleration=65000, base_running_iq=75000)
+        assert first.base_times is second.base_times
+        assert not first.base_times.flags.writeable
+        assert (slower.base_times[0, 0, 1:] > first.base_times[0, 0, 1:]).all()
+
+    def test_invalid_base_falls_back(self):
+        runner = BaseRunner()
+        with pytest.warns(UserWarning, match="Invalid base combination"):
+            time = runner.calculate_time_to_base("first", "plate", include_leadoff=False)
+        assert time == _kinematic_time(runner, BASE_PATH_LENGTH, need_turn=True)
@@ -0,0 +1,80 @@
+"""
+Tests for the concurrency budget.
+
+Validates:
+1. Budgets split the available CPUs across processes
+2. Pool workers get capped Numba/BLAS thread counts and their CPU block
+3. ParallelGameSimulator sizes its pool from a budget
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from multiprocessing import Pool
+
+from batted_ball.concurrency import ConcurrencyBudget, available_cpus
+from batted_ball.parallel_game_simulation import ParallelGameSimulator, ParallelSimulationSettings
+
+
+def _worker_limits(_):
+    import numba
+    affinity = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else None
+    return numba.get_num_threads(), os.environ.get('OMP_NUM_THREADS'), affinity
+
+
+class TestBudget:
+    """Splitting CPUs into processes x threads."""
+
+    def test_for_processes(self):
+        n_cpus = len(available_cpus())
+        budget = ConcurrencyBudget.for_processes()
+        assert budget.processes == n_cpus
+        assert budget.threads_per_process == 1
+
+        single = ConcurrencyBudget.for_processes(1)
+        assert single.threads_per_process == n_cpus
+        assert single.total_threads == n_cpus
+
+        oversubscribed = ConcurrencyBudget.for_processes(4 * n_cpus)
+        assert oversubscribed.threads_per_process == 1
+
+    def test_cpu_sets(self):
+        cpus = available_cpus()
+        budget = ConcurrencyBudget(3, 2, pin_cpus=True)
+        sets = budget.cpu_sets()
+        assert len(sets) == 3
+        assert all(len(block) == 2 and set(block) <= set(cpus) for block in sets)
+        if len(cpus) >= 6:
+            assert len({cpu for block in sets for cpu in block}) == 6
+
+
+class TestPoolWorkers:
+    """Initializer applied in pool workers."""
+
+    def test_workers_capped_and_pinned(self):
+        budget = ConcurrencyBudget(2, 1, pin_cpus=True)
+        with Pool(processes=2, **budget.pool_kwargs()) as pool:
+            results = pool.map(_worker_limits, range(4), chunksize=1)
+        blocks = [sorted(block) for block in budget.cpu_sets()]
+        for numba_threads, omp_threads, affinity in results:
+            assert numba_threads == 1
+            assert omp_threads == '1'
+            if affinity is not None:
+                assert affinity in blocks
+
+
+class TestSimulators:
+    """Simulators take their pool size from the budget."""
+
+    def test_parallel_game_simulator_budget(self):
+        simulator = ParallelGameSimulator(ParallelSimulationSettings(num_workers=1))
+        assert simulator.concurrency.processes == 1
+        assert simulator.concurrency.threads_per_process == len(available_cpus())
+
+        budget = ConcurrencyBudget(3, 2)
+        simulator = ParallelGameSimulator(ParallelSimulationSettings(concurrency=budget))
+        assert simulator.num_workers == 3
+        assert simulator.concurrency is budget
@@ -0,0 +1,117 @@
+"""
+Tests for precomputed swing/whiff decision surfaces.
+
+Validates:
+1. The surface matches swing_probability_terms()/whiff_probability_exact()
+2. Validation mode tracks the largest surface-vs-exact difference
+3. Surfaces rebuild when attributes change and extend to unseen pitch types
+4. decide_to_swing() draws the same random numbers on both paths
+5. GameSimulator(decision_surfaces=True) enables surfaces for every hitter
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball import DecisionSurface, GameSimulator, create_test_team
+from batted_ball.attributes import HitterAttributes
+from batted_ball.player import Hitter
+
+
+def _hitter(**ratings):
+    return Hitter("Test Hitter", attributes=HitterAttributes(**ratings))
+
+
+class TestSurfaceAccuracy:
+    """Surface lookups against the exact functions."""
+
+    def test_compare_errors_small(self):
+        for ratings in ({}, {'ZONE_DISCERNMENT': 95000, 'VISION': 20000}):
+            errors = _hitter(**ratings).enable_decision_surface().compare(5000, seed=3)
+            # Only the velocity banding differs from the exact path
+            assert errors['max_swing_error'] < 0.01
+            assert errors['mean_swing_error'] < 0.001
+            assert errors['max_whiff_error'] < 0.01
+
+    def test_chase_step_exact(self):
+        """Location enters in closed form, so the 3\" chase step is not blurred."""
+        hitter = _hitter()
+        surface = hitter.enable_decision_surface()
+        for x in (11.49, 11.5, 11.51):
+            location = (x, 30.0)
+            exact = hitter.swing_probability_terms(location, False, (1, 1), 90.0, 'fastball').final
+            assert abs(surface.swing_probability(location, False, 1, 1, 90.0, 'fastball')
+                       - exact) < 1e-9
+
+    def test_invalid_count_falls_back(self):
+        hitter = _hitter()
+        surface = hitter.enable_decision_surface()
+        exact = hitter.swing_probability_terms((0.0, 30.0), True, (5, 3), 93.0, 'slider').final
+        assert surface.swing_probability((0.0, 30.0), True, 5, 3, 93.0, 'slider') == exact
+
+
+class TestValidationAndRebuild:
+    """Validation mode, attribute changes and new pitch types."""
+
+    def test_validation_report(self):
+        hitter = _hitter()
+        surface = hitter.enable_decision_surface(validate=True)
+        for i in range(50):
+            hitter.decide_to_swing((i - 25.0, 30.0), abs(i - 25.0) <= 8.5, (i % 4, i % 3), 91.3)
+            hitter.calculate_whiff_probability(91.3, 'slider', (2.0, 6.0))
+        report = surface.validation_report()
+        assert report['swings_checked'] == 50 and report['whiffs_checked'] == 50
+        assert 0.0 < report['max_swing_error'] < 0.01
+        assert report['max_whiff_error'] < 0.01
+
+    def test_rebuilds_after_attribute_change(self):
+        hitter = _hitter(ZONE_DISCERNMENT=20000)
+        surface = hitter.enable_decision_surface()
+        before = surface.swing_probability((12.0, 30.0), False, 0, 0, 90.0, 'fastball')
+        hitter.attributes.ZONE_DISCERNMENT = 95000
+        after = surface.swing_probability((12.0, 30.0), False, 0, 0, 90.0, 'fastball')
+        assert after < before
+        exact = hitter.swing_probability_terms((12.0, 30.0), False, (0, 0), 90.0, 'fastball').final
+        assert abs(after - exact) < 1e-9
+
+    def test_unseen_pitch_type(self):
+        hitter = _hitter()
+        surface = hitter.enable_decision_surface()
+        assert 'knuckleball' not in surface._swing_rows
+        whiff = hitter.calculate_whiff_probability(78.0, 'knuckleball', (4.0, 4.0))
+        assert abs(whiff - hitter.whiff_probability_exact(78.0, 'knuckleball', (4.0, 4.0))) < 0.01
+        assert 'knuckleball' in surface._swing_rows
+
+
+class TestDecisionPath:
+    """decide_to_swing() with and without a surface."""
+
+    def test_same_random_stream(self):
+        hitter = _hitter()
+        pitches = [((x, z), abs(x) <= 8.5 and 18.0 <= z <= 42.0, (b, s))
+                   for x in (-15.0, -4.0, 0.0, 9.0, 20.0)
+                   for z in (10.0, 30.0, 45.0)
+                   for b, s in ((0, 0), (3, 2))]
+
+        def run():
+            np.random.seed(11)
+            decisions = [hitter.decide_to_swing(loc, strike, count, 92.0, 'changeup')
+                         for loc, strike, count in pitches]
+            return decisions, np.random.random()
+
+        exact = run()
+        hitter.enable_decision_surface()
+        assert run() == exact
+        hitter.disable_decision_surface()
+        assert hitter.decision_surface is None
+
+    def test_game_simulator_enables_surfaces(self):
+        away = create_test_team("Away", "average")
+        home = create_test_team("Home", "average")
+        GameSimulator(away, home, verbose=False, decision_surfaces=True)
+        assert all(isinstance(h.decision_surface, DecisionSurface)
+                   for h in away.hitters + home.hitters)
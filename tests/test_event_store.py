@@ -0,0 +1,140 @@
+"""
+Tests for the structured play-by-play event store.
+
+Validates:
+1. Plate appearances and pitches are recorded as fixed-schema rows
+2. Save/load round-trips through memory-mapped .npy files
+3. Merging stores remaps vocabulary codes and game ids
+4. Text is rendered on demand from rows
+5. Simulated games record the fielder for database-style rosters
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.event_store import (
+    EventStore, FIELDER_POSITION_NUMBERS, PLAY_EVENT_DTYPE, PITCH_EVENT_DTYPE, _FIELDER_ABBREVIATIONS,
+)
+from batted_ball.game_simulation import GameSimulator, create_test_team
+
+
+def _pitch(pitch_type, outcome, count=(0, 0), swing=False):
+    return {
+        'pitch_type': pitch_type,
+        'velocity_release': 94.0,
+        'velocity_plate': 86.0,
+        'final_location': (3.0, 30.0),
+        'count_before': count,
+        'swing': swing,
+        'pitch_outcome': outcome,
+    }
+
+
+def _record_game(store, batter, pitcher):
+    store.start_game()
+    store.record_plate_appearance(
+        1, True, 0, 0, batter, pitcher,
+        [_pitch('slider', 'ball'), _pitch('fastball', 'ball_in_play', (1, 0), True)],
+        'SINGLE',
+        batted_ball={'exit_velocity': 101.0, 'launch_angle': 12.0,
+                     'spray_angle': -8.0, 'distance': 210.0,
+                     'landing_x': -29.2, 'landing_y': 208.0},
+        fielder_position='center_field',
+    )
+    store.record_plate_appearance(
+        1, True, 0, 1, pitcher, batter,
+        [_pitch('curveball', 'swinging_strike', swing=True)],
+        'STRIKEOUT_SWING', outs_made=1,
+    )
+    store.end_game()
+
+
+class TestEventStore:
+    """Tests for EventStore recording, persistence and merging."""
+
+    def test_record_rows(self):
+        """Each PA produces one play row and one row per pitch."""
+        store = EventStore()
+        _record_game(store, "Batter A", "Pitcher B")
+
+        plays, pitches = store.plays, store.pitches
+        assert plays.dtype == PLAY_EVENT_DTYPE
+        assert pitches.dtype == PITCH_EVENT_DTYPE
+        assert len(plays) == 2
+        assert len(pitches) == 3
+        assert plays['fielder'][0] == 8
+        assert np.isnan(plays['exit_velocity'][1])
+        assert np.isclose(plays['landing_x'][0], -29.2)
+        assert np.isclose(plays['landing_y'][0], 208.0)
+        assert np.isnan(plays['landing_x'][1])
+        assert plays['base_mask'][1] == 1
+        assert list(store.decode('pa_outcome', plays['outcome'])) == ['SINGLE', 'STRIKEOUT_SWING']
+        assert store.vocab['pitch_type'][plays['pitch_type'][0]] == 'fastball'
+
+    def test_save_load_mmap(self, tmp_path):
+        """Saved stores load memory-mapped with identical rows."""
+        store = EventStore()
+        _record_game(store, "Batter A", "Pitcher B")
+        store.save(str(tmp_path))
+
+        loaded = EventStore.load(str(tmp_path))
+        assert isinstance(loaded.plays, np.memmap)
+        assert loaded.plays.tobytes() == store.plays.tobytes()
+        assert loaded.vocab == store.vocab
+        assert loaded.num_games == 1
+
+    def test_merge_remaps_codes(self):
+        """Merged stores keep names consistent and game ids unique."""
+        first = EventStore()
+        _record_game(first, "Batter A", "Pitcher B")
+        second = EventStore()
+        _record_game(second, "Batter C", "Pitcher B")
+
+        season = EventStore()
+        season.merge(first)
+        season.merge(second)
+
+        plays = season.plays
+        assert season.num_games == 2
+        assert list(plays['game_id']) == [0, 0, 1, 1]
+        batters = season.decode('player', plays['batter_id'])
+        assert list(batters) == ["Batter A", "Pitcher B", "Batter C", "Pitcher B"]
+        assert season.decode('pitch_type', season.pitches['pitch_type'])[-1] == 'curveball'
+
+    def test_render_on_demand(self):
+        """Rows render to readable text."""
+        store = EventStore()
+        _record_game(store, "Batter A", "Pitcher B")
+        lines = list(store.iter_play_text(game_id=0))
+
+        assert lines[0].startswith("Top 1, 0 out: Batter A vs Pitcher B - SINGLE")
+        assert "[CF]" in lines[0]
+        assert "STRIKEOUT_SWING" in lines[1]
+        assert "slider" in store.render_pitch(store.pitches[0])
+
+
+class TestGameRecording:
+    """Tests for plate appearances recorded by GameSimulator."""
+
+    def test_fielder_from_abbreviated_positions(self):
+        """Fielders with TeamLoader-style 'SS'/'CF' positions still get their numbers."""
+        np.random.seed(7)
+        away, home = create_test_team("Away"), create_test_team("Home")
+        for team in (away, home):
+            for name, fielder in team.fielders.items():
+                fielder.position = _FIELDER_ABBREVIATIONS[FIELDER_POSITION_NUMBERS[name]]
+
+        store = EventStore()
+        GameSimulator(away, home, verbose=False, event_store=store).simulate_game(num_innings=3)
+
+        plays = store.plays
+        outcomes = store.decode('pa_outcome', plays['outcome'])
+        outs_in_play = np.isin(outcomes, ['OUT_FLY', 'OUT_LINE', 'OUT_GROUND', 'OUT_FORCE', 'DOUBLE_PLAY'])
+        assert outs_in_play.any()
+        assert (plays['fielder'][outs_in_play] > 0).all()
+        assert np.isfinite(plays['landing_x'][outs_in_play]).all()
@@ -0,0 +1,98 @@
+"""
+Tests for the vectorized fence-clearance engine.
+
+Validates:
+1. Dense fence tables reproduce the piecewise-linear fence profile
+2. Straight-line trajectories cross the fence at the exact height
+3. Batch clearance matches the single-trajectory form on padded batches
+4. is_home_run() defers to the trajectory intersection when given samples
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball import BattedBallSimulator
+from batted_ball.ballpark import get_ballpark, list_available_parks
+from batted_ball.constants import FEET_TO_METERS
+
+
+def _radial_line(spray_angle, end_distance_ft, end_height_ft, n=50):
+    """Straight trajectory from home plate (trajectory coordinates, meters)."""
+    r = np.linspace(0.0, end_distance_ft, n) * FEET_TO_METERS
+    angle = np.radians(spray_angle)
+    z = np.linspace(0.0, end_height_ft, n) * FEET_TO_METERS
+    # Field spray angle is atan2(-y, x) in trajectory coordinates
+    return np.column_stack([r * np.cos(angle), -r * np.sin(angle), z])
+
+
+class TestFenceTables:
+    """Dense distance/height tables."""
+
+    def test_tables_match_profile(self):
+        for name in list_available_parks():
+            park = get_ballpark(name)
+            profile = np.array([park.fence_profile[a] for a in park.angles])
+            angles = np.linspace(-50.0, 50.0, 1001)
+            distances, heights = park.fence_at_angles(angles)
+            np.testing.assert_allclose(distances, np.interp(angles, park.angles, profile[:, 0]))
+            np.testing.assert_allclose(heights, np.interp(angles, park.angles, profile[:, 1]))
+            for angle, distance, height in zip(angles[::50], distances[::50], heights[::50]):
+                assert np.allclose(park.get_fence_at_angle(angle), (distance, height))
+
+    def test_tables_read_only(self):
+        park = get_ballpark('fenway')
+        assert not park.fence_distances.flags.writeable
+        assert not park.fence_heights.flags.writeable
+
+
+class TestClearsFence:
+    """Trajectory/fence intersection."""
+
+    def test_straight_line_height_exact(self):
+        park = get_ballpark('fenway')
+        angles = [-40.0, -17.3, 0.0, 12.6, 44.0]
+        lines = np.array([_radial_line(a, 500.0, 100.0) for a in angles])
+        reached, margin = park.fence_crossings_batch(lines)
+        assert reached.all()
+        fence_distance, fence_height = park.fence_at_angles(angles)
+        np.testing.assert_allclose(margin, fence_distance / 500.0 * 100.0 - fence_height, atol=1e-6)
+
+    def test_short_trajectory_not_reached(self):
+        park = get_ballpark('generic')
+        short = _radial_line(0.0, 250.0, 0.0)
+        reached, margin = park.fence_crossings_batch(short[np.newaxis])
+        assert not reached[0] and np.isnan(margin[0])
+        assert not park.clears_fence(short)
+
+    def test_batch_matches_single(self):
+        park = get_ballpark('yankee')
+        sim = BattedBallSimulator()
+        rng = np.random.default_rng(7)
+        results = [
+            sim.simulate(exit_velocity=rng.uniform(90.0, 115.0), launch_angle=rng.uniform(18.0, 40.0),
+                         spray_angle=rng.uniform(-40.0, 40.0), backspin_rpm=2000.0)
+            for _ in range(12)
+        ]
+        n_samples = np.array([len(r.position) for r in results])
+        padded = np.zeros((len(results), n_samples.max(), 3))
+        for i, r in enumerate(results):
+            # Pad with a far-away point that must be ignored
+            padded[i] = 1e4
+            padded[i, :n_samples[i]] = r.position
+
+        cleared = park.clears_fence_batch(padded, n_samples)
+        expected = [park.clears_fence(r.position) for r in results]
+        assert list(cleared) == expected
+        assert any(expected) and not all(expected)
+
+    def test_is_home_run_uses_trajectory(self):
+        park = get_ballpark('fenway')
+        over = _radial_line(-44.0, 400.0, 80.0)
+        into_wall = _radial_line(-44.0, 400.0, 30.0)
+        assert park.is_home_run(-44.0, 400.0, None, trajectory_samples=over)
+        assert not park.is_home_run(-44.0, 400.0, None, trajectory_samples=into_wall)
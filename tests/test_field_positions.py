@@ -0,0 +1,108 @@
+"""
+Tests for slotted FieldPosition and the array helpers of the fielding layer.
+
+Validates:
+1. FieldPosition is slotted and its distances are unchanged
+2. positions_to_array / positions_from_array round-trip
+3. Batched ball positions match calculate_ball_position_at_time()
+4. Direction penalty buckets and row norms match independent references
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from batted_ball.attributes import FielderAttributes
+from batted_ball.constants import (
+    BACKWARD_MOVEMENT_PENALTY,
+    FORWARD_MOVEMENT_PENALTY,
+    LATERAL_MOVEMENT_PENALTY,
+)
+from batted_ball.field_layout import FieldPosition, positions_from_array, positions_to_array
+from batted_ball.fielding import Fielder
+from batted_ball.outfield_interception import _row_norms
+from batted_ball.play_simulation import PlaySimulator
+from batted_ball.trajectory import BattedBallSimulator
+
+
+class TestFieldPosition:
+    """Slotted positions."""
+
+    def test_slots_and_distances(self):
+        a = FieldPosition(10.0, 250.0, 6.0)
+        b = FieldPosition(-35.5, 180.25, 0.0)
+        assert not hasattr(a, '__dict__')
+        with pytest.raises(AttributeError):
+            a.w = 1.0
+
+        assert a.distance_to(b) == np.sqrt(45.5**2 + 69.75**2 + 6.0**2)
+        assert a.horizontal_distance_to(b) == np.sqrt(45.5**2 + 69.75**2)
+
+    def test_array_round_trip(self):
+        positions = [FieldPosition(1.0, 2.0, 3.0), FieldPosition(-4.0, 5.5, 0.0)]
+        array = positions_to_array(positions)
+        assert array.shape == (2, 3)
+        back = positions_from_array(array)
+        assert [(p.x, p.y, p.z) for p in back] == [(1.0, 2.0, 3.0), (-4.0, 5.5, 0.0)]
+
+        flat = positions_from_array([[7.0, 8.0]])
+        assert (flat[0].x, flat[0].y, flat[0].z) == (7.0, 8.0, 0.0)
+        assert FieldPosition.from_array(array[1]).y == 5.5
+        assert positions_to_array([]).shape == (0, 3)
+
+
+class TestVectorHelpers:
+    """Array paths agree with the per-object code they replace."""
+
+    def test_ball_positions_at_times(self):
+        handler = PlaySimulator().fly_ball_handler
+        ball = BattedBallSimulator().simulate(95.0, 30.0, 10.0, 1800.0)
+        times = np.concatenate([[-0.1, 0.0], np.linspace(0.01, ball.flight_time, 40), [ball.flight_time + 1.0]])
+
+        batch = handler.calculate_ball_positions_at_times(ball, times)
+        for t, row in zip(times, batch):
+            single = handler.calculate_ball_position_at_time(ball, t)
+            assert tuple(row) == (single.x, single.y, single.z)
+
+    def test_direction_penalty_and_norms(self):
+        # Distinct in/back modifiers so every bucket has its own value
+        attrs = FielderAttributes(RANGE_IN=90000, RANGE_BACK=20000)
+        fielder = Fielder("CF", "outfield", attributes=attrs)
+        forward = FORWARD_MOVEMENT_PENALTY * attrs.get_range_in_modifier()
+        lateral = LATERAL_MOVEMENT_PENALTY * (attrs.get_range_back_modifier()
+                                              + attrs.get_range_in_modifier()) / 2.0
+        backward = BACKWARD_MOVEMENT_PENALTY * attrs.get_range_back_modifier()
+        assert len({forward, lateral, backward}) == 3
+
+        cases = [
+            ((0.0, 50.0), forward),
+            ((50.0, 50.0), forward),      # 45° boundary
+            ((-3.0, 3.0), forward),
+            ((40.0, -10.0), lateral),
+            ((50.0, -50.0), lateral),     # 135° boundary
+            ((-7.0, -7.0), lateral),
+            ((-5.0, -80.0), backward),
+            ((0.0, 0.0), FORWARD_MOVEMENT_PENALTY),
+        ]
+        for (dx, dy), expected in cases:
+            assert fielder._directional_speed_penalty(dx, dy) == pytest.approx(expected, abs=1e-12)
+            assert fielder.calculate_directional_speed_penalty(
+                np.array([dx, dy, 0.0])) == pytest.approx(expected, abs=1e-12)
+
+            # Pre-change formula: np.linalg.norm normalization, np.degrees(np.arctan2) bucket
+            direction = np.array([dx, dy])
+            if np.linalg.norm(direction) < 1e-6:
+                continue
+            direction = direction / np.linalg.norm(direction)
+            angle_deg = abs(np.degrees(np.arctan2(direction[0], direction[1])))
+            bucket = forward if angle_deg <= 45 else lateral if angle_deg <= 135 else backward
+            assert bucket == expected
+
+        vectors = np.random.default_rng(0).uniform(-300, 300, (500, 2))
+        expected = np.array([np.linalg.norm(v) for v in vectors])
+        np.testing.assert_array_equal(_row_norms(vectors), expected)
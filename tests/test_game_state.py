@@ -0,0 +1,108 @@
+"""
+Tests for the compact GameState representation.
+
+Validates:
+1. Attribute API (counters, runners, scoring) behaves like the old dataclass
+2. Base-occupancy mask stays in sync with runner references
+3. Counter export covers every per-team field and feeds GameResult
+"""
+
+import pickle
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from batted_ball.game_simulation import (
+    GameState,
+    BaseState,
+    GAME_STATE_COUNTER_FIELDS,
+    BASE_FIRST,
+    BASE_THIRD,
+)
+from batted_ball.season_simulator import GameResult
+
+
+class TestGameState:
+    """Tests for GameState counters and base mask."""
+
+    def test_counter_attributes(self):
+        """Per-team counters read and write through the attribute API."""
+        state = GameState()
+        state.away_hits += 1
+        state.away_hits += 1
+        state.home_strikeouts = 7
+        state.score_run(for_away_team=True)
+        state.away_exit_velocities.append(101.5)
+
+        assert state.away_hits == 2
+        assert state.home_strikeouts == 7
+        assert state.away_score == 1
+        assert state.home_score == 0
+        assert state.away_exit_velocities == [101.5]
+        assert not hasattr(state, '__dict__')
+
+    def test_keyword_construction(self):
+        """Keyword arguments match the old dataclass field names."""
+        state = GameState(inning=5, away_score=3, home_walks=2)
+        assert state.inning == 5
+        assert state.away_score == 3
+        assert state.home_walks == 2
+
+        with pytest.raises(TypeError):
+            GameState(away_runs=1)
+
+    def test_base_mask_tracks_runners(self):
+        """Assigning runners updates the 3-bit mask and base state."""
+        state = GameState()
+        runner_a, runner_b = object(), object()
+
+        state.runner_on_first = runner_a
+        state.runner_on_third = runner_b
+        assert state.base_mask == BASE_FIRST | BASE_THIRD
+        assert state.get_base_state() == BaseState.FIRST_THIRD
+        assert state.runner_on_first is runner_a
+
+        state.runner_on_first = None
+        assert state.get_base_state() == BaseState.THIRD
+
+        state.runner_on_first = runner_a
+        state.runner_on_second = runner_b
+        state.runner_on_third = runner_b
+        assert state.get_base_state() == BaseState.LOADED
+
+        state.end_half_inning()
+        assert state.base_mask == 0
+        assert state.runner_on_second is None
+        assert state.get_base_state() == BaseState.EMPTY
+
+    def test_export_counters_feeds_game_result(self):
+        """Exported counters cover every field and build a GameResult."""
+        state = GameState()
+        state.home_line_drive_outs = 4
+        state.away_home_runs = 2
+
+        counters = state.export_counters()
+        assert tuple(counters) == GAME_STATE_COUNTER_FIELDS
+        assert counters['home_line_drive_outs'] == 4
+
+        snapshot = state.counter_snapshot()
+        state.away_home_runs += 1
+        assert snapshot[GAME_STATE_COUNTER_FIELDS.index('away_home_runs')] == 2
+
+        result = GameResult(date=None, away_team="AWY", home_team="HOM", **counters)
+        assert result.away_home_runs == 2
+        assert result.home_line_drive_outs == 4
+
+    def test_pickle_round_trip(self):
+        """State survives pickling (used by multiprocessing workers)."""
+        state = GameState(inning=3, away_hits=4)
+        state.runner_on_second = "runner"
+        restored = pickle.loads(pickle.dumps(state))
+
+        assert restored.inning == 3
+        assert restored.away_hits == 4
+        assert restored.get_base_state() == BaseState.SECOND
@@ -15,7 +15,15 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from batted_ball.ground_ball_interception import GroundBallInterceptor, GroundBallInterceptionResult
+from batted_ball.ground_ball_interception import (
+    GroundBallInterceptor,
+    GroundBallInterceptionResult,
+    FIELDER_ROLES,
+    ROLE_OUTFIELD,
+    RUST_FIELDER_MAX_SPEED_FPS,
+    find_ground_ball_interception_numpy,
+)
+from batted_ball import fast_trajectory
 from batted_ball.fielding import Fielder
 from batted_ball.field_layout import FieldPosition
 from batted_ball.attributes import FielderAttributes
@@ -209,6 +217,107 @@ class TestGroundBallInterception:
         assert interception.fielding_position in ['shortstop', 'second_base', 'pitcher']
 
 
+def random_ground_balls(n: int, seed: int) -> list:
+    """Ground balls over the whole infield, including dribblers and slow rollers."""
+    rng = np.random.default_rng(seed)
+    balls = []
+    for _ in range(n):
+        spray_angle = rng.uniform(-50, 50)
+        landing_y = rng.uniform(2, 40)
+        balls.append(MockBattedBallResult(
+            landing_x=landing_y * np.tan(np.radians(spray_angle)) + rng.normal(0, 3),
+            landing_y=landing_y,
+            exit_velocity_mph=rng.uniform(40, 115),
+            spray_angle_deg=spray_angle + rng.normal(0, 5),
+            launch_angle_deg=rng.uniform(-15, 0)
+        ))
+    return balls
+
+
+def create_full_defense() -> dict:
+    """Test infielders plus a catcher and outfielders with varied speed and reactions."""
+    fielders = create_test_fielders()
+    extra = {
+        'catcher': (0.0, -3.0, 'catcher', 40000, 30000),
+        'left_field': (-110.0, 280.0, 'outfield', 80000, 90000),
+        'center_field': (0.0, 320.0, 'outfield', 60000, 99000),
+        'right_field': (110.0, 280.0, 'outfield', 20000, 45000),
+    }
+    for position_name, (x, y, pos_type, reaction, speed) in extra.items():
+        fielders[position_name] = Fielder(
+            name=f"Test {position_name}",
+            position=pos_type,
+            attributes=FielderAttributes(REACTION_TIME=reaction, TOP_SPRINT_SPEED=speed),
+            current_position=FieldPosition(x, y, 0.0)
+        )
+    return fielders
+
+
+class TestBatchedInterception:
+    """All fielders in one kernel call vs the per-fielder reference loop."""
+
+    def test_batch_matches_per_fielder(self):
+        batch = GroundBallInterceptor()
+        reference = GroundBallInterceptor(use_batch=False)
+        fielders = create_full_defense()
+
+        positions = set()
+        for ball in random_ground_balls(300, seed=5):
+            expected = reference.find_best_interception(ball, fielders)
+            actual = batch.find_best_interception(ball, fielders)
+            assert actual.can_be_fielded == expected.can_be_fielded
+            assert actual.fielding_position == expected.fielding_position
+            positions.add(actual.fielding_position)
+            if expected.can_be_fielded:
+                assert actual.fielding_fielder is expected.fielding_fielder
+                assert np.isclose(actual.interception_time, expected.interception_time, rtol=0, atol=1e-9)
+                assert np.isclose(actual.fielder_arrival_time, expected.fielder_arrival_time, rtol=0, atol=1e-9)
+                assert np.isclose(actual.time_margin, expected.time_margin, rtol=0, atol=1e-9)
+                assert np.isclose(actual.ball_position_at_interception.x,
+                                  expected.ball_position_at_interception.x, rtol=0, atol=1e-9)
+                assert np.isclose(actual.ball_position_at_interception.y,
+                                  expected.ball_position_at_interception.y, rtol=0, atol=1e-9)
+        # Infielders, outfielders and balls through are all covered
+        assert None in positions and 'pitcher' in positions and 'left_field' in positions
+
+    def test_infielder_priority_and_ties(self):
+        """Two identical fielders: the infielder wins, and among equals the first one listed."""
+        twin = create_test_fielders()['shortstop']
+        position = np.array([[twin.current_position.x, twin.current_position.y]] * 2)
+        args = (-5.0, 20.0, -0.17, 0.985, 120.0, 12.66, 0.3, 95.0,
+                position, np.full(2, 28.5), np.full(2, 0.35), np.full(2, 3.0))
+
+        index, *_ = find_ground_ball_interception_numpy(*args, np.array([ROLE_OUTFIELD, FIELDER_ROLES['shortstop']]))
+        assert index == 1
+        index, *_ = find_ground_ball_interception_numpy(*args, np.array([FIELDER_ROLES['shortstop']] * 2))
+        assert index == 0
+
+    @pytest.mark.skipif(
+        not (fast_trajectory.RUST_AVAILABLE
+             and hasattr(fast_trajectory.trajectory_rs, 'find_ground_ball_interception')),
+        reason="trajectory_rs ground-ball kernel not built"
+    )
+    def test_rust_matches_numpy(self):
+        interceptor = GroundBallInterceptor()
+        fielders = create_full_defense()
+        names = list(fielders)
+        positions = np.array([[fielders[n].current_position.x, fielders[n].current_position.y] for n in names])
+        speeds = np.minimum([fielders[n].get_sprint_speed_fps() for n in names], RUST_FIELDER_MAX_SPEED_FPS)
+        reactions = np.array([fielders[n].get_reaction_time_seconds() for n in names])
+        roles = np.array([FIELDER_ROLES.get(n, ROLE_OUTFIELD) for n in names], dtype=np.int64)
+
+        for ball in random_ground_balls(200, seed=9):
+            landing, direction, speed, decel, exit_velocity = interceptor._ground_ball_conditions(ball)
+            charges = np.array([interceptor._calculate_charge_bonus(exit_velocity, n) for n in names])
+            args = (landing[0], landing[1], direction[0], direction[1], speed, decel, ball.flight_time,
+                    exit_velocity, positions, speeds, reactions, charges, roles)
+            rust = fast_trajectory.trajectory_rs.find_ground_ball_interception(*args)
+            numpy = find_ground_ball_interception_numpy(*args)
+            assert rust[0] == numpy[0]
+            if rust[0] >= 0:
+                np.testing.assert_allclose(rust[1:], numpy[1:], rtol=0, atol=1e-9)
+
+
 class TestChargingMechanic:
     """Test the infielder charging mechanic on slower hits."""
     
@@ -0,0 +1,119 @@
+"""
+Tests for the lazily derived quantities of PitchResult and BattedBallResult.
+
+Validates:
+1. Both results are slotted and compute nothing on construction
+2. Derived quantities match the formulas they were eagerly computed with
+3. The vectorized pitch break matches the per-sample loop bit for bit
+4. Pitches that never reach the plate have no approach angle or plate velocity
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from batted_ball.constants import METERS_TO_FEET, MS_TO_MPH
+from batted_ball.pitch import PitchResult, PitchSimulator, create_curveball, create_fastball_4seam, create_slider
+from batted_ball.trajectory import BattedBallResult, BattedBallSimulator
+
+PITCH_SIMULATOR = PitchSimulator()
+BALL_SIMULATOR = BattedBallSimulator()
+
+
+def loop_break(position, plate_pos):
+    """Maximum vertical/horizontal deviation in inches, one sample at a time."""
+    release_pos = position[0]
+    max_vertical_dev = 0.0
+    max_horizontal_dev = 0.0
+    for pos in position:
+        vec_to_plate = plate_pos - release_pos
+        t = np.clip(np.dot(pos - release_pos, vec_to_plate) / np.dot(vec_to_plate, vec_to_plate), 0, 1)
+        deviation = pos - (release_pos + t * vec_to_plate)
+        max_vertical_dev = max(abs(deviation[2]), max_vertical_dev)
+        max_horizontal_dev = max(abs(deviation[1]), max_horizontal_dev)
+    return max_vertical_dev * METERS_TO_FEET * 12.0, max_horizontal_dev * METERS_TO_FEET * 12.0
+
+
+class TestPitchResult:
+    """Plate crossing and break on first access."""
+
+    def test_slots_and_lazy(self):
+        pitch = PITCH_SIMULATOR.simulate(create_fastball_4seam(), target_x=0.0, target_z=2.5)
+        assert not hasattr(pitch, '__dict__')
+        with pytest.raises(AttributeError):
+            pitch.spin_rate = 2400
+
+        fresh = PitchResult(pitch.trajectory_data, pitch.pitch_type, pitch.release_params, pitch.environment)
+        assert fresh._crossing is None and fresh._break is None
+        assert fresh.plate_z == pitch.plate_z
+        assert fresh._break is None
+        assert fresh.total_break == np.sqrt(fresh.vertical_break**2 + fresh.horizontal_break**2)
+
+    def test_break_matches_loop(self):
+        rng = np.random.default_rng(5)
+        for make in (create_fastball_4seam, create_slider, create_curveball):
+            for _ in range(10):
+                pitch = PITCH_SIMULATOR.simulate(make(), target_x=rng.uniform(-0.7, 0.7), target_z=rng.uniform(1.5, 3.5))
+                plate_idx = np.where(pitch.position[:, 0] <= 0)[0][0]
+                expected = loop_break(pitch.position, pitch.position[plate_idx])
+                assert (pitch.vertical_break, pitch.horizontal_break) == expected
+
+    def test_plate_crossing(self):
+        pitch = PITCH_SIMULATOR.simulate(create_slider(), target_x=0.2, target_z=2.0)
+        assert pitch.crossed_plate
+        assert abs(pitch.plate_x) < 1e-9
+        vx, _, vz = pitch.plate_velocity_vector
+        assert pitch.plate_angle_vertical == pytest.approx(np.degrees(np.arctan2(-vz, -vx)))
+        assert pitch.plate_speed == pytest.approx(np.linalg.norm(pitch.plate_velocity_vector))
+        assert 0.3 < pitch.flight_time < pitch.time[-1]
+
+    def test_short_pitch(self):
+        pitch = PITCH_SIMULATOR.simulate(create_fastball_4seam(), target_x=0.0, target_z=2.5)
+        # Only the samples up to just short of the plate
+        keep = pitch.position[:, 0] > 0
+        data = dict(pitch.trajectory_data, time=pitch.time[keep], position=pitch.position[keep],
+                    velocity=pitch.velocity[keep])
+        short = PitchResult(data, pitch.pitch_type, pitch.release_params, pitch.environment)
+
+        assert not short.crossed_plate and not short.is_strike
+        assert not hasattr(short, 'plate_angle_vertical')
+        assert not hasattr(short, 'plate_velocity_vector')
+        assert short.flight_time == short.time[-1]
+        assert (short.vertical_break, short.horizontal_break) == loop_break(short.position, short.position[-1])
+
+
+class TestBattedBallResult:
+    """Landing point, peak and final velocity on first access."""
+
+    def test_slots_and_values(self):
+        ball = BALL_SIMULATOR.simulate(98.0, 28.0, -15.0, 2000.0)
+        assert not hasattr(ball, '__dict__')
+        with pytest.raises(AttributeError):
+            ball.hang_time = 5.0
+
+        fresh = BattedBallResult(ball.trajectory_data, ball.initial_conditions, ball.environment)
+        assert fresh._landing is None and fresh._peak is None and fresh._final_velocity is None
+
+        landing = ball.position[-1]
+        assert fresh.landing_x == -landing[1] * METERS_TO_FEET
+        assert fresh.landing_y == landing[0] * METERS_TO_FEET
+        assert fresh.distance == np.sqrt(landing[0]**2 + landing[1]**2) * METERS_TO_FEET
+        assert fresh.spray_angle_landing == np.rad2deg(np.arctan2(fresh.landing_x, fresh.landing_y))
+        assert fresh.flight_time == ball.time[-1]
+        assert fresh.final_velocity == np.linalg.norm(ball.velocity[-1]) * MS_TO_MPH
+
+        top = np.argmax(ball.position[:, 2])
+        assert fresh.peak_height == ball.position[top, 2] * METERS_TO_FEET
+        assert fresh.time_to_peak == ball.time[top]
+
+    def test_peak_survives_drop(self):
+        ball = BALL_SIMULATOR.simulate(101.0, 33.0, 5.0, 2300.0)
+        fresh = BattedBallResult(ball.trajectory_data, ball.initial_conditions, ball.environment)
+        fresh.drop_raw_trajectory()
+        assert (fresh.peak_height, fresh.time_to_peak) == (ball.peak_height, ball.time_to_peak)
+        assert (fresh.distance, fresh.flight_time) == (ball.distance, ball.flight_time)
@@ -0,0 +1,72 @@
+"""
+Tests for the buffered, leveled game log writer.
+
+Validates:
+1. Messages above the configured level are dropped without formatting
+2. File output is buffered until flush()/close()
+3. Compressed logs round-trip through gzip
+"""
+
+import gzip
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batted_ball.log_writer import GameLogWriter, LogLevel
+
+
+class TestGameLogWriter:
+    """Tests for GameLogWriter level filtering and buffering."""
+
+    def test_level_filtering_is_lazy(self, tmp_path):
+        """Disabled levels never call the message builder."""
+        path = tmp_path / "game.txt"
+        writer = GameLogWriter(str(path), level=LogLevel.PLAY_BY_PLAY)
+        calls = []
+
+        def build():
+            calls.append(1)
+            return "expensive"
+
+        writer.write(LogLevel.DETAILED, build)
+        writer.write(LogLevel.PLAY_BY_PLAY, "EV=%.1f mph", 101.25)
+        writer.close()
+
+        assert calls == []
+        assert not writer.enabled_for(LogLevel.SUMMARY)  # Closed, no echo
+        assert path.read_text(encoding='utf-8') == "EV=101.2 mph\n"
+
+    def test_buffered_until_flush(self, tmp_path):
+        """Lines reach the file only on flush (or buffer limit)."""
+        path = tmp_path / "game.txt"
+        writer = GameLogWriter(str(path), max_buffered_lines=3)
+
+        writer.write(LogLevel.SUMMARY, "one")
+        writer.write(LogLevel.SUMMARY, "two")
+        assert path.read_text(encoding='utf-8') == ""
+
+        writer.flush()
+        assert path.read_text(encoding='utf-8') == "one\ntwo\n"
+
+        for line in ("a", "b", "c"):
+            writer.write(LogLevel.SUMMARY, line)
+        assert path.read_text(encoding='utf-8') == "one\ntwo\na\nb\nc\n"
+        writer.close()
+
+    def test_no_sink_disables_everything(self):
+        """Without a file or echo, every level is disabled."""
+        writer = GameLogWriter(None, level=LogLevel.DETAILED, echo=False)
+        assert not writer.enabled_for(LogLevel.SUMMARY)
+
+    def test_compressed_log(self, tmp_path):
+        """compress=True writes gzip and appends .gz."""
+        path = tmp_path / "game.txt"
+        writer = GameLogWriter(str(path), compress=True)
+        writer.write(LogLevel.SUMMARY, "FINAL SCORE")
+        writer.close()
+
+        assert writer.path == str(path) + ".gz"
+        with gzip.open(writer.path, 'rt', encoding='utf-8') as f:
+            assert f.read() == "FINAL SCORE\n"
@@ -0,0 +1,55 @@
+"""
+Tests for the disabled-mode metrics collector.
+
+Validates:
+1. DebugLevel.OFF returns the shared no-op collector
+2. Every recording method on the null collector is a no-op
+3. Enabled levels still return a full SimMetricsCollector
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batted_ball.sim_metrics import (
+    DebugLevel,
+    SimMetricsCollector,
+    NullMetricsCollector,
+    NULL_METRICS_COLLECTOR,
+    create_metrics_collector,
+)
+
+
+class TestNullMetricsCollector:
+    """Tests for create_metrics_collector and NullMetricsCollector."""
+
+    def test_off_returns_shared_singleton(self):
+        """OFF yields the same disabled collector every time."""
+        collector = create_metrics_collector(DebugLevel.OFF)
+
+        assert collector is NULL_METRICS_COLLECTOR
+        assert create_metrics_collector() is collector
+        assert collector.enabled is False
+        assert collector.debug_level == DebugLevel.OFF
+
+    def test_record_methods_are_noops(self):
+        """Recording on the null collector accepts any arguments and stores nothing."""
+        collector = NullMetricsCollector()
+        collector.record_pitch(object())
+        collector.record_swing_decision(object())
+        collector.record_batted_ball(object())
+        collector.record_fielding(object())
+        collector.record_baserunning(object())
+        collector.record_fatigue(object())
+        collector.record_expected_outcome(object())
+
+        assert not hasattr(collector, '__dict__')
+
+    def test_enabled_level_returns_full_collector(self):
+        """Non-OFF levels still build a real collector."""
+        collector = create_metrics_collector(DebugLevel.BASIC)
+
+        assert isinstance(collector, SimMetricsCollector)
+        assert collector.enabled is True
@@ -0,0 +1,126 @@
+"""
+Tests for the park-factor Monte Carlo engine.
+
+Validates:
+1. The sampled-flight integrator agrees with the batch endpoint integrator
+2. The Rust sampled kernel matches the NumPy fallback (when built)
+3. Common random numbers: identical environments give identical outcomes
+4. Altitude and a tailwind raise the home-run rate in the same park
+5. Factors average to one and lie inside their bootstrap intervals
+6. Common random numbers narrow the intervals
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from batted_ball import fast_trajectory
+from batted_ball.aerodynamics import get_lookup_tables
+from batted_ball.constants import BALL_CROSS_SECTIONAL_AREA, DT_FAST, MAX_SIMULATION_TIME, METERS_TO_FEET
+from batted_ball.park_factors import (
+    BattedBallSample,
+    ParkEnvironment,
+    ParkFactorEngine,
+    _integrate_sampled_numpy,
+    integrate_sample,
+)
+from batted_ball.vectorized_at_bat import integrate_batted_balls
+
+RUST_SAMPLED = fast_trajectory.RUST_AVAILABLE and hasattr(
+    fast_trajectory.trajectory_rs, 'integrate_trajectories_sampled_batch'
+)
+
+SAMPLE = BattedBallSample.draw(400, seed=11)
+
+
+class TestSampledFlights:
+    """Polylines from the park-factor integrator."""
+
+    def test_matches_endpoint_integrator(self):
+        air = np.flatnonzero(SAMPLE.airborne)[:60]
+        positions, counts, hang_times = integrate_sample(SAMPLE, ParkEnvironment('generic'), air)
+        landing = positions[np.arange(len(air)), counts - 1]
+        distances = np.hypot(landing[:, 0], landing[:, 1]) * METERS_TO_FEET
+
+        expected = integrate_batted_balls(
+            SAMPLE.exit_velocity[air], SAMPLE.launch_angle[air],
+            SAMPLE.spray_angle[air], SAMPLE.backspin_rpm[air],
+        )
+        np.testing.assert_allclose(distances, expected, atol=0.5)
+        assert (hang_times > 0).all()
+        # Padding repeats the landing point
+        assert np.allclose(positions[:, -1], landing)
+
+    @pytest.mark.skipif(not RUST_SAMPLED, reason="trajectory_rs sampled kernel not built")
+    def test_rust_matches_numpy(self):
+        environment = ParkEnvironment('coors', 5190.0, 80.0, 0.5, wind_speed=10.0, wind_direction=30.0)
+        states, spin_params = SAMPLE.initial_states(SAMPLE.airborne)
+        cd_table, cl_table = get_lookup_tables()
+        rust = fast_trajectory.trajectory_rs.integrate_trajectories_sampled_batch(
+            states, DT_FAST, MAX_SIMULATION_TIME, 0.0, spin_params, environment.wind_velocity(),
+            environment.air_density, BALL_CROSS_SECTIONAL_AREA, cd_table, cl_table, 10,
+        )
+        numpy = _integrate_sampled_numpy(
+            states, spin_params, environment.wind_velocity(), environment.air_density,
+            DT_FAST, MAX_SIMULATION_TIME, 10, cd_table, cl_table,
+        )
+        np.testing.assert_array_equal(rust[1], numpy[1])
+        np.testing.assert_allclose(rust[0], numpy[0], atol=1e-9)
+        np.testing.assert_allclose(rust[2], numpy[2], atol=1e-9)
+
+
+class TestParkOutcomes:
+    """Per-park classification of one sample."""
+
+    def test_common_random_numbers(self):
+        engine = ParkFactorEngine(parks=['fenway', 'petco'])
+        fenway = engine.classify(SAMPLE, 'fenway')
+        again = engine.classify(SAMPLE, 'fenway')
+        petco = engine.classify(SAMPLE, 'petco')
+        for name in ('fair', 'home_run', 'hit', 'extra_base'):
+            np.testing.assert_array_equal(getattr(fenway, name), getattr(again, name))
+
+        # Ground balls get the same outcome in every park
+        ground = ~SAMPLE.airborne
+        np.testing.assert_array_equal(fenway.hit[ground], petco.hit[ground])
+        assert not fenway.home_run[ground].any()
+
+    def test_altitude_and_wind_add_home_runs(self):
+        sea_level = ParkFactorEngine(parks=['coors'], environments={'coors': ParkEnvironment('coors')})
+        mile_high = ParkFactorEngine(parks=['coors'])
+        tailwind = ParkFactorEngine(parks=['coors'], wind_speed=15.0, wind_direction=0.0)
+        hr_sea = sea_level.classify(SAMPLE, 'coors').home_run
+        hr_coors = mile_high.classify(SAMPLE, 'coors').home_run
+        hr_wind = tailwind.classify(SAMPLE, 'coors').home_run
+        assert hr_coors.sum() > hr_sea.sum()
+        assert hr_wind.sum() > hr_coors.sum()
+        # Same balls: thinner air never turns a home run into an out
+        assert not (hr_sea & ~hr_coors).any()
+
+
+class TestParkFactors:
+    """Factors and confidence intervals."""
+
+    def test_factors_and_intervals(self):
+        engine = ParkFactorEngine(parks=['fenway', 'coors', 'oracle'])
+        results = engine.run(sample=SAMPLE, seed=3, n_bootstrap=200)
+        for stat in ('hr', 'xbh', 'babip'):
+            factors = results.factors[stat]
+            assert np.isclose(factors.mean(), 1.0)
+            low, high = results.intervals[stat].T
+            assert ((low <= factors) & (factors <= high)).all()
+        factor, low, high = results.factor('coors', 'hr')
+        assert low <= factor <= high
+        assert 'coors' in results.summary()
+
+    def test_common_random_numbers_narrow_intervals(self):
+        engine = ParkFactorEngine(parks=['fenway', 'oracle'])
+        paired = engine.run(sample=SAMPLE, seed=5, n_bootstrap=200)
+        independent = engine.run(sample=SAMPLE, seed=5, n_bootstrap=200, common_random_numbers=False)
+        width = lambda results: np.diff(results.intervals['hr'], axis=1).mean()
+        assert width(paired) < width(independent)
@@ -0,0 +1,70 @@
+"""
+Tests for the hot-path PhaseProfiler.
+
+Validates:
+1. Timers and counters accumulate per phase
+2. Snapshots are plain dicts that merge across processes
+3. Per-game breakdown divides by the number of games
+"""
+
+import pickle
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batted_ball.performance import PhaseProfiler
+
+
+class TestPhaseProfiler:
+    """Tests for PhaseProfiler accumulation and merging."""
+
+    def test_record_and_count(self):
+        """Recording a phase accumulates time and call count."""
+        profiler = PhaseProfiler()
+        profiler.record('pitch_flight', 0.002)
+        profiler.record('pitch_flight', 0.003)
+        profiler.count('pitch_steps', 400)
+
+        assert abs(profiler.phase_times['pitch_flight'] - 0.005) < 1e-12
+        assert profiler.phase_calls['pitch_flight'] == 2
+        assert profiler.counters['pitch_steps'] == 400
+
+    def test_snapshot_merge(self):
+        """Worker snapshots survive pickling and merge additively."""
+        worker_a = PhaseProfiler()
+        worker_a.record('play', 0.5)
+        worker_a.count('batted_balls', 30)
+        worker_a.end_game()
+
+        worker_b = PhaseProfiler()
+        worker_b.record('play', 0.25)
+        worker_b.record('throwing', 0.01)
+        worker_b.end_game()
+
+        season = PhaseProfiler()
+        season.merge(pickle.loads(pickle.dumps(worker_a.snapshot())))
+        season.merge(worker_b)
+        season.merge({})  # Games run without profiling contribute nothing
+
+        assert season.games == 2
+        assert abs(season.phase_times['play'] - 0.75) < 1e-12
+        assert season.phase_calls['play'] == 2
+        assert season.phase_calls['throwing'] == 1
+        assert season.counters['batted_balls'] == 30
+
+    def test_breakdown_per_game(self):
+        """Per-game averages divide totals by the number of games."""
+        profiler = PhaseProfiler.from_snapshot({
+            'phase_times': {'at_bat': 4.0},
+            'phase_calls': {'at_bat': 160},
+            'counters': {'pitches': 600},
+            'games': 2,
+        })
+        breakdown = profiler.get_breakdown()
+
+        assert breakdown['games'] == 2
+        assert abs(breakdown['phases']['at_bat']['per_game_ms'] - 2000.0) < 1e-9
+        assert abs(breakdown['phases']['at_bat']['per_call_us'] - 25000.0) < 1e-6
+        assert breakdown['counters']['pitches']['per_game'] == 300
@@ -0,0 +1,68 @@
+"""
+Tests for batch pitch simulation.
+
+Validates:
+1. PitchSimulator.simulate_batch() without the Rust kernel reproduces simulate()
+2. trajectory_rs.integrate_pitches_batch() agrees with simulate() when built
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from batted_ball import fast_trajectory
+from batted_ball.pitch import PitchSimulator, create_curveball, create_fastball_4seam, create_slider
+
+RUST_PITCH_KERNEL = hasattr(fast_trajectory.trajectory_rs, 'integrate_pitches_batch')
+
+
+def _compare(batch_sim, scalar_sim, location_tol, tol):
+    rng = np.random.default_rng(3)
+    for pitch in (create_fastball_4seam(), create_curveball(), create_slider()):
+        target_x = rng.uniform(-2.0, 2.0, 6)
+        target_z = rng.uniform(0.5, 4.5, 6)
+        batch = batch_sim.simulate_batch(
+            pitch, target_x, target_z, release_distance=54.0, altitude=5000.0, fast_mode=True
+        )
+        for i in range(len(target_x)):
+            result = scalar_sim.simulate(
+                pitch, target_x=target_x[i], target_z=target_z[i],
+                release_distance=54.0, altitude=5000.0, fast_mode=True,
+            )
+            assert batch['crossed_plate'][i] == result.crossed_plate
+            assert batch['is_strike'][i] == result.is_strike
+            assert batch['plate_y'][i] == pytest.approx(result.plate_y, abs=location_tol)
+            assert batch['plate_z'][i] == pytest.approx(result.plate_z, abs=location_tol)
+            assert batch['plate_speed'][i] == pytest.approx(result.plate_speed, abs=tol)
+            assert batch['flight_time'][i] == pytest.approx(result.flight_time, abs=tol)
+            assert batch['vertical_break'][i] == pytest.approx(result.vertical_break, abs=tol)
+            assert batch['horizontal_break'][i] == pytest.approx(result.horizontal_break, abs=tol)
+            if result.crossed_plate:
+                assert batch['plate_angle_vertical'][i] == pytest.approx(
+                    result.plate_angle_vertical, abs=tol)
+            else:
+                assert np.isnan(batch['plate_angle_vertical'][i])
+
+
+class TestSimulateBatch:
+    """Batch plate crossings against PitchSimulator.simulate()."""
+
+    def test_python_path_matches_simulate(self):
+        sim = PitchSimulator(use_rust=False)
+        _compare(sim, sim, 1e-12, 1e-12)
+
+    @pytest.mark.skipif(not RUST_PITCH_KERNEL, reason="trajectory_rs pitch kernel not built")
+    def test_rust_kernel_matches_simulate(self):
+        # Batch aiming corrects with the interpolated crossing (see simulate_batch)
+        _compare(PitchSimulator(), PitchSimulator(), 0.05, 0.05)
+
+    def test_scalar_targets(self):
+        sim = PitchSimulator()
+        batch = sim.simulate_batch(create_fastball_4seam(), 0.0, 2.5, fast_mode=True)
+        assert batch['plate_y'].shape == (1,)
+        assert abs(batch['plate_z'][0] - 2.5) < 0.1
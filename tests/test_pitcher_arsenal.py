@@ -0,0 +1,146 @@
+"""
+Tests for the per-game pitcher arsenal cache.
+
+Validates:
+1. Cached pitches with fatigue deltas match the Pitcher getters and factories
+2. Pitch selection matches the weighted np.random.choice it replaced
+3. The cache is rebuilt for a new game and when attributes change
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.arsenal import PITCH_FACTORIES
+from batted_ball.attributes import PitcherAttributes
+from batted_ball.game_simulation import create_test_team
+from batted_ball.pitch import create_fastball_4seam
+from batted_ball.player import Pitcher
+
+
+def _pitcher():
+    return Pitcher(
+        "Test Pitcher",
+        attributes=PitcherAttributes(RAW_VELOCITY_CAP=70000, SPIN_RATE_CAP=60000, STAMINA=40000),
+        pitch_arsenal={'fastball': {}, 'slider': {'usage': 70}, 'changeup': {}, 'curve': {}},
+        pitch_effectiveness={'slider': {'stuff': 80000}},
+    )
+
+
+def _legacy_select(pitcher, count, recent_pitches):
+    """Weighted selection as AtBatSimulator.select_pitch_type did before the cache."""
+    balls, strikes = count
+    leverage = strikes - balls
+    pitch_weights = {}
+    for pitch_type, pitch_data in pitcher.pitch_arsenal.items():
+        weight = pitch_data.get('usage', 50) / 100.0
+        if leverage >= 2:
+            if pitch_type in ['slider', 'curveball', 'splitter', 'changeup']:
+                weight *= 1.5
+        elif leverage <= -2:
+            weight *= 2.0 if pitch_type in ['fastball', '4-seam', '2-seam', 'cutter'] else 0.3
+        elif balls == 3 and strikes < 2:
+            weight *= 2.5 if pitch_type in ['fastball', '4-seam'] else 0.2
+        elif strikes == 2:
+            if pitch_type in ['slider', 'changeup', 'splitter']:
+                weight *= 1.8
+        if recent_pitches:
+            if pitch_type == recent_pitches[-1]:
+                weight *= 0.3
+            if len(recent_pitches) >= 2 and pitch_type == recent_pitches[-2]:
+                weight *= 0.5
+            last_pitch = recent_pitches[-1]
+            if last_pitch in ['fastball', '4-seam'] and pitch_type in ['changeup', 'splitter']:
+                weight *= 1.3
+            elif last_pitch in ['curveball', 'slider'] and pitch_type in ['fastball', '4-seam']:
+                weight *= 1.2
+        pitch_weights[pitch_type] = max(weight, 0.01)
+    weights = np.array(list(pitch_weights.values()))
+    weights /= weights.sum()
+    return np.random.choice(list(pitch_weights), p=weights)
+
+
+class TestArsenalPitches:
+    """Cached pitch parameters against the per-pitch getters."""
+
+    def test_fatigued_pitch_matches_getters(self):
+        pitcher = _pitcher()
+        arsenal = pitcher.get_arsenal()
+        for pitches_thrown in (0, 17, 60, 500):
+            pitcher.pitches_thrown = pitches_thrown
+            for pitch_type in ('fastball', 'slider', 'changeup', 'curve', 'sinker'):
+                key, factory = PITCH_FACTORIES[pitch_type]
+                velocity = pitcher.get_pitch_velocity_mph(key)
+                spin = pitcher.get_pitch_spin_rpm(key)
+                expected = factory(velocity, spin)
+
+                pitch, cached_velocity, cached_spin = arsenal.build_pitch(pitch_type)
+                assert (cached_velocity, cached_spin) == (velocity, spin)
+                assert pitch.name == expected.name
+                assert (pitch.velocity, pitch.spin_rpm) == (velocity, spin)
+                assert np.array_equal(pitch.spin_axis, expected.spin_axis)
+                assert pitch.spin_efficiency == expected.spin_efficiency
+
+    def test_unknown_pitch_type_is_fastball(self):
+        pitch, _, _ = _pitcher().get_arsenal().build_pitch('eephus')
+        assert pitch.name == create_fastball_4seam().name
+
+    def test_whiff_multiplier_cached(self):
+        pitcher = _pitcher()
+        arsenal = pitcher.get_arsenal()
+        assert arsenal.get('slider').whiff_multiplier == pitcher.get_pitch_whiff_multiplier('slider')
+        assert arsenal.get('fastball').whiff_multiplier == 1.0
+
+
+class TestPitchSelection:
+    """Cumulative-weight selection against np.random.choice."""
+
+    def test_same_choices_and_random_stream(self):
+        pitcher = _pitcher()
+        arsenal = pitcher.get_arsenal()
+        pitch_types = list(pitcher.pitch_arsenal)
+        situations = [
+            ((balls, strikes), pitch_types[i % 4:i % 4 + i % 3])
+            for i, (balls, strikes) in enumerate(
+                (b, s) for b in range(4) for s in range(3) for _ in range(40)
+            )
+        ]
+
+        np.random.seed(21)
+        expected = [_legacy_select(pitcher, count, recent) for count, recent in situations]
+        expected_next = np.random.random()
+        np.random.seed(21)
+        selected = [arsenal.select_pitch_type(count, recent) for count, recent in situations]
+
+        assert selected == expected
+        assert np.random.random() == expected_next
+
+    def test_empty_arsenal(self):
+        pitcher = _pitcher()
+        pitcher.pitch_arsenal = {}
+        assert pitcher.get_arsenal().select_pitch_type((0, 0)) == 'fastball'
+
+
+class TestArsenalCache:
+    """Cache lifetime."""
+
+    def test_rebuilt_when_attributes_change(self):
+        pitcher = _pitcher()
+        arsenal = pitcher.get_arsenal()
+        assert pitcher.get_arsenal() is arsenal
+        fresh_velocity = arsenal.get('fastball').velocity_mph
+
+        pitcher.attributes.RAW_VELOCITY_CAP = 95000
+        rebuilt = pitcher.get_arsenal()
+        assert rebuilt is not arsenal
+        assert rebuilt.get('fastball').velocity_mph > fresh_velocity
+
+    def test_rebuilt_for_new_game(self):
+        team = create_test_team("Test", "average")
+        before = [pitcher.get_arsenal() for pitcher in team.pitchers]
+        team.reset_pitcher_state()
+        assert all(pitcher.arsenal is not old for pitcher, old in zip(team.pitchers, before))
@@ -0,0 +1,102 @@
+"""
+Tests for fielder reach envelopes and pruned timing.
+
+Validates:
+1. Fielders cache their reach envelope until the ratings change
+2. Batched movement noise matches the separate np.random.normal() draws
+3. Pruning is conservative: a pruned target is never reachable in time
+4. Unpruned times and RNG consumption match the exact calculation
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+
+import numpy as np
+
+from batted_ball.field_layout import FieldLayout, FieldPosition
+from batted_ball.fielding import create_average_fielder, create_elite_fielder, create_poor_fielder
+
+LAYOUT = FieldLayout()
+
+
+def create_defense():
+    """Mixed-quality fielders at their standard positions."""
+    makers = [create_elite_fielder, create_average_fielder, create_poor_fielder]
+    fielders = []
+    for i, name in enumerate(LAYOUT.defensive_positions):
+        fielder = makers[i % 3](name, 'outfield' if name.endswith('_field') else 'infield')
+        fielder.current_position = LAYOUT.get_defensive_position(name)
+        fielders.append(fielder)
+    return fielders
+
+
+class TestReachEnvelope:
+    """Cached best-case movement constants."""
+
+    def test_cached_until_ratings_change(self):
+        fielder = create_average_fielder("CF", "outfield")
+        envelope = fielder.reach_envelope
+        assert fielder.reach_envelope is envelope
+        assert envelope.first_step_time == fielder.get_first_step_time()
+        assert envelope.range_multiplier == fielder.get_effective_range_multiplier()
+
+        fielder.attributes.TOP_SPRINT_SPEED = 95000
+        faster = fielder.reach_envelope
+        assert faster is not envelope
+        assert faster.best_speed_fps > envelope.best_speed_fps
+
+    def test_grows_with_time(self):
+        envelope = create_elite_fielder("CF", "outfield").reach_envelope
+        assert envelope.max_distance(envelope.first_step_time - 0.1) == -math.inf
+        reach = [envelope.max_distance(t) for t in np.linspace(envelope.first_step_time + 0.5, 6.0, 20)]
+        assert np.all(np.diff(reach) > 0)
+        # A strong Jump draw only ever extends the reach
+        assert envelope.max_distance(3.0, jump_noise=2.0) > envelope.max_distance(3.0)
+
+    def test_noise_draws_match_separate_normals(self):
+        fielder = create_average_fielder("SS", "infield")
+        for distance, scales in [(12.0, [0.05, 1.0]), (45.0, [0.05, 1.0, 0.02])]:
+            np.random.seed(21)
+            noise = fielder._draw_movement_noise(distance)
+            np.random.seed(21)
+            expected = [np.random.normal(0, scale) for scale in scales]
+            assert [scale * g for scale, g in zip(scales, noise)] == expected
+
+
+class TestPrunedTiming:
+    """calculate_effective_time_within() against the exact calculation."""
+
+    def test_pruning_is_conservative(self):
+        rng = np.random.default_rng(12)
+        pruned = 0
+        for fielder in create_defense():
+            for _ in range(400):
+                target = FieldPosition(rng.uniform(-300, 300), rng.uniform(-10, 420), 0.0)
+                time_limit = rng.uniform(0.0, 7.0)
+
+                np.random.seed(int(rng.integers(2**31)))
+                state = np.random.get_state()
+                fast = fielder.calculate_effective_time_within(target, time_limit)
+                after_fast = np.random.random()
+
+                np.random.set_state(state)
+                exact = fielder.calculate_effective_time_to_position(target)
+                assert np.random.random() == after_fast
+
+                if math.isinf(fast):
+                    pruned += 1
+                    assert exact > time_limit
+                else:
+                    assert fast == exact
+        # Most random spots are far out of reach for most fielders
+        assert pruned > 1000
+
+    def test_catcher_on_deep_fly(self):
+        catcher = create_average_fielder("C", "catcher")
+        catcher.current_position = LAYOUT.get_defensive_position("catcher")
+        assert math.isinf(catcher.calculate_effective_time_within(FieldPosition(20.0, 360.0, 0.0), 5.0))
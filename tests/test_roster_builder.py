@@ -0,0 +1,326 @@
+"""
+Tests for vectorized rating mapping and the batch roster builder.
+
+Validates:
+1. Array mapping functions match the scalar piecewise logistic maps
+2. profile_columns() matches per-object compiled profiles (incl. Statcast overrides)
+3. percentile_to_rating_array matches percentile_to_rating
+4. Roster builder accepts record lists, DataFrames and structured arrays alike
+5. Rating adjustments (bat speed boost, attack angle floor, squared-up rate)
+6. Column-wise stats → ratings match the per-player StatsConverter methods
+   and hand-computed ratings at known thresholds
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from batted_ball.attributes import (
+    HitterAttributes,
+    FielderAttributes,
+    PitcherAttributes,
+    piecewise_logistic_map,
+    piecewise_logistic_map_inverse,
+    piecewise_logistic_map_array,
+    piecewise_logistic_map_inverse_array,
+)
+from batted_ball.database.stats_converter import StatsConverter
+from batted_ball.database.roster_builder import (
+    attributes_from_columns,
+    build_hitter_columns,
+    build_pitcher_columns,
+    defensive_stat_ratings,
+    hitter_stat_ratings,
+    pitcher_stat_ratings,
+    rating_records,
+)
+
+
+RATINGS = np.array([-500.0, 0.0, 12000.0, 50000.0, 84999.0, 85000.0, 92000.0, 100000.0, 120000.0])
+
+
+def _hitter_records():
+    return [
+        # Elite power, no bat tracking: boosted BAT_SPEED, 80k AAC floor
+        {'player_name': 'A', 'power': 85000, 'contact': 60000, 'discipline': 55000,
+         'home_runs': 40, 'slugging_pct': 0.560, 'attack_angle_control': 62000},
+        # Bat tracking data: measured bat speed and squared-up rate (percent)
+        {'player_name': 'B', 'power': 45000, 'contact': 70000, 'discipline': 65000,
+         'bat_speed': 72.5, 'squared_up_rate': 30.0, 'hard_swing_rate': 65.0,
+         'home_runs': 8, 'slugging_pct': 0.390, 'attack_angle_control': None},
+        # Missing optional columns fall back to defaults
+        {'player_name': 'C', 'power': 30000, 'contact': 40000, 'discipline': 45000,
+         'home_runs': None, 'slugging_pct': None},
+    ]
+
+
+class TestArrayMapping:
+    """Vectorized logistic maps against the scalar versions."""
+
+    def test_map_matches_scalar(self):
+        expected = [piecewise_logistic_map(r, 59.0, 79.0, 89.0) for r in RATINGS]
+        assert np.allclose(piecewise_logistic_map_array(RATINGS, 59.0, 79.0, 89.0), expected,
+                           rtol=0, atol=1e-12)
+
+    def test_inverse_matches_scalar(self):
+        expected = [piecewise_logistic_map_inverse(r, 2.5, 5.8, 1.65) for r in RATINGS]
+        assert np.allclose(piecewise_logistic_map_inverse_array(RATINGS, 2.5, 5.8, 1.65), expected,
+                           rtol=0, atol=1e-12)
+
+    def test_scalar_functions_dispatch_arrays(self):
+        """Passing an ndarray to the scalar functions returns an array."""
+        result = piecewise_logistic_map(RATINGS, 0.5, 0.9, 1.0)
+        assert isinstance(result, np.ndarray) and result.shape == RATINGS.shape
+
+
+class TestProfileColumns:
+    """profile_columns() against per-object compiled profiles."""
+
+    def test_all_classes_match_compiled_profiles(self):
+        rng = np.random.default_rng(7)
+        for cls in (HitterAttributes, FielderAttributes, PitcherAttributes):
+            ratings = {name: rng.uniform(0, 100000, 20) for name in cls._RATING_NAMES}
+            columns = cls.profile_columns(ratings)
+            for i in range(20):
+                profile = cls(**{name: values[i] for name, values in ratings.items()}).profile
+                for field, value in profile.as_dict().items():
+                    assert columns[field][i] == value, (cls.__name__, field)
+
+    def test_measured_overrides(self):
+        """Non-NaN actual_bat_speed_mph replaces the BAT_SPEED mapping."""
+        columns = HitterAttributes.profile_columns({
+            'BAT_SPEED': np.array([50000.0, 50000.0]),
+            'actual_bat_speed_mph': np.array([np.nan, 74.0]),
+        })
+        assert columns['bat_speed_mph'][0] == HitterAttributes().get_bat_speed_mph()
+        assert columns['bat_speed_mph'][1] == 74.0
+
+    def test_structured_array_input(self):
+        ratings = np.zeros(3, dtype=[('RAW_VELOCITY_CAP', 'f8'), ('COMMAND', 'f8')])
+        ratings['RAW_VELOCITY_CAP'] = [30000, 60000, 90000]
+        columns = PitcherAttributes.profile_columns(ratings)
+        assert np.all(np.diff(columns['raw_velocity_mph']) > 0)
+        # Unlisted ratings default to 50,000
+        assert columns['stamina_pitches'][0] == PitcherAttributes().get_stamina_pitches()
+
+
+class TestPercentileToRatingArray:
+    """Vectorized stat → rating conversion."""
+
+    def test_matches_scalar(self):
+        thresholds = (StatsConverter.PITCHER_ERA_ELITE, StatsConverter.PITCHER_ERA_GOOD,
+                      StatsConverter.PITCHER_ERA_AVG, StatsConverter.PITCHER_ERA_POOR)
+        values = np.linspace(0.5, 10.0, 200)
+        for inverse in (False, True):
+            expected = [StatsConverter.percentile_to_rating(v, *thresholds, inverse=inverse)
+                        for v in values]
+            result = StatsConverter.percentile_to_rating_array(values, *thresholds, inverse=inverse)
+            assert result.tolist() == expected
+
+
+class TestRosterBuilder:
+    """Batch conversion of database records."""
+
+    def test_rating_adjustments(self):
+        columns = build_hitter_columns(_hitter_records())
+
+        assert columns['BAT_SPEED'].tolist() == [100000, 50000, 48000]
+        assert columns['ATTACK_ANGLE_CONTROL'].tolist() == [80000, 50000, 45000]
+        assert np.isnan(columns['actual_bat_speed_mph'][0])
+        assert columns['bat_speed_mph'][1] == 72.5
+        assert abs(columns['barrel_accuracy_mm'][1] - (40.0 - 90.0 * 0.30)) < 1e-12
+        assert abs(columns['hard_swing_rate'][1] - 0.65) < 1e-12
+        assert columns['VISION'][2] == 50000
+
+    def test_input_types_agree(self):
+        records = _hitter_records()
+        from_records = build_hitter_columns(records)
+        frame = pd.DataFrame(records)
+        from_frame = build_hitter_columns(frame)
+        from_struct = build_hitter_columns(
+            frame.drop(columns='player_name').astype(np.float64).to_records(index=False)
+        )
+        for name, values in from_records.items():
+            assert np.array_equal(values, from_frame[name], equal_nan=True), name
+            assert np.array_equal(values, from_struct[name], equal_nan=True), name
+
+    def test_attributes_from_columns(self):
+        records = [{'velocity': 80000, 'command': 40000, 'stamina': 70000,
+                    'movement': 60000, 'nibbling_tendency': 0.8}]
+        columns = build_pitcher_columns(records)
+        attrs = attributes_from_columns(PitcherAttributes, columns)[0]
+
+        assert attrs._profile is not None  # Compiled without running the getters
+        # Same state as going through the constructor
+        expected = PitcherAttributes(RAW_VELOCITY_CAP=80000, COMMAND=40000, STAMINA=70000,
+                                     SPIN_RATE_CAP=60000, NIBBLING_TENDENCY=80000)
+        assert {k: v for k, v in vars(attrs).items() if k != '_profile'} == \
+            {k: v for k, v in vars(expected).items() if k != '_profile'}
+        assert attrs.NIBBLING_TENDENCY == 80000
+        assert attrs.get_raw_velocity_mph() == PitcherAttributes(RAW_VELOCITY_CAP=80000).get_raw_velocity_mph()
+
+    def test_hitter_measured_values_passed_through(self):
+        attrs = attributes_from_columns(HitterAttributes, build_hitter_columns(_hitter_records()))
+        assert attrs[0]._actual_bat_speed_mph is None
+        assert attrs[1]._actual_bat_speed_mph == 72.5
+        assert attrs[1]._hard_swing_rate == 0.65
+        assert set(vars(attrs[1])) == set(vars(HitterAttributes()))
+        # Changing a rating still invalidates the precompiled profile
+        attrs[0].BAT_SPEED = 0
+        assert attrs[0].get_bat_speed_mph() == HitterAttributes(BAT_SPEED=0).get_bat_speed_mph()
+
+
+def _with_gaps(rng, low, high, n):
+    values = rng.uniform(low, high, n)
+    values[rng.random(n) < 0.3] = np.nan
+    return values
+
+
+def _optional(value):
+    return None if pd.isna(value) else value
+
+
+class TestStatRatings:
+    """Column-wise stats → ratings against the per-player StatsConverter methods."""
+
+    N = 300
+
+    def test_pitchers_match_scalar(self):
+        rng = np.random.default_rng(3)
+        stats = pd.DataFrame({
+            'era': _with_gaps(rng, 0.5, 9.0, self.N),
+            'whip': _with_gaps(rng, 0.6, 2.0, self.N),
+            'k_per_9': _with_gaps(rng, 3.0, 15.0, self.N),
+            'bb_per_9': _with_gaps(rng, 0.5, 6.0, self.N),
+            'avg_fastball_velo': _with_gaps(rng, 85.0, 101.0, self.N),
+            'innings_pitched': _with_gaps(rng, 0.0, 200.0, self.N),
+            'games_pitched': np.floor(_with_gaps(rng, 0.0, 40.0, self.N)),
+        })
+        records = rating_records(pitcher_stat_ratings(stats))
+        for row, attrs in zip(stats.to_dict('records'), records):
+            expected = StatsConverter.mlb_stats_to_pitcher_attributes_v2(
+                **{name: _optional(value) for name, value in row.items()})
+            assert attrs == expected
+
+    def test_hitters_match_scalar(self):
+        rng = np.random.default_rng(4)
+        stats = pd.DataFrame({
+            'batting_avg': _with_gaps(rng, 0.15, 0.35, self.N),
+            'on_base_pct': _with_gaps(rng, 0.20, 0.45, self.N),
+            'slugging_pct': _with_gaps(rng, 0.25, 0.70, self.N),
+            'home_runs': np.floor(_with_gaps(rng, 0, 50, self.N)),
+            'strikeouts': np.floor(_with_gaps(rng, 0, 200, self.N)),
+            'walks': np.floor(_with_gaps(rng, 0, 120, self.N)),
+            'at_bats': np.floor(_with_gaps(rng, 0, 650, self.N)),
+            'avg_exit_velo': _with_gaps(rng, 80.0, 96.0, self.N),
+            'barrel_pct': _with_gaps(rng, 0.0, 20.0, self.N),
+            'sprint_speed': _with_gaps(rng, 23.0, 31.0, self.N),
+            'stolen_bases': np.floor(_with_gaps(rng, 0, 60, self.N)),
+        })
+        records = rating_records(hitter_stat_ratings(stats))
+        for row, attrs in zip(stats.to_dict('records'), records):
+            expected = StatsConverter.mlb_stats_to_hitter_attributes_v2(
+                **{name: _optional(value) for name, value in row.items()})
+            assert attrs == expected
+
+    def test_defense_matches_scalar(self):
+        rng = np.random.default_rng(5)
+        ranges = {
+            'oaa': (-15, 20), 'sprint_speed': (23, 31), 'arm_strength_mph': (70, 99),
+            'drs': (-15, 20), 'jump': (-5, 6), 'jump_reaction': (-3, 3),
+            'jump_burst': (-3, 3), 'jump_route': (-3, 2), 'fielding_pct': (0.94, 1.0),
+            'back_oaa': (-8, 10), 'in_oaa': (-6, 8), 'catch_5star_pct': (0, 70),
+            'catch_34star_pct': (30, 100),
+        }
+        stats = pd.DataFrame({name: _with_gaps(rng, low, high, self.N)
+                              for name, (low, high) in ranges.items()})
+        stats['primary_position'] = rng.choice(
+            ['C', '1B', '2B', '3B', 'SS', 'LF', 'CF', 'RF', 'DH', None], self.N)
+
+        records = rating_records(defensive_stat_ratings(stats))
+        for row, attrs in zip(stats.to_dict('records'), records):
+            position = _optional(row.pop('primary_position')) or 'LF'
+            expected = StatsConverter.mlb_stats_to_defensive_attributes(
+                position, **{name: _optional(value) for name, value in row.items()})
+            assert attrs == expected
+
+    def test_pitcher_good_thresholds(self):
+        """Every stat exactly at its 'good' threshold rates 70,000."""
+        ratings = rating_records(pitcher_stat_ratings([{
+            'era': 3.50, 'whip': 1.10, 'k_per_9': 9.5, 'bb_per_9': 2.5,
+            'avg_fastball_velo': 94.5, 'innings_pitched': 110.0, 'games_pitched': 20,
+        }]))[0]
+        assert ratings == {
+            'velocity': 70000, 'command': 70000, 'stamina': 70000, 'movement': 70000,
+            'repertoire': 70000, 'putaway_skill': 70000,
+            'nibbling_tendency': 0.50,  # 2.5 BB/9 is in the 2.5-3.5 bucket
+        }
+
+    def test_hitter_good_thresholds(self):
+        ratings = rating_records(hitter_stat_ratings([{
+            'batting_avg': 0.280, 'on_base_pct': 0.350, 'slugging_pct': 0.470,
+            'home_runs': 30, 'strikeouts': 120, 'walks': 66, 'at_bats': 600,
+            'avg_exit_velo': 89.5, 'barrel_pct': 8.0, 'sprint_speed': 28.5,
+        }]))[0]
+        # Attack angle raw score (70k*1.5*1.5 + 70k + 70k*1.2*1.2 + 70k*0.5*0.5) / 4.2
+        # = 82,333.3 → 68,000 + int(10,399.99...)
+        assert ratings == {
+            'contact': 70000, 'power': 70000, 'discipline': 70000, 'speed': 70000,
+            'vision': 70000, 'attack_angle_control': 78399,
+        }
+
+    def test_no_stats_defaults(self):
+        assert rating_records(pitcher_stat_ratings([{}]))[0] == {
+            'velocity': 50000, 'command': 50000, 'stamina': 60000, 'movement': 50000,
+            'repertoire': 50000, 'putaway_skill': 50000, 'nibbling_tendency': 0.50,
+        }
+        hitter = rating_records(hitter_stat_ratings([{}, {'stolen_bases': 20, 'at_bats': 600}]))
+        assert hitter[0] == {
+            'contact': 50000, 'power': 50000, 'discipline': 50000, 'speed': 50000,
+            'vision': 50000, 'attack_angle_control': 65000,
+        }
+        assert hitter[1]['speed'] == 70000  # 20 SB per 600 AB = good
+        defense = rating_records(defensive_stat_ratings([{}]))[0]
+        assert set(defense.values()) == {50000}
+
+    def test_defense_oaa_fallbacks(self):
+        """OAA-only estimates differ between infielders and outfielders."""
+        infielder, outfielder = rating_records(defensive_stat_ratings([
+            {'primary_position': 'SS', 'oaa': 4.0},
+            {'primary_position': 'CF', 'oaa': 4.0, 'sprint_speed': 28.5},
+        ]))
+        assert infielder['reaction_time'] == 74000      # 70k + 20k * (4 - 3) / (8 - 3)
+        assert infielder['route_efficiency'] == 60000   # OAA/2 = 2.0 on the OAA+DRS thresholds
+        assert infielder['arm_strength'] == 50000 + 4 * 3000
+        assert infielder['jump'] == 50000 + 4 * 2000
+        assert infielder['range_back'] == 50000 + 4 * 1500
+        assert infielder['range_in'] == 50000 + 4 * 2500
+        assert infielder['burst'] == 50000
+
+        assert outfielder['top_sprint_speed'] == 70000
+        assert outfielder['burst'] == 50000 + 12500     # 1 ft/s above average sprint speed
+        assert outfielder['jump'] == 50000 + 4 * 3125
+        assert outfielder['range_back'] == 50000 + 4 * 2500
+        assert outfielder['range_in'] == 50000 + 4 * 2000
+        assert outfielder['catch_elite'] == 50000 + 4 * 3125
+        assert outfielder['catch_difficult'] == 50000 + 4 * 2500
+
+        # Measured arm strength uses the position's thresholds
+        arms = defensive_stat_ratings([
+            {'primary_position': 'RF', 'arm_strength_mph': 88.0},
+            {'primary_position': 'C', 'arm_strength_mph': 80.0},
+            {'primary_position': 'SS', 'arm_strength_mph': 88.0},
+        ])['arm_strength']
+        assert arms.tolist() == [70000, 70000, 90000]
+
+    def test_missing_columns_use_defaults(self):
+        """Columns absent from the season frame count as not available."""
+        stats = pd.DataFrame({'era': [3.10, np.nan]})
+        records = rating_records(pitcher_stat_ratings(stats))
+        assert records[0] == StatsConverter.mlb_stats_to_pitcher_attributes_v2(era=3.10)
+        assert records[1] == StatsConverter.mlb_stats_to_pitcher_attributes_v2()
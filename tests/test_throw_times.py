@@ -0,0 +1,104 @@
+"""
+Tests for per-fielder throw parameters and vectorized throw times.
+
+Validates:
+1. Fielders cache their throw parameters until the ratings change
+2. throw_arrival_times() reproduces simulate_fielder_throw() for every base
+3. Force plays and double plays draw the same random numbers as before
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.baserunning import BaserunningSimulator, create_average_runner
+from batted_ball.field_layout import BASE_INDEX, BASES, FieldLayout, FieldPosition
+from batted_ball.fielding import (
+    create_average_fielder,
+    create_poor_fielder,
+    simulate_fielder_throw,
+    throw_arrival_times,
+)
+from batted_ball.throwing_logic import PlayResult, ThrowingLogic
+
+LAYOUT = FieldLayout()
+
+
+class TestThrowParameters:
+    """Cached per-fielder throwing constants."""
+
+    def test_cached_until_ratings_change(self):
+        fielder = create_average_fielder("SS", "infield")
+        params = fielder.throw_parameters
+        assert fielder.throw_parameters is params
+        assert params.arm_strength_mph == fielder.attributes.get_arm_strength_mph()
+        assert params.transfer_time == fielder.attributes.get_transfer_time_s()
+        assert 0.70 <= params.on_target_probability <= 0.98
+
+        fielder.attributes.ARM_STRENGTH = 95000
+        stronger = fielder.throw_parameters
+        assert stronger is not params
+        assert stronger.throw_velocity_fps > params.throw_velocity_fps
+
+
+class TestThrowArrivalTimes:
+    """The (positions x bases) throw-time matrix."""
+
+    def test_matches_simulated_throws(self):
+        fielder = create_poor_fielder("LF", "outfield")
+        rng = np.random.default_rng(4)
+        positions = np.column_stack([rng.uniform(-200, 200, 20), rng.uniform(30, 380, 20)])
+        times = throw_arrival_times(fielder, positions, LAYOUT)
+        assert times.shape == (20, len(BASES))
+
+        for row, (x, y) in zip(times, positions):
+            for base in BASES:
+                np.random.seed(7)
+                throw = simulate_fielder_throw(fielder, FieldPosition(x, y, 0), base, LAYOUT)
+                np.random.seed(7)
+                _, penalty = fielder.throw_parameters.draw_accuracy()
+                assert throw.arrival_time == row[BASE_INDEX[base]] + penalty
+
+    def test_base_to_base(self):
+        fielder = create_average_fielder("2B", "infield")
+        times = throw_arrival_times(fielder, LAYOUT.base_coordinates, LAYOUT)
+        # Standing on the base costs only the transfer
+        assert np.all(np.diag(times) == fielder.throw_parameters.transfer_time)
+        np.testing.assert_allclose(times, times.T)
+        # Across the diamond is the longest throw from first
+        assert times[BASE_INDEX["first"]].argmax() == BASE_INDEX["third"]
+
+        single = throw_arrival_times(fielder, LAYOUT.get_base_position("second"), LAYOUT)
+        np.testing.assert_array_equal(single[0], times[BASE_INDEX["second"]])
+
+
+class TestThrowingLogic:
+    """Force and double plays built on the throw-time matrix."""
+
+    def test_force_play_matches_simulated_throw(self):
+        fielder = create_average_fielder("SS", "infield")
+        ball_position = FieldPosition(-40.0, 140.0, 0)
+        simulator = BaserunningSimulator(LAYOUT)
+        simulator.add_runner("first", create_average_runner("R1"))
+        simulator.add_runner("home", create_average_runner("Batter"))
+        logic = ThrowingLogic(LAYOUT, simulator)
+
+        np.random.seed(3)
+        force = logic.attempt_force_play(fielder, ball_position, 1.0, PlayResult())
+        assert force["to_base"] == "second"
+
+        np.random.seed(3)
+        throw = simulate_fielder_throw(fielder, ball_position, "second", LAYOUT)
+        assert force["throw_arrival"] == 1.0 + throw.arrival_time
+
+        np.random.seed(5)
+        turned = logic.attempt_double_play(fielder, ball_position, 1.0, PlayResult(), force)
+        np.random.seed(5)
+        relay = simulate_fielder_throw(fielder, LAYOUT.get_base_position("second"), "first", LAYOUT)
+        batter = simulator.get_runner_at_base("home")
+        batter_arrival = 1.0 + batter.calculate_time_to_base("home", "first", include_leadoff=False)
+        assert turned == (batter_arrival - (force["throw_arrival"] + 0.3 + relay.arrival_time) > 0.1)
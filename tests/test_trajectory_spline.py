@@ -0,0 +1,105 @@
+"""
+Tests for the cubic Hermite trajectory spline.
+
+Validates:
+1. The spline reproduces the integrator's samples on a uniform knot grid
+2. Scalar and vectorized evaluation agree exactly
+3. fence_crossing() finds the crossing time and height
+4. drop_raw_trajectory() keeps endpoints and position queries
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.constants import METERS_TO_FEET, TRAJECTORY_SPLINE_DT
+from batted_ball.play_analyzer import PlayAnalyzer
+from batted_ball.trajectory import BattedBallSimulator
+
+SIMULATOR = BattedBallSimulator()
+
+
+def in_flight(result):
+    """Raw samples up to landing (drops the below-ground overshoot step)."""
+    keep = result.time <= result.flight_time
+    return result.time[keep], result.position[keep]
+
+
+class TestSplineAccuracy:
+    """Agreement with the raw integrator samples."""
+
+    def test_matches_raw_samples(self):
+        for launch_angle in (-5.0, 8.0, 28.0, 65.0):
+            result = SIMULATOR.simulate(95.0, launch_angle, 15.0, 1800.0, wind_speed=10.0, wind_direction=30.0)
+            spline = result.spline
+            assert result.spline is spline
+
+            times, positions = in_flight(result)
+            np.testing.assert_allclose(spline.positions(times), positions, rtol=0, atol=1e-5)
+            np.testing.assert_array_equal(spline.position(0.0), result.position[0])
+            np.testing.assert_array_equal(spline.knot_positions[-1], result.position[-1])
+
+            # Uniform knots, plus the landing time
+            knots = spline.knot_times
+            np.testing.assert_allclose(np.diff(knots[:-1]), TRAJECTORY_SPLINE_DT)
+            assert knots[-1] == result.flight_time
+            assert len(knots) <= len(result.time) // 10
+
+    def test_scalar_matches_vectorized(self):
+        spline = SIMULATOR.simulate(100.0, 32.0, -20.0, 2200.0).spline
+        times = np.concatenate([[0.0], np.random.default_rng(2).uniform(0, spline.flight_time, 50), spline.knot_times])
+        batch = spline.positions(times)
+        for t, row in zip(times, batch):
+            np.testing.assert_array_equal(spline.position(t), row)
+
+        # Velocity is the derivative of the position
+        t = 1.2345
+        numeric = np.subtract(spline.position(t + 1e-6), spline.position(t - 1e-6)) / 2e-6
+        np.testing.assert_allclose(spline.velocity(t), numeric, rtol=1e-6)
+
+
+class TestFenceCrossing:
+    """Where the ball reaches a given horizontal distance."""
+
+    def test_crossing_time_and_height(self):
+        result = SIMULATOR.simulate(104.0, 27.0, 10.0, 2100.0)
+        time, height = result.spline.fence_crossing(380.0)
+
+        x, y, z = result.spline.position(time)
+        assert abs(np.hypot(x, y) * METERS_TO_FEET - 380.0) < 1e-6
+        assert height == z * METERS_TO_FEET
+        assert result.get_height_at_distance(380.0) == height
+
+        # Linear interpolation on the raw samples lands in the same place
+        times, positions = in_flight(result)
+        reach = np.hypot(positions[:, 0], positions[:, 1]) * METERS_TO_FEET
+        assert abs(np.interp(380.0, reach, positions[:, 2] * METERS_TO_FEET) - height) < 1e-4
+
+    def test_short_ball(self):
+        result = SIMULATOR.simulate(80.0, 20.0, 0.0, 1500.0)
+        assert result.spline.fence_crossing(result.distance + 10.0) is None
+        assert result.get_height_at_distance(result.distance + 10.0) is None
+
+
+class TestDropRawTrajectory:
+    """Releasing the per-step arrays."""
+
+    def test_queries_unchanged(self):
+        result = SIMULATOR.simulate(97.0, 35.0, 5.0, 1900.0)
+        first, last = result.position[0].copy(), result.position[-1].copy()
+        raw_samples = len(result.time)
+        times = np.linspace(0.05, result.flight_time - 0.05, 25)
+        before = [PlayAnalyzer.calculate_ball_position_at_time(result, t) for t in times]
+
+        result.drop_raw_trajectory()
+        assert len(result.time) < raw_samples // 10
+        assert result.trajectory_data['position'] is result.position
+        np.testing.assert_array_equal(result.position[0], first)
+        np.testing.assert_array_equal(result.position[-1], last)
+
+        after = [PlayAnalyzer.calculate_ball_position_at_time(result, t) for t in times]
+        assert [(p.x, p.y, p.z) for p in after] == [(p.x, p.y, p.z) for p in before]
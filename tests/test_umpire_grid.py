@@ -0,0 +1,104 @@
+"""
+Tests for the umpire call probability grid.
+
+Validates:
+1. Grid probabilities match the exact zone rules (definitive regions exactly)
+2. call_pitch() consumes the same random numbers as call_pitch_exact()
+3. call_pitches() batch calls match the expected strike rate
+4. Framing bonus and consistency noise apply to borderline pitches only
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from batted_ball.umpire import UmpireModel, CLEAR_STRIKE, CLEAR_BALL
+
+
+def _exact_probability(umpire, horizontal, vertical, framing_bonus):
+    """Strike probability from the zone rules (no consistency noise)."""
+    if umpire._is_clearly_in_zone(horizontal, vertical):
+        return 1.0
+    if umpire._is_clearly_out_of_zone(horizontal, vertical):
+        return 0.0
+    distance = umpire._calculate_distance_from_zone(horizontal, vertical)
+    bias = umpire.borderline_bias
+    if distance <= 0:
+        base = bias + (1.0 - bias) * (-distance / 2.0)
+    else:
+        base = bias * (1.0 - distance / 2.0)
+    return float(np.clip(base + framing_bonus, 0.0, 1.0))
+
+
+def _locations(n, seed=1):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-14.0, 14.0, n), rng.uniform(12.0, 48.0, n)
+
+
+class TestCallGrid:
+    """Grid lookups against the exact rules."""
+
+    def test_probabilities_match(self):
+        for umpire in (UmpireModel(), UmpireModel(borderline_bias=0.55)):
+            horizontal, vertical = _locations(5000)
+            errors = [
+                abs(umpire.strike_probability(h, v, 0.02) - _exact_probability(umpire, h, v, 0.02))
+                for h, v in zip(horizontal, vertical)
+            ]
+            # Half a 0.05" cell at ~0.25 probability per inch
+            assert max(errors) < 0.0075
+            assert np.mean(errors) < 0.001
+
+    def test_definitive_regions(self):
+        umpire = UmpireModel()
+        assert umpire.base_strike_probability(0.0, 30.0) == CLEAR_STRIKE
+        assert umpire.base_strike_probability(-6.4, 20.1) == CLEAR_STRIKE
+        assert umpire.base_strike_probability(6.6, 30.0) != CLEAR_STRIKE
+        assert umpire.base_strike_probability(10.6, 30.0) == CLEAR_BALL
+        assert umpire.base_strike_probability(0.0, 15.9) == CLEAR_BALL
+        assert umpire.base_strike_probability(0.0, 60.0) == CLEAR_BALL
+        # Framing never turns a clear ball into a strike
+        assert umpire.strike_probability(20.0, 30.0, 0.05) == 0.0
+
+    def test_grid_shared_between_umpires(self):
+        assert UmpireModel()._grid is UmpireModel()._grid
+        assert UmpireModel()._grid is not UmpireModel(borderline_bias=0.55)._grid
+
+
+class TestCalls:
+    """Single and batch calls."""
+
+    def test_same_random_stream_as_exact(self):
+        for consistency in (1.0, 0.7):
+            umpire = UmpireModel(consistency=consistency)
+            horizontal, vertical = _locations(3000, seed=2)
+
+            np.random.seed(5)
+            exact = [umpire.call_pitch_exact(h, v, 0.03) for h, v in zip(horizontal, vertical)]
+            exact_next = np.random.random()
+            np.random.seed(5)
+            grid = [umpire.call_pitch(h, v, 0.03) for h, v in zip(horizontal, vertical)]
+
+            assert np.random.random() == exact_next
+            assert np.mean(np.array(exact) == np.array(grid)) > 0.99
+
+    def test_batch_strike_rate(self):
+        umpire = UmpireModel()
+        horizontal, vertical = _locations(200000, seed=3)
+        strikes = umpire.call_pitches(horizontal, vertical, 0.02, rng=np.random.default_rng(0))
+        expected = np.mean([_exact_probability(umpire, h, v, 0.02)
+                            for h, v in zip(horizontal[:20000], vertical[:20000])])
+        assert strikes.dtype == bool and strikes.shape == horizontal.shape
+        assert abs(strikes[:20000].mean() - expected) < 0.01
+
+    def test_batch_definitive_and_per_pitch_framing(self):
+        umpire = UmpireModel()
+        horizontal = np.array([0.0, 20.0, 9.0, 9.0])
+        vertical = np.array([30.0, 30.0, 43.0, 43.0])  # Last two: borderline corner
+        framing = np.array([0.0, 0.05, -1.0, 1.0])
+        strikes = umpire.call_pitches(horizontal, vertical, framing, rng=np.random.default_rng(0))
+        assert strikes.tolist() == [True, False, False, True]
@@ -0,0 +1,250 @@
+"""
+Tests for the vectorized plate-appearance engine.
+
+Validates:
+1. Batch pitch targets, swing/whiff lookups and spray angles match the
+   per-pitch functions
+2. Pitch flight tables reproduce PitchSimulator at the aim-point grid
+3. Batch batted-ball distances match BattedBallSimulator
+4. Engine outcomes are consistent, seeded and leave the players untouched
+5. BulkAtBatSimulator runs both the vectorized engine and the scalar loop
+"""
+
+import sys
+import os
+
+# Add the project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from batted_ball import fast_trajectory
+from batted_ball.attributes import HitterAttributes, PitcherAttributes
+from batted_ball.bulk_simulation import BulkAtBatSimulator, BulkSimulationSettings
+from batted_ball.constants import MOUND_DISTANCE, SimulationMode
+from batted_ball.decision_surface import DecisionSurface
+from batted_ball.ev_la_distribution import (
+    get_spray_angle_for_launch_angle,
+    get_spray_angles_for_launch_angles,
+)
+from batted_ball.pitch import PitchSimulator
+from batted_ball.pitcher_control import PitcherControlModule
+from batted_ball.player import Hitter, Pitcher
+from batted_ball.trajectory import BattedBallSimulator
+from batted_ball.vectorized_at_bat import (
+    FLIGHT_GRID_HORIZONTAL,
+    FLIGHT_GRID_VERTICAL,
+    STRIKEOUT,
+    WALK,
+    PitchFlightTable,
+    VectorizedAtBatEngine,
+    integrate_batted_balls,
+)
+
+
+def _pitcher():
+    return Pitcher(
+        "Test Pitcher",
+        attributes=PitcherAttributes(RAW_VELOCITY_CAP=60000, COMMAND=55000),
+        pitch_arsenal={'fastball': {}, 'slider': {}, 'changeup': {}},
+    )
+
+
+def _hitter():
+    return Hitter("Test Hitter", attributes=HitterAttributes())
+
+
+def _in_zone(horizontal, vertical):
+    return (np.abs(horizontal) <= 8.5) & (vertical >= 18.0) & (vertical <= 42.0)
+
+
+class TestBatchComponents:
+    """Batch helpers against their per-pitch counterparts."""
+
+    def test_pitch_locations_match_scalar(self):
+        control = PitcherControlModule(_pitcher())
+        rng = np.random.default_rng(4)
+        np.random.seed(4)
+        n = 4000
+        for balls, strikes in ((0, 0), (3, 1), (1, 2), (2, 0)):
+            horizontal, vertical = control.generate_pitch_locations(
+                np.full(n, balls), np.full(n, strikes), rng
+            )
+            scalar = np.array([control.generate_pitch_location(balls, strikes, 'fastball')
+                               for _ in range(n)])
+            assert abs(_in_zone(horizontal, vertical).mean()
+                       - _in_zone(scalar[:, 0], scalar[:, 1]).mean()) < 0.04
+            assert abs(vertical.mean() - scalar[:, 1].mean()) < 1.0
+            assert abs(np.abs(horizontal).mean() - np.abs(scalar[:, 0]).mean()) < 0.6
+
+    def test_swing_and_whiff_lookups_match_scalar(self):
+        surface = DecisionSurface(_hitter())
+        rng = np.random.default_rng(5)
+        n = 500
+        horizontal = rng.uniform(-16.0, 16.0, n)
+        vertical = rng.uniform(8.0, 52.0, n)
+        is_strike = _in_zone(horizontal, vertical)
+        balls = rng.integers(0, 4, n)
+        strikes = rng.integers(0, 3, n)
+        velocity = rng.uniform(72.0, 100.0, n)
+        v_break = rng.uniform(-20.0, 20.0, n)
+        h_break = rng.uniform(-15.0, 15.0, n)
+        for pitch_type in ('fastball', 'slider', 'knuckleball'):
+            swing = surface.swing_probabilities(
+                horizontal, vertical, is_strike, balls, strikes, velocity, pitch_type
+            )
+            whiff = surface.whiff_probabilities(velocity, pitch_type, v_break, h_break)
+            for i in range(n):
+                assert swing[i] == pytest.approx(surface.swing_probability(
+                    (horizontal[i], vertical[i]), is_strike[i], balls[i], strikes[i],
+                    velocity[i], pitch_type), abs=1e-12)
+                assert whiff[i] == pytest.approx(surface.whiff_probability(
+                    velocity[i], pitch_type, (v_break[i], h_break[i])), abs=1e-12)
+
+    def test_spray_angles_match_scalar(self):
+        launch_angles = np.repeat([-5.0, 15.0, 35.0], 4000)
+        batch = get_spray_angles_for_launch_angles(launch_angles, 5.0, np.random.default_rng(6))
+        np.random.seed(6)
+        scalar = np.array([get_spray_angle_for_launch_angle(la, 5.0) for la in launch_angles])
+        assert np.abs(batch).max() <= 45.0
+        for group in range(3):
+            part = slice(group * 4000, (group + 1) * 4000)
+            assert abs(np.mean(batch[part] > 0) - np.mean(scalar[part] > 0)) < 0.04
+            assert abs(batch[part].std() - scalar[part].std()) < 1.5
+
+
+class TestPhysicsTables:
+    """Pitch flight tables and batch batted-ball flight."""
+
+    def test_flight_table_reproduces_grid_nodes(self):
+        pitcher = _pitcher()
+        table = PitchFlightTable(pitcher, fast_mode=True)
+        pitch, velocity, _ = pitcher.get_arsenal().build_pitch('slider')
+        release_distance = MOUND_DISTANCE - pitcher.get_release_extension_feet()
+        index = table.pitch_types.index('slider')
+        # The Rust batch kernel aims with the interpolated plate crossing
+        if hasattr(fast_trajectory.trajectory_rs, 'integrate_pitches_batch'):
+            location_tol, tol = 0.6, 1e-3
+        else:
+            location_tol, tol = None, 1e-6
+        for aim_h, aim_v in ((FLIGHT_GRID_HORIZONTAL[1], FLIGHT_GRID_VERTICAL[5]),
+                             (FLIGHT_GRID_HORIZONTAL[3], FLIGHT_GRID_VERTICAL[7])):
+            result = PitchSimulator().simulate(
+                pitch, target_x=aim_h / 12.0, target_z=aim_v / 12.0,
+                release_distance=release_distance, fast_mode=True,
+            )
+            flight = table.plate_crossings(
+                np.array([index]), np.array([aim_h]), np.array([aim_v]), np.array([velocity])
+            )
+            assert flight['plate_h'][0] == pytest.approx(result.plate_y * 12.0, abs=location_tol)
+            assert flight['plate_v'][0] == pytest.approx(result.plate_z * 12.0, abs=location_tol)
+            assert flight['plate_speed'][0] == pytest.approx(result.plate_speed, rel=tol)
+            assert flight['vertical_break'][0] == pytest.approx(result.vertical_break, rel=tol)
+
+    def test_flight_table_interpolates_between_nodes(self):
+        pitcher = _pitcher()
+        table = PitchFlightTable(pitcher, fast_mode=True)
+        pitch, velocity, _ = pitcher.get_arsenal().build_pitch('fastball')
+        release_distance = MOUND_DISTANCE - pitcher.get_release_extension_feet()
+        result = PitchSimulator().simulate(
+            pitch, target_x=-5.0 / 12.0, target_z=27.0 / 12.0,
+            release_distance=release_distance, fast_mode=True,
+        )
+        flight = table.plate_crossings(
+            np.array([table.pitch_types.index('fastball')]),
+            np.array([-5.0]), np.array([27.0]), np.array([velocity]),
+        )
+        assert abs(flight['plate_h'][0] - result.plate_y * 12.0) < 0.5
+        assert abs(flight['plate_v'][0] - result.plate_z * 12.0) < 0.5
+        assert abs(flight['plate_speed'][0] - result.plate_speed) < 0.2
+
+    @pytest.mark.skipif(fast_trajectory.RUST_AVAILABLE, reason="Python batted-ball path only")
+    def test_batted_ball_distances_match_scalar(self):
+        rng = np.random.default_rng(7)
+        n = 30
+        exit_velocity = rng.uniform(70.0, 110.0, n)
+        launch_angle = rng.uniform(-20.0, 40.0, n)
+        spray_angle = rng.uniform(-40.0, 40.0, n)
+        backspin = rng.uniform(-500.0, 3000.0, n)
+        sim = BattedBallSimulator(simulation_mode=SimulationMode.FAST)
+        scalar = np.array([
+            sim.simulate(exit_velocity=exit_velocity[i], launch_angle=launch_angle[i],
+                         spray_angle=spray_angle[i], backspin_rpm=backspin[i],
+                         fast_mode=True).distance
+            for i in range(n)
+        ])
+        batch = integrate_batted_balls(exit_velocity, launch_angle, spray_angle, backspin)
+
+        ground = launch_angle <= 10.0
+        np.testing.assert_allclose(batch[ground], scalar[ground], rtol=1e-9)
+        # Airborne balls use the Numba lookup-table aerodynamics
+        assert np.abs(batch[~ground] - scalar[~ground]).max() < 15.0
+        assert abs(batch[~ground].mean() - scalar[~ground].mean()) < 0.02 * scalar[~ground].mean()
+
+
+class TestEngine:
+    """Lockstep plate appearances."""
+
+    def test_outcomes_consistent(self):
+        pitcher = _pitcher()
+        hitter = _hitter()
+        pitcher.pitches_thrown = 12
+        results = VectorizedAtBatEngine(pitcher, hitter, seed=1).simulate(3000)
+
+        strikeouts = results.outcome == STRIKEOUT
+        walks = results.outcome == WALK
+        in_play = results.in_play
+        assert np.all(strikeouts | walks | in_play)
+        assert np.all(results.strikes[strikeouts] == 3)
+        assert np.all(results.balls[walks] == 4)
+        assert np.all(results.pitches[strikeouts] >= 3)
+        assert np.all(results.pitches[walks] >= 4)
+        assert np.all(np.isfinite(results.distance[in_play]))
+        assert np.all(np.isnan(results.exit_velocity[~in_play]))
+        assert sum(results.contact_quality_counts().values()) == in_play.sum()
+
+        counts = results.outcome_counts()
+        assert 0.10 < counts['strikeout'] / 3000 < 0.40
+        assert 0.03 < counts['walk'] / 3000 < 0.20
+        assert 3.0 < results.pitches.mean() < 5.0
+
+        # Players are left as they were
+        assert pitcher.pitches_thrown == 12
+        assert hitter.decision_surface is None
+
+    def test_seeded(self):
+        pitcher = _pitcher()
+        hitter = _hitter()
+        first = VectorizedAtBatEngine(pitcher, hitter, seed=9).simulate(500)
+        second = VectorizedAtBatEngine(pitcher, hitter, seed=9).simulate(500)
+        assert np.array_equal(first.outcome, second.outcome)
+        assert np.array_equal(first.distance, second.distance, equal_nan=True)
+
+
+class TestBulkSimulator:
+    """BulkAtBatSimulator with and without the vectorized engine."""
+
+    def test_vectorized_settings(self):
+        assert BulkSimulationSettings.for_simulation_count(100000).use_vectorized_engine
+        assert not BulkSimulationSettings.for_simulation_count(10000).use_vectorized_engine
+
+    def test_vectorized_matchup(self):
+        settings = BulkSimulationSettings(use_vectorized_engine=True, vectorized_batch_size=700)
+        np.random.seed(11)
+        result = BulkAtBatSimulator(settings=settings).simulate_matchup(_pitcher(), _hitter(), 1500)
+        assert result.total_at_bats == 1500
+        assert sum(result.outcome_counts.values()) == 1500
+        assert sum(result.contact_quality_distribution.values()) == result.outcome_counts['in_play']
+        assert result.contact_quality_distribution['solid'] > 0
+        assert result.individual_results is None
+        assert 60.0 < result.average_exit_velocity < 130.0
+
+    def test_scalar_matchup_resets_pitch_count(self):
+        pitcher = _pitcher()
+        pitcher.pitches_thrown = 5
+        np.random.seed(12)
+        result = BulkAtBatSimulator().simulate_matchup(pitcher, _hitter(), 3)
+        assert sum(result.outcome_counts.values()) == 3
+        assert len(result.individual_results) == 3
+        assert pitcher.pitches_thrown == 5
@@ -5,8 +5,8 @@
 //!
 //! Performance target: 2-3x speedup over Numba for batch operations.
 
-use numpy::ndarray::{Array1, Array2, ArrayView2};
-use numpy::{PyArray1, PyArray2, PyReadonlyArray1, PyReadonlyArray2, ToPyArray};
+use numpy::ndarray::{Array1, Array2, Array3, ArrayView2};
+use numpy::{PyArray1, PyArray2, PyArray3, PyReadonlyArray1, PyReadonlyArray2, ToPyArray};
 use pyo3::prelude::*;
 use rayon::prelude::*;
 
@@ -304,7 +304,6 @@ fn step_rk4_with_wind(
 ///
 /// This is the critical hot path - optimized for maximum performance.
 #[inline(always)]
-#[allow(dead_code)]
 fn step_rk4(
     state: &[f64; 6],
     dt: f64,
@@ -586,6 +585,128 @@ fn find_fielder_interception(
     best_result
 }
 
+/// Fielder roles used by GroundBallInterceptor (batted_ball/ground_ball_interception.py).
+const ROLE_PITCHER: i64 = 0;
+const ROLE_CATCHER: i64 = 1;
+const ROLE_OUTFIELD: i64 = 4;
+const MOUND_Y: f64 = 60.5;
+const INTERCEPTION_MARGIN_MIN: f64 = -0.05;
+
+/// GroundBallInterceptor interception for one fielder.
+///
+/// Follows GroundBallInterceptor._calculate_fielder_interception: catcher and
+/// pitcher limits, the charge toward home, the direct-path check on the
+/// ball's line, then candidate points every 25 ms from 0.1 s to 2.5 s after
+/// landing scored by the exit-velocity strategy. The rolling ball is the
+/// straight-line, constant-deceleration model of that class, not
+/// ball_position_at_time.
+///
+/// Returns (ball_time, fielder_time, point) or None if the fielder can't make the play.
+fn ground_ball_fielder_interception(
+    landing: [f64; 2],
+    direction: [f64; 2],
+    ball_speed_fps: f64,
+    decel_fps2: f64,
+    flight_time: f64,
+    exit_velocity_mph: f64,
+    fielder: [f64; 2],
+    sprint_speed_fps: f64,
+    reaction_time: f64,
+    charge_bonus: f64,
+    role: i64,
+) -> Option<(f64, f64, [f64; 2])> {
+    if role == ROLE_CATCHER {
+        let from_home = (landing[0] * landing[0] + landing[1] * landing[1]).sqrt();
+        if from_home > 15.0 {
+            return None;
+        }
+        let rolling_away = direction[1] > 0.0 && direction[0] * landing[0] + direction[1] * landing[1] > 0.0;
+        if rolling_away && (from_home > 10.0 || ball_speed_fps > 30.0) {
+            return None;
+        }
+    }
+
+    let travel = |distance: f64| fielder_travel_time(distance, sprint_speed_fps, 0.0, FIELDER_ACCELERATION);
+
+    let mut effective = fielder;
+    if charge_bonus > 0.0 && role != ROLE_PITCHER && role != ROLE_CATCHER {
+        effective[1] -= charge_bonus;
+    }
+
+    let mut best: Option<(f64, f64, [f64; 2])> = None;
+    let mut best_score = f64::NEG_INFINITY;
+
+    // Direct path: run laterally to the closest point of the ball's line
+    let projection = (effective[0] - landing[0]) * direction[0] + (effective[1] - landing[1]) * direction[1];
+    if projection > 0.0 {
+        let closest = [landing[0] + projection * direction[0], landing[1] + projection * direction[1]];
+        let lx = effective[0] - closest[0];
+        let ly = effective[1] - closest[1];
+        let lateral = (lx * lx + ly * ly).sqrt();
+        let discriminant = ball_speed_fps * ball_speed_fps - 2.0 * decel_fps2 * projection;
+        if discriminant > 0.0 {
+            let ball_time = flight_time + (ball_speed_fps - discriminant.sqrt()) / decel_fps2;
+            let lateral_time = if lateral <= 3.0 {
+                lateral / 15.0
+            } else if lateral <= 8.0 {
+                lateral / 22.0
+            } else {
+                travel(lateral)
+            };
+            let fielder_time = reaction_time + lateral_time;
+
+            let mut can_field = lateral <= 18.0;
+            if role == ROLE_PITCHER {
+                let my = closest[1] - MOUND_Y;
+                let from_mound = (closest[0] * closest[0] + my * my).sqrt();
+                can_field = can_field && from_mound <= 15.0 && lateral <= 12.0;
+            }
+            if can_field && ball_time - fielder_time >= INTERCEPTION_MARGIN_MIN {
+                best = Some((ball_time, fielder_time, closest));
+                best_score = -lateral;
+            }
+        }
+    }
+
+    // Candidate points along the rolling path
+    let hard_hit = exit_velocity_mph > 85.0;
+    let weak_hit = exit_velocity_mph < 70.0;
+    let mut test_time = 0.1;
+    while test_time <= 2.5 {
+        let rolled = (ball_speed_fps * test_time - 0.5 * decel_fps2 * (test_time * test_time)).max(0.0);
+        let point = [landing[0] + direction[0] * rolled, landing[1] + direction[1] * rolled];
+
+        let mut reachable = true;
+        if role == ROLE_PITCHER {
+            let my = point[1] - MOUND_Y;
+            reachable = (point[0] * point[0] + my * my).sqrt() <= 10.0 && point[0].abs() <= 8.0;
+        }
+        if reachable {
+            let dx = point[0] - effective[0];
+            let dy = point[1] - effective[1];
+            let distance = (dx * dx + dy * dy).sqrt();
+            let fielder_time = reaction_time + travel(distance);
+            let ball_time = flight_time + test_time;
+            if ball_time - fielder_time >= INTERCEPTION_MARGIN_MIN {
+                let score = if hard_hit {
+                    -distance
+                } else if weak_hit {
+                    -ball_time
+                } else {
+                    -distance * 0.5 - ball_time * 0.5
+                };
+                if best.is_none() || score > best_score {
+                    best = Some((ball_time, fielder_time, point));
+                    best_score = score;
+                }
+            }
+        }
+        test_time += 0.025;
+    }
+
+    best
+}
+
 /// Simulate ground ball physics from initial conditions.
 /// 
 /// Handles initial bouncing phase, then transitions to rolling.
@@ -759,6 +880,89 @@ fn integrate_single_trajectory(
     )
 }
 
+/// Plate crossing of a single pitch.
+struct PitchCrossing {
+    position: [f64; 3],
+    velocity: [f64; 3],
+    time: f64,
+    vertical_break: f64,
+    horizontal_break: f64,
+    crossed: bool,
+}
+
+/// Integrate a pitch until it crosses the plate plane (x <= 0), hits the ground or max time.
+///
+/// Mirrors PitchResult: the crossing is interpolated linearly in x, and break is the
+/// largest deviation of the sampled path (up to the first sample past the plate) from
+/// the straight line release -> that sample. Positions are only kept in a local buffer
+/// for the break pass; nothing per-step is returned.
+fn integrate_pitch_to_plate(
+    initial_state: [f64; 6],
+    dt: f64,
+    max_time: f64,
+    ground_level: f64,
+    spin_axis: [f64; 3],
+    spin_rpm: f64,
+    air_density: f64,
+    cross_area: f64,
+    cd_table: &ArrayView2<f64>,
+    cl_table: &ArrayView2<f64>,
+) -> PitchCrossing {
+    let max_steps = (max_time / dt) as usize + 10;
+    let mut positions: Vec<[f64; 3]> = Vec::with_capacity(max_steps);
+    
+    let mut state = initial_state;
+    let mut previous = initial_state;
+    let mut current_time = 0.0;
+    let mut crossed = state[0] <= 0.0;
+    positions.push([state[0], state[1], state[2]]);
+    
+    while !crossed && current_time < max_time && positions.len() < max_steps - 1 {
+        previous = state;
+        state = step_rk4(&state, dt, &spin_axis, spin_rpm, air_density, cross_area, cd_table, cl_table);
+        current_time += dt;
+        positions.push([state[0], state[1], state[2]]);
+        
+        if state[0] <= 0.0 {
+            crossed = true;
+        } else if state[2] <= ground_level {
+            break;
+        }
+    }
+    
+    // Interpolate to the plate plane
+    let mut position = [state[0], state[1], state[2]];
+    let mut velocity = [state[3], state[4], state[5]];
+    let mut time = current_time;
+    if crossed && positions.len() > 1 {
+        let fraction = -previous[0] / (state[0] - previous[0]);
+        for k in 0..3 {
+            position[k] = previous[k] + fraction * (state[k] - previous[k]);
+            velocity[k] = previous[k + 3] + fraction * (state[k + 3] - previous[k + 3]);
+        }
+        time = current_time - dt + fraction * dt;
+    }
+    
+    // Break: maximum deviation from the release -> plate line
+    let release = positions[0];
+    let end = positions[positions.len() - 1];
+    let line = [end[0] - release[0], end[1] - release[1], end[2] - release[2]];
+    let line_sq = line[0] * line[0] + line[1] * line[1] + line[2] * line[2];
+    let mut vertical_break = 0.0_f64;
+    let mut horizontal_break = 0.0_f64;
+    if line_sq > 0.0 {
+        for p in positions.iter() {
+            let to_point = [p[0] - release[0], p[1] - release[1], p[2] - release[2]];
+            let t = ((to_point[0] * line[0] + to_point[1] * line[1] + to_point[2] * line[2]) / line_sq)
+                .clamp(0.0, 1.0);
+            vertical_break = vertical_break.max((to_point[2] - t * line[2]).abs());
+            horizontal_break = horizontal_break.max((to_point[1] - t * line[1]).abs());
+        }
+    }
+    
+    PitchCrossing { position, velocity, time, vertical_break, horizontal_break, crossed }
+}
+
 // ============================================================================
 // PyO3 Python Interface
 // ============================================================================
@@ -791,12 +995,14 @@ fn integrate_trajectory<'py>(
     ];
     let spin_ax = [spin[0], spin[1], spin[2]];
     
-    // Run integration
-    let result = integrate_single_trajectory(
-        init_state, dt, max_time, ground_level,
-        spin_ax, spin_rpm, air_density, cross_area,
-        &cd, &cl,
-    );
+    // Run integration without holding the GIL
+    let result = py.allow_threads(|| {
+        integrate_single_trajectory(
+            init_state, dt, max_time, ground_level,
+            spin_ax, spin_rpm, air_density, cross_area,
+            &cd, &cl,
+        )
+    });
     
     // Convert results to numpy arrays
     let n = result.positions.len();
@@ -848,12 +1054,14 @@ fn integrate_trajectory_with_wind<'py>(
     let wind_vel = [wind[0], wind[1], wind[2]];
     let spin_ax = [spin[0], spin[1], spin[2]];
     
-    // Run integration with wind
-    let result = integrate_single_trajectory_with_wind(
-        init_state, dt, max_time, ground_level,
-        wind_vel, spin_ax, spin_rpm, air_density, cross_area,
-        &cd, &cl,
-    );
+    // Run integration with wind without holding the GIL
+    let result = py.allow_threads(|| {
+        integrate_single_trajectory_with_wind(
+            init_state, dt, max_time, ground_level,
+            wind_vel, spin_ax, spin_rpm, air_density, cross_area,
+            &cd, &cl,
+        )
+    });
     
     // Convert results to numpy arrays
     let n = result.positions.len();
@@ -960,6 +1168,103 @@ fn integrate_trajectories_batch<'py>(
     ))
 }
 
+/// Integrate multiple trajectories with wind in parallel, keeping a sampled
+/// polyline of each flight.
+///
+/// Every `sample_every`-th position is kept, plus the landing point, so that
+/// polyline tests (fence clearance) can run on thousands of trajectories
+/// without the full per-step arrays. Positions are padded with each
+/// trajectory's last point up to the longest sampled flight.
+#[pyfunction]
+#[pyo3(signature = (initial_states, dt, max_time, ground_level, spin_params, wind_velocity, air_density, cross_area, cd_table, cl_table, sample_every=10))]
+fn integrate_trajectories_sampled_batch<'py>(
+    py: Python<'py>,
+    initial_states: PyReadonlyArray2<f64>,
+    dt: f64,
+    max_time: f64,
+    ground_level: f64,
+    spin_params: PyReadonlyArray2<f64>,
+    wind_velocity: PyReadonlyArray1<f64>,
+    air_density: f64,
+    cross_area: f64,
+    cd_table: PyReadonlyArray2<f64>,
+    cl_table: PyReadonlyArray2<f64>,
+    sample_every: usize,
+) -> PyResult<(Bound<'py, PyArray3<f64>>, Bound<'py, PyArray1<i64>>, Bound<'py, PyArray1<f64>>)> {
+    let states = initial_states.as_array();
+    let spins = spin_params.as_array();
+    let wind = wind_velocity.as_array();
+    let cd = cd_table.as_array();
+    let cl = cl_table.as_array();
+
+    let n_trajectories = states.nrows();
+    if spins.nrows() != n_trajectories {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "spin_params must have one row per initial state",
+        ));
+    }
+    if wind.len() != 3 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "wind_velocity must have 3 components",
+        ));
+    }
+    let wind_vel = [wind[0], wind[1], wind[2]];
+    let step = sample_every.max(1);
+
+    let inputs: Vec<_> = (0..n_trajectories)
+        .map(|i| {
+            let init_state = [
+                states[[i, 0]], states[[i, 1]], states[[i, 2]],
+                states[[i, 3]], states[[i, 4]], states[[i, 5]],
+            ];
+            let spin_ax = [spins[[i, 0]], spins[[i, 1]], spins[[i, 2]]];
+            (init_state, spin_ax, spins[[i, 3]])
+        })
+        .collect();
+
+    let results: Vec<(Vec<[f64; 3]>, f64)> = py.allow_threads(|| {
+        inputs
+            .par_iter()
+            .map(|(init_state, spin_ax, spin_rpm)| {
+                let result = integrate_single_trajectory_with_wind(
+                    *init_state, dt, max_time, ground_level,
+                    wind_vel, *spin_ax, *spin_rpm, air_density, cross_area,
+                    &cd, &cl,
+                );
+                let n = result.positions.len();
+                let mut samples: Vec<[f64; 3]> = result.positions.iter().step_by(step).copied().collect();
+                if (n - 1) % step != 0 {
+                    samples.push(result.positions[n - 1]);
+                }
+                (samples, result.times[n - 1])
+            })
+            .collect()
+    });
+
+    let n_samples = results.iter().map(|(samples, _)| samples.len()).max().unwrap_or(1);
+    let mut positions = Array3::<f64>::zeros((n_trajectories, n_samples, 3));
+    let mut sample_counts = Array1::<i64>::zeros(n_trajectories);
+    let mut landing_times = Array1::<f64>::zeros(n_trajectories);
+
+    for (i, (samples, time)) in results.iter().enumerate() {
+        let last = samples[samples.len() - 1];
+        for j in 0..n_samples {
+            let p = if j < samples.len() { samples[j] } else { last };
+            positions[[i, j, 0]] = p[0];
+            positions[[i, j, 1]] = p[1];
+            positions[[i, j, 2]] = p[2];
+        }
+        sample_counts[i] = samples.len() as i64;
+        landing_times[i] = *time;
+    }
+
+    Ok((
+        positions.to_pyarray(py),
+        sample_counts.to_pyarray(py),
+        landing_times.to_pyarray(py),
+    ))
+}
+
 /// Calculate trajectory endpoints only (memory efficient batch mode).
 ///
 /// When you only need landing positions, this skips storing full trajectory.
@@ -984,6 +1289,98 @@ fn calculate_endpoints_batch<'py>(
     )
 }
 
+/// Integrate a batch of pitches to the plate plane in parallel using Rayon.
+///
+/// Each row has its own release state, spin axis (unit vector), effective spin
+/// and air density. Returns plate positions (N, 3), plate velocities (N, 3),
+/// flight times (N,), breaks (N, 2) as [vertical, horizontal] maximum deviation
+/// from the release -> plate line (meters), and whether each pitch crossed the plate.
+#[pyfunction]
+#[pyo3(signature = (release_states, spin_axes, spin_rpm, air_density, dt, max_time, ground_level, cross_area, cd_table, cl_table))]
+fn integrate_pitches_batch<'py>(
+    py: Python<'py>,
+    release_states: PyReadonlyArray2<f64>,
+    spin_axes: PyReadonlyArray2<f64>,
+    spin_rpm: PyReadonlyArray1<f64>,
+    air_density: PyReadonlyArray1<f64>,
+    dt: f64,
+    max_time: f64,
+    ground_level: f64,
+    cross_area: f64,
+    cd_table: PyReadonlyArray2<f64>,
+    cl_table: PyReadonlyArray2<f64>,
+) -> PyResult<(
+    Bound<'py, PyArray2<f64>>,
+    Bound<'py, PyArray2<f64>>,
+    Bound<'py, PyArray1<f64>>,
+    Bound<'py, PyArray2<f64>>,
+    Bound<'py, PyArray1<bool>>,
+)> {
+    let states = release_states.as_array();
+    let axes = spin_axes.as_array();
+    let rpm = spin_rpm.as_array();
+    let density = air_density.as_array();
+    let cd = cd_table.as_array();
+    let cl = cl_table.as_array();
+    
+    let n_pitches = states.nrows();
+    if axes.nrows() != n_pitches || rpm.len() != n_pitches || density.len() != n_pitches {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "release_states, spin_axes, spin_rpm and air_density must have the same length",
+        ));
+    }
+    
+    let inputs: Vec<_> = (0..n_pitches)
+        .map(|i| {
+            let init_state = [
+                states[[i, 0]], states[[i, 1]], states[[i, 2]],
+                states[[i, 3]], states[[i, 4]], states[[i, 5]],
+            ];
+            let spin_ax = [axes[[i, 0]], axes[[i, 1]], axes[[i, 2]]];
+            (init_state, spin_ax, rpm[i], density[i])
+        })
+        .collect();
+    
+    let results: Vec<PitchCrossing> = py.allow_threads(|| {
+        inputs
+            .par_iter()
+            .map(|(init_state, spin_ax, spin, rho)| {
+                integrate_pitch_to_plate(
+                    *init_state, dt, max_time, ground_level,
+                    *spin_ax, *spin, *rho, cross_area,
+                    &cd, &cl,
+                )
+            })
+            .collect()
+    });
+    
+    // Convert results to numpy arrays
+    let mut plate_positions = Array2::<f64>::zeros((n_pitches, 3));
+    let mut plate_velocities = Array2::<f64>::zeros((n_pitches, 3));
+    let mut flight_times = Array1::<f64>::zeros(n_pitches);
+    let mut breaks = Array2::<f64>::zeros((n_pitches, 2));
+    let mut crossed = Array1::<bool>::from_elem(n_pitches, false);
+    
+    for (i, result) in results.iter().enumerate() {
+        for k in 0..3 {
+            plate_positions[[i, k]] = result.position[k];
+            plate_velocities[[i, k]] = result.velocity[k];
+        }
+        flight_times[i] = result.time;
+        breaks[[i, 0]] = result.vertical_break;
+        breaks[[i, 1]] = result.horizontal_break;
+        crossed[i] = result.crossed;
+    }
+    
+    Ok((
+        plate_positions.to_pyarray(py),
+        plate_velocities.to_pyarray(py),
+        flight_times.to_pyarray(py),
+        breaks.to_pyarray(py),
+        crossed.to_pyarray(py),
+    ))
+}
+
 /// Get the number of CPU threads available for parallel processing.
 #[pyfunction]
 fn get_num_threads() -> usize {
@@ -1020,6 +1417,7 @@ fn set_num_threads(n: usize) {
 #[pyfunction]
 #[pyo3(signature = (x0, y0, vx_mph, vy_mph, vz_mph, spin_rpm, is_grass = true))]
 fn simulate_ground_ball(
+    py: Python<'_>,
     x0: f64,
     y0: f64,
     vx_mph: f64,
@@ -1028,7 +1426,9 @@ fn simulate_ground_ball(
     spin_rpm: f64,
     is_grass: bool,
 ) -> (f64, f64, f64, f64, f64, f64, f64, f64) {
-    let result = simulate_ground_ball_initial(x0, y0, vx_mph, vy_mph, vz_mph, spin_rpm, is_grass);
+    let result = py.allow_threads(|| {
+        simulate_ground_ball_initial(x0, y0, vx_mph, vy_mph, vz_mph, spin_rpm, is_grass)
+    });
     (
         result.landing_position[0],
         result.landing_position[1],
@@ -1052,6 +1452,10 @@ fn simulate_ground_ball(
 ///     time_after_landing: Time since ball started rolling
 ///
 /// Returns tuple: (x, y, velocity_mph)
+///
+/// Closed-form and sub-microsecond, so it keeps the GIL: releasing it would cost
+/// more than the call, and reacquiring it under contention waits for the
+/// interpreter switch interval.
 #[pyfunction]
 #[pyo3(signature = (landing_x, landing_y, landing_velocity_mph, direction_x, direction_y, friction, spin_effect, time_after_landing))]
 fn get_ball_position_at_time(
@@ -1086,6 +1490,8 @@ fn get_ball_position_at_time(
 ///     acceleration: Acceleration rate (ft/s², default 28.0)
 ///
 /// Returns: Total time to reach destination
+///
+/// Closed-form; keeps the GIL for the same reason as get_ball_position_at_time.
 #[pyfunction]
 #[pyo3(signature = (distance_ft, sprint_speed_fps, reaction_time = 0.3, acceleration = 28.0))]
 fn calculate_fielder_travel_time(
@@ -1116,6 +1522,7 @@ fn calculate_fielder_travel_time(
 #[pyfunction]
 #[pyo3(signature = (landing_x, landing_y, landing_velocity_mph, direction_x, direction_y, landing_time, friction, spin_effect, fielder_x, fielder_y, sprint_speed_fps, reaction_time, exit_velocity_mph))]
 fn find_interception_point(
+    py: Python<'_>,
     landing_x: f64,
     landing_y: f64,
     landing_velocity_mph: f64,
@@ -1139,21 +1546,23 @@ fn find_interception_point(
         spin_effect,
     };
     
-    // Calculate distance to landing for charge bonus
-    let dx = landing_x - fielder_x;
-    let dy = landing_y - fielder_y;
-    let distance_to_landing = (dx * dx + dy * dy).sqrt();
-    
-    let charge_bonus = calculate_charge_bonus(exit_velocity_mph, distance_to_landing, sprint_speed_fps);
-    
-    let result = find_fielder_interception(
-        &ground_ball,
-        fielder_x,
-        fielder_y,
-        sprint_speed_fps,
-        reaction_time,
-        charge_bonus,
-    );
+    let result = py.allow_threads(|| {
+        // Calculate distance to landing for charge bonus
+        let dx = landing_x - fielder_x;
+        let dy = landing_y - fielder_y;
+        let distance_to_landing = (dx * dx + dy * dy).sqrt();
+        
+        let charge_bonus = calculate_charge_bonus(exit_velocity_mph, distance_to_landing, sprint_speed_fps);
+        
+        find_fielder_interception(
+            &ground_ball,
+            fielder_x,
+            fielder_y,
+            sprint_speed_fps,
+            reaction_time,
+            charge_bonus,
+        )
+    });
     
     (
         result.can_intercept,
@@ -1279,6 +1688,116 @@ fn find_best_interception<'py>(
     )
 }
 
+/// Best GroundBallInterceptor interception over all fielders in one call.
+///
+/// Runs ground_ball_fielder_interception for every fielder, then selects
+/// like GroundBallInterceptor: infielders before outfielders, then the
+/// shortest distance from the fielder's position to the interception point,
+/// the first fielder winning ties.
+///
+/// Args:
+///     landing_x, landing_y: Landing position (ft, field coordinates)
+///     direction_x, direction_y: Unit rolling direction
+///     ball_speed_fps: Rolling speed at landing (ft/s)
+///     decel_fps2: Rolling deceleration (ft/s²)
+///     flight_time: Time from contact to landing (s)
+///     exit_velocity_mph: Exit velocity (selects the fielding strategy)
+///     fielder_positions: Nx2 array of fielder (x, y) positions
+///     fielder_speeds: Fielder sprint speeds (ft/s)
+///     reaction_times: Fielder reaction times (s)
+///     charge_bonuses: Distance each fielder charges toward home (ft)
+///     fielder_roles: 0 pitcher, 1 catcher, 2 corner infielder, 3 middle infielder, 4 outfielder
+///
+/// Returns tuple:
+///     (best_fielder_idx, ball_time, fielder_time, intercept_x, intercept_y);
+///     best_fielder_idx is -1 if the ball gets through
+///
+/// A few hundred closed-form steps per fielder; keeps the GIL like
+/// get_ball_position_at_time.
+#[pyfunction]
+#[pyo3(signature = (landing_x, landing_y, direction_x, direction_y, ball_speed_fps, decel_fps2, flight_time, exit_velocity_mph, fielder_positions, fielder_speeds, reaction_times, charge_bonuses, fielder_roles))]
+fn find_ground_ball_interception(
+    landing_x: f64,
+    landing_y: f64,
+    direction_x: f64,
+    direction_y: f64,
+    ball_speed_fps: f64,
+    decel_fps2: f64,
+    flight_time: f64,
+    exit_velocity_mph: f64,
+    fielder_positions: PyReadonlyArray2<f64>,
+    fielder_speeds: PyReadonlyArray1<f64>,
+    reaction_times: PyReadonlyArray1<f64>,
+    charge_bonuses: PyReadonlyArray1<f64>,
+    fielder_roles: PyReadonlyArray1<i64>,
+) -> PyResult<(i64, f64, f64, f64, f64)> {
+    let positions = fielder_positions.as_array();
+    let speeds = fielder_speeds.as_array();
+    let reactions = reaction_times.as_array();
+    let charges = charge_bonuses.as_array();
+    let roles = fielder_roles.as_array();
+
+    let n_fielders = positions.nrows();
+    if positions.ncols() != 2
+        || speeds.len() != n_fielders
+        || reactions.len() != n_fielders
+        || charges.len() != n_fielders
+        || roles.len() != n_fielders
+    {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "fielder_positions must be (N, 2) with one speed, reaction time, charge bonus and role per fielder",
+        ));
+    }
+
+    let landing = [landing_x, landing_y];
+    let direction = [direction_x, direction_y];
+
+    let mut best_idx: i64 = -1;
+    let mut best = (0.0, 0.0, [0.0, 0.0]);
+    let mut best_infield = false;
+    let mut best_distance = f64::INFINITY;
+
+    for i in 0..n_fielders {
+        let fielder = [positions[[i, 0]], positions[[i, 1]]];
+        let interception = ground_ball_fielder_interception(
+            landing,
+            direction,
+            ball_speed_fps,
+            decel_fps2,
+            flight_time,
+            exit_velocity_mph,
+            fielder,
+            speeds[i],
+            reactions[i],
+            charges[i],
+            roles[i],
+        );
+        let (ball_time, fielder_time, point) = match interception {
+            Some(found) => found,
+            None => continue,
+        };
+        if ball_time - fielder_time < INTERCEPTION_MARGIN_MIN {
+            continue;
+        }
+
+        let infield = roles[i] != ROLE_OUTFIELD;
+        let dx = point[0] - fielder[0];
+        let dy = point[1] - fielder[1];
+        let distance = (dx * dx + dy * dy).sqrt();
+        let is_better = best_idx < 0
+            || (infield && !best_infield)
+            || (infield == best_infield && distance < best_distance);
+        if is_better {
+            best_idx = i as i64;
+            best = (ball_time, fielder_time, point);
+            best_infield = infield;
+            best_distance = distance;
+        }
+    }
+
+    Ok((best_idx, best.0, best.1, best.2[0], best.2[1]))
+}
+
 /// Python module definition.
 #[pymodule]
 fn trajectory_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
@@ -1286,7 +1805,9 @@ fn trajectory_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(integrate_trajectory, m)?)?;
     m.add_function(wrap_pyfunction!(integrate_trajectory_with_wind, m)?)?;
     m.add_function(wrap_pyfunction!(integrate_trajectories_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(integrate_trajectories_sampled_batch, m)?)?;
     m.add_function(wrap_pyfunction!(calculate_endpoints_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(integrate_pitches_batch, m)?)?;
     m.add_function(wrap_pyfunction!(get_num_threads, m)?)?;
     m.add_function(wrap_pyfunction!(set_num_threads, m)?)?;
     
@@ -1296,6 +1817,7 @@ fn trajectory_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(calculate_fielder_travel_time, m)?)?;
     m.add_function(wrap_pyfunction!(find_interception_point, m)?)?;
     m.add_function(wrap_pyfunction!(find_best_interception, m)?)?;
+    m.add_function(wrap_pyfunction!(find_ground_ball_interception, m)?)?;
     
     // Add constants
     m.add("GRAVITY", GRAVITY)?;